@@ -2,9 +2,23 @@ import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import json
+import os
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 import numpy as np
+from figure_cache import cached_figure
+from assets import picture_html, stylesheet_html
+import render_profile
+from respondent_store import RespondentStore, build_cube
+from metrics_engine import SIGNIFICANT_GAIN, segment_metrics
+from live_ingest import LiveSession
+from file_watch import FileWatcher
+from session_schema import SchemaError, parse_session, with_segment
+from warmup import WarmUp, serving
+from portfolio import KPIS, build_portfolio, kpi_sessions
+from shared_data import HASH_FUNCS, SHARED_DATA
+from registry import REGISTRY
 
 
 # ============================================================================
@@ -18,152 +32,26 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Opt-in render timings (SLS_PROFILE=1 or ?profile=1) — see render_profile.py
+PROFILING = render_profile.enabled(st.query_params)
+if PROFILING:
+    render_profile.install(st)
+render_profile.start(PROFILING)
+
 # ============================================================================
 # INITIATIVE & SESSION CONFIGURATION
 # ============================================================================
 
-INITIATIVES = {
-    "Towards the Vision": {
-        "name": "Towards the Vision",
-        "icon": "🎯",
-        "description": "Educational initiative empowering participants with knowledge and skills aligned with Vision 2030 goals",
-        "color": "#006341",
-        "sessions": {
-            "Cybersecurity": {
-                "name": "🔐 Cybersecurity Session",
-                "data_file": "sls_kpi_data_cybersecurity_updated1.json",
-                "icon": "🔐",
-                "vision_theme": "Digital Transformation & Innovation",
-                "color": "#667eea",
-                "topic_labels": ["Cybersecurity Knowledge", "Vision 2030 Contribution", "Technical Skills in Demand"]
-            },
-            "Finance": {
-                "name": "💰 Finance Session",
-                "data_file": "sls_kpi_finance_session2_ttv_data_updated1.json",
-                "icon": "💰",
-                "vision_theme": "Financial Sector Development",
-                "color": "#f093fb",
-                "topic_labels": ["Finance Knowledge", "Vision 2030 Contribution", "Technical Skills in Demand"]
-            },
-            "Health": {
-                "name": "🏥 Health Session",
-                "data_file": "sls_kpi_health_session3_ttv_data_updated.json",
-                "icon": "🏥",
-                "vision_theme": "Health Sector Development",
-                "color": "#10b981",
-                "topic_labels": ["Health Sector Knowledge", "Vision 2030 Contribution", "Job Market Awareness", "In-Demand Skills"],
-                "type": "health"
-            },
-            "Nursing": {
-                "name": "💉 Nursing Session",
-                "data_file": "sls_kpi_nursing_final.json",
-                "icon": "💉",
-                "vision_theme": "Nursing Sector Development",
-                "color": "#0ea5e9",
-                "topic_keys": ["grow_nursing_knowledge", "grow_vision2030", "grow_job_market", "grow_skills"],
-                "topic_labels": ["Nursing Knowledge", "Vision 2030 Contribution", "Job Market Awareness", "In-Demand Skills"],
-                "type": "health"
-            }
-        }
-    },
-    "Misk Tracks": {
-        "name": "Misk Tracks",
-        "icon": "🚀",
-        "description": "An initiative highlighting Misk Foundation's four tracks — Leadership, Entrepreneurship, Skills, and Community — to help Saudi students in Australia explore programs aligned with their academic and career goals.",
-        "color": "#8B5CF6",
-        "sessions": {
-            "Awareness Study": {
-                "name": "📊 Misk Tracks Awareness",
-                "data_file": "misk_tracks_awareness_session.json",
-                "icon": "📊",
-                "vision_theme": "Baseline Awareness Assessment",
-                "color": "#10b981",
-                "topic_labels": [],
-                "type": "awareness"
-            },
-            "10x Leaders": {
-                "name": "⭐ 10x Leaders Program",
-                "data_file": "sls_kpi_10xleaders_session_data_updated_overall.json",
-                "icon": "⭐",
-                "vision_theme": "Leadership Development & Excellence",
-                "color": "#f59e0b",
-                "topic_labels": [],
-                "type": "comprehensive"
-            }
-        }
-    },
-    "Leaders Network Circles": {
-        "name": "Leaders Network Circles",
-        "icon": "🔗",
-        "description": "Professional networking circles connecting Saudi health students and professionals in Australia — Growth, Connection, and Impact circles — aligned with Vision 2030.",
-        "color": "#0d3b6e",
-        "sessions": {
-            "Health Sector Session 1": {
-                "name": "🏥 Health Sector — Session 1",
-                "data_file": None,
-                "icon": "🏥",
-                "vision_theme": "Professional Networking & Career Development",
-                "color": "#0d3b6e",
-                "topic_labels": [],
-                "type": "lnc"
-            },
-            "Technology Sector Session 1": {
-                "name": "💻 Technology Sector — Session 1",
-                "data_file": None,
-                "icon": "💻",
-                "vision_theme": "Professional Networking & Career Development",
-                "color": "#0d3b6e",
-                "topic_labels": [],
-                "type": "lnc_tech"
-            },
-            
-            "Cross-Sector Analysis": {
-                "name": "⚡ Health vs Technology — Cross Analysis",
-                "data_file": None,
-                "icon": "⚡",
-                "vision_theme": "Health & Technology Sectors Compared",
-                "color": "#0d3b6e",
-                "topic_labels": [],
-                "type": "lnc_cross"
-            },
-            "Combined Analysis": {
-                "name": "🌐 Health + Technology — Combined",
-                "data_file": None,
-                "icon": "🌐",
-                "vision_theme": "Health & Technology — Combined Programme Insights",
-                "color": "#0d3b6e",
-                "topic_labels": [],
-                "type": "lnc_combined"
-            }
-        }
-    },
-    "Leaders Accelerator": {
-        "name": "Leaders Accelerator",
-        "icon": "⚡",
-        "description": "A mentorship-driven accelerator preparing Saudi students in Australia to apply for Misk's 10X Leaders program — through clarity, confidence, and coaching.",
-        "color": "#7C3AED",
-        "sessions": {
-            "10X Leaders Session": {
-                "name": "⚡ Leaders Accelerator — 10X Leaders",
-                "data_file": None,
-                "icon": "⚡",
-                "vision_theme": "Application Readiness & Leadership Development",
-                "color": "#7C3AED",
-                "topic_labels": [],
-                "type": "leaders_accelerator"
-            }
-        }
-    }
-}
+# Sessions are registered in registry.json (registry.py), not here. Each run
+# reads the published snapshot once, so a reload never mixes two versions in
+# one run, and an edited registry shows up on the next run without a restart.
+INITIATIVES = REGISTRY.current()
 
 # ============================================================================
 # STUNNING SLS BRAND CSS - SAUDI-INSPIRED
 # ============================================================================
 
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@300;400;500;600;700&family=Epilogue:wght@300;400;500;600;700;800;900&display=swap');
-    
+APP_CSS = """
     * { font-family: 'Epilogue', sans-serif; }
     
     .main {
@@ -571,8 +459,42 @@ st.markdown("""
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
     header {visibility: hidden;}
-</style>
-""", unsafe_allow_html=True)
+"""
+
+# Minified once per process. With static serving on (.streamlit/config.toml) and
+# `python assets.py build` run, it is served from static/ with the bundled fonts,
+# and each rerun re-sends only a <link>.
+@st.cache_resource
+def app_stylesheet():
+    return stylesheet_html(APP_CSS, st.get_option("server.enableStaticServing"))
+
+st.markdown(app_stylesheet(), unsafe_allow_html=True)
+
+# ── Header banner ─────────────────────────────────────────────────────────────
+# Decoded once per process. With static serving and built variants it becomes a
+# <picture> of WebP/JPEG variants at stable hashed URLs; otherwise st.image gets
+# the same cached bytes, which also keeps its media URL stable across reruns.
+HEADER_IMAGE = "sls_image.jpg"
+
+@st.cache_resource
+def header_image():
+    if st.get_option("server.enableStaticServing"):
+        try:
+            return picture_html(HEADER_IMAGE, alt="Saudi Leadership Society")
+        except FileNotFoundError:
+            pass  # not built yet
+    with open(HEADER_IMAGE, 'rb') as f:
+        return f.read()
+
+def show_header_image():
+    try:
+        image = header_image()
+    except OSError:
+        return
+    if isinstance(image, str):
+        st.markdown(image, unsafe_allow_html=True)
+    else:
+        st.image(image, use_container_width=True)
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -593,6 +515,7 @@ def create_kpi_card(category, label, value, context, trend="", warn=False):
     </div>
     """
 
+@cached_figure
 def lnc_bar(x, y, color, height=320, h_range=None, v_range=None, orientation='v', name=None):
     """Quick bar chart for LNC single-series charts."""
     fig = go.Figure()
@@ -621,7 +544,9 @@ def lnc_bar(x, y, color, height=320, h_range=None, v_range=None, orientation='v'
     fig.update_layout(**layout)
     return fig
 
-def lnc_grouped_bar(labels, pre_vals, post_vals, pre_color='#d0d9e8', post_color='#0d3b6e', height=360, y_max=30):
+@cached_figure
+def lnc_grouped_bar(labels, pre_vals, post_vals, pre_color='#d0d9e8', post_color='#0d3b6e', height=360, y_max=30,
+                    layout=None):
     fig = go.Figure()
     fig.add_trace(go.Bar(name='Before', x=labels, y=pre_vals,
         marker_color=pre_color, text=pre_vals, textposition='outside', textfont=dict(size=13)))
@@ -634,8 +559,11 @@ def lnc_grouped_bar(labels, pre_vals, post_vals, pre_color='#d0d9e8', post_color
         plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
         legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
     )
+    if layout:
+        fig.update_layout(**layout)
     return fig
 
+@cached_figure
 def lnc_donut(labels, values, colors, center_text="", height=320):
     fig = go.Figure(data=[go.Pie(
         labels=labels, values=values, hole=0.52,
@@ -654,6 +582,16 @@ def lnc_donut(labels, values, colors, center_text="", height=320):
     )
     return fig
 
+@cached_figure
+def lnc_figure(traces, layout, hline=None, vline=None):
+    """Cached one-off chart. `traces` are plain trace dicts carrying a 'type' key."""
+    fig = go.Figure(data=list(traces), layout=layout)
+    if hline:
+        fig.add_hline(**hline)
+    if vline:
+        fig.add_vline(**vline)
+    return fig
+
 def compare_band(pre_val, post_val, pre_label, post_label, pre_color, post_color, unit="", note=""):
     if isinstance(pre_val, float):
         pre_str  = f"{pre_val:.1f}{unit}"
@@ -685,39 +623,481 @@ def compare_band(pre_val, post_val, pre_label, post_label, pre_color, post_color
     </div>
     """
 
+# ── Gain uncertainty ──────────────────────────────────────────────────────────
+# Files built by metrics_engine.py carry a bootstrap CI and paired tests for
+# each topic's gain. Bars that end at a topic's post score or its improvement
+# get the CI as whiskers (the gain's interval, measured from that end), with
+# the p-values on hover. Older files and segment views have none and render
+# exactly as before.
+def format_p(p):
+    return "n/a" if p is None else "< 0.001" if p < 0.001 else f"{p:.3f}"
+
+def gain_ci(record, axis='y'):
+    """Trace keys adding each topic's gain CI to a bar trace, or {} without CIs."""
+    topics = record.topics
+    if not topics or any(t.ci_low is None or t.ci_high is None for t in topics):
+        return {}
+    return {
+        f"error_{axis}": dict(type='data', symmetric=False, color='#2c3e50', thickness=1.5, width=6,
+                              array=[round(max(t.ci_high - t.improvement, 0), 3) for t in topics],
+                              arrayminus=[round(max(t.improvement - t.ci_low, 0), 3) for t in topics]),
+        "hovertext": [f"{t.label}<br>Gain {t.improvement:+.2f} [{t.ci_low:+.2f}, {t.ci_high:+.2f}]"
+                      f"<br>Wilcoxon p {format_p(t.p_wilcoxon)} · paired t p {format_p(t.p_ttest)}"
+                      for t in topics],
+        "hoverinfo": "text",
+    }
+
+def gain_ci_note(record):
+    """Caption explaining the whiskers and the overall gain's CI and tests ('' without CIs)."""
+    u = record.uncertainty
+    if not u or not gain_ci(record):
+        return ""
+    o = u.get('overall') or {}
+    note = (f"Whiskers: {u['confidence']:.0%} bootstrap interval of each topic's gain "
+            f"({u['resamples']:,} resamples of the matched respondents).")
+    if o.get('ci_low') is not None:
+        note += (f" Average gain {o['mean']:+.2f} [{o['ci_low']:+.2f}, {o['ci_high']:+.2f}], n = {o['n']}; "
+                 f"Wilcoxon p {format_p(o['p_wilcoxon'])}, paired t p {format_p(o['p_ttest'])}.")
+    return note
+
+# ── Lazy tabs ─────────────────────────────────────────────────────────────────
+# Session tabs track which one is open, so a run only builds (and sends) the
+# open tab's charts. Reopening a tab redraws it from FIGURE_CACHE. Each
+# dashboard wraps its tabs in a nested `@st.fragment def dashboard_tabs()`, so
+# switching tabs (or using a control inside one) reruns that region alone:
+# the header, CSS, data loading and KPI cards above it are left as they are.
+# Headless renders that need the whole page (snapshots, warm-up) set
+# st.session_state[ALL_TABS] and get plain eager tabs.
+ALL_TABS = "all_tabs"
+
+def session_tabs(selected_session, labels):
+    if st.session_state.get(ALL_TABS):
+        return st.tabs(labels)
+    return st.tabs(labels, key=f"tabs_{selected_session}", on_change="rerun")
+
+def tab_open(tab):
+    """False only for a lazy tab that isn't selected (eager tabs report open=None)."""
+    return tab.open is not False
+
 # ============================================================================
 # DATA LOADING
 # ============================================================================
 
-@st.cache_data
+# Each data file is parsed once per process into a read-only document that
+# every viewer shares (shared_data.py): no per-call copy as with st.cache_data.
+# Cached helpers keyed on documents hash them by file digest (HASH_FUNCS).
 def load_data(data_file):
     if not data_file:
         return None
     try:
-        with open(data_file, 'r') as f:
-            return json.load(f)
-    except:
+        return SHARED_DATA.get(data_file)
+    except (OSError, ValueError):
         st.error(f"⚠️ Data file '{data_file}' not found!")
         return None
 
+# ── Per-respondent stores ─────────────────────────────────────────────────────
+# Written by metrics_engine.py ("respondents" in its manifest). Cached as a
+# resource, not data: the columns are read-only memmaps, so every viewer
+# shares the same pages instead of holding a private copy.
+@st.cache_resource
+def load_respondents(path):
+    if not path or not os.path.exists(os.path.join(path, "columns.json")):
+        return None
+    return RespondentStore(path)
+
+# ── Live sessions ─────────────────────────────────────────────────────────────
+# A session whose registry entry has "live": <folder> (see live_ingest.py) is
+# rendered from that folder's response log instead of its data_file while it
+# exists. One LiveSession per folder is shared by every viewer and folds in
+# only the responses appended since the last refresh; each open dashboard
+# polls it and reruns once it has moved past what that viewer rendered.
+LIVE_POLL_SECONDS = 5
+
+@st.cache_resource
+def live_session(path):
+    if not path or not os.path.exists(os.path.join(path, "spec.json")):
+        return None
+    return LiveSession(path)
+
+def live_data(live):
+    live.refresh()
+    st.session_state[f"live_version_{live.path}"] = live.version
+    return live.document()
+
+@st.fragment(run_every=LIVE_POLL_SECONDS)
+def live_status(live):
+    live.refresh()
+    if live.version != st.session_state.get(f"live_version_{live.path}"):
+        st.rerun()
+    updated = live.updated.strftime('%H:%M:%S') if live.updated else "—"
+    st.caption(f"🔴 Live · {live.responses} responses · updated {updated}")
+
+# ── Segment filters ───────────────────────────────────────────────────────────
+# Sessions with a respondent store can be narrowed to any combination of these
+# segments. The cube is summed once per store; each filter change is then an
+# index-and-sum over it rather than a rescan of the respondents.
+SEGMENT_DIMENSIONS = {"location": "📍 Location", "academic_level": "🎓 Academic Level",
+                      "heard_about": "📣 Heard About Us"}
+SATISFACTION_LABELS = ['Very dissatisfied', 'Dissatisfied', 'Neutral', 'Satisfied', 'Very satisfied']
+
+@st.cache_resource
+def segment_cube(path):
+    store = load_respondents(path)
+    return build_cube(store, list(SEGMENT_DIMENSIONS), SIGNIFICANT_GAIN) if store is not None else None
+
+def segment_filter(selected_session, session_info, record):
+    """Segment pickers; returns the SessionRecord with metrics recomputed for the chosen segment."""
+    cube = segment_cube(session_info.get('respondents'))
+    if cube is None:
+        return record
+    filters = {}
+    with st.expander("🔎 Filter by Segment"):
+        cols = st.columns(len(cube.dims))
+        for col, dim in zip(cols, cube.dims):
+            with col:
+                chosen = st.multiselect(SEGMENT_DIMENSIONS[dim], cube.labels[dim],
+                                        key=f"segment_{selected_session}_{dim}")
+            if chosen:
+                filters[dim] = chosen
+    if not filters:
+        return record
+
+    agg = cube.select(**filters)
+    seg = segment_metrics(agg, cube.topics)
+    st.info(f"🔎 Showing **{agg['n']}** matched respondents: "
+            + " · ".join(", ".join(v) for v in filters.values()))
+    answers = {}
+    if 'satisfaction' in agg['likert']:
+        answers['satisfaction'] = {label: int(c) for label, c in
+                                   zip(SATISFACTION_LABELS, agg['likert']['satisfaction']) if c}
+    for name in ('action_plan', 'recommend'):
+        if name in agg['categories']:
+            answers[name] = {k: v for k, v in agg['categories'][name].items() if v}
+    return with_segment(record, seg, cube.topics, answers)
+
+# ── Validated sessions ────────────────────────────────────────────────────────
+# Each session's file(s) are checked against the schema for its dashboard type
+# (session_schema.py) once per data version. Standard and health sessions come
+# back as SessionRecords; a bad file raises SchemaError before anything renders.
+@st.cache_resource
+def session_record(initiative, session):
+    info = INITIATIVES[initiative]['sessions'][session]
+    if info.get('sources'):
+        data = [load_data(f) for f in info['sources']]
+        if any(d is None for d in data):
+            return None
+    else:
+        data = load_data(info['data_file'])
+        if data is None:
+            return None
+    return parse_session(info, data)
+
+@st.cache_resource
+def registry_problems():
+    """Every registered session validated once per process: {(initiative, session): problem}."""
+    problems = {}
+    for initiative, info in INITIATIVES.items():
+        for session in info['sessions']:
+            try:
+                session_record(initiative, session)
+            except SchemaError as e:
+                problems[(initiative, session)] = str(e)
+                print(f"[session schema] {initiative}/{session}: {e}", file=sys.stderr)
+    return problems
+
+# ── Portfolio trends ──────────────────────────────────────────────────────────
+# Initiatives with two or more KPI dashboards (standard / health) also get a
+# trend page across their sessions. The series comes from portfolio.py's
+# on-disk index, so building it reads only files that changed since the last
+# build; it is then cached here until the watcher sees one of them change.
+PORTFOLIO = "📈 Portfolio Trends"
+
+@st.cache_resource
+def portfolio_series(initiative):
+    return build_portfolio(kpi_sessions(INITIATIVES[initiative]))
+
+# ── Data file watcher ─────────────────────────────────────────────────────────
+# One background thread per process watches every data file and respondent
+# store in the registry. When one's content changes only its own cache entries
+# are dropped: the next viewer of that session reloads it, every other session
+# stays warm, and nobody has to restart the app after a file is overwritten.
+DATA_WATCH_SECONDS = 2
+
+def forget_session(initiative, session):
+    def forget(path):
+        SHARED_DATA.reload(path)
+        session_record.clear(initiative, session)
+        registry_problems.clear()
+        portfolio_series.clear(initiative)
+    return forget
+
+def forget_store(columns_json):
+    path = os.path.dirname(columns_json)
+    load_respondents.clear(path)
+    segment_cube.clear(path)
+
+def data_files(session):
+    return [path for path in [session.get('data_file')] + list(session.get('sources', [])) if path]
+
+def watch_session(watcher, initiative, name, session, before=None):
+    """Watch a session's files, skipping those its previous registry entry (`before`) already had."""
+    before = before or {}
+    for path in data_files(session):
+        if path not in data_files(before):
+            watcher.watch(path, forget_session(initiative, name))
+    store = session.get('respondents')
+    if store and store != before.get('respondents'):
+        watcher.watch(os.path.join(store, "columns.json"), forget_store)
+
+@st.cache_resource
+def data_file_watcher():
+    watcher = FileWatcher(DATA_WATCH_SECONDS)
+    for initiative, info in INITIATIVES.items():
+        for name, session in info['sessions'].items():
+            watch_session(watcher, initiative, name, session)
+    return watcher.start()
+
+# ── Registry reloads ──────────────────────────────────────────────────────────
+# registry.json is watched as well. When registry.py publishes an edit, only
+# the sessions it added, removed or changed lose their cached records, and
+# their new files are watched. Connected viewers keep their sessions; one
+# whose session was removed goes back to the nearest screen that still exists.
+def registry_reloaded(watcher):
+    def reloaded(old, new, changed):
+        for initiative, name in changed:
+            session_record.clear(initiative, name)
+            portfolio_series.clear(initiative)
+            session = new.get(initiative, {}).get('sessions', {}).get(name)
+            if session is not None:
+                watch_session(watcher, initiative, name, session,
+                              old.get(initiative, {}).get('sessions', {}).get(name))
+        registry_problems.clear()
+    return reloaded
+
+@st.cache_resource
+def registry_watcher():
+    REGISTRY.subscribe(registry_reloaded(data_file_watcher()))
+    return REGISTRY.watch(DATA_WATCH_SECONDS)
+
+# ── Startup warm-up ───────────────────────────────────────────────────────────
+# Under `streamlit run`, the first script run after a deploy starts a
+# background thread and returns. The thread loads and validates every data
+# file in this process (registry_problems), then installs the figures that
+# warmup.py's process pool built for every session into this process's figure
+# cache, logging each session's warm-up time to stderr. The per-type tallies
+# (*_static) are still built by each session's first viewer, at about 1 ms
+# each. Headless runs (benchmark, snapshots, the warm-up workers themselves)
+# skip this and validate on first use.
+WARM_UP_ON_START = True
+
+@st.cache_resource
+def startup_warm_up():
+    if not WARM_UP_ON_START or not serving():
+        return None
+    sessions = [(i, s) for i, info in INITIATIVES.items() for s in info['sessions']]
+    return WarmUp(os.path.abspath(__file__), sessions, prepare=registry_problems).start()
+
+data_file_watcher()
+registry_watcher()
+startup_warm_up()
+
+# ── LNC sector files ──────────────────────────────────────────────────────────
+# The Health and Technology surveys word some options differently; the
+# cross-sector and combined dashboards compare them on these shared labels.
+LNC_BARRIERS = ["Starting\nconversations", "Finding\nrelevant people",
+                "Shyness /\nanxiety", "No specific\nbarrier"]
+LNC_BARRIER_LABELS = {
+    "Not knowing how to\nstart conversations": "Starting\nconversations",
+    "Difficulty finding\nrelevant people":     "Finding\nrelevant people",
+    "Shyness / anxiety":                       "Shyness /\nanxiety",
+    "Other":                                   "No specific\nbarrier",
+}
+LNC_HIGH_CONFIDENCE = ("Extremely confident", "Somewhat confident", "Very confident", "Confident",
+                       "Significantly\nimproved", "Slightly\nimproved")
+LNC_LOW_CONFIDENCE = ("Somewhat not confident", "Extremely not confident", "Unconfident", "Very unconfident")
+LNC_RECOMMEND = ("Highly recommend", "Very likely", "Likely")
+LNC_RECOMMEND_MODERATE = ("Slightly recommend",)
+LNC_POSITIVE_OUTCOME = ("Yes, definitely", "Possibly", "Very relevant", "Relevant")
+LNC_CONN_MIDPOINTS = {"1–2": 1.5, "3–5": 4, "6–9": 7.5, "10–12": 11, "12+": 13}
+LNC_HEARD_CHANNELS = ("WhatsApp", "Friend/colleague", "Snapchat", "LinkedIn", "Other")  # breaks count ties
+
+
+def lnc_weighted_avg(counts, n):
+    """Average connections per respondent, using each bucket's midpoint."""
+    return round(sum(LNC_CONN_MIDPOINTS[k] * v for k, v in counts.items()) / n, 1) if n else 0
+
+
+def lnc_sector(data):
+    """Sector-neutral summary of one LNC session file (pre/post tallies + respondent counts)."""
+    pre, post = data['pre'], data['post']
+    count = lambda d, labels: sum(d.get(k, 0) for k in labels)
+
+    def barriers(d):
+        canon = {LNC_BARRIER_LABELS.get(k, k): v for k, v in d.items()}
+        return {k: canon.get(k, 0) for k in LNC_BARRIERS}
+
+    # Health asked how confidence changed rather than re-asking it post-event
+    post_conf = post.get('confidence') or post.get('confidence_change', {})
+    outcomes  = post.get('career_opps') or post.get('relevance', {})
+    return dict(
+        n_pre  = data['respondents']['pre'],
+        n_post = data['respondents']['post'],
+        registration = pre['registration'],
+        format       = post['format_rating'],
+        heard_about  = pre['heard_about'],
+        conf_pre_high  = count(pre['confidence'], LNC_HIGH_CONFIDENCE),
+        conf_post_high = count(post_conf, LNC_HIGH_CONFIDENCE),
+        conf_post_low  = count(post_conf, LNC_LOW_CONFIDENCE),
+        atmosphere_pre_comfort    = pre['atmosphere']['Comfortable\n& friendly'],
+        atmosphere_post_comfort   = post['atmosphere']['Comfortable\n& friendly'],
+        atmosphere_pre_overwhelm  = pre['atmosphere']['A bit\noverwhelming'],
+        atmosphere_post_overwhelm = post['atmosphere']['A bit\noverwhelming'],
+        conn_target     = pre['conn_targets'],
+        linkedin_post   = post['linkedin_conns'],
+        meaningful_post = post['meaningful'],
+        nps_pre  = pre.get('nps'),
+        nps_post = post['nps'],
+        recommendation = post['recommendation'],
+        recommend      = count(post['recommendation'], LNC_RECOMMEND),
+        recommend_moderate = count(post['recommendation'], LNC_RECOMMEND_MODERATE),
+        outcome        = count(outcomes, LNC_POSITIVE_OUTCOME),
+        barriers_pre   = barriers(pre['barriers']),
+        barriers_post  = barriers(post['barriers_overcome']),
+    )
+
+
+def lnc_aggregate(summaries):
+    """Merge lnc_sector() summaries from any number of sessions into one.
+
+    Counts are summed; category dicts are aligned on the union of their keys
+    (first-seen order). Questions a session did not ask (None) are skipped.
+    """
+    merged = {}
+    for key in summaries[0]:
+        values = [s[key] for s in summaries if s.get(key) is not None]
+        if not values:
+            merged[key] = None
+        elif isinstance(values[0], dict):
+            labels = dict.fromkeys(label for v in values for label in v)
+            merged[key] = {label: sum(v.get(label, 0) for v in values) for label in labels}
+        else:
+            merged[key] = sum(values)
+    return merged
+
+
+# ── LNC session comparison ────────────────────────────────────────────────────
+LNC_SESSION_TYPES = ('lnc', 'lnc_tech')
+
+# metric key -> (label, numerator, respondent base)
+LNC_COMPARE_RATES = {
+    'registration_pct': ("Registration Excellent %", lambda s: s['registration'].get('Excellent', 0), 'n_pre'),
+    'format_pct':       ("Format Excellent %",       lambda s: s['format'].get('Excellent', 0),       'n_post'),
+    'conf_pre_pct':     ("Pre Confidence %",         lambda s: s['conf_pre_high'],                    'n_pre'),
+    'conf_post_pct':    ("Post Confidence %",        lambda s: s['conf_post_high'],                   'n_post'),
+    'comfort_pre_pct':  ("Pre Comfort %",            lambda s: s['atmosphere_pre_comfort'],           'n_pre'),
+    'comfort_post_pct': ("Post Comfort %",           lambda s: s['atmosphere_post_comfort'],          'n_post'),
+    'recommend_pct':    ("Recommend %",              lambda s: s['recommend'],                        'n_post'),
+    'outcome_pct':      ("Career / Relevant Conns %", lambda s: s['outcome'],                         'n_post'),
+    'nps_post':         ("NPS Score",                lambda s: s['nps_post']['Promoters'] - s['nps_post']['Detractors'], 'n_post'),
+}
+# metric key -> (label, connection buckets averaged over post respondents)
+LNC_COMPARE_AVERAGES = {
+    'linkedin_avg':   ("Avg LinkedIn Conns",   'linkedin_post'),
+    'meaningful_avg': ("Avg Meaningful Conns", 'meaningful_post'),
+}
+
+
+@st.cache_resource(hash_funcs=HASH_FUNCS)
+def lnc_comparison(sources):
+    """Side-by-side metrics for LNC session files and every pairwise delta (once per data version).
+
+    `rates` is (metric × session) whole percentages, `averages` (metric × session)
+    midpoint averages; `deltas[m, a, b]` is session b minus session a for metric
+    m, over the rate metrics followed by the averages.
+    """
+    summaries = [lnc_sector(d) for d in sources]
+    rate_defs = list(LNC_COMPARE_RATES.values())
+    num  = np.array([[f(s) for s in summaries] for _, f, _ in rate_defs], dtype=float)
+    base = np.array([[s[n] for s in summaries] for _, _, n in rate_defs], dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates = np.nan_to_num(np.rint(num / base * 100)).astype(int)
+    averages = np.array([[lnc_weighted_avg(s[field], s['n_post']) for s in summaries]
+                         for _, field in LNC_COMPARE_AVERAGES.values()], dtype=float)
+    values = np.vstack([rates, averages])
+    return dict(
+        summaries = summaries,
+        rates     = rates,
+        averages  = averages,
+        metrics   = list(LNC_COMPARE_RATES) + list(LNC_COMPARE_AVERAGES),
+        labels    = [v[0] for v in rate_defs] + [v[0] for v in LNC_COMPARE_AVERAGES.values()],
+        deltas    = values[:, None, :] - values[:, :, None],
+    )
+
+
+def lnc_metric(table, key):
+    """One metric across every session in a comparison table, as plain Python numbers."""
+    if key in LNC_COMPARE_RATES:
+        return table['rates'][list(LNC_COMPARE_RATES).index(key)].tolist()
+    return table['averages'][list(LNC_COMPARE_AVERAGES).index(key)].tolist()
+
 # ============================================================================
 # SESSION MANAGEMENT
 # ============================================================================
 
+# The open screen lives in session state and is mirrored in the URL:
+#   ?initiative=Leaders+Network+Circles&session=Combined+Analysis
+#   ?initiative=Towards+the+Vision&view=trends       (portfolio trends)
+# A new browser session starts wherever its URL points, so a shared link
+# renders its dashboard in the first run. Buttons navigate through on_click
+# callbacks, which Streamlit runs before the script reruns, so a click costs
+# one run, never a run plus an st.rerun().
+TRENDS_VIEW = "trends"
+
+def valid_route(initiative, session):
+    """The screen itself if the registry still has it, else the nearest one that it does."""
+    if initiative not in INITIATIVES:
+        return None, None
+    info = INITIATIVES[initiative]
+    if session == PORTFOLIO:
+        return initiative, session if len(kpi_sessions(info)) >= 2 else None
+    return initiative, session if session in info['sessions'] else None
+
+def route_from_url(params):
+    """(initiative, session) named by the query string."""
+    session = PORTFOLIO if params.get("view") == TRENDS_VIEW else params.get("session")
+    return valid_route(params.get("initiative"), session)
+
+def sync_url(initiative, session):
+    """Point the query string at a screen, leaving unrelated params (e.g. ?profile=1) alone."""
+    route = {"initiative": initiative,
+             "session": session if session != PORTFOLIO else None,
+             "view": TRENDS_VIEW if session == PORTFOLIO else None}
+    for key, value in route.items():
+        if value is None:
+            st.query_params.pop(key, None)
+        elif st.query_params.get(key) != value:
+            st.query_params[key] = value
+
+def navigate(initiative=None, session=None):
+    """on_click callback: open a screen."""
+    st.session_state.selected_initiative = initiative
+    st.session_state.selected_session = session
+
 if 'selected_initiative' not in st.session_state:
-    st.session_state.selected_initiative = None
+    navigate(*route_from_url(st.query_params))
 if 'selected_session' not in st.session_state:
     st.session_state.selected_session = None
+screen = (st.session_state.selected_initiative, st.session_state.selected_session)
+if valid_route(*screen) != screen:  # removed by a registry reload
+    navigate(*valid_route(*screen))
+sync_url(st.session_state.selected_initiative, st.session_state.selected_session)
 
 # ============================================================================
 # INITIATIVE SELECTION SCREEN
 # ============================================================================
 
 if st.session_state.selected_initiative is None:
-    try:
-        st.image("sls_image.jpg", use_column_width=True)
-    except:
-        pass
+    show_header_image()
     
     st.markdown("""
     <div class="sls-header">
@@ -745,14 +1125,13 @@ if st.session_state.selected_initiative is None:
     cols = st.columns(len(INITIATIVES))
     for idx, (initiative_key, initiative_info) in enumerate(INITIATIVES.items()):
         with cols[idx]:
-            if st.button(
+            st.button(
                 f"{initiative_info['icon']} {initiative_key}",
                 key=f"btn_init_{initiative_key}",
                 use_container_width=True,
-                type="primary"
-            ):
-                st.session_state.selected_initiative = initiative_key
-                st.rerun()
+                type="primary",
+                on_click=navigate, args=(initiative_key,)
+            )
             st.markdown(f"""
             <div class="session-card">
                 <div class="session-icon">{initiative_info['icon']}</div>
@@ -770,10 +1149,7 @@ if st.session_state.selected_session is None:
     initiative_key = st.session_state.selected_initiative
     initiative_info = INITIATIVES[initiative_key]
     
-    try:
-        st.image("sls_image.jpg", use_column_width=True)
-    except:
-        pass
+    show_header_image()
     
     st.markdown(f"""
     <div class="sls-header">
@@ -782,21 +1158,21 @@ if st.session_state.selected_session is None:
     </div>
     """, unsafe_allow_html=True)
     
-    if st.button("← Back to Initiatives", type="secondary"):
-        st.session_state.selected_initiative = None
-        st.rerun()
+    st.button("← Back to Initiatives", type="secondary", on_click=navigate)
     
     st.markdown('<p class="section-title">📚 Select a Session</p>', unsafe_allow_html=True)
     
     sessions = initiative_info['sessions']
+    for (problem_initiative, problem_session), problem in registry_problems().items():
+        if problem_initiative == initiative_key:
+            st.error(f"⚠️ **{problem_session}** data file failed validation: {problem}")
     cols = st.columns(min(len(sessions), 3))
     for idx, (session_key, session_info) in enumerate(sessions.items()):
         col_idx = idx % 3
         with cols[col_idx]:
-            if st.button(f"{session_info['icon']} {session_key}", key=f"btn_{session_key}",
-                         use_container_width=True, type="primary"):
-                st.session_state.selected_session = session_key
-                st.rerun()
+            st.button(f"{session_info['icon']} {session_key}", key=f"btn_{session_key}",
+                      use_container_width=True, type="primary",
+                      on_click=navigate, args=(initiative_key, session_key))
             st.markdown(f"""
             <div class="session-card">
                 <div class="session-icon">{session_info['icon']}</div>
@@ -804,113 +1180,102 @@ if st.session_state.selected_session is None:
                 <p class="session-theme">{session_info['vision_theme']}</p>
             </div>
             """, unsafe_allow_html=True)
+    n_kpi = len(kpi_sessions(initiative_info))
+    if n_kpi >= 2:
+        st.markdown('<p class="section-title">📈 Across Sessions</p>', unsafe_allow_html=True)
+        st.button(f"{PORTFOLIO} — {n_kpi} sessions over time", key=f"portfolio_{initiative_key}",
+                  use_container_width=True, type="primary",
+                  on_click=navigate, args=(initiative_key, PORTFOLIO))
     st.stop()
 
 # ============================================================================
-# LOAD SELECTED SESSION
+# PORTFOLIO TRENDS
 # ============================================================================
 
-selected_initiative = st.session_state.selected_initiative
-selected_session    = st.session_state.selected_session
-initiative_info     = INITIATIVES[selected_initiative]
-session_info        = initiative_info['sessions'][selected_session]
-
-try:
-    st.image("sls_image.jpg", use_column_width=True)
-except:
-    pass
-
-# ─── Header (LNC gets its own navy header) ───────────────────────────────────
-if session_info.get('type') == 'lnc':
-    st.markdown(f"""
-    <div class="lnc-header">
-        <h1 class="initiative-title">🔗 Leaders Network Circles</h1>
-        <p class="initiative-subtitle">Saudi Leadership Society — Australia Chapter</p>
-        <div style="text-align:center; margin-top:1.2rem; position:relative; z-index:1;">
-            <span class="circle-badge circle-growth">🌱 Growth</span>
-            <span class="circle-badge circle-connect">🤝 Connection</span>
-            <span class="circle-badge circle-impact">💥 Impact</span>
-        </div>
-        <div style="text-align:center; margin-top:1rem;">
-            <span class="mission-tagline">Health Sector — Session 1</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-else:
+def render_portfolio(initiative):
+    """Satisfaction, growth, match rate and NPS across an initiative's sessions, by generated date."""
+    initiative_info = INITIATIVES[initiative]
+    series = portfolio_series(initiative)
+    show_header_image()
+    span = (f"{str(series.dates[0])[:10]} → {str(series.dates[-1])[:10]}" if len(series) else "no dated sessions")
     st.markdown(f"""
     <div class="sls-header">
-        <h1 class="initiative-title">{session_info["icon"]} {selected_session}</h1>
-        <p class="initiative-subtitle">{initiative_info['name']} • {session_info['vision_theme']}</p>
+        <h1 class="initiative-title">{PORTFOLIO}</h1>
+        <p class="initiative-subtitle">{initiative_info['name']} • {len(series)} sessions • {span}</p>
     </div>
     """, unsafe_allow_html=True)
+    col1, col2 = st.columns([1, 5])
+    with col1:
+        st.button("← Back", type="secondary", on_click=navigate, args=(initiative,))
+    for name in series.undated:
+        st.warning(f"⚠️ **{name}** is left out: its file is missing or has no `metadata.generated_date`.")
+    if not len(series):
+        st.stop()
 
-col1, col2 = st.columns([1, 5])
-with col1:
-    if st.button("← Back", type="secondary"):
-        st.session_state.selected_session = None
-        st.rerun()
+    st.markdown('<p class="section-title">📊 Latest Results</p>', unsafe_allow_html=True)
+    for col, (kpi, (label, unit)) in zip(st.columns(len(KPIS)), KPIS.items()):
+        value, session = series.latest(kpi)
+        change = series.change(kpi)
+        with col:
+            st.markdown(create_kpi_card(
+                "TREND", label, "—" if value is None else f"{value:g}{unit}",
+                f"Latest: {session}" if session else "Not reported yet",
+                "" if change is None else f"{'✓' if change >= 0 else '▼'} {change:+g}{unit} since first session",
+                warn=change is not None and change < 0), unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">📈 Trends by Generated Date</p>', unsafe_allow_html=True)
+    dates = [str(d).replace('T', ' ') for d in series.dates]
+    kpis = list(KPIS.items())
+    for row in range(0, len(kpis), 2):
+        for col, (kpi, (label, unit)) in zip(st.columns(2), kpis[row:row + 2]):
+            values = [None if np.isnan(v) else float(v) for v in series.kpis[kpi]]
+            fig = lnc_figure(
+                [dict(type='scatter', mode='lines+markers+text', x=dates, y=values, text=series.sessions,
+                      textposition='top center', textfont=dict(size=10, color='#6c757d'), connectgaps=True,
+                      line=dict(color='#006341', width=2.5), marker=dict(size=9, color='#93c13f'),
+                      hovertemplate=f"%{{text}}<br>%{{x|%d %b %Y}}<br>{label}: %{{y}}{unit}<extra></extra>")],
+                dict(title=dict(text=label, font=dict(family="Cormorant Garamond", size=20)),
+                     height=320, font=dict(family="Epilogue", color="#2c3e50"), showlegend=False,
+                     plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                     xaxis=dict(type='date', tickformat='%b %Y'), margin=dict(l=20, r=20, t=50, b=20)))
+            with col:
+                st.plotly_chart(fig, use_container_width=True)
+    st.caption("NPS uses the 5-point recommend question: “Very likely” promotes, “Likely” is passive, "
+               "the rest detract. Gaps are sessions that didn't ask that question.")
 
-# Only load JSON for non-LNC sessions
-data = None
-if session_info.get('type') not in ('lnc', 'lnc_tech', 'lnc_cross', 'lnc_combined', 'leaders_accelerator'):
-    data = load_data(session_info['data_file'])
-    if data is None:
-        st.error("Could not load data.")
-        st.stop()
+    with st.expander("📋 All sessions"):
+        st.dataframe(series.table(), use_container_width=True, hide_index=True)
 
+if st.session_state.selected_session == PORTFOLIO:
+    render_portfolio(st.session_state.selected_initiative)
+    st.stop()
 
 # ============================================================================
 # LNC TECHNOLOGY SECTOR DASHBOARD
 # ============================================================================
 
-if session_info.get('type') == 'lnc_tech':
-
-    N = 22  # post-survey respondents (used as base for post metrics)
-    N_pre = 24  # pre-survey respondents
-
-    pre = dict(
-        heard_about={"Snapchat": 3, "LinkedIn": 1, "WhatsApp": 14,
-                     "Friend/colleague": 3, "Other": 3},
-        registration={"Excellent": 12, "Good": 11, "Fair": 0, "Poor": 1},
-        connection_types={"Professional network\n(tech sector)": 19,
-                          "Cross-sector\nconnections": 4,
-                          "Mentorship": 10,
-                          "Collaboration\npartners": 9,
-                          "Curious / no target": 4},
-        confidence={"Very confident": 8, "Confident": 9, "Neutral": 4,
-                    "Unconfident": 2, "Very unconfident": 1},
-        barriers={"Starting\nconversations": 8, "Finding\nrelevant people": 8,
-                  "Shyness /\nanxiety": 1, "No specific\nbarrier": 7},
-        conn_targets={"1–2": 6, "3–5": 9, "6–9": 3, "10–12": 2, "12+": 4},
-        atmosphere={"Comfortable\n& friendly": 20, "Professional &\nwell-organized": 15,
-                    "A bit\noverwhelming": 2, "Hard to\nconnect": 0,
-                    "Casual & not\norganized": 1},
-    )
-
-    post = dict(
-        format_rating={"Excellent": 19, "Good": 2, "Fair": 1, "Poor": 0},
-        linkedin_conns={"1–2": 1, "3–5": 2, "6–9": 12, "10–12": 5, "12+": 2},
-        meaningful={"1–2": 4, "3–5": 8, "6–9": 8, "10–12": 2, "12+": 0},
-        connection_types={"Professional network\n(tech sector)": 21,
-                          "Cross-sector\nconnections": 12,
-                          "Mentorship": 3,
-                          "Collaboration\npartners": 6,
-                          "No connection\nmade": 0},
-        relevance={"Very relevant": 10, "Relevant": 9, "Neutral": 3,
-                   "Irrelevant": 0, "Very irrelevant": 0},
-        confidence={"Very confident": 15, "Confident": 4, "Neutral": 3,
-                    "Unconfident": 0, "Very unconfident": 0},
-        barriers_overcome={"Starting\nconversations": 10, "Finding\nrelevant people": 5,
-                           "Shyness /\nanxiety": 1, "No specific\nbarrier": 6},
-        discussion_questions={"Very helpful": 12, "Helpful": 9, "Neutral": 0,
-                              "Unhelpful": 0, "Very unhelpful": 1},
-        atmosphere={"Comfortable\n& friendly": 20, "Professional &\nwell-organized": 16,
-                    "A bit\noverwhelming": 0, "Hard to\nconnect": 0,
-                    "Casual & not\norganized": 1},
-        recommendation={"Very likely": 20, "Likely": 2, "Neutral": 0,
-                        "Unlikely": 0, "Very unlikely": 0},
-        nps={"Promoters": 15, "Passives": 5, "Detractors": 2},
-    )
+@dataclass(frozen=True, slots=True)
+class LncTechTallies:
+    """Technology session tallies read by render_lnc_tech."""
+    N: int
+    N_pre: int
+    pre: dict
+    post: dict
+    nps_score: int
+    conf_pre_high: int
+    conf_post_high: int
+    relevant_pct: int
+    recommend_pct: int
+    format_excel_pct: int
+    discussion_help: int
+
+
+@st.cache_resource(hash_funcs=HASH_FUNCS)
+def lnc_tech_static(data):
+    """Technology session tallies and headline rates (computed once per data version)."""
+    N = data['respondents']['post']     # post-survey respondents (used as base for post metrics)
+    N_pre = data['respondents']['pre']  # pre-survey respondents
+    pre, post = data['pre'], data['post']
 
     # Derived numbers
     nps_score       = round((post['nps']['Promoters'] - post['nps']['Detractors']) / N * 100)
@@ -921,6 +1286,16 @@ if session_info.get('type') == 'lnc_tech':
     format_excel_pct= round(post['format_rating']['Excellent'] / N * 100)
     discussion_help = round((post['discussion_questions']['Very helpful'] + post['discussion_questions']['Helpful']) / N * 100)
 
+    return LncTechTallies(N=N, N_pre=N_pre, pre=pre, post=post, nps_score=nps_score,
+                          conf_pre_high=conf_pre_high, conf_post_high=conf_post_high,
+                          relevant_pct=relevant_pct, recommend_pct=recommend_pct,
+                          format_excel_pct=format_excel_pct, discussion_help=discussion_help)
+
+
+def render_lnc_tech(selected_session, initiative_info, session_info, data):
+    """LNC Technology Sector dashboard."""
+    t = lnc_tech_static(data)
+
     # ── HEADER ────────────────────────────────────────────────────────────────
     st.markdown(f"""
     <div class="lnc-header">
@@ -941,12 +1316,12 @@ if session_info.get('type') == 'lnc_tech':
     st.markdown(f"""
     <div class="lnc-highlight-box" style="padding:2rem;">
         <div style="display:flex; flex-wrap:wrap; justify-content:center; gap:0.5rem; position:relative; z-index:1;">
-            <div class="stat-pill"><span class="num">{N_pre}</span><span class="lbl">Pre-survey</span></div>
-            <div class="stat-pill"><span class="num">{N}</span><span class="lbl">Post-survey</span></div>
-            <div class="stat-pill"><span class="num">{format_excel_pct}%</span><span class="lbl">Excellent format</span></div>
-            <div class="stat-pill"><span class="num">{relevant_pct}%</span><span class="lbl">Relevant connections</span></div>
-            <div class="stat-pill"><span class="num">{nps_score}</span><span class="lbl">NPS score</span></div>
-            <div class="stat-pill"><span class="num">{recommend_pct}%</span><span class="lbl">Recommend</span></div>
+            <div class="stat-pill"><span class="num">{t.N_pre}</span><span class="lbl">Pre-survey</span></div>
+            <div class="stat-pill"><span class="num">{t.N}</span><span class="lbl">Post-survey</span></div>
+            <div class="stat-pill"><span class="num">{t.format_excel_pct}%</span><span class="lbl">Excellent format</span></div>
+            <div class="stat-pill"><span class="num">{t.relevant_pct}%</span><span class="lbl">Relevant connections</span></div>
+            <div class="stat-pill"><span class="num">{t.nps_score}</span><span class="lbl">NPS score</span></div>
+            <div class="stat-pill"><span class="num">{t.recommend_pct}%</span><span class="lbl">Recommend</span></div>
         </div>
     </div>
     """, unsafe_allow_html=True)
@@ -958,58 +1333,58 @@ if session_info.get('type') == 'lnc_tech':
     c1, c2, c3 = st.columns(3)
     with c1:
         st.markdown(create_kpi_card("REACH", "Participants Surveyed",
-            f"{N_pre} / {N}",
-            f"{N_pre} pre-event · {N} post-event respondents",
+            f"{t.N_pre} / {t.N}",
+            f"{t.N_pre} pre-event · {t.N} post-event respondents",
             "✓ Strong survey participation"), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card("FORMAT", "Circle Format — Excellent",
-            f"{format_excel_pct}%",
-            f"{post['format_rating']['Excellent']} of {N} rated the circle format Excellent",
+            f"{t.format_excel_pct}%",
+            f"{t.post['format_rating']['Excellent']} of {t.N} rated the circle format Excellent",
             "✓ Innovative rotation format"), unsafe_allow_html=True)
     with c3:
-        reg_excel = round(pre['registration']['Excellent'] / N_pre * 100)
+        reg_excel = round(t.pre['registration']['Excellent'] / t.N_pre * 100)
         st.markdown(create_kpi_card("ONBOARDING", "Registration — Excellent",
             f"{reg_excel}%",
-            f"{pre['registration']['Excellent']} of {N_pre} rated registration Excellent",
+            f"{t.pre['registration']['Excellent']} of {t.N_pre} rated registration Excellent",
             "✓ Smooth onboarding"), unsafe_allow_html=True)
 
     st.markdown('<p class="subsection-title">Networking Outcomes</p>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     with c1:
-        conf_lift = conf_post_high - conf_pre_high
+        conf_lift = t.conf_post_high - t.conf_pre_high
         st.markdown(create_kpi_card("CONFIDENCE", "High Confidence — Post-Event",
-            f"{round(conf_post_high / N * 100)}%",
-            f"{conf_post_high} felt Very Confident or Confident after the event",
+            f"{round(t.conf_post_high / t.N * 100)}%",
+            f"{t.conf_post_high} felt Very Confident or Confident after the event",
             f"✓ +{conf_lift} participants vs pre-event"), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card("RELEVANCE", "Relevant Connections Made",
-            f"{relevant_pct}%",
+            f"{t.relevant_pct}%",
             f"Rated connections as Relevant or Very Relevant to their goals",
             "✓ High-quality networking"), unsafe_allow_html=True)
     with c3:
-        discuss_count = post['discussion_questions']['Very helpful'] + post['discussion_questions']['Helpful']
+        discuss_count = t.post['discussion_questions']['Very helpful'] + t.post['discussion_questions']['Helpful']
         st.markdown(create_kpi_card("DISCUSSION", "Discussion Questions Helpful",
-            f"{discussion_help}%",
-            f"{discuss_count} of {N} found discussion questions Very Helpful or Helpful",
+            f"{t.discussion_help}%",
+            f"{discuss_count} of {t.N} found discussion questions Very Helpful or Helpful",
             "✓ Strong facilitation design"), unsafe_allow_html=True)
 
     st.markdown('<p class="subsection-title">Satisfaction & Advocacy</p>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     with c1:
-        comfort_pct = round(post['atmosphere']['Comfortable\n& friendly'] / N * 100)
+        comfort_pct = round(t.post['atmosphere']['Comfortable\n& friendly'] / t.N * 100)
         st.markdown(create_kpi_card("ATMOSPHERE", "Comfortable Atmosphere",
             f"{comfort_pct}%",
-            f"{post['atmosphere']['Comfortable\n& friendly']} of {N} felt comfortable & friendly",
+            f"{t.post['atmosphere']['Comfortable\n& friendly']} of {t.N} felt comfortable & friendly",
             "✓ 0% found it overwhelming"), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card("NPS", "Net Promoter Score",
-            str(nps_score),
-            f"Promoters: {post['nps']['Promoters']} · Passives: {post['nps']['Passives']} · Detractors: {post['nps']['Detractors']}",
+            str(t.nps_score),
+            f"Promoters: {t.post['nps']['Promoters']} · Passives: {t.post['nps']['Passives']} · Detractors: {t.post['nps']['Detractors']}",
             "✓ Strong advocacy"), unsafe_allow_html=True)
     with c3:
         st.markdown(create_kpi_card("ADVOCACY", "Would Recommend",
-            f"{recommend_pct}%",
-            f"{post['recommendation']['Very likely']} Very Likely + {post['recommendation']['Likely']} Likely",
+            f"{t.recommend_pct}%",
+            f"{t.post['recommendation']['Very likely']} Very Likely + {t.post['recommendation']['Likely']} Likely",
             "✓ Outstanding word-of-mouth"), unsafe_allow_html=True)
 
     # ── HIGHLIGHT BOX ──────────────────────────────────────────────────────────
@@ -1017,12 +1392,12 @@ if session_info.get('type') == 'lnc_tech':
     <div class="lnc-highlight-box">
         <h3>✨ Technology Sector Session — Highlights</h3>
         <ul>
-            <li>{format_excel_pct}% rated the circle-rotation format as <strong>Excellent</strong></li>
+            <li>{t.format_excel_pct}% rated the circle-rotation format as <strong>Excellent</strong></li>
             <li>Professional tech-sector network goal <em>exceeded</em>: 19 aimed → 21 achieved</li>
             <li>Overwhelming atmosphere dropped from <strong>2 → 0 participants</strong> post-event</li>
-            <li>Discussion questions rated helpful by <strong>{discussion_help}%</strong> of participants</li>
-            <li>Confidence in networking: <strong>{round(conf_pre_high/N_pre*100)}% → {round(conf_post_high/N*100)}%</strong> (Very Confident + Confident)</li>
-            <li>{relevant_pct}% found connections <strong>relevant or very relevant</strong> to their goals</li>
+            <li>Discussion questions rated helpful by <strong>{t.discussion_help}%</strong> of participants</li>
+            <li>Confidence in networking: <strong>{round(t.conf_pre_high/t.N_pre*100)}% → {round(t.conf_post_high/t.N*100)}%</strong> (Very Confident + Confident)</li>
+            <li>{t.relevant_pct}% found connections <strong>relevant or very relevant</strong> to their goals</li>
         </ul>
     </div>
     """, unsafe_allow_html=True)
@@ -1031,243 +1406,250 @@ if session_info.get('type') == 'lnc_tech':
     st.markdown("---")
     st.markdown('<p class="section-title">📚 Deep-Dive Analysis</p>', unsafe_allow_html=True)
 
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🌐 Experience", "🤝 Connections & Goals", "💼 Outcomes", "🔄 Pre vs Post"
-    ])
-
-    # ── TAB 1: EXPERIENCE ──────────────────────────────────────────────────────
-    with tab1:
-        st.markdown("### Circle Format Rating (Post-Event)")
-        c1, c2 = st.columns(2)
-        with c1:
-            fig = lnc_donut(
-                list(post['format_rating'].keys()),
-                list(post['format_rating'].values()),
-                ['#0d3b6e', '#378add', '#85B7EB', '#e74c3c'],
-                center_text="Format\nRating"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("### Discussion Questions Helpfulness")
-            fig = lnc_bar(
-                list(post['discussion_questions'].keys()),
-                list(post['discussion_questions'].values()),
-                ['#006341', '#00843d', '#93c13f', '#e9ecef', '#e74c3c'],
-                height=320, v_range=[0, 15]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Event Atmosphere — Before vs After")
-        st.markdown(compare_band(
-            round(pre['atmosphere']['Comfortable\n& friendly'] / N_pre * 100),
-            round(post['atmosphere']['Comfortable\n& friendly'] / N * 100),
-            f"{pre['atmosphere']['Comfortable\n& friendly']} felt comfortable (pre)",
-            f"{post['atmosphere']['Comfortable\n& friendly']} felt comfortable (post)",
-            "#6b7280", "#0d3b6e", "%", "Comfortable & friendly"
-        ), unsafe_allow_html=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Atmosphere — Before vs After")
-            atm_labs = ["Comfortable\n& friendly", "Professional &\nwell-organized", "A bit\noverwhelming"]
-            fig = lnc_grouped_bar(
-                atm_labs,
-                [pre['atmosphere'][k] for k in atm_labs],
-                [post['atmosphere'][k] for k in atm_labs],
-                y_max=25
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Recommendation (Post-Event)")
-            fig = lnc_bar(
-                list(post['recommendation'].keys()),
-                list(post['recommendation'].values()),
-                ['#006341', '#00843d', '#93c13f', '#e9ecef', '#e74c3c'],
-                height=320, v_range=[0, 24]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 2: CONNECTIONS & GOALS ─────────────────────────────────────────────
-    with tab2:
-        st.markdown("### Connection Type — Intended vs Achieved")
-        st.markdown(compare_band(
-            19, 21,
-            "aimed to expand professional tech network",
-            "actually expanded professional tech network",
-            "#6b7280", "#0d3b6e", "", "Tech network goal exceeded"
-        ), unsafe_allow_html=True)
-
-        conn_labs = ["Professional network\n(tech sector)", "Cross-sector\nconnections",
-                     "Mentorship", "Collaboration\npartners"]
-        fig = lnc_grouped_bar(
-            conn_labs,
-            [pre['connection_types'][k] for k in conn_labs],
-            [post['connection_types'][k] for k in conn_labs],
-            y_max=25
-        )
-        fig.update_layout(title_text="Connection Goals: Intended (Pre) vs Achieved (Post)",
-            title_font=dict(family='Cormorant Garamond', size=18))
-        st.plotly_chart(fig, use_container_width=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Connection Target (Pre-Event)")
-            fig = lnc_bar(
-                list(pre['conn_targets'].keys()),
-                list(pre['conn_targets'].values()),
-                '#378add', height=300, v_range=[0, 12]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### LinkedIn Connections Made (Post-Event)")
-            fig = lnc_bar(
-                list(post['linkedin_conns'].keys()),
-                list(post['linkedin_conns'].values()),
-                '#0d3b6e', height=300, v_range=[0, 15]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Meaningful Connections Made (Post-Event)")
-            fig = lnc_bar(
-                list(post['meaningful'].keys()),
-                list(post['meaningful'].values()),
-                '#006341', height=300, v_range=[0, 12]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Connection Relevance to Goals")
-            fig = lnc_donut(
-                list(post['relevance'].keys()),
-                list(post['relevance'].values()),
-                ['#0d3b6e', '#378add', '#85B7EB', '#e9ecef', '#e74c3c'],
-                center_text="Relevance"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 3: OUTCOMES ────────────────────────────────────────────────────────
-    with tab3:
-        st.markdown("### Confidence Shift — Before vs After")
-        st.markdown(compare_band(
-            round(conf_pre_high / N_pre * 100),
-            round(conf_post_high / N * 100),
-            "were Very Confident or Confident pre-event",
-            "were Very Confident or Confident post-event",
-            "#6b7280", "#0d3b6e", "%", "Confidence improvement"
-        ), unsafe_allow_html=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Confidence — Before vs After")
-            conf_labs = ["Very confident", "Confident", "Neutral", "Unconfident", "Very unconfident"]
-            fig = lnc_grouped_bar(
-                conf_labs,
-                [pre['confidence'][k] for k in conf_labs],
-                [post['confidence'][k] for k in conf_labs],
-                y_max=18
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Barriers Overcome (Pre vs Post)")
-            bar_labs = ["Starting\nconversations", "Finding\nrelevant people",
-                        "Shyness /\nanxiety", "No specific\nbarrier"]
-            fig = lnc_grouped_bar(
-                [k.replace('\n', ' ') for k in bar_labs],
-                [pre['barriers'][k] for k in bar_labs],
-                [post['barriers_overcome'][k] for k in bar_labs],
-                pre_color='#d0d9e8', post_color='#0d3b6e',
-                y_max=14
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### NPS Breakdown")
-        nps_labs = ["Promoters", "Passives", "Detractors"]
-        fig = go.Figure(go.Bar(
-            x=nps_labs,
-            y=[post['nps'][k] for k in nps_labs],
-            marker_color=['#006341', '#f39c12', '#e74c3c'],
-            text=[post['nps'][k] for k in nps_labs],
-            textposition='outside',
-            textfont=dict(size=14, family='Epilogue')
-        ))
-        fig.update_layout(height=320, yaxis=dict(range=[0, 20]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 4: PRE vs POST ─────────────────────────────────────────────────────
-    with tab4:
-        st.markdown("### 🔄 Pre vs Post — Full Comparison")
-
-        metrics_compare = [
-            ("Comfortable atmosphere",
-             round(pre['atmosphere']['Comfortable\n& friendly'] / N_pre * 100),
-             round(post['atmosphere']['Comfortable\n& friendly'] / N * 100), "%"),
-            ("High confidence (Very + Confident)",
-             round(conf_pre_high / N_pre * 100),
-             round(conf_post_high / N * 100), "%"),
-            ("Professional tech network (intended/achieved)",
-             round(19 / N_pre * 100),
-             round(21 / N * 100), "%"),
-            ("Overwhelming atmosphere",
-             round(pre['atmosphere']['A bit\noverwhelming'] / N_pre * 100),
-             round(post['atmosphere']['A bit\noverwhelming'] / N * 100), "%"),
-        ]
-        labels_cmp = [m[0] for m in metrics_compare]
-        pre_cmp    = [m[1] for m in metrics_compare]
-        post_cmp   = [m[2] for m in metrics_compare]
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(name='Before Event', y=labels_cmp, x=pre_cmp,
-            orientation='h', marker_color='#d0d9e8',
-            text=[f"{v}%" for v in pre_cmp], textposition='outside'))
-        fig.add_trace(go.Bar(name='After Event', y=labels_cmp, x=post_cmp,
-            orientation='h', marker_color='#0d3b6e',
-            text=[f"{v}%" for v in post_cmp], textposition='outside'))
-        fig.update_layout(barmode='group', height=380, xaxis=dict(range=[0, 110]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
-            margin=dict(l=10, r=60, t=20, b=20))
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Radar — Experience Profile")
-        radar_dims = ["Comfortable\natmosphere", "Excellent\nformat", "High\nconfidence",
-                      "Relevant\nconnections", "Would\nrecommend", "Discussion\nhelpful"]
-        radar_pre  = [
-            round(pre['atmosphere']['Comfortable\n& friendly'] / N_pre * 100),
-            0,
-            round(conf_pre_high / N_pre * 100),
-            0, 0, 0
-        ]
-        radar_post = [
-            round(post['atmosphere']['Comfortable\n& friendly'] / N * 100),
-            format_excel_pct,
-            round(conf_post_high / N * 100),
-            relevant_pct,
-            recommend_pct,
-            discussion_help,
-        ]
-        fig_r = go.Figure()
-        fig_r.add_trace(go.Scatterpolar(
-            r=radar_pre + [radar_pre[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='Before Event',
-            line_color='#adb5bd', fillcolor='rgba(173,181,189,0.15)', line_width=2))
-        fig_r.add_trace(go.Scatterpolar(
-            r=radar_post + [radar_post[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='After Event',
-            line_color='#0d3b6e', fillcolor='rgba(13,59,110,0.15)', line_width=2.5))
-        fig_r.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=10)),
-                       angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))),
-            showlegend=True, height=480, paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=-0.1, xanchor='center', x=0.5)
-        )
-        col_l, col_c, col_r = st.columns([1, 3, 1])
-        with col_c:
-            st.plotly_chart(fig_r, use_container_width=True)
+    @st.fragment
+    def dashboard_tabs():
+        tab1, tab2, tab3, tab4 = session_tabs(selected_session, [
+            "🌐 Experience", "🤝 Connections & Goals", "💼 Outcomes", "🔄 Pre vs Post"
+        ])
+
+        # ── TAB 1: EXPERIENCE ──────────────────────────────────────────────────────
+        with tab1:
+            if tab_open(tab1):
+                st.markdown("### Circle Format Rating (Post-Event)")
+                c1, c2 = st.columns(2)
+                with c1:
+                    fig = lnc_donut(
+                        list(t.post['format_rating'].keys()),
+                        list(t.post['format_rating'].values()),
+                        ['#0d3b6e', '#378add', '#85B7EB', '#e74c3c'],
+                        center_text="Format\nRating"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("### Discussion Questions Helpfulness")
+                    fig = lnc_bar(
+                        list(t.post['discussion_questions'].keys()),
+                        list(t.post['discussion_questions'].values()),
+                        ['#006341', '#00843d', '#93c13f', '#e9ecef', '#e74c3c'],
+                        height=320, v_range=[0, 15]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Event Atmosphere — Before vs After")
+                st.markdown(compare_band(
+                    round(t.pre['atmosphere']['Comfortable\n& friendly'] / t.N_pre * 100),
+                    round(t.post['atmosphere']['Comfortable\n& friendly'] / t.N * 100),
+                    f"{t.pre['atmosphere']['Comfortable\n& friendly']} felt comfortable (pre)",
+                    f"{t.post['atmosphere']['Comfortable\n& friendly']} felt comfortable (post)",
+                    "#6b7280", "#0d3b6e", "%", "Comfortable & friendly"
+                ), unsafe_allow_html=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Atmosphere — Before vs After")
+                    atm_labs = ["Comfortable\n& friendly", "Professional &\nwell-organized", "A bit\noverwhelming"]
+                    fig = lnc_grouped_bar(
+                        atm_labs,
+                        [t.pre['atmosphere'][k] for k in atm_labs],
+                        [t.post['atmosphere'][k] for k in atm_labs],
+                        y_max=25
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Recommendation (Post-Event)")
+                    fig = lnc_bar(
+                        list(t.post['recommendation'].keys()),
+                        list(t.post['recommendation'].values()),
+                        ['#006341', '#00843d', '#93c13f', '#e9ecef', '#e74c3c'],
+                        height=320, v_range=[0, 24]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 2: CONNECTIONS & GOALS ─────────────────────────────────────────────
+        with tab2:
+            if tab_open(tab2):
+                st.markdown("### Connection Type — Intended vs Achieved")
+                st.markdown(compare_band(
+                    19, 21,
+                    "aimed to expand professional tech network",
+                    "actually expanded professional tech network",
+                    "#6b7280", "#0d3b6e", "", "Tech network goal exceeded"
+                ), unsafe_allow_html=True)
+
+                conn_labs = ["Professional network\n(tech sector)", "Cross-sector\nconnections",
+                             "Mentorship", "Collaboration\npartners"]
+                fig = lnc_grouped_bar(
+                    conn_labs,
+                    [t.pre['connection_types'][k] for k in conn_labs],
+                    [t.post['connection_types'][k] for k in conn_labs],
+                    y_max=25,
+                    layout=dict(title_text="Connection Goals: Intended (Pre) vs Achieved (Post)",
+                                title_font=dict(family='Cormorant Garamond', size=18))
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Connection Target (Pre-Event)")
+                    fig = lnc_bar(
+                        list(t.pre['conn_targets'].keys()),
+                        list(t.pre['conn_targets'].values()),
+                        '#378add', height=300, v_range=[0, 12]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### LinkedIn Connections Made (Post-Event)")
+                    fig = lnc_bar(
+                        list(t.post['linkedin_conns'].keys()),
+                        list(t.post['linkedin_conns'].values()),
+                        '#0d3b6e', height=300, v_range=[0, 15]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Meaningful Connections Made (Post-Event)")
+                    fig = lnc_bar(
+                        list(t.post['meaningful'].keys()),
+                        list(t.post['meaningful'].values()),
+                        '#006341', height=300, v_range=[0, 12]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Connection Relevance to Goals")
+                    fig = lnc_donut(
+                        list(t.post['relevance'].keys()),
+                        list(t.post['relevance'].values()),
+                        ['#0d3b6e', '#378add', '#85B7EB', '#e9ecef', '#e74c3c'],
+                        center_text="Relevance"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 3: OUTCOMES ────────────────────────────────────────────────────────
+        with tab3:
+            if tab_open(tab3):
+                st.markdown("### Confidence Shift — Before vs After")
+                st.markdown(compare_band(
+                    round(t.conf_pre_high / t.N_pre * 100),
+                    round(t.conf_post_high / t.N * 100),
+                    "were Very Confident or Confident pre-event",
+                    "were Very Confident or Confident post-event",
+                    "#6b7280", "#0d3b6e", "%", "Confidence improvement"
+                ), unsafe_allow_html=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Confidence — Before vs After")
+                    conf_labs = ["Very confident", "Confident", "Neutral", "Unconfident", "Very unconfident"]
+                    fig = lnc_grouped_bar(
+                        conf_labs,
+                        [t.pre['confidence'][k] for k in conf_labs],
+                        [t.post['confidence'][k] for k in conf_labs],
+                        y_max=18
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Barriers Overcome (Pre vs Post)")
+                    bar_labs = ["Starting\nconversations", "Finding\nrelevant people",
+                                "Shyness /\nanxiety", "No specific\nbarrier"]
+                    fig = lnc_grouped_bar(
+                        [k.replace('\n', ' ') for k in bar_labs],
+                        [t.pre['barriers'][k] for k in bar_labs],
+                        [t.post['barriers_overcome'][k] for k in bar_labs],
+                        pre_color='#d0d9e8', post_color='#0d3b6e',
+                        y_max=14
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### NPS Breakdown")
+                nps_labs = ["Promoters", "Passives", "Detractors"]
+                fig = lnc_figure(
+                    [dict(type='bar',
+                        x=nps_labs,
+                        y=[t.post['nps'][k] for k in nps_labs],
+                        marker_color=['#006341', '#f39c12', '#e74c3c'],
+                        text=[t.post['nps'][k] for k in nps_labs],
+                        textposition='outside',
+                        textfont=dict(size=14, family='Epilogue'))],
+                    dict(height=320, yaxis=dict(range=[0, 20]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        showlegend=False))
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 4: PRE vs POST ─────────────────────────────────────────────────────
+        with tab4:
+            if tab_open(tab4):
+                st.markdown("### 🔄 Pre vs Post — Full Comparison")
+
+                metrics_compare = [
+                    ("Comfortable atmosphere",
+                     round(t.pre['atmosphere']['Comfortable\n& friendly'] / t.N_pre * 100),
+                     round(t.post['atmosphere']['Comfortable\n& friendly'] / t.N * 100), "%"),
+                    ("High confidence (Very + Confident)",
+                     round(t.conf_pre_high / t.N_pre * 100),
+                     round(t.conf_post_high / t.N * 100), "%"),
+                    ("Professional tech network (intended/achieved)",
+                     round(19 / t.N_pre * 100),
+                     round(21 / t.N * 100), "%"),
+                    ("Overwhelming atmosphere",
+                     round(t.pre['atmosphere']['A bit\noverwhelming'] / t.N_pre * 100),
+                     round(t.post['atmosphere']['A bit\noverwhelming'] / t.N * 100), "%"),
+                ]
+                labels_cmp = [m[0] for m in metrics_compare]
+                pre_cmp    = [m[1] for m in metrics_compare]
+                post_cmp   = [m[2] for m in metrics_compare]
+
+                fig = lnc_figure(
+                    [dict(type='bar', name='Before Event', y=labels_cmp, x=pre_cmp,
+                        orientation='h', marker_color='#d0d9e8',
+                        text=[f"{v}%" for v in pre_cmp], textposition='outside'),
+                     dict(type='bar', name='After Event', y=labels_cmp, x=post_cmp,
+                        orientation='h', marker_color='#0d3b6e',
+                        text=[f"{v}%" for v in post_cmp], textposition='outside')],
+                    dict(barmode='group', height=380, xaxis=dict(range=[0, 110]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
+                        margin=dict(l=10, r=60, t=20, b=20)))
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Radar — Experience Profile")
+                radar_dims = ["Comfortable\natmosphere", "Excellent\nformat", "High\nconfidence",
+                              "Relevant\nconnections", "Would\nrecommend", "Discussion\nhelpful"]
+                radar_pre  = [
+                    round(t.pre['atmosphere']['Comfortable\n& friendly'] / t.N_pre * 100),
+                    0,
+                    round(t.conf_pre_high / t.N_pre * 100),
+                    0, 0, 0
+                ]
+                radar_post = [
+                    round(t.post['atmosphere']['Comfortable\n& friendly'] / t.N * 100),
+                    t.format_excel_pct,
+                    round(t.conf_post_high / t.N * 100),
+                    t.relevant_pct,
+                    t.recommend_pct,
+                    t.discussion_help,
+                ]
+                fig_r = lnc_figure(
+                    [dict(type='scatterpolar',
+                        r=radar_pre + [radar_pre[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='Before Event',
+                        line_color='#adb5bd', fillcolor='rgba(173,181,189,0.15)', line_width=2),
+                     dict(type='scatterpolar',
+                        r=radar_post + [radar_post[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='After Event',
+                        line_color='#0d3b6e', fillcolor='rgba(13,59,110,0.15)', line_width=2.5)],
+                    dict(
+                        polar=dict(radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=10)),
+                                   angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))),
+                        showlegend=True, height=480, paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=-0.1, xanchor='center', x=0.5)
+                    ))
+                col_l, col_c, col_r = st.columns([1, 3, 1])
+                with col_c:
+                    st.plotly_chart(fig_r, use_container_width=True)
+    dashboard_tabs()
 
     # ── ABOUT BOX ──────────────────────────────────────────────────────────────
     st.markdown("""
@@ -1290,123 +1672,98 @@ if session_info.get('type') == 'lnc_tech':
         <h2>💻 Technology Sector — Session 1</h2>
         <p class="tagline">Leaders Network Circles · Australia Chapter</p>
         <div style="display:flex; justify-content:center; gap:3rem; margin:2rem 0; flex-wrap:wrap; position:relative; z-index:1;">
-            <div><div style="font-size:2.5rem;font-weight:700">{N_pre}</div><div style="opacity:0.8">Pre-survey</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{N}</div><div style="opacity:0.8">Post-survey</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{format_excel_pct}%</div><div style="opacity:0.8">Excellent format</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{nps_score}</div><div style="opacity:0.8">NPS score</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{recommend_pct}%</div><div style="opacity:0.8">Recommend</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N_pre}</div><div style="opacity:0.8">Pre-survey</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N}</div><div style="opacity:0.8">Post-survey</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.format_excel_pct}%</div><div style="opacity:0.8">Excellent format</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.nps_score}</div><div style="opacity:0.8">NPS score</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.recommend_pct}%</div><div style="opacity:0.8">Recommend</div></div>
         </div>
         <p style="font-size:1.1rem;margin-top:2rem;opacity:0.9;position:relative;z-index:1"><strong>Grow • Connect • Impact</strong></p>
         <p style="font-size:0.9rem;opacity:0.7;margin-top:1rem;position:relative;z-index:1">{datetime.now().strftime('%B %d, %Y')} | Vision 2030</p>
     </div>
     """, unsafe_allow_html=True)
 
-    st.stop()
-
 
     # ============================================================================
 # LNC CROSS-SECTOR ANALYSIS DASHBOARD (Health vs Technology)
 # ============================================================================
 
-if session_info.get('type') == 'lnc_cross':
+@dataclass(frozen=True, slots=True)
+class LncCrossTallies:
+    """Health vs Technology figures read by render_lnc_cross."""
+    N_H: int
+    N_T_pre: int
+    N_T: int
+    H: dict
+    T: dict
+    H_nps_pre: int
+    H_nps_post: int
+    T_nps_post: int
+    H_format_pct: int
+    T_format_pct: int
+    H_conf_pre_pct: int
+    H_conf_post_pct: int
+    T_conf_pre_pct: int
+    T_conf_post_pct: int
+    H_comfort_pre_pct: int
+    H_comfort_post_pct: int
+    T_comfort_pre_pct: int
+    T_comfort_post_pct: int
+    H_rec_pct: int
+    T_rec_pct: int
+    H_career: int
+    T_relevant: int
+    H_linkedin_avg: float
+    T_linkedin_avg: float
+    H_meaningful_avg: float
+    T_meaningful_avg: float
+
+
+@st.cache_resource(hash_funcs=HASH_FUNCS)
+def lnc_cross_static(health, tech):
+    """Health and Technology tallies plus side-by-side rates (computed once per data version)."""
+    table = lnc_comparison([health, tech])
+    H, T = (dict(s) for s in table['summaries'])   # copies: the table is shared
+    for sector in (H, T):
+        sector['registration_excellent'] = sector['registration']['Excellent']
+        sector['format_excellent'] = sector['format']['Excellent']
+        for k in ('barriers_pre', 'barriers_post'):
+            sector[k] = {label.replace('\n', ' '): v for label, v in sector[k].items()}
 
     # ── SHARED CONSTANTS ──────────────────────────────────────────────────────
-    N_H     = 27   # Health: both pre & post matched
-    N_T_pre = 24   # Tech pre
-    N_T     = 22   # Tech post
-
-    # ── HEALTH DATA ───────────────────────────────────────────────────────────
-    H = dict(
-        registration_excellent = 21,
-        heard_about  = {"Friend/colleague": 13, "WhatsApp": 10, "Other": 2, "Snapchat": 2, "LinkedIn": 0},
-        conf_pre_high  = 12 + 5,   # Extremely + Somewhat confident
-        conf_post_high = 19 + 7,   # Significantly + Slightly improved (used as proxy)
-        atmosphere_pre_comfort  = 17,
-        atmosphere_post_comfort = 23,
-        atmosphere_pre_overwhelm  = 6,
-        atmosphere_post_overwhelm = 0,
-        format_excellent = 23,
-        conn_target  = {"1–2": 8, "3–5": 9, "6–9": 5, "10–12": 2, "12+": 3},
-        linkedin_post= {"1–2": 3, "3–5": 9, "6–9": 9, "10–12": 4, "12+": 2},
-        meaningful_post={"1–2": 9, "3–5": 8, "6–9": 5, "10–12": 2, "12+": 3},
-        nps_pre  = {"Promoters": 12, "Passives": 9, "Detractors": 6},
-        nps_post = {"Promoters": 17, "Passives": 8, "Detractors": 2},
-        recommendation = {"Highly recommend": 20, "Slightly recommend": 5,
-                          "Maybe": 0, "Don't think they need it": 2},
-        barriers_pre  = {"Starting conversations": 8, "Finding relevant people": 10,
-                         "Shyness / anxiety": 6, "No specific barrier": 3},
-        barriers_post = {"Starting conversations": 8, "Finding relevant people": 9,
-                         "Shyness / anxiety": 6, "No specific barrier": 4},
-        career_opps   = {"Yes, definitely": 14, "Possibly": 6, "Not at this stage": 7},
-        network_expanded = {"Significantly": 18, "Moderately": 6, "Slightly": 1, "Not at all": 2},
-        goals_pre     = {"Friendships": 20, "Professional network": 21, "Mentor": 13,
-                         "Research / projects": 10, "Saudi community": 14},
-        goals_post    = {"Friendships": 22, "Professional network": 24, "Mentor": 9,
-                         "Research / projects": 9, "Saudi community": 15},
-    )
-
-    # ── TECH DATA ─────────────────────────────────────────────────────────────
-    T = dict(
-        registration_excellent = 12,
-        heard_about  = {"WhatsApp": 14, "Friend/colleague": 3, "Snapchat": 3, "Other": 3, "LinkedIn": 1},
-        conf_pre_high  = 8 + 9,    # Very confident + Confident
-        conf_post_high = 15 + 4,   # Very confident + Confident post
-        atmosphere_pre_comfort  = 20,
-        atmosphere_post_comfort = 20,
-        atmosphere_pre_overwhelm  = 2,
-        atmosphere_post_overwhelm = 0,
-        format_excellent = 19,
-        conn_target  = {"1–2": 6, "3–5": 9, "6–9": 3, "10–12": 2, "12+": 4},
-        linkedin_post= {"1–2": 1, "3–5": 2, "6–9": 12, "10–12": 5, "12+": 2},
-        meaningful_post={"1–2": 4, "3–5": 8, "6–9": 8, "10–12": 2, "12+": 0},
-        nps_post = {"Promoters": 15, "Passives": 5, "Detractors": 2},
-        recommendation = {"Very likely": 20, "Likely": 2, "Neutral": 0,
-                          "Unlikely": 0, "Very unlikely": 0},
-        barriers_pre  = {"Starting conversations": 8, "Finding relevant people": 8,
-                         "Shyness / anxiety": 1, "No specific barrier": 7},
-        barriers_post = {"Starting conversations": 10, "Finding relevant people": 5,
-                         "Shyness / anxiety": 1, "No specific barrier": 6},
-        relevance     = {"Very relevant": 10, "Relevant": 9, "Neutral": 3,
-                         "Irrelevant": 0, "Very irrelevant": 0},
-        discussion_help = {"Very helpful": 12, "Helpful": 9, "Neutral": 0,
-                           "Unhelpful": 0, "Very unhelpful": 1},
-        conn_types_pre = {"Professional network\n(tech)": 19, "Cross-sector": 4,
-                          "Mentorship": 10, "Collaboration": 9, "Curious": 4},
-        conn_types_post= {"Professional network\n(tech)": 21, "Cross-sector": 12,
-                          "Mentorship": 3, "Collaboration": 6, "No connection": 0},
-    )
+    N_H     = H['n_post']   # Health: both pre & post matched
+    N_T_pre = T['n_pre']    # Tech pre
+    N_T     = T['n_post']   # Tech post
 
-    # ── DERIVED NUMBERS ───────────────────────────────────────────────────────
+    # ── DERIVED NUMBERS (one column per sector of the comparison table) ──────
     H_nps_pre  = round((H['nps_pre']['Promoters']  - H['nps_pre']['Detractors'])  / N_H * 100)
-    H_nps_post = round((H['nps_post']['Promoters'] - H['nps_post']['Detractors']) / N_H * 100)
-    T_nps_post = round((T['nps_post']['Promoters'] - T['nps_post']['Detractors']) / N_T * 100)
-
-    H_format_pct      = round(H['format_excellent'] / N_H * 100)
-    T_format_pct      = round(T['format_excellent'] / N_T * 100)
-    H_conf_pre_pct    = round(H['conf_pre_high']  / N_H * 100)
-    H_conf_post_pct   = round(H['conf_post_high'] / N_H * 100)
-    T_conf_pre_pct    = round(T['conf_pre_high']  / N_T_pre * 100)
-    T_conf_post_pct   = round(T['conf_post_high'] / N_T * 100)
-    H_comfort_pre_pct = round(H['atmosphere_pre_comfort']  / N_H * 100)
-    H_comfort_post_pct= round(H['atmosphere_post_comfort'] / N_H * 100)
-    T_comfort_pre_pct = round(T['atmosphere_pre_comfort']  / N_T_pre * 100)
-    T_comfort_post_pct= round(T['atmosphere_post_comfort'] / N_T * 100)
-    H_rec_pct  = round(H['recommendation']['Highly recommend'] / N_H * 100)
-    T_rec_pct  = round((T['recommendation']['Very likely'] + T['recommendation']['Likely']) / N_T * 100)
-    H_career   = round((H['career_opps']['Yes, definitely'] + H['career_opps']['Possibly']) / N_H * 100)
-    H_network  = round(H['network_expanded']['Significantly'] / N_H * 100)
-    T_relevant = round((T['relevance']['Very relevant'] + T['relevance']['Relevant']) / N_T * 100)
-    T_discuss  = round((T['discussion_help']['Very helpful'] + T['discussion_help']['Helpful']) / N_T * 100)
-
-    # ── LINKEDIN WEIGHTED MIDPOINTS ───────────────────────────────────────────
-    def weighted_avg_conns(d, n):
-        mids = {"1–2": 1.5, "3–5": 4, "6–9": 7.5, "10–12": 11, "12+": 13}
-        return round(sum(mids[k] * v for k, v in d.items()) / n, 1)
-
-    H_linkedin_avg = weighted_avg_conns(H['linkedin_post'], N_H)
-    T_linkedin_avg = weighted_avg_conns(T['linkedin_post'], N_T)
-    H_meaningful_avg = weighted_avg_conns(H['meaningful_post'], N_H)
-    T_meaningful_avg = weighted_avg_conns(T['meaningful_post'], N_T)
+    H_nps_post,         T_nps_post         = lnc_metric(table, 'nps_post')
+    H_format_pct,       T_format_pct       = lnc_metric(table, 'format_pct')
+    H_conf_pre_pct,     T_conf_pre_pct     = lnc_metric(table, 'conf_pre_pct')
+    H_conf_post_pct,    T_conf_post_pct    = lnc_metric(table, 'conf_post_pct')
+    H_comfort_pre_pct,  T_comfort_pre_pct  = lnc_metric(table, 'comfort_pre_pct')
+    H_comfort_post_pct, T_comfort_post_pct = lnc_metric(table, 'comfort_post_pct')
+    H_rec_pct,          T_rec_pct          = lnc_metric(table, 'recommend_pct')
+    H_career,           T_relevant         = lnc_metric(table, 'outcome_pct')   # career opps / relevant conns
+    H_linkedin_avg,     T_linkedin_avg     = lnc_metric(table, 'linkedin_avg')
+    H_meaningful_avg,   T_meaningful_avg   = lnc_metric(table, 'meaningful_avg')
+
+    return LncCrossTallies(N_H=N_H, N_T_pre=N_T_pre, N_T=N_T, H=H, T=T, H_nps_pre=H_nps_pre,
+                           H_nps_post=H_nps_post, T_nps_post=T_nps_post, H_format_pct=H_format_pct,
+                           T_format_pct=T_format_pct, H_conf_pre_pct=H_conf_pre_pct,
+                           H_conf_post_pct=H_conf_post_pct, T_conf_pre_pct=T_conf_pre_pct,
+                           T_conf_post_pct=T_conf_post_pct, H_comfort_pre_pct=H_comfort_pre_pct,
+                           H_comfort_post_pct=H_comfort_post_pct,
+                           T_comfort_pre_pct=T_comfort_pre_pct,
+                           T_comfort_post_pct=T_comfort_post_pct, H_rec_pct=H_rec_pct,
+                           T_rec_pct=T_rec_pct, H_career=H_career, T_relevant=T_relevant,
+                           H_linkedin_avg=H_linkedin_avg, T_linkedin_avg=T_linkedin_avg,
+                           H_meaningful_avg=H_meaningful_avg, T_meaningful_avg=T_meaningful_avg)
+
+
+def render_lnc_cross(selected_session, initiative_info, session_info, data):
+    """LNC Health vs Technology cross-sector dashboard."""
+    t = lnc_cross_static(*data)
 
     # ── HEADER ────────────────────────────────────────────────────────────────
     st.markdown("""
@@ -1427,11 +1784,11 @@ if session_info.get('type') == 'lnc_cross':
     st.markdown(f"""
     <div class="lnc-highlight-box" style="padding:2rem;">
         <div style="display:flex; flex-wrap:wrap; justify-content:center; gap:0.5rem; position:relative; z-index:1;">
-            <div class="stat-pill"><span class="num">{N_H}</span><span class="lbl">Health participants</span></div>
-            <div class="stat-pill"><span class="num">{N_T}</span><span class="lbl">Tech participants</span></div>
-            <div class="stat-pill"><span class="num">{H_nps_post} vs {T_nps_post}</span><span class="lbl">NPS (H vs T)</span></div>
-            <div class="stat-pill"><span class="num">{H_format_pct}% vs {T_format_pct}%</span><span class="lbl">Excellent format (H vs T)</span></div>
-            <div class="stat-pill"><span class="num">{H_rec_pct}% vs {T_rec_pct}%</span><span class="lbl">Recommend (H vs T)</span></div>
+            <div class="stat-pill"><span class="num">{t.N_H}</span><span class="lbl">Health participants</span></div>
+            <div class="stat-pill"><span class="num">{t.N_T}</span><span class="lbl">Tech participants</span></div>
+            <div class="stat-pill"><span class="num">{t.H_nps_post} vs {t.T_nps_post}</span><span class="lbl">NPS (H vs T)</span></div>
+            <div class="stat-pill"><span class="num">{t.H_format_pct}% vs {t.T_format_pct}%</span><span class="lbl">Excellent format (H vs T)</span></div>
+            <div class="stat-pill"><span class="num">{t.H_rec_pct}% vs {t.T_rec_pct}%</span><span class="lbl">Recommend (H vs T)</span></div>
         </div>
     </div>
     """, unsafe_allow_html=True)
@@ -1480,55 +1837,55 @@ if session_info.get('type') == 'lnc_cross':
     st.markdown('<p class="subsection-title">Reach & Format Quality</p>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     with c1:
-        st.markdown(dual_kpi("Participants Surveyed", N_H, N_T,
+        st.markdown(dual_kpi("Participants Surveyed", t.N_H, t.N_T,
             "matched pre & post", "post-event respondents", "👥"), unsafe_allow_html=True)
     with c2:
-        st.markdown(dual_kpi("Format — Excellent", f"{H_format_pct}%", f"{T_format_pct}%",
-            f"{H['format_excellent']} of {N_H}", f"{T['format_excellent']} of {N_T}", "🏆"), unsafe_allow_html=True)
+        st.markdown(dual_kpi("Format — Excellent", f"{t.H_format_pct}%", f"{t.T_format_pct}%",
+            f"{t.H['format_excellent']} of {t.N_H}", f"{t.T['format_excellent']} of {t.N_T}", "🏆"), unsafe_allow_html=True)
     with c3:
-        reg_h = round(H['registration_excellent'] / N_H * 100)
-        reg_t = round(T['registration_excellent'] / N_T_pre * 100)
+        reg_h = round(t.H['registration_excellent'] / t.N_H * 100)
+        reg_t = round(t.T['registration_excellent'] / t.N_T_pre * 100)
         st.markdown(dual_kpi("Registration — Excellent", f"{reg_h}%", f"{reg_t}%",
-            f"{H['registration_excellent']} of {N_H}", f"{T['registration_excellent']} of {N_T_pre}", "📋"), unsafe_allow_html=True)
+            f"{t.H['registration_excellent']} of {t.N_H}", f"{t.T['registration_excellent']} of {t.N_T_pre}", "📋"), unsafe_allow_html=True)
 
     st.markdown('<p class="subsection-title">Confidence & Atmosphere</p>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     with c1:
-        st.markdown(dual_kpi("Pre-Event High Confidence", f"{H_conf_pre_pct}%", f"{T_conf_pre_pct}%",
-            f"{H['conf_pre_high']} of {N_H}", f"{T['conf_pre_high']} of {N_T_pre}", "💪"), unsafe_allow_html=True)
+        st.markdown(dual_kpi("Pre-Event High Confidence", f"{t.H_conf_pre_pct}%", f"{t.T_conf_pre_pct}%",
+            f"{t.H['conf_pre_high']} of {t.N_H}", f"{t.T['conf_pre_high']} of {t.N_T_pre}", "💪"), unsafe_allow_html=True)
     with c2:
-        st.markdown(dual_kpi("Post-Event High Confidence", f"{H_conf_post_pct}%", f"{T_conf_post_pct}%",
-            f"of {N_H} participants", f"of {N_T} participants", "🚀"), unsafe_allow_html=True)
+        st.markdown(dual_kpi("Post-Event High Confidence", f"{t.H_conf_post_pct}%", f"{t.T_conf_post_pct}%",
+            f"of {t.N_H} participants", f"of {t.N_T} participants", "🚀"), unsafe_allow_html=True)
     with c3:
-        st.markdown(dual_kpi("Comfortable Atmosphere (Post)", f"{H_comfort_post_pct}%", f"{T_comfort_post_pct}%",
-            f"{H['atmosphere_post_comfort']} of {N_H}", f"{T['atmosphere_post_comfort']} of {N_T}", "🌿"), unsafe_allow_html=True)
+        st.markdown(dual_kpi("Comfortable Atmosphere (Post)", f"{t.H_comfort_post_pct}%", f"{t.T_comfort_post_pct}%",
+            f"{t.H['atmosphere_post_comfort']} of {t.N_H}", f"{t.T['atmosphere_post_comfort']} of {t.N_T}", "🌿"), unsafe_allow_html=True)
 
     st.markdown('<p class="subsection-title">Connections & Advocacy</p>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     with c1:
-        st.markdown(dual_kpi("Avg LinkedIn Connections", f"{H_linkedin_avg}", f"{T_linkedin_avg}",
+        st.markdown(dual_kpi("Avg LinkedIn Connections", f"{t.H_linkedin_avg}", f"{t.T_linkedin_avg}",
             "weighted avg per participant", "weighted avg per participant", "🔗"), unsafe_allow_html=True)
     with c2:
-        st.markdown(dual_kpi("Avg Meaningful Connections", f"{H_meaningful_avg}", f"{T_meaningful_avg}",
+        st.markdown(dual_kpi("Avg Meaningful Connections", f"{t.H_meaningful_avg}", f"{t.T_meaningful_avg}",
             "weighted avg per participant", "weighted avg per participant", "🤝"), unsafe_allow_html=True)
     with c3:
-        st.markdown(dual_kpi("Would Recommend", f"{H_rec_pct}%", f"{T_rec_pct}%",
-            f"{H['recommendation']['Highly recommend']} highly recommend",
-            f"{T['recommendation']['Very likely']} very likely", "📣"), unsafe_allow_html=True)
+        st.markdown(dual_kpi("Would Recommend", f"{t.H_rec_pct}%", f"{t.T_rec_pct}%",
+            f"{t.H['recommendation']['Highly recommend']} highly recommend",
+            f"{t.T['recommendation']['Very likely']} very likely", "📣"), unsafe_allow_html=True)
 
     st.markdown('<p class="subsection-title">NPS & Satisfaction</p>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     with c1:
-        st.markdown(dual_kpi("NPS Score (Post-Event)", str(H_nps_post), str(T_nps_post),
-            f"was {H_nps_pre} pre-event", "post-event only", "📈"), unsafe_allow_html=True)
+        st.markdown(dual_kpi("NPS Score (Post-Event)", str(t.H_nps_post), str(t.T_nps_post),
+            f"was {t.H_nps_pre} pre-event", "post-event only", "📈"), unsafe_allow_html=True)
     with c2:
         st.markdown(dual_kpi("Overwhelming Atmosphere Eliminated",
-            f"{H['atmosphere_pre_overwhelm']} → 0",
-            f"{T['atmosphere_pre_overwhelm']} → 0",
+            f"{t.H['atmosphere_pre_overwhelm']} → 0",
+            f"{t.T['atmosphere_pre_overwhelm']} → 0",
             "participants pre → post", "participants pre → post", "✅"), unsafe_allow_html=True)
     with c3:
         st.markdown(dual_kpi("Sector-Specific Outcome",
-            f"{H_career}%", f"{T_relevant}%",
+            f"{t.H_career}%", f"{t.T_relevant}%",
             "found career opportunities", "found relevant connections", "🎯"), unsafe_allow_html=True)
 
     # ── HIGHLIGHT BOX ──────────────────────────────────────────────────────────
@@ -1537,11 +1894,11 @@ if session_info.get('type') == 'lnc_cross':
         <h3>⚡ Cross-Sector Insights — What the Data Tells Us</h3>
         <ul>
             <li>Both sectors <strong>eliminated overwhelming atmosphere</strong> post-event — the circle format works universally</li>
-            <li>Tech participants made <strong>more LinkedIn connections</strong> on average ({T_linkedin_avg} vs {H_linkedin_avg}), reflecting the sector's digital-native culture</li>
-            <li>Health sector had a <strong>stronger NPS swing</strong>: {H_nps_pre} → {H_nps_post} (+{H_nps_post - H_nps_pre} pts); Tech achieved {T_nps_post} post-event</li>
-            <li>Confidence improved in both sectors: Health {H_conf_pre_pct}% → {H_conf_post_pct}% · Tech {T_conf_pre_pct}% → {T_conf_post_pct}%</li>
+            <li>Tech participants made <strong>more LinkedIn connections</strong> on average ({t.T_linkedin_avg} vs {t.H_linkedin_avg}), reflecting the sector's digital-native culture</li>
+            <li>Health sector had a <strong>stronger NPS swing</strong>: {t.H_nps_pre} → {t.H_nps_post} (+{t.H_nps_post - t.H_nps_pre} pts); Tech achieved {t.T_nps_post} post-event</li>
+            <li>Confidence improved in both sectors: Health {t.H_conf_pre_pct}% → {t.H_conf_post_pct}% · Tech {t.T_conf_pre_pct}% → {t.T_conf_post_pct}%</li>
             <li>Tech participants skewed toward <strong>higher connection volumes</strong> (6–9 range dominated); Health leaned toward <strong>deeper meaningful ties</strong></li>
-            <li>Both sessions achieved <strong>{min(H_rec_pct, T_rec_pct)}%+ recommendation rates</strong>, validating the LNC format across sectors</li>
+            <li>Both sessions achieved <strong>{min(t.H_rec_pct, t.T_rec_pct)}%+ recommendation rates</strong>, validating the LNC format across sectors</li>
         </ul>
     </div>
     """, unsafe_allow_html=True)
@@ -1550,347 +1907,397 @@ if session_info.get('type') == 'lnc_cross':
     st.markdown("---")
     st.markdown('<p class="section-title">📚 Deep-Dive Comparison</p>', unsafe_allow_html=True)
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📊 Overview", "🤝 Connections", "💪 Confidence & Barriers",
-        "📣 Advocacy & NPS", "🕸️ Radar Profile"
-    ])
-
-    # ── TAB 1: OVERVIEW ────────────────────────────────────────────────────────
-    with tab1:
-        st.markdown("### Format Rating — Health vs Technology")
-        c1, c2 = st.columns(2)
-        with c1:
-            fig = go.Figure()
-            fmt_labs = ["Excellent", "Good", "Fair", "Poor"]
-            fig.add_trace(go.Bar(name='🏥 Health', x=fmt_labs,
-                y=[H['format_excellent'], 3, 0, 1],
-                marker_color='#006341',
-                text=[H['format_excellent'], 3, 0, 1], textposition='outside'))
-            fig.add_trace(go.Bar(name='💻 Technology', x=fmt_labs,
-                y=[T['format_excellent'], 2, 1, 0],
-                marker_color='#1a5fa8',
-                text=[T['format_excellent'], 2, 1, 0], textposition='outside'))
-            fig.update_layout(barmode='group', height=360, yaxis=dict(range=[0, 28]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("### Comfortable Atmosphere — Pre vs Post")
-            dims = ['Health Pre', 'Health Post', 'Tech Pre', 'Tech Post']
-            vals = [H_comfort_pre_pct, H_comfort_post_pct, T_comfort_pre_pct, T_comfort_post_pct]
-            colors = ['rgba(0,99,65,0.4)', '#006341', 'rgba(13,59,110,0.4)', '#1a5fa8']
-            fig = go.Figure(go.Bar(x=dims, y=vals, marker_color=colors,
-                text=[f"{v}%" for v in vals], textposition='outside',
-                textfont=dict(size=13, family='Epilogue')))
-            fig.update_layout(height=360, yaxis=dict(range=[0, 100]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Registration Excellence & Outreach")
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Registration Rating — Excellent %")
-            fig = go.Figure(go.Bar(
-                x=['🏥 Health', '💻 Technology'],
-                y=[round(H['registration_excellent']/N_H*100),
-                   round(T['registration_excellent']/N_T_pre*100)],
-                marker_color=['#006341', '#1a5fa8'],
-                text=[f"{round(H['registration_excellent']/N_H*100)}%",
-                      f"{round(T['registration_excellent']/N_T_pre*100)}%"],
-                textposition='outside', textfont=dict(size=14)
-            ))
-            fig.update_layout(height=320, yaxis=dict(range=[0, 100]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### How Participants Heard About the Event")
-            channels = ["WhatsApp", "Friend/colleague", "Snapchat", "LinkedIn", "Other"]
-            h_heard = [10, 13, 2, 0, 2]
-            t_heard = [14, 3, 3, 1, 3]
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='🏥 Health', x=channels, y=h_heard,
-                marker_color='#006341', text=h_heard, textposition='outside'))
-            fig.add_trace(go.Bar(name='💻 Technology', x=channels, y=t_heard,
-                marker_color='#1a5fa8', text=t_heard, textposition='outside'))
-            fig.update_layout(barmode='group', height=320, yaxis=dict(range=[0, 18]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-            st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 2: CONNECTIONS ─────────────────────────────────────────────────────
-    with tab2:
-        st.markdown("### LinkedIn Connections Made — Distribution")
-        conn_labs = ["1–2", "3–5", "6–9", "10–12", "12+"]
-        h_linkedin = [H['linkedin_post'][k] for k in conn_labs]
-        t_linkedin = [T['linkedin_post'][k] for k in conn_labs]
-        fig = go.Figure()
-        fig.add_trace(go.Bar(name='🏥 Health', x=conn_labs, y=h_linkedin,
-            marker_color='#006341', text=h_linkedin, textposition='outside'))
-        fig.add_trace(go.Bar(name='💻 Technology', x=conn_labs, y=t_linkedin,
-            marker_color='#1a5fa8', text=t_linkedin, textposition='outside'))
-        fig.update_layout(barmode='group', height=380, yaxis=dict(range=[0, 15]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-        st.plotly_chart(fig, use_container_width=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Meaningful Connections — Distribution")
-            h_mean = [H['meaningful_post'][k] for k in conn_labs]
-            t_mean = [T['meaningful_post'][k] for k in conn_labs]
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='🏥 Health', x=conn_labs, y=h_mean,
-                marker_color='#006341', text=h_mean, textposition='outside'))
-            fig.add_trace(go.Bar(name='💻 Technology', x=conn_labs, y=t_mean,
-                marker_color='#1a5fa8', text=t_mean, textposition='outside'))
-            fig.update_layout(barmode='group', height=340, yaxis=dict(range=[0, 12]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Weighted Average Connections")
-            avg_labs = ["LinkedIn\nConnections", "Meaningful\nConnections"]
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='🏥 Health', x=avg_labs,
-                y=[H_linkedin_avg, H_meaningful_avg],
-                marker_color='#006341',
-                text=[f"{H_linkedin_avg}", f"{H_meaningful_avg}"],
-                textposition='outside', textfont=dict(size=14)))
-            fig.add_trace(go.Bar(name='💻 Technology', x=avg_labs,
-                y=[T_linkedin_avg, T_meaningful_avg],
-                marker_color='#1a5fa8',
-                text=[f"{T_linkedin_avg}", f"{T_meaningful_avg}"],
-                textposition='outside', textfont=dict(size=14)))
-            fig.update_layout(barmode='group', height=340, yaxis=dict(range=[0, 12]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Connection Target (Pre-Event) — What Did They Aim For?")
-        h_targets = [H['conn_target'][k] for k in conn_labs]
-        t_targets = [T['conn_target'][k] for k in conn_labs]
-        fig = go.Figure()
-        fig.add_trace(go.Bar(name='🏥 Health', x=conn_labs, y=h_targets,
-            marker_color='rgba(0,99,65,0.5)', text=h_targets, textposition='outside'))
-        fig.add_trace(go.Bar(name='💻 Technology', x=conn_labs, y=t_targets,
-            marker_color='rgba(13,59,110,0.5)', text=t_targets, textposition='outside'))
-        fig.update_layout(barmode='group', height=340, yaxis=dict(range=[0, 12]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
-            title_text="Pre-Event Connection Targets vs Post-Event Achievements",
-            title_font=dict(family='Cormorant Garamond', size=16))
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 3: CONFIDENCE & BARRIERS ───────────────────────────────────────────
-    with tab3:
-        st.markdown("### Confidence Journey — Pre to Post")
-        conf_cats = ["Pre-Event\nHigh Confidence", "Post-Event\nHigh Confidence", "Confidence\nLift (pp)"]
-        h_conf = [H_conf_pre_pct, H_conf_post_pct, H_conf_post_pct - H_conf_pre_pct]
-        t_conf = [T_conf_pre_pct, T_conf_post_pct, T_conf_post_pct - T_conf_pre_pct]
-        fig = go.Figure()
-        fig.add_trace(go.Bar(name='🏥 Health', x=conf_cats, y=h_conf,
-            marker_color='#006341', text=[f"{v}%" for v in h_conf], textposition='outside'))
-        fig.add_trace(go.Bar(name='💻 Technology', x=conf_cats, y=t_conf,
-            marker_color='#1a5fa8', text=[f"{v}%" for v in t_conf], textposition='outside'))
-        fig.update_layout(barmode='group', height=380, yaxis=dict(range=[-5, 100]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Networking Barriers — Pre-Event vs Post-Event (Overcome)")
-        barrier_cats = ["Starting conversations", "Finding relevant people",
-                        "Shyness / anxiety", "No specific barrier"]
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### 🏥 Health Sector")
-            h_pre_b  = [H['barriers_pre'][k]  for k in barrier_cats]
-            h_post_b = [H['barriers_post'][k] for k in barrier_cats]
-            fig = lnc_grouped_bar(
-                barrier_cats, h_pre_b, h_post_b,
-                pre_color='rgba(0,99,65,0.3)', post_color='#006341', y_max=14
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### 💻 Technology Sector")
-            t_pre_b  = [T['barriers_pre'][k]  for k in barrier_cats]
-            t_post_b = [T['barriers_post'][k] for k in barrier_cats]
-            fig = lnc_grouped_bar(
-                barrier_cats, t_pre_b, t_post_b,
-                pre_color='rgba(13,59,110,0.3)', post_color='#1a5fa8', y_max=14
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Barriers Comparison — Health vs Technology (Pre-Event)")
-        fig = go.Figure()
-        fig.add_trace(go.Bar(name='🏥 Health', x=barrier_cats,
-            y=[H['barriers_pre'][k] for k in barrier_cats],
-            marker_color='#006341',
-            text=[H['barriers_pre'][k] for k in barrier_cats], textposition='outside'))
-        fig.add_trace(go.Bar(name='💻 Technology', x=barrier_cats,
-            y=[T['barriers_pre'][k] for k in barrier_cats],
-            marker_color='#1a5fa8',
-            text=[T['barriers_pre'][k] for k in barrier_cats], textposition='outside'))
-        fig.update_layout(barmode='group', height=360, yaxis=dict(range=[0, 14]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 4: ADVOCACY & NPS ──────────────────────────────────────────────────
-    with tab4:
-        st.markdown("### NPS Comparison")
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### 🏥 Health — NPS Journey (Pre → Post)")
-            nps_labs = ["Promoters", "Passives", "Detractors"]
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='Before', x=nps_labs,
-                y=[H['nps_pre'][k] for k in nps_labs],
-                marker_color=['rgba(0,99,65,0.4)', 'rgba(243,156,18,0.4)', 'rgba(231,76,60,0.4)'],
-                text=[H['nps_pre'][k] for k in nps_labs], textposition='outside'))
-            fig.add_trace(go.Bar(name='After', x=nps_labs,
-                y=[H['nps_post'][k] for k in nps_labs],
-                marker_color=['#006341', '#e67e22', '#e74c3c'],
-                text=[H['nps_post'][k] for k in nps_labs], textposition='outside'))
-            fig.update_layout(barmode='group', height=340, yaxis=dict(range=[0, 22]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### 💻 Technology — NPS (Post-Event Only)")
-            fig = go.Figure(go.Bar(
-                x=nps_labs,
-                y=[T['nps_post'][k] for k in nps_labs],
-                marker_color=['#1a5fa8', '#e67e22', '#e74c3c'],
-                text=[T['nps_post'][k] for k in nps_labs],
-                textposition='outside', textfont=dict(size=14)
-            ))
-            fig.update_layout(height=340, yaxis=dict(range=[0, 20]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Recommendation — Health vs Technology")
-        c1, c2 = st.columns(2)
-        with c1:
-            fig = lnc_donut(
-                ["Highly recommend", "Slightly recommend", "Maybe", "Don't think they need it"],
-                [H['recommendation']['Highly recommend'], H['recommendation']['Slightly recommend'],
-                 H['recommendation']['Maybe'], H['recommendation']["Don't think they need it"]],
-                ['#006341', '#00843d', '#93c13f', '#e74c3c'],
-                center_text="🏥 Health\nRecommend"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            fig = lnc_donut(
-                ["Very likely", "Likely", "Neutral", "Unlikely", "Very unlikely"],
-                [T['recommendation']['Very likely'], T['recommendation']['Likely'],
-                 T['recommendation']['Neutral'], T['recommendation']['Unlikely'],
-                 T['recommendation']['Very unlikely']],
-                ['#1a5fa8', '#378add', '#85B7EB', '#e9ecef', '#e74c3c'],
-                center_text="💻 Tech\nRecommend"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### NPS Score — Final Comparison")
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=['🏥 Health (Pre)', '🏥 Health (Post)', '💻 Tech (Post)'],
-            y=[H_nps_pre, H_nps_post, T_nps_post],
-            marker_color=['rgba(0,99,65,0.4)', '#006341', '#1a5fa8'],
-            text=[str(H_nps_pre), str(H_nps_post), str(T_nps_post)],
-            textposition='outside', textfont=dict(size=15, family='Cormorant Garamond')
-        ))
-        fig.update_layout(height=360, yaxis=dict(range=[-10, 60]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            showlegend=False)
-        fig.add_hline(y=0, line_dash="dash", line_color="#adb5bd", line_width=1.5)
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 5: RADAR PROFILE ───────────────────────────────────────────────────
-    with tab5:
-        st.markdown("### 🕸️ Sector Profile Radar — Health vs Technology")
-        radar_dims = [
-            "Format\nExcellent %", "Post-Event\nComfort %",
-            "Confidence\nLift (pp)", "Avg LinkedIn\nConns (×10)",
-            "Recommend %", "NPS Score\n(normalised)"
-        ]
-        h_radar = [
-            H_format_pct,
-            H_comfort_post_pct,
-            H_conf_post_pct - H_conf_pre_pct,
-            round(H_linkedin_avg * 10),
-            H_rec_pct,
-            round((H_nps_post + 100) / 2)
-        ]
-        t_radar = [
-            T_format_pct,
-            T_comfort_post_pct,
-            T_conf_post_pct - T_conf_pre_pct,
-            round(T_linkedin_avg * 10),
-            T_rec_pct,
-            round((T_nps_post + 100) / 2)
-        ]
-        fig_r = go.Figure()
-        fig_r.add_trace(go.Scatterpolar(
-            r=h_radar + [h_radar[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='🏥 Health',
-            line_color='#006341', fillcolor='rgba(0,99,65,0.15)', line_width=2.5))
-        fig_r.add_trace(go.Scatterpolar(
-            r=t_radar + [t_radar[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='💻 Technology',
-            line_color='#1a5fa8', fillcolor='rgba(13,59,110,0.15)', line_width=2.5))
-        fig_r.update_layout(
-            polar=dict(
-                radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=10)),
-                angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))
-            ),
-            showlegend=True, height=520, paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=-0.1, xanchor='center', x=0.5)
-        )
-        col_l, col_c, col_r = st.columns([1, 3, 1])
-        with col_c:
-            st.plotly_chart(fig_r, use_container_width=True)
-
-        st.markdown("### Metric-by-Metric Breakdown")
-        metric_names = ["Format Excellent %", "Post Comfort %",
-                        "Confidence Lift (pp)", "Avg LinkedIn Conns",
-                        "Recommend %", "NPS Score"]
-        h_vals_table = [H_format_pct, H_comfort_post_pct,
-                        H_conf_post_pct - H_conf_pre_pct,
-                        H_linkedin_avg, H_rec_pct, H_nps_post]
-        t_vals_table = [T_format_pct, T_comfort_post_pct,
-                        T_conf_post_pct - T_conf_pre_pct,
-                        T_linkedin_avg, T_rec_pct, T_nps_post]
-
-        fig_table = go.Figure()
-        fig_table.add_trace(go.Bar(
-            name='🏥 Health', x=metric_names, y=h_vals_table,
-            marker_color='#006341',
-            text=[str(v) for v in h_vals_table], textposition='outside'))
-        fig_table.add_trace(go.Bar(
-            name='💻 Technology', x=metric_names, y=t_vals_table,
-            marker_color='#1a5fa8',
-            text=[str(v) for v in t_vals_table], textposition='outside'))
-        fig_table.update_layout(barmode='group', height=420, yaxis=dict(range=[0, 110]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-        st.plotly_chart(fig_table, use_container_width=True)
+    @st.fragment
+    def dashboard_tabs():
+        tab1, tab2, tab3, tab4, tab5 = session_tabs(selected_session, [
+            "📊 Overview", "🤝 Connections", "💪 Confidence & Barriers",
+            "📣 Advocacy & NPS", "🕸️ Radar Profile"
+        ])
+
+        # ── TAB 1: OVERVIEW ────────────────────────────────────────────────────────
+        with tab1:
+            if tab_open(tab1):
+                st.markdown("### Format Rating — Health vs Technology")
+                c1, c2 = st.columns(2)
+                with c1:
+                    fmt_labs = ["Excellent", "Good", "Fair", "Poor"]
+                    fig = lnc_figure(
+                        [dict(type='bar', name='🏥 Health', x=fmt_labs,
+                            y=[t.H['format'][k] for k in fmt_labs],
+                            marker_color='#006341',
+                            text=[t.H['format'][k] for k in fmt_labs], textposition='outside'),
+                         dict(type='bar', name='💻 Technology', x=fmt_labs,
+                            y=[t.T['format'][k] for k in fmt_labs],
+                            marker_color='#1a5fa8',
+                            text=[t.T['format'][k] for k in fmt_labs], textposition='outside')],
+                        dict(barmode='group', height=360, yaxis=dict(range=[0, 28]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("### Comfortable Atmosphere — Pre vs Post")
+                    dims = ['Health Pre', 'Health Post', 'Tech Pre', 'Tech Post']
+                    vals = [t.H_comfort_pre_pct, t.H_comfort_post_pct, t.T_comfort_pre_pct, t.T_comfort_post_pct]
+                    colors = ['rgba(0,99,65,0.4)', '#006341', 'rgba(13,59,110,0.4)', '#1a5fa8']
+                    fig = lnc_figure(
+                        [dict(type='bar', x=dims, y=vals, marker_color=colors,
+                            text=[f"{v}%" for v in vals], textposition='outside',
+                            textfont=dict(size=13, family='Epilogue'))],
+                        dict(height=360, yaxis=dict(range=[0, 100]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False))
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Registration Excellence & Outreach")
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Registration Rating — Excellent %")
+                    fig = lnc_figure(
+                        [dict(type='bar', x=['🏥 Health', '💻 Technology'],
+                            y=[round(t.H['registration_excellent']/t.N_H*100),
+                               round(t.T['registration_excellent']/t.N_T_pre*100)],
+                            marker_color=['#006341', '#1a5fa8'],
+                            text=[f"{round(t.H['registration_excellent']/t.N_H*100)}%",
+                                  f"{round(t.T['registration_excellent']/t.N_T_pre*100)}%"],
+                            textposition='outside', textfont=dict(size=14))],
+                        dict(height=320, yaxis=dict(range=[0, 100]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False))
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### How Participants Heard About the Event")
+                    channels = list(LNC_HEARD_CHANNELS)
+                    h_heard = [10, 13, 2, 0, 2]
+                    t_heard = [14, 3, 3, 1, 3]
+                    fig = lnc_figure(
+                        [dict(type='bar', name='🏥 Health', x=channels, y=h_heard,
+                            marker_color='#006341', text=h_heard, textposition='outside'),
+                         dict(type='bar', name='💻 Technology', x=channels, y=t_heard,
+                            marker_color='#1a5fa8', text=t_heard, textposition='outside')],
+                        dict(barmode='group', height=320, yaxis=dict(range=[0, 18]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                    st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 2: CONNECTIONS ─────────────────────────────────────────────────────
+        with tab2:
+            if tab_open(tab2):
+                st.markdown("### LinkedIn Connections Made — Distribution")
+                conn_labs = ["1–2", "3–5", "6–9", "10–12", "12+"]
+                h_linkedin = [t.H['linkedin_post'][k] for k in conn_labs]
+                t_linkedin = [t.T['linkedin_post'][k] for k in conn_labs]
+                fig = lnc_figure(
+                    [dict(type='bar', name='🏥 Health', x=conn_labs, y=h_linkedin,
+                        marker_color='#006341', text=h_linkedin, textposition='outside'),
+                     dict(type='bar', name='💻 Technology', x=conn_labs, y=t_linkedin,
+                        marker_color='#1a5fa8', text=t_linkedin, textposition='outside')],
+                    dict(barmode='group', height=380, yaxis=dict(range=[0, 15]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                st.plotly_chart(fig, use_container_width=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Meaningful Connections — Distribution")
+                    h_mean = [t.H['meaningful_post'][k] for k in conn_labs]
+                    t_mean = [t.T['meaningful_post'][k] for k in conn_labs]
+                    fig = lnc_figure(
+                        [dict(type='bar', name='🏥 Health', x=conn_labs, y=h_mean,
+                            marker_color='#006341', text=h_mean, textposition='outside'),
+                         dict(type='bar', name='💻 Technology', x=conn_labs, y=t_mean,
+                            marker_color='#1a5fa8', text=t_mean, textposition='outside')],
+                        dict(barmode='group', height=340, yaxis=dict(range=[0, 12]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Weighted Average Connections")
+                    avg_labs = ["LinkedIn\nConnections", "Meaningful\nConnections"]
+                    fig = lnc_figure(
+                        [dict(type='bar', name='🏥 Health', x=avg_labs,
+                            y=[t.H_linkedin_avg, t.H_meaningful_avg],
+                            marker_color='#006341',
+                            text=[f"{t.H_linkedin_avg}", f"{t.H_meaningful_avg}"],
+                            textposition='outside', textfont=dict(size=14)),
+                         dict(type='bar', name='💻 Technology', x=avg_labs,
+                            y=[t.T_linkedin_avg, t.T_meaningful_avg],
+                            marker_color='#1a5fa8',
+                            text=[f"{t.T_linkedin_avg}", f"{t.T_meaningful_avg}"],
+                            textposition='outside', textfont=dict(size=14))],
+                        dict(barmode='group', height=340, yaxis=dict(range=[0, 12]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Connection Target (Pre-Event) — What Did They Aim For?")
+                h_targets = [t.H['conn_target'][k] for k in conn_labs]
+                t_targets = [t.T['conn_target'][k] for k in conn_labs]
+                fig = lnc_figure(
+                    [dict(type='bar', name='🏥 Health', x=conn_labs, y=h_targets,
+                        marker_color='rgba(0,99,65,0.5)', text=h_targets, textposition='outside'),
+                     dict(type='bar', name='💻 Technology', x=conn_labs, y=t_targets,
+                        marker_color='rgba(13,59,110,0.5)', text=t_targets, textposition='outside')],
+                    dict(barmode='group', height=340, yaxis=dict(range=[0, 12]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
+                        title_text="Pre-Event Connection Targets vs Post-Event Achievements",
+                        title_font=dict(family='Cormorant Garamond', size=16)))
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 3: CONFIDENCE & BARRIERS ───────────────────────────────────────────
+        with tab3:
+            if tab_open(tab3):
+                st.markdown("### Confidence Journey — Pre to Post")
+                conf_cats = ["Pre-Event\nHigh Confidence", "Post-Event\nHigh Confidence", "Confidence\nLift (pp)"]
+                h_conf = [t.H_conf_pre_pct, t.H_conf_post_pct, t.H_conf_post_pct - t.H_conf_pre_pct]
+                t_conf = [t.T_conf_pre_pct, t.T_conf_post_pct, t.T_conf_post_pct - t.T_conf_pre_pct]
+                fig = lnc_figure(
+                    [dict(type='bar', name='🏥 Health', x=conf_cats, y=h_conf,
+                        marker_color='#006341', text=[f"{v}%" for v in h_conf], textposition='outside'),
+                     dict(type='bar', name='💻 Technology', x=conf_cats, y=t_conf,
+                        marker_color='#1a5fa8', text=[f"{v}%" for v in t_conf], textposition='outside')],
+                    dict(barmode='group', height=380, yaxis=dict(range=[-5, 100]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Networking Barriers — Pre-Event vs Post-Event (Overcome)")
+                barrier_cats = ["Starting conversations", "Finding relevant people",
+                                "Shyness / anxiety", "No specific barrier"]
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### 🏥 Health Sector")
+                    h_pre_b  = [t.H['barriers_pre'][k]  for k in barrier_cats]
+                    h_post_b = [t.H['barriers_post'][k] for k in barrier_cats]
+                    fig = lnc_grouped_bar(
+                        barrier_cats, h_pre_b, h_post_b,
+                        pre_color='rgba(0,99,65,0.3)', post_color='#006341', y_max=14
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### 💻 Technology Sector")
+                    t_pre_b  = [t.T['barriers_pre'][k]  for k in barrier_cats]
+                    t_post_b = [t.T['barriers_post'][k] for k in barrier_cats]
+                    fig = lnc_grouped_bar(
+                        barrier_cats, t_pre_b, t_post_b,
+                        pre_color='rgba(13,59,110,0.3)', post_color='#1a5fa8', y_max=14
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Barriers Comparison — Health vs Technology (Pre-Event)")
+                fig = lnc_figure(
+                    [dict(type='bar', name='🏥 Health', x=barrier_cats,
+                        y=[t.H['barriers_pre'][k] for k in barrier_cats],
+                        marker_color='#006341',
+                        text=[t.H['barriers_pre'][k] for k in barrier_cats], textposition='outside'),
+                     dict(type='bar', name='💻 Technology', x=barrier_cats,
+                        y=[t.T['barriers_pre'][k] for k in barrier_cats],
+                        marker_color='#1a5fa8',
+                        text=[t.T['barriers_pre'][k] for k in barrier_cats], textposition='outside')],
+                    dict(barmode='group', height=360, yaxis=dict(range=[0, 14]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 4: ADVOCACY & NPS ──────────────────────────────────────────────────
+        with tab4:
+            if tab_open(tab4):
+                st.markdown("### NPS Comparison")
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### 🏥 Health — NPS Journey (Pre → Post)")
+                    nps_labs = ["Promoters", "Passives", "Detractors"]
+                    fig = lnc_figure(
+                        [dict(type='bar', name='Before', x=nps_labs,
+                            y=[t.H['nps_pre'][k] for k in nps_labs],
+                            marker_color=['rgba(0,99,65,0.4)', 'rgba(243,156,18,0.4)', 'rgba(231,76,60,0.4)'],
+                            text=[t.H['nps_pre'][k] for k in nps_labs], textposition='outside'),
+                         dict(type='bar', name='After', x=nps_labs,
+                            y=[t.H['nps_post'][k] for k in nps_labs],
+                            marker_color=['#006341', '#e67e22', '#e74c3c'],
+                            text=[t.H['nps_post'][k] for k in nps_labs], textposition='outside')],
+                        dict(barmode='group', height=340, yaxis=dict(range=[0, 22]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### 💻 Technology — NPS (Post-Event Only)")
+                    fig = lnc_figure(
+                        [dict(type='bar', x=nps_labs,
+                            y=[t.T['nps_post'][k] for k in nps_labs],
+                            marker_color=['#1a5fa8', '#e67e22', '#e74c3c'],
+                            text=[t.T['nps_post'][k] for k in nps_labs],
+                            textposition='outside', textfont=dict(size=14))],
+                        dict(height=340, yaxis=dict(range=[0, 20]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False))
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Recommendation — Health vs Technology")
+                c1, c2 = st.columns(2)
+                with c1:
+                    fig = lnc_donut(
+                        ["Highly recommend", "Slightly recommend", "Maybe", "Don't think they need it"],
+                        [t.H['recommendation']['Highly recommend'], t.H['recommendation']['Slightly recommend'],
+                         t.H['recommendation']['Maybe'], t.H['recommendation']["Don't think they need it"]],
+                        ['#006341', '#00843d', '#93c13f', '#e74c3c'],
+                        center_text="🏥 Health\nRecommend"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    fig = lnc_donut(
+                        ["Very likely", "Likely", "Neutral", "Unlikely", "Very unlikely"],
+                        [t.T['recommendation']['Very likely'], t.T['recommendation']['Likely'],
+                         t.T['recommendation']['Neutral'], t.T['recommendation']['Unlikely'],
+                         t.T['recommendation']['Very unlikely']],
+                        ['#1a5fa8', '#378add', '#85B7EB', '#e9ecef', '#e74c3c'],
+                        center_text="💻 Tech\nRecommend"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### NPS Score — Final Comparison")
+                fig = lnc_figure(
+                    [dict(type='bar', x=['🏥 Health (Pre)', '🏥 Health (Post)', '💻 Tech (Post)'],
+                        y=[t.H_nps_pre, t.H_nps_post, t.T_nps_post],
+                        marker_color=['rgba(0,99,65,0.4)', '#006341', '#1a5fa8'],
+                        text=[str(t.H_nps_pre), str(t.H_nps_post), str(t.T_nps_post)],
+                        textposition='outside', textfont=dict(size=15, family='Cormorant Garamond'))],
+                    dict(height=360, yaxis=dict(range=[-10, 60]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        showlegend=False),
+                    hline=dict(y=0, line_dash="dash", line_color="#adb5bd", line_width=1.5))
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 5: RADAR PROFILE ───────────────────────────────────────────────────
+        with tab5:
+            if tab_open(tab5):
+                st.markdown("### 🕸️ Sector Profile Radar — Health vs Technology")
+                radar_dims = [
+                    "Format\nExcellent %", "Post-Event\nComfort %",
+                    "Confidence\nLift (pp)", "Avg LinkedIn\nConns (×10)",
+                    "Recommend %", "NPS Score\n(normalised)"
+                ]
+                h_radar = [
+                    t.H_format_pct,
+                    t.H_comfort_post_pct,
+                    t.H_conf_post_pct - t.H_conf_pre_pct,
+                    round(t.H_linkedin_avg * 10),
+                    t.H_rec_pct,
+                    round((t.H_nps_post + 100) / 2)
+                ]
+                t_radar = [
+                    t.T_format_pct,
+                    t.T_comfort_post_pct,
+                    t.T_conf_post_pct - t.T_conf_pre_pct,
+                    round(t.T_linkedin_avg * 10),
+                    t.T_rec_pct,
+                    round((t.T_nps_post + 100) / 2)
+                ]
+                fig_r = lnc_figure(
+                    [dict(type='scatterpolar', r=h_radar + [h_radar[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='🏥 Health',
+                        line_color='#006341', fillcolor='rgba(0,99,65,0.15)', line_width=2.5),
+                     dict(type='scatterpolar', r=t_radar + [t_radar[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='💻 Technology',
+                        line_color='#1a5fa8', fillcolor='rgba(13,59,110,0.15)', line_width=2.5)],
+                    dict(
+                        polar=dict(
+                            radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=10)),
+                            angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))
+                        ),
+                        showlegend=True, height=520, paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=-0.1, xanchor='center', x=0.5)
+                    ))
+                col_l, col_c, col_r = st.columns([1, 3, 1])
+                with col_c:
+                    st.plotly_chart(fig_r, use_container_width=True)
+
+                st.markdown("### Metric-by-Metric Breakdown")
+                metric_names = ["Format Excellent %", "Post Comfort %",
+                                "Confidence Lift (pp)", "Avg LinkedIn Conns",
+                                "Recommend %", "NPS Score"]
+                h_vals_table = [t.H_format_pct, t.H_comfort_post_pct,
+                                t.H_conf_post_pct - t.H_conf_pre_pct,
+                                t.H_linkedin_avg, t.H_rec_pct, t.H_nps_post]
+                t_vals_table = [t.T_format_pct, t.T_comfort_post_pct,
+                                t.T_conf_post_pct - t.T_conf_pre_pct,
+                                t.T_linkedin_avg, t.T_rec_pct, t.T_nps_post]
+
+                fig_table = lnc_figure(
+                    [dict(type='bar', name='🏥 Health', x=metric_names, y=h_vals_table,
+                        marker_color='#006341',
+                        text=[str(v) for v in h_vals_table], textposition='outside'),
+                     dict(type='bar', name='💻 Technology', x=metric_names, y=t_vals_table,
+                        marker_color='#1a5fa8',
+                        text=[str(v) for v in t_vals_table], textposition='outside')],
+                    dict(barmode='group', height=420, yaxis=dict(range=[0, 110]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                st.plotly_chart(fig_table, use_container_width=True)
+    dashboard_tabs()
+
+    # ── COMPARE ANY SESSIONS ───────────────────────────────────────────────────
+    # One table over every LNC session in the registry; picking sessions only
+    # slices the cached rates and pairwise deltas, and reruns just this fragment.
+    @st.fragment
+    def compare_sessions():
+        # (initiative, session) -> document; unreadable files are left out
+        catalog = {(initiative, name): load_data(info['data_file'])
+                   for initiative, initiative_info in INITIATIVES.items()
+                   for name, info in initiative_info['sessions'].items()
+                   if info.get('type') in LNC_SESSION_TYPES}
+        catalog = {key: doc for key, doc in catalog.items() if doc is not None}
+        if len(catalog) >= 2:
+            st.markdown("---")
+            st.markdown('<p class="section-title">🔀 Compare Sessions</p>', unsafe_allow_html=True)
+            table = lnc_comparison(list(catalog.values()))
+            names = [f"{initiative} / {name}" for initiative, name in catalog]
+            chosen = st.multiselect("Sessions to compare", names, default=names[:2], key="lnc_compare_sessions")
+            idx = [names.index(n) for n in chosen]
+
+            if len(idx) >= 2:
+                palette = ['#006341', '#1a5fa8', '#0d3b6e', '#93c13f', '#f39c12', '#7C3AED']
+                rate_labels = table['labels'][:len(LNC_COMPARE_RATES)]
+                fig = lnc_figure(
+                    [dict(type='bar', name=names[i], x=rate_labels, y=table['rates'][:, i].tolist(),
+                          marker_color=palette[n % len(palette)],
+                          text=[str(v) for v in table['rates'][:, i].tolist()], textposition='outside')
+                     for n, i in enumerate(idx)],
+                    dict(barmode='group', height=440,
+                         yaxis=dict(range=[min(0, int(table['rates'][:, idx].min())) - 10, 110]),
+                         font=dict(family='Epilogue', color='#2c3e50'),
+                         plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                         legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                st.plotly_chart(fig, use_container_width=True)
+
+                base = idx[0]
+                st.markdown(f"#### Differences vs {names[base]}")
+                headline = ['format_pct', 'conf_post_pct', 'recommend_pct', 'nps_post', 'linkedin_avg']
+                for j in idx[1:]:
+                    st.markdown(f"**{names[j]}**")
+                    cols = st.columns(len(headline))
+                    for col, key in zip(cols, headline):
+                        m = table['metrics'].index(key)
+                        value = lnc_metric(table, key)[j]
+                        delta = round(float(table['deltas'][m, base, j]), 1)
+                        col.metric(table['labels'][m], value, f"{delta:+g}")
+            else:
+                st.info("Select at least two sessions to compare.")
+    compare_sessions()
 
     # ── ABOUT BOX ──────────────────────────────────────────────────────────────
     st.markdown("""
@@ -1914,11 +2321,11 @@ if session_info.get('type') == 'lnc_cross':
         <p class="tagline">Health × Technology · Leaders Network Circles · Australia Chapter</p>
         <div style="display:flex; justify-content:center; gap:3rem; margin:2rem 0;
              flex-wrap:wrap; position:relative; z-index:1;">
-            <div><div style="font-size:2.5rem;font-weight:700">{N_H} + {N_T}</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N_H} + {t.N_T}</div>
                  <div style="opacity:0.8">Total participants</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{H_nps_post} vs {T_nps_post}</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.H_nps_post} vs {t.T_nps_post}</div>
                  <div style="opacity:0.8">NPS (H vs T)</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{H_rec_pct}% / {T_rec_pct}%</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.H_rec_pct}% / {t.T_rec_pct}%</div>
                  <div style="opacity:0.8">Recommend (H / T)</div></div>
             <div><div style="font-size:2.5rem;font-weight:700">0%</div>
                  <div style="opacity:0.8">Overwhelming atmosphere (both)</div></div>
@@ -1930,107 +2337,104 @@ if session_info.get('type') == 'lnc_cross':
     </div>
     """, unsafe_allow_html=True)
 
-    st.stop()
-
 
 # ============================================================================
 # LNC COMBINED ANALYSIS DASHBOARD (Health + Technology)
 # ============================================================================
 
-if session_info.get('type') == 'lnc_combined':
+@dataclass(frozen=True, slots=True)
+class LncCombinedTallies:
+    """Pooled LNC figures read by render_lnc_combined."""
+    source_mix: str
+    N_total_pre: int
+    N_total_post: int
+    reg_excellent: int
+    reg_good: int
+    reg_fair: int
+    reg_poor: int
+    fmt_excellent: int
+    fmt_good: int
+    fmt_fair: int
+    fmt_poor: int
+    atm_pre_comfort: int
+    atm_post_comfort: int
+    atm_pre_overwhelm: int
+    atm_post_overwhelm: int
+    conf_pre_high: int
+    conf_post_high: int
+    conf_post_low: int
+    linkedin_combined: dict
+    meaningful_combined: dict
+    conn_target_combined: dict
+    barriers_pre_combined: dict
+    barriers_post_combined: dict
+    nps_post_combined: dict
+    heard_combined: dict
+    fmt_excel_pct: int
+    reg_excel_pct: int
+    conf_pre_pct: int
+    conf_post_pct: int
+    conf_lift: int
+    comfort_pre_pct: int
+    comfort_post_pct: int
+    nps_score: int
+    rec_combined: int
+    rec_moderate: int
+    rec_combined_pct: int
+    linkedin_avg: float
+    meaningful_avg: float
+    target_avg: float
+    career_combined_pct: int
+
+
+@st.cache_resource(hash_funcs=HASH_FUNCS)
+def lnc_combined_static(sources):
+    """Pooled tallies and rates across any number of LNC sessions (computed once per data version)."""
+    C = lnc_aggregate([lnc_sector(d) for d in sources])
+    source_mix = " · ".join(f"{d['respondents']['pre']} {(d.get('metadata') or {}).get('sector', '')}".strip()
+                            for d in sources)
 
     # ── SHARED CONSTANTS ──────────────────────────────────────────────────────
-    N_H     = 27
-    N_T_pre = 24
-    N_T     = 22
-    N_total_pre  = N_H + N_T_pre   # 51
-    N_total_post = N_H + N_T       # 49
+    N_total_pre  = C['n_pre']
+    N_total_post = C['n_post']
 
     # ── COMBINED RAW COUNTS ───────────────────────────────────────────────────
 
     # Registration excellence
-    reg_excellent = 21 + 12   # 33
-    reg_good      = 5  + 11   # 16
-    reg_fair      = 1  + 0    # 1
-    reg_poor      = 1  + 1    # 2 (health poor=0 actually, tech poor=1; health had 0 poor in reg)
+    reg_excellent, reg_good, reg_fair, reg_poor = (C['registration'].get(k, 0)
+                                                   for k in ("Excellent", "Good", "Fair", "Poor"))
 
     # Format excellence (post)
-    fmt_excellent = 23 + 19   # 42
-    fmt_good      = 3  + 2    # 5
-    fmt_fair      = 0  + 1    # 1
-    fmt_poor      = 1  + 0    # 1
+    fmt_excellent, fmt_good, fmt_fair, fmt_poor = (C['format'].get(k, 0)
+                                                   for k in ("Excellent", "Good", "Fair", "Poor"))
 
     # Atmosphere — comfortable & friendly
-    atm_pre_comfort  = 17 + 20   # 37
-    atm_post_comfort = 23 + 20   # 43
-    atm_pre_overwhelm  = 6 + 2   # 8
-    atm_post_overwhelm = 0 + 0   # 0
+    atm_pre_comfort    = C['atmosphere_pre_comfort']
+    atm_post_comfort   = C['atmosphere_post_comfort']
+    atm_pre_overwhelm  = C['atmosphere_pre_overwhelm']
+    atm_post_overwhelm = C['atmosphere_post_overwhelm']
 
     # Confidence
-    conf_pre_high  = (12 + 5) + (8 + 9)    # 34
-    conf_post_high = (19 + 7) + (15 + 4)   # 45
-
-    # LinkedIn connections (post) — raw counts per bucket
-    linkedin_combined = {
-        "1–2":   3 + 1,    # 4
-        "3–5":   9 + 2,    # 11
-        "6–9":   9 + 12,   # 21
-        "10–12": 4 + 5,    # 9
-        "12+":   2 + 2,    # 4
-    }
-
-    # Meaningful connections (post)
-    meaningful_combined = {
-        "1–2":   9 + 4,    # 13
-        "3–5":   8 + 8,    # 16
-        "6–9":   5 + 8,    # 13
-        "10–12": 2 + 2,    # 4
-        "12+":   3 + 0,    # 3
-    }
-
-    # Connection targets (pre)
-    conn_target_combined = {
-        "1–2":   8 + 6,    # 14
-        "3–5":   9 + 9,    # 18
-        "6–9":   5 + 3,    # 8
-        "10–12": 2 + 2,    # 4
-        "12+":   3 + 4,    # 7
-    }
+    conf_pre_high  = C['conf_pre_high']
+    conf_post_high = C['conf_post_high']
+    conf_post_low  = C['conf_post_low']
 
-    # Barriers pre
-    barriers_pre_combined = {
-        "Starting\nconversations":  8 + 8,    # 16
-        "Finding\nrelevant people": 10 + 8,   # 18
-        "Shyness /\nanxiety":       6 + 1,    # 7
-        "No specific\nbarrier":     3 + 7,    # 10
-    }
+    # Connections — raw counts per bucket
+    linkedin_combined    = C['linkedin_post']
+    meaningful_combined  = C['meaningful_post']
+    conn_target_combined = C['conn_target']
 
-    # Barriers post (overcome)
-    barriers_post_combined = {
-        "Starting\nconversations":  8 + 10,   # 18
-        "Finding\nrelevant people": 9 + 5,    # 14
-        "Shyness /\nanxiety":       6 + 1,    # 7
-        "No specific\nbarrier":     4 + 6,    # 10
-    }
+    # Barriers (pre) and barriers overcome (post)
+    barriers_pre_combined  = C['barriers_pre']
+    barriers_post_combined = C['barriers_post']
 
     # NPS post (combined raw counts)
-    nps_post_combined = {
-        "Promoters":  17 + 15,   # 32
-        "Passives":   8  + 5,    # 13
-        "Detractors": 2  + 2,    # 4
-    }
-    nps_pre_health = {
-        "Promoters": 12, "Passives": 9, "Detractors": 6
-    }
+    nps_post_combined = C['nps_post']
 
-    # How heard (pre) — combined
-    heard_combined = {
-        "WhatsApp":          10 + 14,  # 24
-        "Friend/colleague":  13 + 3,   # 16
-        "Snapchat":          2  + 3,   # 5
-        "Other":             2  + 3,   # 5
-        "LinkedIn":          0  + 1,   # 1
-    }
+    # How heard (pre) — combined, most common first; ties keep the channel order
+    rank = {k: i for i, k in enumerate(LNC_HEARD_CHANNELS)}
+    heard_combined = dict(sorted(C['heard_about'].items(),
+                                 key=lambda kv: (-kv[1], rank.get(kv[0], len(rank)))))
 
     # ── DERIVED METRICS ───────────────────────────────────────────────────────
     fmt_excel_pct      = round(fmt_excellent / N_total_post * 100)
@@ -2048,27 +2452,47 @@ if session_info.get('type') == 'lnc_combined':
         / N_total_post * 100
     )
 
-    # Recommend combined
-    # Health: "Highly recommend" = 20 of 27
-    # Tech:   "Very likely" + "Likely" = 20 + 2 = 22 of 22
-    rec_combined     = 20 + 22    # 42
+    # Recommend combined — Health: "Highly recommend"; Tech: "Very likely" + "Likely"
+    rec_combined     = C['recommend']
+    rec_moderate     = C['recommend_moderate']
     rec_combined_pct = round(rec_combined / N_total_post * 100)
 
-    # Weighted avg connections helper
-    def weighted_avg(d, n):
-        mids = {"1–2": 1.5, "3–5": 4, "6–9": 7.5, "10–12": 11, "12+": 13}
-        return round(sum(mids[k] * v for k, v in d.items()) / n, 1)
+    linkedin_avg    = lnc_weighted_avg(linkedin_combined,    N_total_post)
+    meaningful_avg  = lnc_weighted_avg(meaningful_combined,  N_total_post)
+    target_avg      = lnc_weighted_avg(conn_target_combined, N_total_pre)
 
-    linkedin_avg    = weighted_avg(linkedin_combined,    N_total_post)
-    meaningful_avg  = weighted_avg(meaningful_combined,  N_total_post)
-    target_avg      = weighted_avg(conn_target_combined, N_total_pre)
-
-    # Career & outcomes (health only has these; used as partial combined)
-    # Health career opps: 14 definite + 6 possible = 20 of 27 = 74%
-    # Tech relevant conns: 10 + 9 = 19 of 22 = 86%
-    career_combined     = 20 + 19   # 39
+    # Career & outcomes — Health: career opportunities; Tech: relevant connections
+    career_combined     = C['outcome']
     career_combined_pct = round(career_combined / N_total_post * 100)
 
+    return LncCombinedTallies(source_mix=source_mix, N_total_pre=N_total_pre, N_total_post=N_total_post,
+                              reg_excellent=reg_excellent, reg_good=reg_good, reg_fair=reg_fair,
+                              reg_poor=reg_poor, fmt_excellent=fmt_excellent, fmt_good=fmt_good,
+                              fmt_fair=fmt_fair, fmt_poor=fmt_poor, atm_pre_comfort=atm_pre_comfort,
+                              atm_post_comfort=atm_post_comfort,
+                              atm_pre_overwhelm=atm_pre_overwhelm,
+                              atm_post_overwhelm=atm_post_overwhelm, conf_pre_high=conf_pre_high,
+                              conf_post_high=conf_post_high, conf_post_low=conf_post_low,
+                              linkedin_combined=linkedin_combined,
+                              meaningful_combined=meaningful_combined,
+                              conn_target_combined=conn_target_combined,
+                              barriers_pre_combined=barriers_pre_combined,
+                              barriers_post_combined=barriers_post_combined,
+                              nps_post_combined=nps_post_combined, heard_combined=heard_combined,
+                              fmt_excel_pct=fmt_excel_pct, reg_excel_pct=reg_excel_pct,
+                              conf_pre_pct=conf_pre_pct, conf_post_pct=conf_post_pct,
+                              conf_lift=conf_lift, comfort_pre_pct=comfort_pre_pct,
+                              comfort_post_pct=comfort_post_pct, nps_score=nps_score,
+                              rec_combined=rec_combined, rec_moderate=rec_moderate,
+                              rec_combined_pct=rec_combined_pct, linkedin_avg=linkedin_avg,
+                              meaningful_avg=meaningful_avg, target_avg=target_avg,
+                              career_combined_pct=career_combined_pct)
+
+
+def render_lnc_combined(selected_session, initiative_info, session_info, data):
+    """LNC dashboard pooling every session listed in the registry's `sources`."""
+    t = lnc_combined_static(data)
+
     # ── HEADER ────────────────────────────────────────────────────────────────
     st.markdown("""
     <div class="lnc-header">
@@ -2091,27 +2515,27 @@ if session_info.get('type') == 'lnc_combined':
         <div style="display:flex; flex-wrap:wrap; justify-content:center;
              gap:0.5rem; position:relative; z-index:1;">
             <div class="stat-pill">
-                <span class="num">{N_total_pre}</span>
+                <span class="num">{t.N_total_pre}</span>
                 <span class="lbl">Pre-survey total</span>
             </div>
             <div class="stat-pill">
-                <span class="num">{N_total_post}</span>
+                <span class="num">{t.N_total_post}</span>
                 <span class="lbl">Post-survey total</span>
             </div>
             <div class="stat-pill">
-                <span class="num">{fmt_excel_pct}%</span>
+                <span class="num">{t.fmt_excel_pct}%</span>
                 <span class="lbl">Excellent format</span>
             </div>
             <div class="stat-pill">
-                <span class="num">{conf_lift:+}pp</span>
+                <span class="num">{t.conf_lift:+}pp</span>
                 <span class="lbl">Confidence lift</span>
             </div>
             <div class="stat-pill">
-                <span class="num">{nps_score}</span>
+                <span class="num">{t.nps_score}</span>
                 <span class="lbl">Combined NPS</span>
             </div>
             <div class="stat-pill">
-                <span class="num">{rec_combined_pct}%</span>
+                <span class="num">{t.rec_combined_pct}%</span>
                 <span class="lbl">Would recommend</span>
             </div>
             <div class="stat-pill">
@@ -2132,22 +2556,22 @@ if session_info.get('type') == 'lnc_combined':
     with c1:
         st.markdown(create_kpi_card(
             "REACH", "Total Participants",
-            f"{N_total_pre} / {N_total_post}",
-            f"{N_total_pre} pre-event across both sectors · {N_total_post} post-event",
+            f"{t.N_total_pre} / {t.N_total_post}",
+            f"{t.N_total_pre} pre-event across both sectors · {t.N_total_post} post-event",
             "✓ 2 sectors · 2 sessions"
         ), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card(
             "FORMAT", "Circle Format — Excellent",
-            f"{fmt_excel_pct}%",
-            f"{fmt_excellent} of {N_total_post} rated the format Excellent",
+            f"{t.fmt_excel_pct}%",
+            f"{t.fmt_excellent} of {t.N_total_post} rated the format Excellent",
             "✓ Consistent across both sectors"
         ), unsafe_allow_html=True)
     with c3:
         st.markdown(create_kpi_card(
             "ONBOARDING", "Registration — Excellent",
-            f"{reg_excel_pct}%",
-            f"{reg_excellent} of {N_total_pre} rated registration Excellent",
+            f"{t.reg_excel_pct}%",
+            f"{t.reg_excellent} of {t.N_total_pre} rated registration Excellent",
             "✓ Smooth onboarding programme-wide"
         ), unsafe_allow_html=True)
 
@@ -2157,22 +2581,22 @@ if session_info.get('type') == 'lnc_combined':
     with c1:
         st.markdown(create_kpi_card(
             "CONFIDENCE", "Post-Event High Confidence",
-            f"{conf_post_pct}%",
-            f"{conf_post_high} of {N_total_post} felt highly confident after the event",
-            f"✓ +{conf_lift}pp lift from pre-event ({conf_pre_pct}%)"
+            f"{t.conf_post_pct}%",
+            f"{t.conf_post_high} of {t.N_total_post} felt highly confident after the event",
+            f"✓ +{t.conf_lift}pp lift from pre-event ({t.conf_pre_pct}%)"
         ), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card(
             "CONNECTIONS", "Avg LinkedIn Connections",
-            str(linkedin_avg),
+            str(t.linkedin_avg),
             f"Weighted average per participant across both sessions",
-            f"✓ Avg {meaningful_avg} meaningful connections"
+            f"✓ Avg {t.meaningful_avg} meaningful connections"
         ), unsafe_allow_html=True)
     with c3:
         st.markdown(create_kpi_card(
             "ATMOSPHERE", "Overwhelming Atmosphere Eliminated",
             "0%",
-            f"Dropped from {atm_pre_overwhelm} participants pre → 0 post-event",
+            f"Dropped from {t.atm_pre_overwhelm} participants pre → 0 post-event",
             "✓ Circle format removes anxiety universally"
         ), unsafe_allow_html=True)
 
@@ -2182,23 +2606,23 @@ if session_info.get('type') == 'lnc_combined':
     with c1:
         st.markdown(create_kpi_card(
             "NPS", "Combined NPS Score",
-            str(nps_score),
-            f"Promoters: {nps_post_combined['Promoters']} · "
-            f"Passives: {nps_post_combined['Passives']} · "
-            f"Detractors: {nps_post_combined['Detractors']}",
+            str(t.nps_score),
+            f"Promoters: {t.nps_post_combined['Promoters']} · "
+            f"Passives: {t.nps_post_combined['Passives']} · "
+            f"Detractors: {t.nps_post_combined['Detractors']}",
             "✓ Strong advocacy across both sectors"
         ), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card(
             "ADVOCACY", "Would Recommend",
-            f"{rec_combined_pct}%",
-            f"{rec_combined} of {N_total_post} would recommend the event",
+            f"{t.rec_combined_pct}%",
+            f"{t.rec_combined} of {t.N_total_post} would recommend the event",
             "✓ Outstanding word-of-mouth"
         ), unsafe_allow_html=True)
     with c3:
         st.markdown(create_kpi_card(
             "OUTCOMES", "Career / Relevant Connections",
-            f"{career_combined_pct}%",
+            f"{t.career_combined_pct}%",
             "Found career opps (Health) or relevant connections (Tech)",
             "✓ High professional value"
         ), unsafe_allow_html=True)
@@ -2208,20 +2632,20 @@ if session_info.get('type') == 'lnc_combined':
     <div class="lnc-highlight-box">
         <h3>🌐 Combined Programme — Key Findings</h3>
         <ul>
-            <li><strong>{N_total_pre} participants</strong> engaged across Health and Technology
-                sessions — {N_H} Health · {N_T_pre} Technology</li>
-            <li><strong>{fmt_excel_pct}%</strong> rated the circle-rotation format as Excellent
+            <li><strong>{t.N_total_pre} participants</strong> engaged across Health and Technology
+                sessions — {t.source_mix}</li>
+            <li><strong>{t.fmt_excel_pct}%</strong> rated the circle-rotation format as Excellent
                 — consistent quality across both sectors</li>
             <li>Overwhelming atmosphere dropped from
-                <strong>{atm_pre_overwhelm} → 0 participants</strong>
+                <strong>{t.atm_pre_overwhelm} → {t.atm_post_overwhelm} participants</strong>
                 post-event in both sessions combined</li>
             <li>Confidence in networking lifted by
-                <strong>+{conf_lift} percentage points</strong>
-                programme-wide ({conf_pre_pct}% → {conf_post_pct}%)</li>
-            <li>Combined NPS of <strong>{nps_score}</strong> with
-                {nps_post_combined['Promoters']} Promoters and only
-                {nps_post_combined['Detractors']} Detractors across both sessions</li>
-            <li><strong>{rec_combined_pct}%</strong> of all participants would recommend
+                <strong>+{t.conf_lift} percentage points</strong>
+                programme-wide ({t.conf_pre_pct}% → {t.conf_post_pct}%)</li>
+            <li>Combined NPS of <strong>{t.nps_score}</strong> with
+                {t.nps_post_combined['Promoters']} Promoters and only
+                {t.nps_post_combined['Detractors']} Detractors across both sessions</li>
+            <li><strong>{t.rec_combined_pct}%</strong> of all participants would recommend
                 Leaders Network Circles to fellow Saudi students</li>
         </ul>
     </div>
@@ -2232,285 +2656,276 @@ if session_info.get('type') == 'lnc_combined':
     st.markdown('<p class="section-title">📚 Programme Deep-Dive</p>',
                 unsafe_allow_html=True)
 
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📊 Format & Atmosphere",
-        "🤝 Connections",
-        "💪 Confidence & Barriers",
-        "📣 Advocacy & NPS"
-    ])
-
-    # ── TAB 1: FORMAT & ATMOSPHERE ─────────────────────────────────────────────
-    with tab1:
-        st.markdown("### Circle Format Rating — Combined (Post-Event)")
-        c1, c2 = st.columns(2)
-        with c1:
-            fig = lnc_donut(
-                ["Excellent", "Good", "Fair", "Poor"],
-                [fmt_excellent, fmt_good, fmt_fair, fmt_poor],
-                ['#0d3b6e', '#378add', '#85B7EB', '#e74c3c'],
-                center_text="Format\nRating"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("### Registration Rating — Combined (Pre-Event)")
-            fig = lnc_donut(
-                ["Excellent", "Good", "Fair", "Poor"],
-                [reg_excellent, reg_good, reg_fair, reg_poor],
-                ['#006341', '#00843d', '#93c13f', '#e74c3c'],
-                center_text="Registration\nRating"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Atmosphere — Before vs After (Combined)")
-        st.markdown(compare_band(
-            comfort_pre_pct, comfort_post_pct,
-            f"{atm_pre_comfort} of {N_total_pre} felt comfortable pre-event",
-            f"{atm_post_comfort} of {N_total_post} felt comfortable post-event",
-            "#6b7280", "#0d3b6e", "%",
-            "Comfortable & friendly"
-        ), unsafe_allow_html=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Comfortable Atmosphere — Pre vs Post")
-            fig = go.Figure(go.Bar(
-                x=["Pre-Event", "Post-Event"],
-                y=[comfort_pre_pct, comfort_post_pct],
-                marker_color=['rgba(13,59,110,0.4)', '#0d3b6e'],
-                text=[f"{comfort_pre_pct}%", f"{comfort_post_pct}%"],
-                textposition='outside', textfont=dict(size=15, family='Epilogue')
-            ))
-            fig.update_layout(height=340, yaxis=dict(range=[0, 100]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Overwhelming Atmosphere — Pre vs Post")
-            fig = go.Figure(go.Bar(
-                x=["Pre-Event", "Post-Event"],
-                y=[atm_pre_overwhelm, atm_post_overwhelm],
-                marker_color=['#e74c3c', '#93c13f'],
-                text=[str(atm_pre_overwhelm), str(atm_post_overwhelm)],
-                textposition='outside', textfont=dict(size=15, family='Epilogue')
-            ))
-            fig.update_layout(height=340, yaxis=dict(range=[0, 12]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### How Participants Heard About the Event — Combined")
-        fig = lnc_bar(
-            list(heard_combined.keys()),
-            list(heard_combined.values()),
-            ['#0d3b6e', '#1a5fa8', '#378add', '#85B7EB', '#d0d9e8'],
-            height=320, v_range=[0, 28]
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 2: CONNECTIONS ─────────────────────────────────────────────────────
-    with tab2:
-        st.markdown("### LinkedIn Connections Made — Combined (Post-Event)")
-        conn_labs = ["1–2", "3–5", "6–9", "10–12", "12+"]
-
-        c1, c2 = st.columns(2)
-        with c1:
-            fig = lnc_donut(
-                conn_labs,
-                [linkedin_combined[k] for k in conn_labs],
-                ['#e9ecef', '#85B7EB', '#0d3b6e', '#006341', '#93c13f'],
-                center_text=f"Avg\n{linkedin_avg}"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("### Meaningful Connections — Combined (Post-Event)")
-            fig = lnc_donut(
-                conn_labs,
-                [meaningful_combined[k] for k in conn_labs],
-                ['#e9ecef', '#85B7EB', '#0d3b6e', '#006341', '#93c13f'],
-                center_text=f"Avg\n{meaningful_avg}"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Target vs Actual — Combined Connection Journey")
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Target (Pre-Event)',
-            x=conn_labs,
-            y=[conn_target_combined[k] for k in conn_labs],
-            marker_color='rgba(13,59,110,0.35)',
-            text=[conn_target_combined[k] for k in conn_labs],
-            textposition='outside'
-        ))
-        fig.add_trace(go.Bar(
-            name='LinkedIn Made (Post)',
-            x=conn_labs,
-            y=[linkedin_combined[k] for k in conn_labs],
-            marker_color='#0d3b6e',
-            text=[linkedin_combined[k] for k in conn_labs],
-            textposition='outside'
-        ))
-        fig.add_trace(go.Bar(
-            name='Meaningful (Post)',
-            x=conn_labs,
-            y=[meaningful_combined[k] for k in conn_labs],
-            marker_color='#006341',
-            text=[meaningful_combined[k] for k in conn_labs],
-            textposition='outside'
-        ))
-        fig.update_layout(
-            barmode='group', height=420, yaxis=dict(range=[0, 26]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02,
-                        xanchor='center', x=0.5)
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.metric("Avg LinkedIn Connections", str(linkedin_avg),
-                      delta="per participant")
-        with c2:
-            st.metric("Avg Meaningful Connections", str(meaningful_avg),
-                      delta="per participant")
-        with c3:
-            st.metric("Avg Target (Pre-Event)", str(target_avg),
-                      delta="per participant")
-
-    # ── TAB 3: CONFIDENCE & BARRIERS ───────────────────────────────────────────
-    with tab3:
-        st.markdown("### Confidence Journey — Combined Programme")
-        st.markdown(compare_band(
-            conf_pre_pct, conf_post_pct,
-            f"{conf_pre_high} of {N_total_pre} highly confident pre-event",
-            f"{conf_post_high} of {N_total_post} highly confident post-event",
-            "#6b7280", "#0d3b6e", "%", "High confidence (combined)"
-        ), unsafe_allow_html=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Confidence — Pre vs Post (Combined %)")
-            fig = go.Figure(go.Bar(
-                x=["Pre-Event\nHigh Confidence", "Post-Event\nHigh Confidence"],
-                y=[conf_pre_pct, conf_post_pct],
-                marker_color=['rgba(13,59,110,0.4)', '#0d3b6e'],
-                text=[f"{conf_pre_pct}%", f"{conf_post_pct}%"],
-                textposition='outside', textfont=dict(size=15)
-            ))
-            fig.update_layout(height=340, yaxis=dict(range=[0, 100]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Confidence Levels Distribution (Post-Event Combined)")
-            # Post combined: Very confident 15+8=23(T only has very conf/conf)
-            # Health post: significantly improved=19, slightly=7 → using as high conf proxy
-            # Tech post: very conf=15, conf=4
-            post_conf_labs = ["High\nConfidence", "Neutral", "Low\nConfidence"]
-            post_conf_vals = [conf_post_high, (N_total_post - conf_post_high - 0), 0]
-            # Health neutral=1 (no change), Tech neutral=3 → total neutral=4
-            post_conf_vals = [conf_post_high, 4, 0]
-            fig = lnc_donut(
-                post_conf_labs, post_conf_vals,
-                ['#0d3b6e', '#85B7EB', '#e9ecef'],
-                center_text=f"{conf_post_pct}%\nHigh Conf"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Barriers — Combined Pre vs Post")
-        bar_labs = [k.replace('\n', ' ') for k in barriers_pre_combined.keys()]
-        pre_bar_vals  = list(barriers_pre_combined.values())
-        post_bar_vals = list(barriers_post_combined.values())
-
-        fig = lnc_grouped_bar(
-            bar_labs, pre_bar_vals, post_bar_vals,
-            pre_color='rgba(13,59,110,0.3)', post_color='#0d3b6e',
-            height=380, y_max=22
-        )
-        fig.update_layout(
-            title_text="Barriers Reported Pre-Event vs Overcome Post-Event (Combined)",
-            title_font=dict(family='Cormorant Garamond', size=17)
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Barriers Distribution — Combined (Pre-Event)")
-        fig = lnc_donut(
-            [k.replace('\n', ' ') for k in barriers_pre_combined.keys()],
-            list(barriers_pre_combined.values()),
-            ['#0d3b6e', '#1a5fa8', '#378add', '#85B7EB'],
-            center_text=f"{N_total_pre}\nParticipants"
-        )
-        col_l, col_c, col_r = st.columns([1, 2, 1])
-        with col_c:
-            st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 4: ADVOCACY & NPS ──────────────────────────────────────────────────
-    with tab4:
-        st.markdown("### NPS — Combined Post-Event")
-        c1, c2 = st.columns(2)
-        with c1:
-            nps_labs = ["Promoters", "Passives", "Detractors"]
-            fig = lnc_donut(
-                nps_labs,
-                [nps_post_combined[k] for k in nps_labs],
-                ['#006341', '#f39c12', '#e74c3c'],
-                center_text=f"NPS\n{nps_score}"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### NPS Breakdown — Raw Counts")
-            fig = go.Figure(go.Bar(
-                x=nps_labs,
-                y=[nps_post_combined[k] for k in nps_labs],
-                marker_color=['#006341', '#f39c12', '#e74c3c'],
-                text=[nps_post_combined[k] for k in nps_labs],
-                textposition='outside', textfont=dict(size=15, family='Epilogue')
-            ))
-            fig.update_layout(height=360, yaxis=dict(range=[0, 38]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Recommendation — Combined (Post-Event)")
-        # Health: Highly=20, Slightly=5, Maybe=0, Don't=2
-        # Tech:   Very likely=20, Likely=2, Neutral=0, Unlikely=0, VU=0
-        # Merged into: Strong=42, Moderate=5, Neutral=0, Against=2
-        fig = lnc_donut(
-            ["Strong\nRecommendation", "Moderate\nRecommendation",
-             "Neutral / Against"],
-            [42, 5, 2],
-            ['#006341', '#00843d', '#e74c3c'],
-            center_text=f"{rec_combined_pct}%\nRecommend"
-        )
-        col_l, col_c, col_r = st.columns([1, 2, 1])
-        with col_c:
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Programme Funnel — Combined")
-        fig = go.Figure(go.Funnel(
-            y=["Pre-Event Participants", "Post-Event Participants",
-               "Excellent Format Rating", "High Confidence (Post)",
-               "Would Recommend"],
-            x=[N_total_pre, N_total_post,
-               fmt_excellent, conf_post_high, rec_combined],
-            textposition="inside",
-            textinfo="value+percent initial",
-            marker={
-                "color": ['#0d3b6e', '#1a5fa8', '#378add', '#006341', '#00843d'],
-                "line": {"width": 2, "color": "white"}
-            }
-        ))
-        fig.update_layout(
-            height=440,
-            font=dict(family="Epilogue", size=13, color="#2c3e50"),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            margin=dict(l=20, r=20, t=20, b=20)
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    @st.fragment
+    def dashboard_tabs():
+        tab1, tab2, tab3, tab4 = session_tabs(selected_session, [
+            "📊 Format & Atmosphere",
+            "🤝 Connections",
+            "💪 Confidence & Barriers",
+            "📣 Advocacy & NPS"
+        ])
+
+        # ── TAB 1: FORMAT & ATMOSPHERE ─────────────────────────────────────────────
+        with tab1:
+            if tab_open(tab1):
+                st.markdown("### Circle Format Rating — Combined (Post-Event)")
+                c1, c2 = st.columns(2)
+                with c1:
+                    fig = lnc_donut(
+                        ["Excellent", "Good", "Fair", "Poor"],
+                        [t.fmt_excellent, t.fmt_good, t.fmt_fair, t.fmt_poor],
+                        ['#0d3b6e', '#378add', '#85B7EB', '#e74c3c'],
+                        center_text="Format\nRating"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("### Registration Rating — Combined (Pre-Event)")
+                    fig = lnc_donut(
+                        ["Excellent", "Good", "Fair", "Poor"],
+                        [t.reg_excellent, t.reg_good, t.reg_fair, t.reg_poor],
+                        ['#006341', '#00843d', '#93c13f', '#e74c3c'],
+                        center_text="Registration\nRating"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Atmosphere — Before vs After (Combined)")
+                st.markdown(compare_band(
+                    t.comfort_pre_pct, t.comfort_post_pct,
+                    f"{t.atm_pre_comfort} of {t.N_total_pre} felt comfortable pre-event",
+                    f"{t.atm_post_comfort} of {t.N_total_post} felt comfortable post-event",
+                    "#6b7280", "#0d3b6e", "%",
+                    "Comfortable & friendly"
+                ), unsafe_allow_html=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Comfortable Atmosphere — Pre vs Post")
+                    fig = lnc_figure(
+                        [dict(type='bar', x=["Pre-Event", "Post-Event"],
+                            y=[t.comfort_pre_pct, t.comfort_post_pct],
+                            marker_color=['rgba(13,59,110,0.4)', '#0d3b6e'],
+                            text=[f"{t.comfort_pre_pct}%", f"{t.comfort_post_pct}%"],
+                            textposition='outside', textfont=dict(size=15, family='Epilogue'))],
+                        dict(height=340, yaxis=dict(range=[0, 100]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False))
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Overwhelming Atmosphere — Pre vs Post")
+                    fig = lnc_figure(
+                        [dict(type='bar', x=["Pre-Event", "Post-Event"],
+                            y=[t.atm_pre_overwhelm, t.atm_post_overwhelm],
+                            marker_color=['#e74c3c', '#93c13f'],
+                            text=[str(t.atm_pre_overwhelm), str(t.atm_post_overwhelm)],
+                            textposition='outside', textfont=dict(size=15, family='Epilogue'))],
+                        dict(height=340, yaxis=dict(range=[0, 12]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False))
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### How Participants Heard About the Event — Combined")
+                fig = lnc_bar(
+                    list(t.heard_combined.keys()),
+                    list(t.heard_combined.values()),
+                    ['#0d3b6e', '#1a5fa8', '#378add', '#85B7EB', '#d0d9e8'],
+                    height=320, v_range=[0, 28]
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 2: CONNECTIONS ─────────────────────────────────────────────────────
+        with tab2:
+            if tab_open(tab2):
+                st.markdown("### LinkedIn Connections Made — Combined (Post-Event)")
+                conn_labs = ["1–2", "3–5", "6–9", "10–12", "12+"]
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    fig = lnc_donut(
+                        conn_labs,
+                        [t.linkedin_combined[k] for k in conn_labs],
+                        ['#e9ecef', '#85B7EB', '#0d3b6e', '#006341', '#93c13f'],
+                        center_text=f"Avg\n{t.linkedin_avg}"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("### Meaningful Connections — Combined (Post-Event)")
+                    fig = lnc_donut(
+                        conn_labs,
+                        [t.meaningful_combined[k] for k in conn_labs],
+                        ['#e9ecef', '#85B7EB', '#0d3b6e', '#006341', '#93c13f'],
+                        center_text=f"Avg\n{t.meaningful_avg}"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Target vs Actual — Combined Connection Journey")
+                fig = lnc_figure(
+                    [dict(type='bar', name='Target (Pre-Event)',
+                        x=conn_labs,
+                        y=[t.conn_target_combined[k] for k in conn_labs],
+                        marker_color='rgba(13,59,110,0.35)',
+                        text=[t.conn_target_combined[k] for k in conn_labs],
+                        textposition='outside'),
+                     dict(type='bar', name='LinkedIn Made (Post)',
+                        x=conn_labs,
+                        y=[t.linkedin_combined[k] for k in conn_labs],
+                        marker_color='#0d3b6e',
+                        text=[t.linkedin_combined[k] for k in conn_labs],
+                        textposition='outside'),
+                     dict(type='bar', name='Meaningful (Post)',
+                        x=conn_labs,
+                        y=[t.meaningful_combined[k] for k in conn_labs],
+                        marker_color='#006341',
+                        text=[t.meaningful_combined[k] for k in conn_labs],
+                        textposition='outside')],
+                    dict(
+                        barmode='group', height=420, yaxis=dict(range=[0, 26]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02,
+                                    xanchor='center', x=0.5)
+                    ))
+                st.plotly_chart(fig, use_container_width=True)
+
+                c1, c2, c3 = st.columns(3)
+                with c1:
+                    st.metric("Avg LinkedIn Connections", str(t.linkedin_avg),
+                              delta="per participant")
+                with c2:
+                    st.metric("Avg Meaningful Connections", str(t.meaningful_avg),
+                              delta="per participant")
+                with c3:
+                    st.metric("Avg Target (Pre-Event)", str(t.target_avg),
+                              delta="per participant")
+
+        # ── TAB 3: CONFIDENCE & BARRIERS ───────────────────────────────────────────
+        with tab3:
+            if tab_open(tab3):
+                st.markdown("### Confidence Journey — Combined Programme")
+                st.markdown(compare_band(
+                    t.conf_pre_pct, t.conf_post_pct,
+                    f"{t.conf_pre_high} of {t.N_total_pre} highly confident pre-event",
+                    f"{t.conf_post_high} of {t.N_total_post} highly confident post-event",
+                    "#6b7280", "#0d3b6e", "%", "High confidence (combined)"
+                ), unsafe_allow_html=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Confidence — Pre vs Post (Combined %)")
+                    fig = lnc_figure(
+                        [dict(type='bar', x=["Pre-Event\nHigh Confidence", "Post-Event\nHigh Confidence"],
+                            y=[t.conf_pre_pct, t.conf_post_pct],
+                            marker_color=['rgba(13,59,110,0.4)', '#0d3b6e'],
+                            text=[f"{t.conf_pre_pct}%", f"{t.conf_post_pct}%"],
+                            textposition='outside', textfont=dict(size=15))],
+                        dict(height=340, yaxis=dict(range=[0, 100]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False))
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Confidence Levels Distribution (Post-Event Combined)")
+                    # Health post asked about confidence *change* (improved → high conf proxy)
+                    post_conf_labs = ["High\nConfidence", "Neutral", "Low\nConfidence"]
+                    post_conf_vals = [t.conf_post_high, t.N_total_post - t.conf_post_high - t.conf_post_low, t.conf_post_low]
+                    fig = lnc_donut(
+                        post_conf_labs, post_conf_vals,
+                        ['#0d3b6e', '#85B7EB', '#e9ecef'],
+                        center_text=f"{t.conf_post_pct}%\nHigh Conf"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Barriers — Combined Pre vs Post")
+                bar_labs = [k.replace('\n', ' ') for k in t.barriers_pre_combined.keys()]
+                pre_bar_vals  = list(t.barriers_pre_combined.values())
+                post_bar_vals = list(t.barriers_post_combined.values())
+
+                fig = lnc_grouped_bar(
+                    bar_labs, pre_bar_vals, post_bar_vals,
+                    pre_color='rgba(13,59,110,0.3)', post_color='#0d3b6e',
+                    height=380, y_max=22,
+                    layout=dict(
+                        title_text="Barriers Reported Pre-Event vs Overcome Post-Event (Combined)",
+                        title_font=dict(family='Cormorant Garamond', size=17)
+                    )
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Barriers Distribution — Combined (Pre-Event)")
+                fig = lnc_donut(
+                    [k.replace('\n', ' ') for k in t.barriers_pre_combined.keys()],
+                    list(t.barriers_pre_combined.values()),
+                    ['#0d3b6e', '#1a5fa8', '#378add', '#85B7EB'],
+                    center_text=f"{t.N_total_pre}\nParticipants"
+                )
+                col_l, col_c, col_r = st.columns([1, 2, 1])
+                with col_c:
+                    st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 4: ADVOCACY & NPS ──────────────────────────────────────────────────
+        with tab4:
+            if tab_open(tab4):
+                st.markdown("### NPS — Combined Post-Event")
+                c1, c2 = st.columns(2)
+                with c1:
+                    nps_labs = ["Promoters", "Passives", "Detractors"]
+                    fig = lnc_donut(
+                        nps_labs,
+                        [t.nps_post_combined[k] for k in nps_labs],
+                        ['#006341', '#f39c12', '#e74c3c'],
+                        center_text=f"NPS\n{t.nps_score}"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### NPS Breakdown — Raw Counts")
+                    fig = lnc_figure(
+                        [dict(type='bar', x=nps_labs,
+                            y=[t.nps_post_combined[k] for k in nps_labs],
+                            marker_color=['#006341', '#f39c12', '#e74c3c'],
+                            text=[t.nps_post_combined[k] for k in nps_labs],
+                            textposition='outside', textfont=dict(size=15, family='Epilogue'))],
+                        dict(height=360, yaxis=dict(range=[0, 38]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False))
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Recommendation — Combined (Post-Event)")
+                # Strong: Health "Highly recommend" + Tech "Very likely"/"Likely";
+                # Moderate: Health "Slightly recommend"; everyone else is neutral / against
+                fig = lnc_donut(
+                    ["Strong\nRecommendation", "Moderate\nRecommendation",
+                     "Neutral / Against"],
+                    [t.rec_combined, t.rec_moderate, t.N_total_post - t.rec_combined - t.rec_moderate],
+                    ['#006341', '#00843d', '#e74c3c'],
+                    center_text=f"{t.rec_combined_pct}%\nRecommend"
+                )
+                col_l, col_c, col_r = st.columns([1, 2, 1])
+                with col_c:
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Programme Funnel — Combined")
+                fig = lnc_figure(
+                    [dict(type='funnel', y=["Pre-Event Participants", "Post-Event Participants",
+                           "Excellent Format Rating", "High Confidence (Post)",
+                           "Would Recommend"],
+                        x=[t.N_total_pre, t.N_total_post,
+                           t.fmt_excellent, t.conf_post_high, t.rec_combined],
+                        textposition="inside",
+                        textinfo="value+percent initial",
+                        marker={
+                            "color": ['#0d3b6e', '#1a5fa8', '#378add', '#006341', '#00843d'],
+                            "line": {"width": 2, "color": "white"}
+                        })],
+                    dict(
+                        height=440,
+                        font=dict(family="Epilogue", size=13, color="#2c3e50"),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        margin=dict(l=20, r=20, t=20, b=20)
+                    ))
+                st.plotly_chart(fig, use_container_width=True)
+    dashboard_tabs()
 
     # ── ABOUT BOX ──────────────────────────────────────────────────────────────
     st.markdown("""
@@ -2527,7 +2942,7 @@ if session_info.get('type') == 'lnc_combined':
             across Health and Technology sectors in Australia.
         </p>
     </div>
-    """.format(n_pre=N_total_pre, n_post=N_total_post), unsafe_allow_html=True)
+    """.format(n_pre=t.N_total_pre, n_post=t.N_total_post), unsafe_allow_html=True)
 
     # ── FOOTER ─────────────────────────────────────────────────────────────────
     st.markdown(f"""
@@ -2536,17 +2951,17 @@ if session_info.get('type') == 'lnc_combined':
         <p class="tagline">Health + Technology · Leaders Network Circles · Australia Chapter</p>
         <div style="display:flex; justify-content:center; gap:2.5rem; margin:2rem 0;
              flex-wrap:wrap; position:relative; z-index:1;">
-            <div><div style="font-size:2.5rem;font-weight:700">{N_total_pre}</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N_total_pre}</div>
                  <div style="opacity:0.8">Total pre-survey</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{N_total_post}</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N_total_post}</div>
                  <div style="opacity:0.8">Total post-survey</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{fmt_excel_pct}%</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.fmt_excel_pct}%</div>
                  <div style="opacity:0.8">Excellent format</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{conf_lift:+}pp</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.conf_lift:+}pp</div>
                  <div style="opacity:0.8">Confidence lift</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{nps_score}</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.nps_score}</div>
                  <div style="opacity:0.8">Combined NPS</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{rec_combined_pct}%</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.rec_combined_pct}%</div>
                  <div style="opacity:0.8">Would recommend</div></div>
         </div>
         <p style="font-size:1.1rem;margin-top:2rem;opacity:0.9;
@@ -2556,8 +2971,6 @@ if session_info.get('type') == 'lnc_combined':
              {datetime.now().strftime('%B %d, %Y')} | Vision 2030</p>
     </div>
     """, unsafe_allow_html=True)
-
-    st.stop()
 # ============================================================================
 # ██╗     ███╗   ██╗ ██████╗    DASHBOARD
 # ██║     ████╗  ██║██╔════╝
@@ -2567,53 +2980,36 @@ if session_info.get('type') == 'lnc_combined':
 # ╚══════╝╚═╝  ╚═══╝ ╚═════╝
 # ============================================================================
 
-if session_info.get('type') == 'lnc':
+@dataclass(frozen=True, slots=True)
+class LncTallies:
+    """Health session tallies read by render_lnc."""
+    N: int
+    pre: dict
+    post: dict
+    nps_pre_score: int
+    nps_post_score: int
+    conf_improved: int
 
-    # ── All 27-respondent data hardcoded ─────────────────────────────────────
-    N  = 27
-    pre  = dict(
-        registration = {"Excellent": 21, "Good": 5, "Fair": 1, "Poor": 0},
-        heard_about  = {"Friend/colleague": 13, "WhatsApp": 10, "Other": 2, "Snapchat": 2, "LinkedIn": 0},
-        confidence   = {"Extremely confident": 12, "Somewhat confident": 5, "Neutral": 9,
-                        "Somewhat not confident": 1, "Extremely not confident": 0},
-        barriers     = {"Difficulty finding\nrelevant people": 10, "Not knowing how to\nstart conversations": 8,
-                        "Shyness / anxiety": 6, "Other": 3},
-        conn_targets = {"1–2": 8, "3–5": 9, "6–9": 5, "10–12": 2, "12+": 3},
-        goals        = {"Friendships": 20, "Professional\nnetwork": 21, "Mentor": 13,
-                        "Research /\nprojects": 10, "Saudi\ncommunity": 14},
-        atmosphere   = {"Comfortable\n& friendly": 17, "Professional &\nwell-organized": 11,
-                        "A bit\noverwhelming": 6, "Hard to\nconnect": 0, "Casual & not\norganized": 1},
-        experience   = {"Very Good": 18, "Average": 9, "Below average": 0, "Very poor": 0},
-        nps          = {"Promoters": 12, "Passives": 9, "Detractors": 6},
-    )
-    post = dict(
-        format_rating  = {"Excellent": 23, "Good": 3, "Fair": 0, "Poor": 1},
-        linkedin_conns = {"1–2": 3, "3–5": 9, "6–9": 9, "10–12": 4, "12+": 2},
-        meaningful     = {"1–2": 9, "3–5": 8, "6–9": 5, "10–12": 2, "12+": 3},
-        goals_achieved = {"Friendships": 22, "Professional\nnetwork": 24, "Mentor": 9,
-                          "Research /\nprojects": 9, "Saudi\ncommunity": 15},
-        confidence_change = {"Significantly\nimproved": 19, "Slightly\nimproved": 7, "No change": 1},
-        barriers_overcome = {"Difficulty finding\nrelevant people": 9, "Not knowing how to\nstart conversations": 8,
-                             "Shyness / anxiety": 6, "Other": 4},
-        network_expanded  = {"Significantly": 18, "Moderately": 6, "Slightly": 1, "Not at all": 2},
-        career_opps       = {"Yes, definitely": 14, "Possibly": 6, "Not at this stage": 7},
-        business_opps     = {"Significantly": 15, "Somewhat": 6, "Slightly": 3, "Not at this stage": 3},
-        research_opps     = {"Yes": 8, "Maybe": 11, "No": 8},
-        circles_helped    = {"Helped engage\nmore easily": 20, "Better health sector\nunderstanding": 16,
-                             "Insights into future\nof health sector": 15, "Identified skills\nto develop": 9, "Not helpful": 3},
-        experience        = {"Very Good": 24, "Average": 2, "Below average": 0, "Very poor": 1},
-        atmosphere        = {"Comfortable\n& friendly": 23, "Professional &\nwell-organized": 11,
-                             "A bit\noverwhelming": 0, "Hard to\nconnect": 0, "Casual & not\norganized": 3},
-        recommendation    = {"Highly recommend": 20, "Slightly recommend": 5, "Maybe": 0, "Don't think they need it": 2},
-        nps               = {"Promoters": 17, "Passives": 8, "Detractors": 2},
-        vs_other_events   = {"First event": 9, "Much better": 6, "Somewhat better": 7, "About the same": 4, "Needs improvement": 1},
-    )
+
+@st.cache_resource(hash_funcs=HASH_FUNCS)
+def lnc_static(data):
+    """Health session tallies and NPS / confidence figures (computed once per data version)."""
+    N = data['respondents']['post']  # same 27 respondents answered both surveys
+    pre, post = data['pre'], data['post']
 
     # Derived quick-access numbers
     nps_pre_score  = round((pre['nps']['Promoters']  - pre['nps']['Detractors'])  / N * 100)
     nps_post_score = round((post['nps']['Promoters'] - post['nps']['Detractors']) / N * 100)
     conf_improved  = post['confidence_change']['Significantly\nimproved'] + post['confidence_change']['Slightly\nimproved']
 
+    return LncTallies(N=N, pre=pre, post=post, nps_pre_score=nps_pre_score,
+                      nps_post_score=nps_post_score, conf_improved=conf_improved)
+
+
+def render_lnc(selected_session, initiative_info, session_info, data):
+    """LNC Health Sector dashboard."""
+    t = lnc_static(data)
+
     # ── SHOW LNC AD IMAGE PROFESSIONALLY ─────────────────────────────────────
     try:
         col_l, col_c, col_r = st.columns([1, 2, 1])
@@ -2635,12 +3031,12 @@ if session_info.get('type') == 'lnc':
     st.markdown(f"""
     <div class="lnc-highlight-box" style="padding:2rem;">
         <div style="display:flex; flex-wrap:wrap; justify-content:center; gap:0.5rem; position:relative; z-index:1;">
-            <div class="stat-pill"><span class="num">{N}</span><span class="lbl">Participants</span></div>
+            <div class="stat-pill"><span class="num">{t.N}</span><span class="lbl">Participants</span></div>
             <div class="stat-pill"><span class="num">85%</span><span class="lbl">Excellent rating</span></div>
-            <div class="stat-pill"><span class="num">{round(conf_improved/N*100)}%</span><span class="lbl">Confidence boosted</span></div>
-            <div class="stat-pill"><span class="num">{nps_post_score}</span><span class="lbl">NPS score</span></div>
+            <div class="stat-pill"><span class="num">{round(t.conf_improved/t.N*100)}%</span><span class="lbl">Confidence boosted</span></div>
+            <div class="stat-pill"><span class="num">{t.nps_post_score}</span><span class="lbl">NPS score</span></div>
             <div class="stat-pill"><span class="num">74%</span><span class="lbl">Highly recommend</span></div>
-            <div class="stat-pill"><span class="num">+{nps_post_score - nps_pre_score}</span><span class="lbl">NPS increase</span></div>
+            <div class="stat-pill"><span class="num">+{t.nps_post_score - t.nps_pre_score}</span><span class="lbl">NPS increase</span></div>
         </div>
     </div>
     """, unsafe_allow_html=True)
@@ -2651,16 +3047,16 @@ if session_info.get('type') == 'lnc':
 
     c1, c2, c3 = st.columns(3)
     with c1:
-        st.markdown(create_kpi_card("REACH", "Total Participants", str(N),
+        st.markdown(create_kpi_card("REACH", "Total Participants", str(t.N),
             "Completed both pre- and post-event surveys",
             "✓ 100% survey completion"), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card("FORMAT", "Circles Format — Excellent",
-            f"{round(post['format_rating']['Excellent']/N*100)}%",
-            f"{post['format_rating']['Excellent']} out of {N} rated Excellent",
+            f"{round(t.post['format_rating']['Excellent']/t.N*100)}%",
+            f"{t.post['format_rating']['Excellent']} out of {t.N} rated Excellent",
             "✓ Innovative circle-rotation format"), unsafe_allow_html=True)
     with c3:
-        reg_excel = round(pre['registration']['Excellent'] / N * 100)
+        reg_excel = round(t.pre['registration']['Excellent'] / t.N * 100)
         st.markdown(create_kpi_card("ONBOARDING", "Registration Experience",
             f"{reg_excel}%",
             "Rated registration & selection Excellent",
@@ -2670,41 +3066,41 @@ if session_info.get('type') == 'lnc':
     c1, c2, c3 = st.columns(3)
     with c1:
         st.markdown(create_kpi_card("CONFIDENCE", "Confidence Improved",
-            f"{round(conf_improved/N*100)}%",
-            f"{post['confidence_change']['Significantly\nimproved']} significantly + {post['confidence_change']['Slightly\nimproved']} slightly",
+            f"{round(t.conf_improved/t.N*100)}%",
+            f"{t.post['confidence_change']['Significantly\nimproved']} significantly + {t.post['confidence_change']['Slightly\nimproved']} slightly",
             "✓ Strong personal growth"), unsafe_allow_html=True)
     with c2:
-        career_yes  = post['career_opps']['Yes, definitely']
-        career_poss = post['career_opps']['Possibly']
+        career_yes  = t.post['career_opps']['Yes, definitely']
+        career_poss = t.post['career_opps']['Possibly']
         st.markdown(create_kpi_card("CAREERS", "Career Opportunities Found",
-            f"{round((career_yes+career_poss)/N*100)}%",
-            f"{career_yes} definite + {career_poss} possible out of {N}",
+            f"{round((career_yes+career_poss)/t.N*100)}%",
+            f"{career_yes} definite + {career_poss} possible out of {t.N}",
             "✓ High career-value event"), unsafe_allow_html=True)
     with c3:
-        network_sig = post['network_expanded']['Significantly']
+        network_sig = t.post['network_expanded']['Significantly']
         st.markdown(create_kpi_card("NETWORK", "Professional Network Expanded",
-            f"{round(network_sig/N*100)}%",
+            f"{round(network_sig/t.N*100)}%",
             f"Significantly expanded their health-sector network",
             "✓ Vision 2030 aligned"), unsafe_allow_html=True)
 
     st.markdown('<p class="subsection-title">Satisfaction & Advocacy</p>', unsafe_allow_html=True)
     c1, c2, c3 = st.columns(3)
     with c1:
-        exp_vg = post['experience']['Very Good']
+        exp_vg = t.post['experience']['Very Good']
         st.markdown(create_kpi_card("EXPERIENCE", "Overall Experience — Very Good",
-            f"{round(exp_vg/N*100)}%",
-            f"{exp_vg} of {N} rated Very Good (was {pre['experience']['Very Good']} pre-event)",
-            f"✓ +{exp_vg - pre['experience']['Very Good']} improvement"), unsafe_allow_html=True)
+            f"{round(exp_vg/t.N*100)}%",
+            f"{exp_vg} of {t.N} rated Very Good (was {t.pre['experience']['Very Good']} pre-event)",
+            f"✓ +{exp_vg - t.pre['experience']['Very Good']} improvement"), unsafe_allow_html=True)
     with c2:
         st.markdown(create_kpi_card("NPS", "Net Promoter Score",
-            str(nps_post_score),
-            f"Post-event (pre-event was {nps_pre_score})",
-            f"✓ +{nps_post_score - nps_pre_score} point jump"), unsafe_allow_html=True)
+            str(t.nps_post_score),
+            f"Post-event (pre-event was {t.nps_pre_score})",
+            f"✓ +{t.nps_post_score - t.nps_pre_score} point jump"), unsafe_allow_html=True)
     with c3:
-        rec_high = post['recommendation']['Highly recommend']
+        rec_high = t.post['recommendation']['Highly recommend']
         st.markdown(create_kpi_card("ADVOCACY", "Highly Recommend",
-            f"{round(rec_high/N*100)}%",
-            f"{rec_high} of {N} would highly recommend",
+            f"{round(rec_high/t.N*100)}%",
+            f"{rec_high} of {t.N} would highly recommend",
             "✓ Outstanding word-of-mouth"), unsafe_allow_html=True)
 
     # ── HIGHLIGHT BOX ─────────────────────────────────────────────────────────
@@ -2715,8 +3111,8 @@ if session_info.get('type') == 'lnc':
             <li>85% rated the circle-rotation format as <strong>Excellent</strong> — a format-first innovation</li>
             <li>Professional network goal <em>exceeded</em>: 21 aimed → 24 achieved (+14% over-delivery)</li>
             <li>Atmosphere anxiety dropped from <strong>22% → 0%</strong> — the circles removed the awkwardness</li>
-            <li>NPS jumped from <strong>{nps_pre_score} → {nps_post_score}</strong> — a {nps_post_score-nps_pre_score} point improvement</li>
-            <li>{round(post['confidence_change']['Significantly\nimproved']/N*100)}% of participants <strong>significantly</strong> improved their networking confidence</li>
+            <li>NPS jumped from <strong>{t.nps_pre_score} → {t.nps_post_score}</strong> — a {t.nps_post_score-t.nps_pre_score} point improvement</li>
+            <li>{round(t.post['confidence_change']['Significantly\nimproved']/t.N*100)}% of participants <strong>significantly</strong> improved their networking confidence</li>
         </ul>
     </div>
     """, unsafe_allow_html=True)
@@ -2725,355 +3121,362 @@ if session_info.get('type') == 'lnc':
     st.markdown("---")
     st.markdown('<p class="section-title">📚 Deep-Dive Analysis</p>', unsafe_allow_html=True)
 
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "🌐 Experience", "🤝 Connections & Goals", "💼 Outcomes", "🔄 Pre vs Post", "👥 Demographics"
-    ])
-
-    # ── TAB 1: EXPERIENCE ─────────────────────────────────────────────────────
-    with tab1:
-        st.markdown("### Event Atmosphere — Before vs After")
-        st.markdown(compare_band(
-            round(pre['atmosphere']['Comfortable\n& friendly']/N*100),
-            round(post['atmosphere']['Comfortable\n& friendly']/N*100),
-            f"{pre['atmosphere']['Comfortable\n& friendly']} people felt comfortable",
-            f"{post['atmosphere']['Comfortable\n& friendly']} people felt comfortable",
-            "#6b7280", "#0d3b6e", "%",
-            "Comfortable\n& friendly"
-        ), unsafe_allow_html=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Atmosphere — Grouped Comparison")
-            atm_labs = ["Comfortable\n& friendly", "Professional &\nwell-organized", "A bit\noverwhelming"]
-            fig = lnc_grouped_bar(
-                atm_labs,
-                [pre['atmosphere'][k] for k in atm_labs],
-                [post['atmosphere'][k] for k in atm_labs],
-                y_max=28
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Overall Experience Rating")
-            exp_labs = ["Very Good", "Average", "Below average", "Very poor"]
-            fig = lnc_grouped_bar(
-                exp_labs,
-                [pre['experience'][k] for k in exp_labs],
-                [post['experience'][k] for k in exp_labs],
-                y_max=28
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Circle-Format Rating (Post-Event)")
-        c1, c2 = st.columns(2)
-        with c1:
-            colors_fmt = ['#0d3b6e', '#378add', '#85B7EB', '#e74c3c']
-            fig = lnc_donut(
-                list(post['format_rating'].keys()),
-                list(post['format_rating'].values()),
-                colors_fmt,
-                center_text="Format\nRating"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### NPS Shift — Before → After")
-            nps_labs = ["Promoters", "Passives", "Detractors"]
-            fig = go.Figure()
-            fig.add_trace(go.Bar(name='Before', x=nps_labs,
-                y=[pre['nps'][k] for k in nps_labs],
-                marker_color=['#93c13f','#f39c12','#e9ecef'],
-                text=[pre['nps'][k] for k in nps_labs], textposition='outside'))
-            fig.add_trace(go.Bar(name='After', x=nps_labs,
-                y=[post['nps'][k] for k in nps_labs],
-                marker_color=['#006341','#e67e22','#e74c3c'],
-                text=[post['nps'][k] for k in nps_labs], textposition='outside'))
-            fig.update_layout(barmode='group', height=340, yaxis=dict(range=[0,22]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5))
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### How This Compared to Other Events Attended")
-        comp_labs = list(post['vs_other_events'].keys())
-        comp_vals = list(post['vs_other_events'].values())
-        comp_colors = ['#e9ecef','#006341','#00843d','#93c13f','#e74c3c']
-        fig = go.Figure(go.Bar(x=comp_labs, y=comp_vals, marker_color=comp_colors,
-            text=comp_vals, textposition='outside', textfont=dict(size=13)))
-        fig.update_layout(height=320, yaxis=dict(range=[0,12]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 2: CONNECTIONS & GOALS ────────────────────────────────────────────
-    with tab2:
-        st.markdown("### Goal Setting vs. Achievement")
-        st.markdown(compare_band(21, 24, "aimed to expand professional network",
-            "actually expanded professional network", "#6b7280", "#0d3b6e", "",
-            "Professional Network goal exceeded"))
-
-        goal_labs = list(pre['goals'].keys())
-        fig = lnc_grouped_bar(
-            goal_labs,
-            [pre['goals'][k] for k in goal_labs],
-            [post['goals_achieved'][k] for k in post['goals_achieved'].keys()],
-            y_max=28
-        )
-        fig.update_layout(title_text="Goals: Intended (Pre) vs Achieved (Post)",
-            title_font=dict(family='Cormorant Garamond', size=18))
-        st.plotly_chart(fig, use_container_width=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Connection Target (Pre-Event)")
-            fig = lnc_bar(
-                list(pre['conn_targets'].keys()),
-                list(pre['conn_targets'].values()),
-                '#378add', height=300, v_range=[0, 12]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### LinkedIn Connections Made (Post-Event)")
-            fig = lnc_bar(
-                list(post['linkedin_conns'].keys()),
-                list(post['linkedin_conns'].values()),
-                '#0d3b6e', height=300, v_range=[0, 12]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Meaningful Connections Made")
-            fig = lnc_bar(
-                list(post['meaningful'].keys()),
-                list(post['meaningful'].values()),
-                '#006341', height=300, v_range=[0, 12]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Confidence Impact (Post-Event)")
-            fig = lnc_donut(
-                [k.replace('\n', ' ') for k in post['confidence_change'].keys()],
-                list(post['confidence_change'].values()),
-                ['#0d3b6e', '#378add', '#e9ecef'],
-                center_text="Confidence\nImpact"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 3: OUTCOMES ───────────────────────────────────────────────────────
-    with tab3:
-        st.markdown("### Professional & Career Impact")
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.markdown("#### Career Opportunities")
-            fig = lnc_donut(
-                list(post['career_opps'].keys()),
-                list(post['career_opps'].values()),
-                ['#006341', '#93c13f', '#e9ecef'],
-                center_text="Career\nOpps"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Business Opportunities")
-            fig = lnc_donut(
-                list(post['business_opps'].keys()),
-                list(post['business_opps'].values()),
-                ['#0d3b6e', '#378add', '#85B7EB', '#e9ecef'],
-                center_text="Business\nOpps"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c3:
-            st.markdown("#### Research / Project Opportunities")
-            fig = lnc_donut(
-                list(post['research_opps'].keys()),
-                list(post['research_opps'].values()),
-                ['#1a5fa8', '#85B7EB', '#e9ecef'],
-                center_text="Research\nOpps"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Network Expansion")
-        st.markdown(compare_band(
-            round(pre['confidence']['Extremely confident'] / N * 100),
-            round(post['network_expanded']['Significantly'] / N * 100),
-            "were Extremely confident pre-event",
-            "expanded network Significantly",
-            "#6b7280", "#0d3b6e", "%",
-            "Confidence → Actual impact"
-        ), unsafe_allow_html=True)
-
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### Network Expansion — Post-Event")
-            fig = lnc_bar(
-                list(post['network_expanded'].keys()),
-                list(post['network_expanded'].values()),
-                ['#0d3b6e','#378add','#85B7EB','#e9ecef'],
-                height=300, v_range=[0, 22]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### How Circles Format Helped")
-            circles_labs = [k.replace('\n', ' ') for k in post['circles_helped'].keys()]
-            circles_vals = list(post['circles_helped'].values())
-            fig = go.Figure(go.Bar(
-                y=circles_labs, x=circles_vals, orientation='h',
-                marker_color=['#006341','#0d3b6e','#378add','#85B7EB','#e9ecef'],
-                text=circles_vals, textposition='outside', textfont=dict(size=12)
-            ))
-            fig.update_layout(height=320, xaxis=dict(range=[0, 25]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False, margin=dict(l=10, r=50, t=10, b=20))
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Barriers Overcome")
-        bar_labs = [k.replace('\n', ' ') for k in pre['barriers'].keys()]
-        fig = lnc_grouped_bar(
-            bar_labs,
-            list(pre['barriers'].values()),
-            [post['barriers_overcome'][k] for k in post['barriers_overcome'].keys()],
-            pre_color='#d0d9e8', post_color='#0d3b6e',
-            y_max=14
-        )
-        fig.update_layout(title_text="Barriers: Pre-Event vs Overcome (Post-Event)",
-            title_font=dict(family='Cormorant Garamond', size=18))
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Recommendation")
-        fig = lnc_bar(
-            list(post['recommendation'].keys()),
-            list(post['recommendation'].values()),
-            ['#006341','#00843d','#93c13f','#e74c3c'],
-            height=300, v_range=[0, 24]
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 4: PRE vs POST SIDE-BY-SIDE ──────────────────────────────────────
-    with tab4:
-        st.markdown("### 🔄 Pre-Event vs Post-Event — Full Comparison")
-
-        metrics_compare = [
-            ("Comfortable atmosphere",
-             round(pre['atmosphere']['Comfortable\n& friendly']/N*100),
-             round(post['atmosphere']['Comfortable\n& friendly']/N*100), "%"),
-            ("Very Good overall experience",
-             round(pre['experience']['Very Good']/N*100),
-             round(post['experience']['Very Good']/N*100), "%"),
-            ("Net Promoter Score", nps_pre_score, nps_post_score, "pts"),
-            ("Confidence (highly confident)",
-             round((pre['confidence']['Extremely confident'])/N*100),
-             round(post['confidence_change']['Significantly\nimproved']/N*100), "%"),
-            ("Overwhelming atmosphere",
-             round(pre['atmosphere']['A bit\noverwhelming']/N*100),
-             round(post['atmosphere']['A bit\noverwhelming']/N*100), "%"),
-        ]
-        labels_cmp = [m[0] for m in metrics_compare]
-        pre_cmp    = [m[1] for m in metrics_compare]
-        post_cmp   = [m[2] for m in metrics_compare]
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(name='Before Event', y=labels_cmp, x=pre_cmp,
-            orientation='h', marker_color='#d0d9e8',
-            text=[f"{v}%" for v in pre_cmp], textposition='outside'))
-        fig.add_trace(go.Bar(name='After Event', y=labels_cmp, x=post_cmp,
-            orientation='h', marker_color='#0d3b6e',
-            text=[f"{v}%" for v in post_cmp], textposition='outside'))
-        fig.update_layout(barmode='group', height=400, xaxis=dict(range=[0, 100]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
-            margin=dict(l=10, r=60, t=20, b=20))
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Waterfall — NPS Journey")
-        fig_wf = go.Figure(go.Waterfall(
-            orientation='v', measure=['relative','relative','relative','total'],
-            x=["Pre-event\nPromoters", "Post-event\nPromoters gain", "Detractors\nreduced", "Final NPS"],
-            y=[nps_pre_score,
-               round(post['nps']['Promoters']/N*100) - round(pre['nps']['Promoters']/N*100),
-               round(pre['nps']['Detractors']/N*100)  - round(post['nps']['Detractors']/N*100),
-               0],
-            connector=dict(line=dict(color='#0d3b6e', width=1.5, dash='dot')),
-            decreasing=dict(marker_color='#e74c3c'),
-            increasing=dict(marker_color='#006341'),
-            totals=dict(marker_color='#0d3b6e'),
-            text=[f"{nps_pre_score}", "+", "+", f"{nps_post_score}"],
-            textfont=dict(size=14, family='Epilogue')
-        ))
-        fig_wf.update_layout(height=340,
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)')
-        st.plotly_chart(fig_wf, use_container_width=True)
-
-        st.markdown("### Radar — Experience Profile")
-        radar_dims  = ["Comfortable\natmosphere", "Very Good\nexperience", "Confidence\nimproved",
-                       "Network\nexpanded sig.", "Career opps\nfound", "Highly\nrecommend"]
-        radar_pre   = [
-            round(pre['atmosphere']['Comfortable\n& friendly']/N*100),
-            round(pre['experience']['Very Good']/N*100),
-            round(pre['confidence']['Extremely confident']/N*100),
-            0, 0, 0
-        ]
-        radar_post  = [
-            round(post['atmosphere']['Comfortable\n& friendly']/N*100),
-            round(post['experience']['Very Good']/N*100),
-            round(conf_improved/N*100),
-            round(post['network_expanded']['Significantly']/N*100),
-            round((post['career_opps']['Yes, definitely']+post['career_opps']['Possibly'])/N*100),
-            round(post['recommendation']['Highly recommend']/N*100),
-        ]
-        fig_r = go.Figure()
-        fig_r.add_trace(go.Scatterpolar(r=radar_pre + [radar_pre[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='Before Event', line_color='#adb5bd', fillcolor='rgba(173,181,189,0.15)', line_width=2))
-        fig_r.add_trace(go.Scatterpolar(r=radar_post + [radar_post[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='After Event', line_color='#0d3b6e', fillcolor='rgba(13,59,110,0.15)', line_width=2.5))
-        fig_r.update_layout(
-            polar=dict(radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=10)),
-                       angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))),
-            showlegend=True, height=480, paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom', y=-0.1, xanchor='center', x=0.5)
-        )
-        col_l, col_c, col_r = st.columns([1, 3, 1])
-        with col_c:
-            st.plotly_chart(fig_r, use_container_width=True)
-
-    # ── TAB 5: DEMOGRAPHICS ───────────────────────────────────────────────────
-    with tab5:
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### How Did Attendees Hear About Us?")
-            fig = lnc_bar(
-                list(pre['heard_about'].keys()),
-                list(pre['heard_about'].values()),
-                ['#0d3b6e','#1a5fa8','#378add','#85B7EB','#d0d9e8'],
-                height=340, v_range=[0, 16]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Pre-Event Confidence Level")
-            fig = lnc_bar(
-                list(pre['confidence'].keys()),
-                list(pre['confidence'].values()),
-                ['#006341','#00843d','#93c13f','#f39c12','#e9ecef'],
-                height=340, v_range=[0, 15]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("#### Primary Reasons for Attending")
-        goals_clean = [k.replace('\n', ' ') for k in pre['goals'].keys()]
-        fig = lnc_bar(
-            goals_clean, list(pre['goals'].values()),
-            ['#0d3b6e','#1a5fa8','#378add','#85B7EB','#d0d9e8'],
-            height=300, v_range=[0, 25]
-        )
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("#### Common Barriers Faced Before the Event")
-        bar_labs_clean = [k.replace('\n', ' ') for k in pre['barriers'].keys()]
-        fig = lnc_bar(
-            bar_labs_clean, list(pre['barriers'].values()),
-            '#378add', height=300, v_range=[0, 13]
-        )
-        st.plotly_chart(fig, use_container_width=True)
+    @st.fragment
+    def dashboard_tabs():
+        tab1, tab2, tab3, tab4, tab5 = session_tabs(selected_session, [
+            "🌐 Experience", "🤝 Connections & Goals", "💼 Outcomes", "🔄 Pre vs Post", "👥 Demographics"
+        ])
+
+        # ── TAB 1: EXPERIENCE ─────────────────────────────────────────────────────
+        with tab1:
+            if tab_open(tab1):
+                st.markdown("### Event Atmosphere — Before vs After")
+                st.markdown(compare_band(
+                    round(t.pre['atmosphere']['Comfortable\n& friendly']/t.N*100),
+                    round(t.post['atmosphere']['Comfortable\n& friendly']/t.N*100),
+                    f"{t.pre['atmosphere']['Comfortable\n& friendly']} people felt comfortable",
+                    f"{t.post['atmosphere']['Comfortable\n& friendly']} people felt comfortable",
+                    "#6b7280", "#0d3b6e", "%",
+                    "Comfortable\n& friendly"
+                ), unsafe_allow_html=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Atmosphere — Grouped Comparison")
+                    atm_labs = ["Comfortable\n& friendly", "Professional &\nwell-organized", "A bit\noverwhelming"]
+                    fig = lnc_grouped_bar(
+                        atm_labs,
+                        [t.pre['atmosphere'][k] for k in atm_labs],
+                        [t.post['atmosphere'][k] for k in atm_labs],
+                        y_max=28
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Overall Experience Rating")
+                    exp_labs = ["Very Good", "Average", "Below average", "Very poor"]
+                    fig = lnc_grouped_bar(
+                        exp_labs,
+                        [t.pre['experience'][k] for k in exp_labs],
+                        [t.post['experience'][k] for k in exp_labs],
+                        y_max=28
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Circle-Format Rating (Post-Event)")
+                c1, c2 = st.columns(2)
+                with c1:
+                    colors_fmt = ['#0d3b6e', '#378add', '#85B7EB', '#e74c3c']
+                    fig = lnc_donut(
+                        list(t.post['format_rating'].keys()),
+                        list(t.post['format_rating'].values()),
+                        colors_fmt,
+                        center_text="Format\nRating"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### NPS Shift — Before → After")
+                    nps_labs = ["Promoters", "Passives", "Detractors"]
+                    fig = lnc_figure(
+                        [dict(type='bar', name='Before', x=nps_labs,
+                            y=[t.pre['nps'][k] for k in nps_labs],
+                            marker_color=['#93c13f','#f39c12','#e9ecef'],
+                            text=[t.pre['nps'][k] for k in nps_labs], textposition='outside'),
+                         dict(type='bar', name='After', x=nps_labs,
+                            y=[t.post['nps'][k] for k in nps_labs],
+                            marker_color=['#006341','#e67e22','#e74c3c'],
+                            text=[t.post['nps'][k] for k in nps_labs], textposition='outside')],
+                        dict(barmode='group', height=340, yaxis=dict(range=[0,22]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)))
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### How This Compared to Other Events Attended")
+                comp_labs = list(t.post['vs_other_events'].keys())
+                comp_vals = list(t.post['vs_other_events'].values())
+                comp_colors = ['#e9ecef','#006341','#00843d','#93c13f','#e74c3c']
+                fig = lnc_figure(
+                    [dict(type='bar', x=comp_labs, y=comp_vals, marker_color=comp_colors,
+                        text=comp_vals, textposition='outside', textfont=dict(size=13))],
+                    dict(height=320, yaxis=dict(range=[0,12]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', showlegend=False))
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 2: CONNECTIONS & GOALS ────────────────────────────────────────────
+        with tab2:
+            if tab_open(tab2):
+                st.markdown("### Goal Setting vs. Achievement")
+                st.markdown(compare_band(21, 24, "aimed to expand professional network",
+                    "actually expanded professional network", "#6b7280", "#0d3b6e", "",
+                    "Professional Network goal exceeded"))
+
+                goal_labs = list(t.pre['goals'].keys())
+                fig = lnc_grouped_bar(
+                    goal_labs,
+                    [t.pre['goals'][k] for k in goal_labs],
+                    [t.post['goals_achieved'][k] for k in t.post['goals_achieved'].keys()],
+                    y_max=28,
+                    layout=dict(title_text="Goals: Intended (Pre) vs Achieved (Post)",
+                                title_font=dict(family='Cormorant Garamond', size=18))
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Connection Target (Pre-Event)")
+                    fig = lnc_bar(
+                        list(t.pre['conn_targets'].keys()),
+                        list(t.pre['conn_targets'].values()),
+                        '#378add', height=300, v_range=[0, 12]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### LinkedIn Connections Made (Post-Event)")
+                    fig = lnc_bar(
+                        list(t.post['linkedin_conns'].keys()),
+                        list(t.post['linkedin_conns'].values()),
+                        '#0d3b6e', height=300, v_range=[0, 12]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Meaningful Connections Made")
+                    fig = lnc_bar(
+                        list(t.post['meaningful'].keys()),
+                        list(t.post['meaningful'].values()),
+                        '#006341', height=300, v_range=[0, 12]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Confidence Impact (Post-Event)")
+                    fig = lnc_donut(
+                        [k.replace('\n', ' ') for k in t.post['confidence_change'].keys()],
+                        list(t.post['confidence_change'].values()),
+                        ['#0d3b6e', '#378add', '#e9ecef'],
+                        center_text="Confidence\nImpact"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 3: OUTCOMES ───────────────────────────────────────────────────────
+        with tab3:
+            if tab_open(tab3):
+                st.markdown("### Professional & Career Impact")
+                c1, c2, c3 = st.columns(3)
+                with c1:
+                    st.markdown("#### Career Opportunities")
+                    fig = lnc_donut(
+                        list(t.post['career_opps'].keys()),
+                        list(t.post['career_opps'].values()),
+                        ['#006341', '#93c13f', '#e9ecef'],
+                        center_text="Career\nOpps"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Business Opportunities")
+                    fig = lnc_donut(
+                        list(t.post['business_opps'].keys()),
+                        list(t.post['business_opps'].values()),
+                        ['#0d3b6e', '#378add', '#85B7EB', '#e9ecef'],
+                        center_text="Business\nOpps"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c3:
+                    st.markdown("#### Research / Project Opportunities")
+                    fig = lnc_donut(
+                        list(t.post['research_opps'].keys()),
+                        list(t.post['research_opps'].values()),
+                        ['#1a5fa8', '#85B7EB', '#e9ecef'],
+                        center_text="Research\nOpps"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Network Expansion")
+                st.markdown(compare_band(
+                    round(t.pre['confidence']['Extremely confident'] / t.N * 100),
+                    round(t.post['network_expanded']['Significantly'] / t.N * 100),
+                    "were Extremely confident pre-event",
+                    "expanded network Significantly",
+                    "#6b7280", "#0d3b6e", "%",
+                    "Confidence → Actual impact"
+                ), unsafe_allow_html=True)
+
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### Network Expansion — Post-Event")
+                    fig = lnc_bar(
+                        list(t.post['network_expanded'].keys()),
+                        list(t.post['network_expanded'].values()),
+                        ['#0d3b6e','#378add','#85B7EB','#e9ecef'],
+                        height=300, v_range=[0, 22]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### How Circles Format Helped")
+                    circles_labs = [k.replace('\n', ' ') for k in t.post['circles_helped'].keys()]
+                    circles_vals = list(t.post['circles_helped'].values())
+                    fig = lnc_figure(
+                        [dict(type='bar', y=circles_labs, x=circles_vals, orientation='h',
+                            marker_color=['#006341','#0d3b6e','#378add','#85B7EB','#e9ecef'],
+                            text=circles_vals, textposition='outside', textfont=dict(size=12))],
+                        dict(height=320, xaxis=dict(range=[0, 25]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False, margin=dict(l=10, r=50, t=10, b=20)))
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Barriers Overcome")
+                bar_labs = [k.replace('\n', ' ') for k in t.pre['barriers'].keys()]
+                fig = lnc_grouped_bar(
+                    bar_labs,
+                    list(t.pre['barriers'].values()),
+                    [t.post['barriers_overcome'][k] for k in t.post['barriers_overcome'].keys()],
+                    pre_color='#d0d9e8', post_color='#0d3b6e',
+                    y_max=14,
+                    layout=dict(title_text="Barriers: Pre-Event vs Overcome (Post-Event)",
+                                title_font=dict(family='Cormorant Garamond', size=18))
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Recommendation")
+                fig = lnc_bar(
+                    list(t.post['recommendation'].keys()),
+                    list(t.post['recommendation'].values()),
+                    ['#006341','#00843d','#93c13f','#e74c3c'],
+                    height=300, v_range=[0, 24]
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 4: PRE vs POST SIDE-BY-SIDE ──────────────────────────────────────
+        with tab4:
+            if tab_open(tab4):
+                st.markdown("### 🔄 Pre-Event vs Post-Event — Full Comparison")
+
+                metrics_compare = [
+                    ("Comfortable atmosphere",
+                     round(t.pre['atmosphere']['Comfortable\n& friendly']/t.N*100),
+                     round(t.post['atmosphere']['Comfortable\n& friendly']/t.N*100), "%"),
+                    ("Very Good overall experience",
+                     round(t.pre['experience']['Very Good']/t.N*100),
+                     round(t.post['experience']['Very Good']/t.N*100), "%"),
+                    ("Net Promoter Score", t.nps_pre_score, t.nps_post_score, "pts"),
+                    ("Confidence (highly confident)",
+                     round((t.pre['confidence']['Extremely confident'])/t.N*100),
+                     round(t.post['confidence_change']['Significantly\nimproved']/t.N*100), "%"),
+                    ("Overwhelming atmosphere",
+                     round(t.pre['atmosphere']['A bit\noverwhelming']/t.N*100),
+                     round(t.post['atmosphere']['A bit\noverwhelming']/t.N*100), "%"),
+                ]
+                labels_cmp = [m[0] for m in metrics_compare]
+                pre_cmp    = [m[1] for m in metrics_compare]
+                post_cmp   = [m[2] for m in metrics_compare]
+
+                fig = lnc_figure(
+                    [dict(type='bar', name='Before Event', y=labels_cmp, x=pre_cmp,
+                        orientation='h', marker_color='#d0d9e8',
+                        text=[f"{v}%" for v in pre_cmp], textposition='outside'),
+                     dict(type='bar', name='After Event', y=labels_cmp, x=post_cmp,
+                        orientation='h', marker_color='#0d3b6e',
+                        text=[f"{v}%" for v in post_cmp], textposition='outside')],
+                    dict(barmode='group', height=400, xaxis=dict(range=[0, 100]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
+                        margin=dict(l=10, r=60, t=20, b=20)))
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Waterfall — NPS Journey")
+                fig_wf = lnc_figure(
+                    [dict(type='waterfall', orientation='v', measure=['relative','relative','relative','total'],
+                        x=["Pre-event\nPromoters", "Post-event\nPromoters gain", "Detractors\nreduced", "Final NPS"],
+                        y=[t.nps_pre_score,
+                           round(t.post['nps']['Promoters']/t.N*100) - round(t.pre['nps']['Promoters']/t.N*100),
+                           round(t.pre['nps']['Detractors']/t.N*100)  - round(t.post['nps']['Detractors']/t.N*100),
+                           0],
+                        connector=dict(line=dict(color='#0d3b6e', width=1.5, dash='dot')),
+                        decreasing=dict(marker_color='#e74c3c'),
+                        increasing=dict(marker_color='#006341'),
+                        totals=dict(marker_color='#0d3b6e'),
+                        text=[f"{t.nps_pre_score}", "+", "+", f"{t.nps_post_score}"],
+                        textfont=dict(size=14, family='Epilogue'))],
+                    dict(height=340,
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)'))
+                st.plotly_chart(fig_wf, use_container_width=True)
+
+                st.markdown("### Radar — Experience Profile")
+                radar_dims  = ["Comfortable\natmosphere", "Very Good\nexperience", "Confidence\nimproved",
+                               "Network\nexpanded sig.", "Career opps\nfound", "Highly\nrecommend"]
+                radar_pre   = [
+                    round(t.pre['atmosphere']['Comfortable\n& friendly']/t.N*100),
+                    round(t.pre['experience']['Very Good']/t.N*100),
+                    round(t.pre['confidence']['Extremely confident']/t.N*100),
+                    0, 0, 0
+                ]
+                radar_post  = [
+                    round(t.post['atmosphere']['Comfortable\n& friendly']/t.N*100),
+                    round(t.post['experience']['Very Good']/t.N*100),
+                    round(t.conf_improved/t.N*100),
+                    round(t.post['network_expanded']['Significantly']/t.N*100),
+                    round((t.post['career_opps']['Yes, definitely']+t.post['career_opps']['Possibly'])/t.N*100),
+                    round(t.post['recommendation']['Highly recommend']/t.N*100),
+                ]
+                fig_r = lnc_figure(
+                    [dict(type='scatterpolar', r=radar_pre + [radar_pre[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='Before Event', line_color='#adb5bd', fillcolor='rgba(173,181,189,0.15)', line_width=2),
+                     dict(type='scatterpolar', r=radar_post + [radar_post[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='After Event', line_color='#0d3b6e', fillcolor='rgba(13,59,110,0.15)', line_width=2.5)],
+                    dict(
+                        polar=dict(radialaxis=dict(visible=True, range=[0, 100], tickfont=dict(size=10)),
+                                   angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))),
+                        showlegend=True, height=480, paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom', y=-0.1, xanchor='center', x=0.5)
+                    ))
+                col_l, col_c, col_r = st.columns([1, 3, 1])
+                with col_c:
+                    st.plotly_chart(fig_r, use_container_width=True)
+
+        # ── TAB 5: DEMOGRAPHICS ───────────────────────────────────────────────────
+        with tab5:
+            if tab_open(tab5):
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### How Did Attendees Hear About Us?")
+                    fig = lnc_bar(
+                        list(t.pre['heard_about'].keys()),
+                        list(t.pre['heard_about'].values()),
+                        ['#0d3b6e','#1a5fa8','#378add','#85B7EB','#d0d9e8'],
+                        height=340, v_range=[0, 16]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Pre-Event Confidence Level")
+                    fig = lnc_bar(
+                        list(t.pre['confidence'].keys()),
+                        list(t.pre['confidence'].values()),
+                        ['#006341','#00843d','#93c13f','#f39c12','#e9ecef'],
+                        height=340, v_range=[0, 15]
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("#### Primary Reasons for Attending")
+                goals_clean = [k.replace('\n', ' ') for k in t.pre['goals'].keys()]
+                fig = lnc_bar(
+                    goals_clean, list(t.pre['goals'].values()),
+                    ['#0d3b6e','#1a5fa8','#378add','#85B7EB','#d0d9e8'],
+                    height=300, v_range=[0, 25]
+                )
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("#### Common Barriers Faced Before the Event")
+                bar_labs_clean = [k.replace('\n', ' ') for k in t.pre['barriers'].keys()]
+                fig = lnc_bar(
+                    bar_labs_clean, list(t.pre['barriers'].values()),
+                    '#378add', height=300, v_range=[0, 13]
+                )
+                st.plotly_chart(fig, use_container_width=True)
+    dashboard_tabs()
 
     # ── ABOUT BOX ─────────────────────────────────────────────────────────────
     st.markdown("""
@@ -3099,71 +3502,49 @@ if session_info.get('type') == 'lnc':
         <h2>🔗 Leaders Network Circles</h2>
         <p class="tagline">Health Sector — Session 1 · Australia Chapter</p>
         <div style="display:flex; justify-content:center; gap:3rem; margin:2rem 0; flex-wrap:wrap; position:relative; z-index:1;">
-            <div><div style="font-size:2.5rem;font-weight:700">{N}</div><div style="opacity:0.8">Participants</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N}</div><div style="opacity:0.8">Participants</div></div>
             <div><div style="font-size:2.5rem;font-weight:700">85%</div><div style="opacity:0.8">Excellent rating</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">+{nps_post_score - nps_pre_score}</div><div style="opacity:0.8">NPS increase</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">+{t.nps_post_score - t.nps_pre_score}</div><div style="opacity:0.8">NPS increase</div></div>
             <div><div style="font-size:2.5rem;font-weight:700">74%</div><div style="opacity:0.8">Highly recommend</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{round(conf_improved/N*100)}%</div><div style="opacity:0.8">Confidence boosted</div></div>
+            <div><div style="font-size:2.5rem;font-weight:700">{round(t.conf_improved/t.N*100)}%</div><div style="opacity:0.8">Confidence boosted</div></div>
         </div>
         <p style="font-size:1.1rem;margin-top:2rem;opacity:0.9;position:relative;z-index:1"><strong>Grow • Connect • Impact</strong></p>
         <p style="font-size:0.9rem;opacity:0.7;margin-top:1rem;position:relative;z-index:1">{datetime.now().strftime('%B %d, %Y')} | Vision 2030</p>
     </div>
     """, unsafe_allow_html=True)
 
-    st.stop()
-
 # ============================================================================
 # LEADERS ACCELERATOR — 10X LEADERS DASHBOARD
 # ============================================================================
 
-if session_info.get('type') == 'leaders_accelerator':
-
-    N_pre  = 10
-    N_post = 9
-
-    # ── RAW DATA ──────────────────────────────────────────────────────────────
-    pre = dict(
-        heard_about = {"WhatsApp": 3, "Saudi Students Associations": 7,
-                       "Telegram": 0, "Snapchat": 0, "Other": 0},
-        location    = {"Sydney": 4, "Melbourne": 5, "Brisbane": 0,
-                       "Perth": 0, "Adelaide": 0, "Canberra": 0,
-                       "New Zealand": 0, "Other": 1},
-        program_understanding = {
-            "Strongly Agree": 2, "Agree": 3, "Neutral": 4,
-            "Disagree": 1, "Strongly Disagree": 0},
-        track_clarity = {
-            "Strongly Agree": 2, "Agree": 6, "Neutral": 1,
-            "Disagree": 1, "Strongly Disagree": 0},
-        app_confidence = {
-            "Strongly Agree": 3, "Agree": 2, "Neutral": 4,
-            "Disagree": 1, "Strongly Disagree": 0},
-        articulate_leadership = {
-            "Strongly Agree": 1, "Agree": 8, "Neutral": 1,
-            "Disagree": 0, "Strongly Disagree": 0},
-    )
-
-    post = dict(
-        program_understanding = {
-            "Strongly Agree": 8, "Agree": 1, "Neutral": 0,
-            "Disagree": 0, "Strongly Disagree": 0},
-        track_clarity = {
-            "Strongly Agree": 7, "Agree": 2, "Neutral": 0,
-            "Disagree": 0, "Strongly Disagree": 0},
-        app_confidence = {
-            "Strongly Agree": 8, "Agree": 1, "Neutral": 0,
-            "Disagree": 0, "Strongly Disagree": 0},
-        articulate_leadership = {
-            "Strongly Agree": 8, "Agree": 1, "Neutral": 0,
-            "Disagree": 0, "Strongly Disagree": 0},
-        mentoring_helped = {
-            "Strongly Agree": 8, "Agree": 1, "Neutral": 0,
-            "Disagree": 0, "Strongly Disagree": 0},
-        plan_to_apply = {
-            "Yes": 7, "No": 0, "I have already applied": 2},
-        recommendation = {
-            "Very likely": 8, "Likely": 1, "Neutral": 0,
-            "Unlikely": 0, "Very unlikely": 0},
-    )
+@dataclass(frozen=True, slots=True)
+class AcceleratorTallies:
+    """Accelerator tallies read by render_leaders_accelerator."""
+    N_pre: int
+    N_post: int
+    pre: dict
+    post: dict
+    pre_understand_pct: int
+    post_understand_pct: int
+    pre_track_pct: int
+    post_track_pct: int
+    pre_conf_pct: int
+    post_conf_pct: int
+    pre_artic_pct: int
+    post_artic_pct: int
+    mentoring_pct: int
+    recommend_pct: int
+    plan_action_pct: int
+    scale_labels: list
+    scale_colors: list
+
+
+@st.cache_resource(hash_funcs=HASH_FUNCS)
+def leaders_accelerator_static(data):
+    """Accelerator Likert tallies and agreement rates (computed once per data version)."""
+    N_pre  = data['respondents']['pre']
+    N_post = data['respondents']['post']
+    pre, post = data['pre'], data['post']
 
     # ── DERIVED METRICS ───────────────────────────────────────────────────────
     def pct_agree(d, n):
@@ -3188,6 +3569,20 @@ if session_info.get('type') == 'leaders_accelerator':
     scale_labels = ["Strongly Agree", "Agree", "Neutral", "Disagree", "Strongly Disagree"]
     scale_colors = ['#7C3AED', '#A78BFA', '#C4B5FD', '#DDD6FE', '#EDE9FE']
 
+    return AcceleratorTallies(N_pre=N_pre, N_post=N_post, pre=pre, post=post,
+                              pre_understand_pct=pre_understand_pct,
+                              post_understand_pct=post_understand_pct, pre_track_pct=pre_track_pct,
+                              post_track_pct=post_track_pct, pre_conf_pct=pre_conf_pct,
+                              post_conf_pct=post_conf_pct, pre_artic_pct=pre_artic_pct,
+                              post_artic_pct=post_artic_pct, mentoring_pct=mentoring_pct,
+                              recommend_pct=recommend_pct, plan_action_pct=plan_action_pct,
+                              scale_labels=scale_labels, scale_colors=scale_colors)
+
+
+def render_leaders_accelerator(selected_session, initiative_info, session_info, data):
+    """Leaders Accelerator dashboard."""
+    t = leaders_accelerator_static(data)
+
     # ── HEADER ────────────────────────────────────────────────────────────────
     st.markdown(f"""
     <div style="background: linear-gradient(135deg, #4C1D95 0%, #7C3AED 60%, #A78BFA 100%);
@@ -3220,19 +3615,19 @@ if session_info.get('type') == 'leaders_accelerator':
          box-shadow:0 10px 40px rgba(124,58,237,0.2);">
         <div style="display:flex;flex-wrap:wrap;justify-content:center;
              gap:0.5rem;position:relative;z-index:1;">
-            <div class="stat-pill"><span class="num">{N_pre}</span>
+            <div class="stat-pill"><span class="num">{t.N_pre}</span>
                 <span class="lbl">Pre-survey</span></div>
-            <div class="stat-pill"><span class="num">{N_post}</span>
+            <div class="stat-pill"><span class="num">{t.N_post}</span>
                 <span class="lbl">Post-survey</span></div>
-            <div class="stat-pill"><span class="num">{post_understand_pct}%</span>
+            <div class="stat-pill"><span class="num">{t.post_understand_pct}%</span>
                 <span class="lbl">Program clarity (post)</span></div>
-            <div class="stat-pill"><span class="num">{post_conf_pct}%</span>
+            <div class="stat-pill"><span class="num">{t.post_conf_pct}%</span>
                 <span class="lbl">App. confidence (post)</span></div>
-            <div class="stat-pill"><span class="num">{mentoring_pct}%</span>
+            <div class="stat-pill"><span class="num">{t.mentoring_pct}%</span>
                 <span class="lbl">Mentoring helped</span></div>
-            <div class="stat-pill"><span class="num">{recommend_pct}%</span>
+            <div class="stat-pill"><span class="num">{t.recommend_pct}%</span>
                 <span class="lbl">Would recommend</span></div>
-            <div class="stat-pill"><span class="num">{plan_action_pct}%</span>
+            <div class="stat-pill"><span class="num">{t.plan_action_pct}%</span>
                 <span class="lbl">Plan to apply</span></div>
         </div>
     </div>
@@ -3268,16 +3663,16 @@ if session_info.get('type') == 'leaders_accelerator':
     c1, c2, c3 = st.columns(3)
     with c1:
         st.markdown(acc_kpi_card("REACH", "Participants Surveyed",
-            f"{N_pre} / {N_post}",
-            f"{N_pre} pre-session · {N_post} post-session respondents",
+            f"{t.N_pre} / {t.N_post}",
+            f"{t.N_pre} pre-session · {t.N_post} post-session respondents",
             "✓ Strong engagement for focused cohort"), unsafe_allow_html=True)
     with c2:
         st.markdown(acc_kpi_card("OUTREACH", "Primary Channel — Saudi Student Assoc.",
             "70%",
-            f"7 of {N_pre} heard via Saudi Students Associations",
+            f"7 of {t.N_pre} heard via Saudi Students Associations",
             "✓ Community-driven reach"), unsafe_allow_html=True)
     with c3:
-        cities = sum(1 for v in pre['location'].values() if v > 0)
+        cities = sum(1 for v in t.pre['location'].values() if v > 0)
         st.markdown(acc_kpi_card("REACH", "Cities Represented",
             str(cities),
             "Sydney, Melbourne + 1 other location",
@@ -3289,13 +3684,13 @@ if session_info.get('type') == 'leaders_accelerator':
     c1, c2, c3, c4 = st.columns(4)
     items = [
         ("CLARITY", "Program Requirements Clarity",
-         pre_understand_pct, post_understand_pct),
+         t.pre_understand_pct, t.post_understand_pct),
         ("TRACK", "Track Selection Clarity",
-         pre_track_pct, post_track_pct),
+         t.pre_track_pct, t.post_track_pct),
         ("CONFIDENCE", "Application Confidence",
-         pre_conf_pct, post_conf_pct),
+         t.pre_conf_pct, t.post_conf_pct),
         ("ARTICULATION", "Leadership Articulation",
-         pre_artic_pct, post_artic_pct),
+         t.pre_artic_pct, t.post_artic_pct),
     ]
     for col, (cat, label, pre_v, post_v) in zip([c1, c2, c3, c4], items):
         lift = post_v - pre_v
@@ -3313,20 +3708,20 @@ if session_info.get('type') == 'leaders_accelerator':
     c1, c2, c3 = st.columns(3)
     with c1:
         st.markdown(acc_kpi_card("MENTORING", "Individual Mentoring Helped",
-            f"{mentoring_pct}%",
-            f"{post['mentoring_helped']['Strongly Agree']} Strongly Agree + "
-            f"{post['mentoring_helped']['Agree']} Agree",
+            f"{t.mentoring_pct}%",
+            f"{t.post['mentoring_helped']['Strongly Agree']} Strongly Agree + "
+            f"{t.post['mentoring_helped']['Agree']} Agree",
             "✓ High-impact coaching format"), unsafe_allow_html=True)
     with c2:
         st.markdown(acc_kpi_card("ACTION", "Plan to Apply / Already Applied",
-            f"{plan_action_pct}%",
+            f"{t.plan_action_pct}%",
             f"7 planning to apply · 2 already applied",
             "✓ 100% conversion — 0 said No"), unsafe_allow_html=True)
     with c3:
         st.markdown(acc_kpi_card("ADVOCACY", "Would Recommend",
-            f"{recommend_pct}%",
-            f"{post['recommendation']['Very likely']} Very Likely + "
-            f"{post['recommendation']['Likely']} Likely",
+            f"{t.recommend_pct}%",
+            f"{t.post['recommendation']['Very likely']} Very Likely + "
+            f"{t.post['recommendation']['Likely']} Likely",
             "✓ Outstanding word-of-mouth"), unsafe_allow_html=True)
 
     # ── HIGHLIGHT BOX ──────────────────────────────────────────────────────────
@@ -3348,16 +3743,16 @@ if session_info.get('type') == 'leaders_accelerator':
                 <span style="position:absolute;left:0;color:#C4B5FD;font-weight:900;
                       font-size:1.4rem;">✓</span>
                 Program requirements clarity jumped from
-                <strong>{pre_understand_pct}% → {post_understand_pct}%</strong>
-                (+{post_understand_pct - pre_understand_pct}pp)</li>
+                <strong>{t.pre_understand_pct}% → {t.post_understand_pct}%</strong>
+                (+{t.post_understand_pct - t.pre_understand_pct}pp)</li>
             <li style="font-family:'Epilogue',sans-serif;font-size:1.1rem;
                  color:rgba(255,255,255,0.95);line-height:2;padding:0.6rem 0 0.6rem 2.5rem;
                  position:relative;">
                 <span style="position:absolute;left:0;color:#C4B5FD;font-weight:900;
                       font-size:1.4rem;">✓</span>
                 Application confidence rose from
-                <strong>{pre_conf_pct}% → {post_conf_pct}%</strong>
-                (+{post_conf_pct - pre_conf_pct}pp)</li>
+                <strong>{t.pre_conf_pct}% → {t.post_conf_pct}%</strong>
+                (+{t.post_conf_pct - t.pre_conf_pct}pp)</li>
             <li style="font-family:'Epilogue',sans-serif;font-size:1.1rem;
                  color:rgba(255,255,255,0.95);line-height:2;padding:0.6rem 0 0.6rem 2.5rem;
                  position:relative;">
@@ -3371,13 +3766,13 @@ if session_info.get('type') == 'leaders_accelerator':
                 <span style="position:absolute;left:0;color:#C4B5FD;font-weight:900;
                       font-size:1.4rem;">✓</span>
                 Individual mentoring rated helpful by
-                <strong>{mentoring_pct}%</strong> of participants</li>
+                <strong>{t.mentoring_pct}%</strong> of participants</li>
             <li style="font-family:'Epilogue',sans-serif;font-size:1.1rem;
                  color:rgba(255,255,255,0.95);line-height:2;padding:0.6rem 0 0.6rem 2.5rem;
                  position:relative;">
                 <span style="position:absolute;left:0;color:#C4B5FD;font-weight:900;
                       font-size:1.4rem;">✓</span>
-                <strong>{recommend_pct}%</strong> would recommend the session to a colleague
+                <strong>{t.recommend_pct}%</strong> would recommend the session to a colleague
             </li>
         </ul>
     </div>
@@ -3388,220 +3783,224 @@ if session_info.get('type') == 'leaders_accelerator':
     st.markdown('<p class="section-title">📚 Deep-Dive Analysis</p>',
                 unsafe_allow_html=True)
 
-    tab1, tab2, tab3 = st.tabs([
-        "🔄 Pre vs Post Shifts", "🎯 Outcomes & Action", "👥 Demographics"
-    ])
-
-    # ── TAB 1: PRE VS POST ─────────────────────────────────────────────────────
-    with tab1:
-        st.markdown("### Readiness Shifts — All Four Dimensions")
-
-        dimensions = [
-            "Program\nRequirements\nClarity",
-            "Track\nSelection\nClarity",
-            "Application\nConfidence",
-            "Leadership\nArticulation",
-        ]
-        pre_pcts  = [pre_understand_pct, pre_track_pct,
-                     pre_conf_pct, pre_artic_pct]
-        post_pcts = [post_understand_pct, post_track_pct,
-                     post_conf_pct, post_artic_pct]
-
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Before Session', x=dimensions, y=pre_pcts,
-            marker_color='#DDD6FE',
-            text=[f"{v}%" for v in pre_pcts], textposition='outside',
-            textfont=dict(size=13, family='Epilogue')))
-        fig.add_trace(go.Bar(
-            name='After Session', x=dimensions, y=post_pcts,
-            marker_color='#7C3AED',
-            text=[f"{v}%" for v in post_pcts], textposition='outside',
-            textfont=dict(size=13, family='Epilogue')))
-        fig.update_layout(
-            barmode='group', height=420,
-            yaxis=dict(range=[0, 110], title='% Agree / Strongly Agree'),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom',
-                        y=1.02, xanchor='center', x=0.5))
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Compare Bands — Each Dimension")
-        for dim, pre_v, post_v in zip(
-                ["Program Requirements Clarity", "Track Selection Clarity",
-                 "Application Confidence", "Leadership Articulation"],
-                pre_pcts, post_pcts):
-            st.markdown(compare_band(
-                pre_v, post_v,
-                f"agreed pre-session",
-                f"agreed post-session",
-                "#6b7280", "#7C3AED", "%", dim
-            ), unsafe_allow_html=True)
-
-        st.markdown("### Likert Distribution — Before vs After")
-        c1, c2 = st.columns(2)
-        likert_dims_pre = {
-            "Program\nClarity":    pre['program_understanding'],
-            "Track\nClarity":      pre['track_clarity'],
-            "App\nConfidence":     pre['app_confidence'],
-            "Leadership\nArticul.":pre['articulate_leadership'],
-        }
-        likert_dims_post = {
-            "Program\nClarity":     post['program_understanding'],
-            "Track\nClarity":       post['track_clarity'],
-            "App\nConfidence":      post['app_confidence'],
-            "Leadership\nArticul.": post['articulate_leadership'],
-        }
-        with c1:
-            st.markdown("#### Before Session")
-            fig_pre = go.Figure()
-            for label, color in zip(scale_labels, scale_colors):
-                fig_pre.add_trace(go.Bar(
-                    name=label,
-                    x=list(likert_dims_pre.keys()),
-                    y=[d.get(label, 0) for d in likert_dims_pre.values()],
-                    marker_color=color,
-                    text=[d.get(label, 0) for d in likert_dims_pre.values()],
-                    textposition='inside', textfont=dict(size=11)
-                ))
-            fig_pre.update_layout(
-                barmode='stack', height=380, yaxis=dict(range=[0, N_pre + 1]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom',
-                            y=-0.3, xanchor='center', x=0.5))
-            st.plotly_chart(fig_pre, use_container_width=True)
-        with c2:
-            st.markdown("#### After Session")
-            fig_post = go.Figure()
-            for label, color in zip(scale_labels, scale_colors):
-                fig_post.add_trace(go.Bar(
-                    name=label,
-                    x=list(likert_dims_post.keys()),
-                    y=[d.get(label, 0) for d in likert_dims_post.values()],
-                    marker_color=color,
-                    text=[d.get(label, 0) for d in likert_dims_post.values()],
-                    textposition='inside', textfont=dict(size=11)
-                ))
-            fig_post.update_layout(
-                barmode='stack', height=380, yaxis=dict(range=[0, N_post + 1]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation='h', yanchor='bottom',
-                            y=-0.3, xanchor='center', x=0.5))
-            st.plotly_chart(fig_post, use_container_width=True)
-
-        st.markdown("### Radar — Readiness Profile Before vs After")
-        radar_dims  = ["Program\nClarity", "Track\nClarity",
-                       "App\nConfidence", "Leadership\nArticulation"]
-        fig_r = go.Figure()
-        fig_r.add_trace(go.Scatterpolar(
-            r=pre_pcts + [pre_pcts[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='Before Session',
-            line_color='#C4B5FD', fillcolor='rgba(196,181,253,0.15)', line_width=2))
-        fig_r.add_trace(go.Scatterpolar(
-            r=post_pcts + [post_pcts[0]], theta=radar_dims + [radar_dims[0]],
-            fill='toself', name='After Session',
-            line_color='#7C3AED', fillcolor='rgba(124,58,237,0.15)', line_width=2.5))
-        fig_r.update_layout(
-            polar=dict(
-                radialaxis=dict(visible=True, range=[0, 100],
-                                tickfont=dict(size=10)),
-                angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))),
-            showlegend=True, height=480, paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation='h', yanchor='bottom',
-                        y=-0.1, xanchor='center', x=0.5))
-        col_l, col_c, col_r = st.columns([1, 3, 1])
-        with col_c:
-            st.plotly_chart(fig_r, use_container_width=True)
-
-    # ── TAB 2: OUTCOMES ────────────────────────────────────────────────────────
-    with tab2:
-        st.markdown("### Post-Session Outcomes")
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            st.markdown("#### Plan to Apply")
-            fig = lnc_donut(
-                list(post['plan_to_apply'].keys()),
-                list(post['plan_to_apply'].values()),
-                ['#7C3AED', '#A78BFA', '#E9D5FF'],
-                center_text=f"{plan_action_pct}%\nWill Apply"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Recommendation Likelihood")
-            fig = lnc_donut(
-                list(post['recommendation'].keys()),
-                list(post['recommendation'].values()),
-                ['#4C1D95', '#7C3AED', '#A78BFA', '#C4B5FD', '#EDE9FE'],
-                center_text=f"{recommend_pct}%\nRecommend"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        with c3:
-            st.markdown("#### Mentoring Effectiveness")
-            fig = lnc_donut(
-                list(post['mentoring_helped'].keys()),
-                list(post['mentoring_helped'].values()),
-                ['#4C1D95', '#7C3AED', '#A78BFA', '#C4B5FD', '#EDE9FE'],
-                center_text=f"{mentoring_pct}%\nHelped"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        st.markdown("### Post-Session Summary — All Measures")
-        post_measures = [
-            "Program\nClarity", "Track\nClarity",
-            "App\nConfidence", "Leadership\nArticulation",
-            "Mentoring\nHelped", "Would\nRecommend", "Plan\nto Apply"
-        ]
-        post_vals = [
-            post_understand_pct, post_track_pct,
-            post_conf_pct, post_artic_pct,
-            mentoring_pct, recommend_pct, plan_action_pct
-        ]
-        fig = go.Figure(go.Bar(
-            x=post_measures, y=post_vals,
-            marker_color='#7C3AED',
-            text=[f"{v}%" for v in post_vals],
-            textposition='outside',
-            textfont=dict(size=13, family='Epilogue')
-        ))
-        fig.update_layout(
-            height=380, yaxis=dict(range=[0, 110]),
-            font=dict(family='Epilogue', color='#2c3e50'),
-            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-            showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
-
-    # ── TAB 3: DEMOGRAPHICS ────────────────────────────────────────────────────
-    with tab3:
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("#### How Participants Heard About the Session")
-            heard_labels = [k for k, v in pre['heard_about'].items() if v > 0]
-            heard_vals   = [v for v in pre['heard_about'].values() if v > 0]
-            fig = go.Figure(go.Bar(
-                x=heard_labels, y=heard_vals,
-                marker_color=['#7C3AED', '#A78BFA', '#C4B5FD'],
-                text=heard_vals, textposition='outside',
-                textfont=dict(size=14, family='Epilogue')
-            ))
-            fig.update_layout(
-                height=340, yaxis=dict(range=[0, 10]),
-                font=dict(family='Epilogue', color='#2c3e50'),
-                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
-        with c2:
-            st.markdown("#### Location of Participants")
-            loc_labels = [k for k, v in pre['location'].items() if v > 0]
-            loc_vals   = [v for k, v in pre['location'].items() if v > 0]
-            fig = lnc_donut(
-                loc_labels, loc_vals,
-                ['#4C1D95', '#7C3AED', '#A78BFA'],
-                center_text=f"{N_pre}\nParticipants"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+    @st.fragment
+    def dashboard_tabs():
+        tab1, tab2, tab3 = session_tabs(selected_session, [
+            "🔄 Pre vs Post Shifts", "🎯 Outcomes & Action", "👥 Demographics"
+        ])
+
+        # ── TAB 1: PRE VS POST ─────────────────────────────────────────────────────
+        with tab1:
+            if tab_open(tab1):
+                st.markdown("### Readiness Shifts — All Four Dimensions")
+
+                dimensions = [
+                    "Program\nRequirements\nClarity",
+                    "Track\nSelection\nClarity",
+                    "Application\nConfidence",
+                    "Leadership\nArticulation",
+                ]
+                pre_pcts  = [t.pre_understand_pct, t.pre_track_pct,
+                             t.pre_conf_pct, t.pre_artic_pct]
+                post_pcts = [t.post_understand_pct, t.post_track_pct,
+                             t.post_conf_pct, t.post_artic_pct]
+
+                fig = lnc_figure(
+                    [dict(type='bar', name='Before Session', x=dimensions, y=pre_pcts,
+                        marker_color='#DDD6FE',
+                        text=[f"{v}%" for v in pre_pcts], textposition='outside',
+                        textfont=dict(size=13, family='Epilogue')),
+                     dict(type='bar', name='After Session', x=dimensions, y=post_pcts,
+                        marker_color='#7C3AED',
+                        text=[f"{v}%" for v in post_pcts], textposition='outside',
+                        textfont=dict(size=13, family='Epilogue'))],
+                    dict(
+                        barmode='group', height=420,
+                        yaxis=dict(range=[0, 110], title='% Agree / Strongly Agree'),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom',
+                                    y=1.02, xanchor='center', x=0.5)
+                    ))
+                st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Compare Bands — Each Dimension")
+                for dim, pre_v, post_v in zip(
+                        ["Program Requirements Clarity", "Track Selection Clarity",
+                         "Application Confidence", "Leadership Articulation"],
+                        pre_pcts, post_pcts):
+                    st.markdown(compare_band(
+                        pre_v, post_v,
+                        f"agreed pre-session",
+                        f"agreed post-session",
+                        "#6b7280", "#7C3AED", "%", dim
+                    ), unsafe_allow_html=True)
+
+                st.markdown("### Likert Distribution — Before vs After")
+                c1, c2 = st.columns(2)
+                likert_dims_pre = {
+                    "Program\nClarity":    t.pre['program_understanding'],
+                    "Track\nClarity":      t.pre['track_clarity'],
+                    "App\nConfidence":     t.pre['app_confidence'],
+                    "Leadership\nArticul.":t.pre['articulate_leadership'],
+                }
+                likert_dims_post = {
+                    "Program\nClarity":     t.post['program_understanding'],
+                    "Track\nClarity":       t.post['track_clarity'],
+                    "App\nConfidence":      t.post['app_confidence'],
+                    "Leadership\nArticul.": t.post['articulate_leadership'],
+                }
+                with c1:
+                    st.markdown("#### Before Session")
+                    fig_pre = lnc_figure(
+                        [dict(type='bar',
+                            name=label,
+                            x=list(likert_dims_pre.keys()),
+                            y=[d.get(label, 0) for d in likert_dims_pre.values()],
+                            marker_color=color,
+                            text=[d.get(label, 0) for d in likert_dims_pre.values()],
+                            textposition='inside', textfont=dict(size=11))
+                         for label, color in zip(t.scale_labels, t.scale_colors)],
+                        dict(
+                            barmode='stack', height=380, yaxis=dict(range=[0, t.N_pre + 1]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom',
+                                        y=-0.3, xanchor='center', x=0.5)
+                        ))
+                    st.plotly_chart(fig_pre, use_container_width=True)
+                with c2:
+                    st.markdown("#### After Session")
+                    fig_post = lnc_figure(
+                        [dict(type='bar',
+                            name=label,
+                            x=list(likert_dims_post.keys()),
+                            y=[d.get(label, 0) for d in likert_dims_post.values()],
+                            marker_color=color,
+                            text=[d.get(label, 0) for d in likert_dims_post.values()],
+                            textposition='inside', textfont=dict(size=11))
+                         for label, color in zip(t.scale_labels, t.scale_colors)],
+                        dict(
+                            barmode='stack', height=380, yaxis=dict(range=[0, t.N_post + 1]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation='h', yanchor='bottom',
+                                        y=-0.3, xanchor='center', x=0.5)
+                        ))
+                    st.plotly_chart(fig_post, use_container_width=True)
+
+                st.markdown("### Radar — Readiness Profile Before vs After")
+                radar_dims  = ["Program\nClarity", "Track\nClarity",
+                               "App\nConfidence", "Leadership\nArticulation"]
+                fig_r = lnc_figure(
+                    [dict(type='scatterpolar', r=pre_pcts + [pre_pcts[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='Before Session',
+                        line_color='#C4B5FD', fillcolor='rgba(196,181,253,0.15)', line_width=2),
+                     dict(type='scatterpolar', r=post_pcts + [post_pcts[0]], theta=radar_dims + [radar_dims[0]],
+                        fill='toself', name='After Session',
+                        line_color='#7C3AED', fillcolor='rgba(124,58,237,0.15)', line_width=2.5)],
+                    dict(
+                        polar=dict(
+                            radialaxis=dict(visible=True, range=[0, 100],
+                                            tickfont=dict(size=10)),
+                            angularaxis=dict(tickfont=dict(size=12, family='Epilogue'))),
+                        showlegend=True, height=480, paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation='h', yanchor='bottom',
+                                    y=-0.1, xanchor='center', x=0.5)
+                    ))
+                col_l, col_c, col_r = st.columns([1, 3, 1])
+                with col_c:
+                    st.plotly_chart(fig_r, use_container_width=True)
+
+        # ── TAB 2: OUTCOMES ────────────────────────────────────────────────────────
+        with tab2:
+            if tab_open(tab2):
+                st.markdown("### Post-Session Outcomes")
+                c1, c2, c3 = st.columns(3)
+                with c1:
+                    st.markdown("#### Plan to Apply")
+                    fig = lnc_donut(
+                        list(t.post['plan_to_apply'].keys()),
+                        list(t.post['plan_to_apply'].values()),
+                        ['#7C3AED', '#A78BFA', '#E9D5FF'],
+                        center_text=f"{t.plan_action_pct}%\nWill Apply"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Recommendation Likelihood")
+                    fig = lnc_donut(
+                        list(t.post['recommendation'].keys()),
+                        list(t.post['recommendation'].values()),
+                        ['#4C1D95', '#7C3AED', '#A78BFA', '#C4B5FD', '#EDE9FE'],
+                        center_text=f"{t.recommend_pct}%\nRecommend"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+                with c3:
+                    st.markdown("#### Mentoring Effectiveness")
+                    fig = lnc_donut(
+                        list(t.post['mentoring_helped'].keys()),
+                        list(t.post['mentoring_helped'].values()),
+                        ['#4C1D95', '#7C3AED', '#A78BFA', '#C4B5FD', '#EDE9FE'],
+                        center_text=f"{t.mentoring_pct}%\nHelped"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+
+                st.markdown("### Post-Session Summary — All Measures")
+                post_measures = [
+                    "Program\nClarity", "Track\nClarity",
+                    "App\nConfidence", "Leadership\nArticulation",
+                    "Mentoring\nHelped", "Would\nRecommend", "Plan\nto Apply"
+                ]
+                post_vals = [
+                    t.post_understand_pct, t.post_track_pct,
+                    t.post_conf_pct, t.post_artic_pct,
+                    t.mentoring_pct, t.recommend_pct, t.plan_action_pct
+                ]
+                fig = lnc_figure(
+                    [dict(type='bar', x=post_measures, y=post_vals,
+                        marker_color='#7C3AED',
+                        text=[f"{v}%" for v in post_vals],
+                        textposition='outside',
+                        textfont=dict(size=13, family='Epilogue'))],
+                    dict(
+                        height=380, yaxis=dict(range=[0, 110]),
+                        font=dict(family='Epilogue', color='#2c3e50'),
+                        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                        showlegend=False
+                    ))
+                st.plotly_chart(fig, use_container_width=True)
+
+        # ── TAB 3: DEMOGRAPHICS ────────────────────────────────────────────────────
+        with tab3:
+            if tab_open(tab3):
+                c1, c2 = st.columns(2)
+                with c1:
+                    st.markdown("#### How Participants Heard About the Session")
+                    heard_labels = [k for k, v in t.pre['heard_about'].items() if v > 0]
+                    heard_vals   = [v for v in t.pre['heard_about'].values() if v > 0]
+                    fig = lnc_figure(
+                        [dict(type='bar', x=heard_labels, y=heard_vals,
+                            marker_color=['#7C3AED', '#A78BFA', '#C4B5FD'],
+                            text=heard_vals, textposition='outside',
+                            textfont=dict(size=14, family='Epilogue'))],
+                        dict(
+                            height=340, yaxis=dict(range=[0, 10]),
+                            font=dict(family='Epilogue', color='#2c3e50'),
+                            plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False
+                        ))
+                    st.plotly_chart(fig, use_container_width=True)
+                with c2:
+                    st.markdown("#### Location of Participants")
+                    loc_labels = [k for k, v in t.pre['location'].items() if v > 0]
+                    loc_vals   = [v for k, v in t.pre['location'].items() if v > 0]
+                    fig = lnc_donut(
+                        loc_labels, loc_vals,
+                        ['#4C1D95', '#7C3AED', '#A78BFA'],
+                        center_text=f"{t.N_pre}\nParticipants"
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+    dashboard_tabs()
 
     # ── ABOUT BOX ──────────────────────────────────────────────────────────────
     st.markdown("""
@@ -3632,15 +4031,15 @@ if session_info.get('type') == 'leaders_accelerator':
              Saudi Leadership Society · Australia Chapter</p>
         <div style="display:flex;justify-content:center;gap:2.5rem;margin:2rem 0;
              flex-wrap:wrap;position:relative;z-index:1;">
-            <div><div style="font-size:2.5rem;font-weight:700">{N_pre}</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N_pre}</div>
                  <div style="opacity:0.8">Pre-survey</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{N_post}</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.N_post}</div>
                  <div style="opacity:0.8">Post-survey</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{post_conf_pct}%</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.post_conf_pct}%</div>
                  <div style="opacity:0.8">App. confident (post)</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{plan_action_pct}%</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.plan_action_pct}%</div>
                  <div style="opacity:0.8">Plan to apply</div></div>
-            <div><div style="font-size:2.5rem;font-weight:700">{recommend_pct}%</div>
+            <div><div style="font-size:2.5rem;font-weight:700">{t.recommend_pct}%</div>
                  <div style="opacity:0.8">Would recommend</div></div>
         </div>
         <p style="font-size:1.1rem;margin-top:2rem;opacity:0.9;
@@ -3650,35 +4049,32 @@ if session_info.get('type') == 'leaders_accelerator':
              {datetime.now().strftime('%B %d, %Y')} | Vision 2030</p>
     </div>
     """, unsafe_allow_html=True)
-
-    st.stop()
 # ============================================================================
 # HEALTH SESSION DASHBOARD
 # ============================================================================
 
-if session_info.get('type') == 'health':
-    metrics = data['metrics']
-    topics = session_info['topic_labels']
-    topic_keys = session_info.get('topic_keys', ['grow_sector', 'grow_vision2030', 'grow_job_market', 'grow_skills'])
-    topic_data = [metrics.get(k, {}) for k in topic_keys]
-    pre_scores   = [t.get('pre', 0)         for t in topic_data]
-    post_scores  = [t.get('post', 0)        for t in topic_data]
-    improvements = [t.get('improvement', 0) for t in topic_data]
+def render_health(selected_session, initiative_info, session_info, data):
+    """Health / Nursing session dashboard; `data` is a SessionRecord."""
+    s = segment_filter(selected_session, session_info, data)
+    topics       = s.topic_labels
+    pre_scores   = s.pre_scores
+    post_scores  = s.post_scores
+    improvements = s.improvements
 
     st.markdown('<p class="section-title">📊 Key Performance Indicators</p>', unsafe_allow_html=True)
     st.markdown('<p class="subsection-title">Reach & Participation</p>', unsafe_allow_html=True)
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.markdown(create_kpi_card("REACH","Total Participants",str(metrics['total_participants_pre']),
-            "Attended the Health session",f"✓ {metrics['total_participants_post']} completed post-survey"),
+        st.markdown(create_kpi_card("REACH","Total Participants",str(s.total_participants_pre),
+            "Attended the Health session",f"✓ {s.total_participants_post} completed post-survey"),
             unsafe_allow_html=True)
     with col2:
-        st.markdown(create_kpi_card("ENGAGEMENT","Completed Both Surveys",str(metrics['total_responses']),
-            "Matched pre & post responses",f"✓ {metrics['match_rate_pct']:.1f}% match rate"),
+        st.markdown(create_kpi_card("ENGAGEMENT","Completed Both Surveys",str(s.total_responses),
+            "Matched pre & post responses",f"✓ {s.match_rate_pct:.1f}% match rate"),
             unsafe_allow_html=True)
     with col3:
-        improved_pct = metrics.get('grow_members_reporting_growth_pct', 0)
+        improved_pct = s.grow_members_reporting_growth_pct
         st.markdown(create_kpi_card("LEARNING","Participants Improved",f"{improved_pct:.1f}%",
             "Showed knowledge gain across topics",
             "✓ Strong majority" if improved_pct >= 60 else "→ Solid progress"),
@@ -3696,7 +4092,7 @@ if session_info.get('type') == 'health':
 
     st.markdown('<p class="subsection-title">Overall Knowledge Growth</p>', unsafe_allow_html=True)
     col1, col2, col3 = st.columns(3)
-    avg_growth = metrics.get('grow_avg_knowledge_increase', 0)
+    avg_growth = s.grow_avg_knowledge_increase
     avg_pre  = sum(pre_scores)/len(pre_scores)
     avg_post = sum(post_scores)/len(post_scores)
     with col1:
@@ -3725,95 +4121,109 @@ if session_info.get('type') == 'health':
 
     st.markdown("---")
     st.markdown('<p class="section-title">📚 Detailed Analysis</p>', unsafe_allow_html=True)
-    tab1, tab2, tab3 = st.tabs(["🌱 Knowledge Development", "🕸️ Knowledge Profile", "👥 Participant Demographics"])
-
-    with tab1:
-        st.markdown("### Learning Progress — Before vs After")
-        col1, col2 = st.columns([3, 2])
-        with col1:
-            knowledge_fig = go.Figure()
-            knowledge_fig.add_trace(go.Bar(name='Before Session',x=topics,y=pre_scores,
-                marker_color='#e9ecef',text=[f"{s:.2f}" for s in pre_scores],textposition='outside'))
-            knowledge_fig.add_trace(go.Bar(name='After Session',x=topics,y=post_scores,
-                marker_color='#006341',text=[f"{s:.2f}" for s in post_scores],textposition='outside'))
-            knowledge_fig.update_layout(barmode='group',yaxis_title='Knowledge Score (1–5 scale)',
-                yaxis=dict(range=[0,5.8]),height=420,font=dict(family="Epilogue",color="#2c3e50"),
-                plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
-                legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5))
-            st.plotly_chart(knowledge_fig, use_container_width=True)
-        with col2:
-            st.markdown("### Growth by Topic")
-            bar_colors = ['#006341' if v>=0 else '#e74c3c' for v in improvements]
-            improvement_fig = go.Figure()
-            improvement_fig.add_trace(go.Bar(x=improvements,y=topics,orientation='h',
-                marker_color=bar_colors,text=[f"{v:+.2f}" for v in improvements],
-                textposition='outside',textfont=dict(size=13)))
-            improvement_fig.add_vline(x=0,line_dash="dash",line_color="#adb5bd",line_width=1.5)
-            improvement_fig.update_layout(xaxis_title='Score Change',xaxis=dict(range=[-0.5,0.8]),
-                height=420,font=dict(family="Epilogue",color="#2c3e50"),
-                plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
-                showlegend=False,margin=dict(l=10,r=40,t=20,b=20))
-            st.plotly_chart(improvement_fig, use_container_width=True)
-            st.markdown("### Key Metrics")
-            st.metric("Average Growth", f"+{avg_growth:.2f} pts")
-            st.metric("Participants Improved", f"{improved_pct:.1f}%")
-            st.metric("Topics Improved", f"{positive_topics} / {len(topics)}")
-
-    with tab2:
-        st.markdown("### Knowledge Profile — Before vs After")
-        radar_fig = go.Figure()
-        radar_fig.add_trace(go.Scatterpolar(r=pre_scores+[pre_scores[0]],theta=topics+[topics[0]],
-            fill='toself',name='Before Session',line_color='#adb5bd',fillcolor='rgba(173,181,189,0.2)',line_width=2))
-        radar_fig.add_trace(go.Scatterpolar(r=post_scores+[post_scores[0]],theta=topics+[topics[0]],
-            fill='toself',name='After Session',line_color='#006341',fillcolor='rgba(0,132,61,0.15)',line_width=2.5))
-        radar_fig.update_layout(polar=dict(radialaxis=dict(visible=True,range=[0,5],tickfont=dict(size=11)),
-            angularaxis=dict(tickfont=dict(size=13,family='Epilogue'))),
-            showlegend=True,height=500,font=dict(family="Epilogue",color="#2c3e50"),paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation="h",yanchor="bottom",y=-0.15,xanchor="center",x=0.5))
-        col1,col2,col3 = st.columns([1,3,1])
-        with col2: st.plotly_chart(radar_fig, use_container_width=True)
-        st.markdown("### Score Summary")
-        summary_cols = st.columns(len(topics))
-        for i,(col,topic) in enumerate(zip(summary_cols,topics)):
-            with col:
-                st.metric(label=topic,value=f"{post_scores[i]:.2f}",delta=f"{improvements[i]:+.2f}",
-                    delta_color="normal" if improvements[i]>=0 else "inverse")
-
-    with tab3:
-        st.markdown("### Who Attended?")
-        demographics = metrics.get('demographics', {})
-        location_data = demographics.get('location',{}) or metrics.get('demographics_location',{})
-        heard_data    = demographics.get('heard_about',{}) or metrics.get('demographics_heard_about',{})
-        academic_data = demographics.get('academic_level',{})
-        if not location_data and not heard_data and not academic_data:
-            st.info("No demographics data available in the JSON yet.")
-        else:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown("#### 📍 Location")
-                if location_data:
-                    fig_loc = go.Figure(data=[go.Pie(labels=list(location_data.keys()),
-                        values=list(location_data.values()),hole=0.45,
-                        marker_colors=['#006341','#00843d','#93c13f','#b8d96d','#d4e89e','#e9f5c9','#f4fbe8'],
-                        textfont=dict(size=13,family='Epilogue'),textinfo='label+percent')])
-                    fig_loc.update_layout(height=400,showlegend=True,paper_bgcolor='rgba(0,0,0,0)',
-                        font=dict(family="Epilogue",color="#2c3e50"),
-                        legend=dict(orientation="v",yanchor="middle",y=0.5,xanchor="left",x=1.02),
-                        margin=dict(l=20,r=120,t=20,b=20))
-                    st.plotly_chart(fig_loc, use_container_width=True)
-            with col2:
-                st.markdown("#### 📣 How Did They Hear About Us?")
-                if heard_data:
-                    heard_labels = list(heard_data.keys()); heard_values = list(heard_data.values())
-                    fig_heard = go.Figure(data=[go.Bar(x=heard_labels,y=heard_values,
-                        marker_color=['#006341','#00843d','#93c13f','#b8d96d','#d4e89e'][:len(heard_labels)],
-                        text=heard_values,textposition='outside',textfont=dict(size=15,family='Epilogue'))])
-                    fig_heard.update_layout(height=380,yaxis_title='Number of Participants',
-                        yaxis=dict(range=[0,max(heard_values)*1.35]),
-                        font=dict(family="Epilogue",color="#2c3e50"),
-                        plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
-                        showlegend=False,margin=dict(l=20,r=20,t=20,b=60))
-                    st.plotly_chart(fig_heard, use_container_width=True)
+    @st.fragment
+    def dashboard_tabs():
+        tab1, tab2, tab3 = session_tabs(selected_session, ["🌱 Knowledge Development", "🕸️ Knowledge Profile", "👥 Participant Demographics"])
+
+        with tab1:
+            if tab_open(tab1):
+                st.markdown("### Learning Progress — Before vs After")
+                col1, col2 = st.columns([3, 2])
+                with col1:
+                    knowledge_fig = lnc_figure(
+                        [dict(type='bar', name='Before Session',x=topics,y=pre_scores,
+                            marker_color='#e9ecef',text=[f"{s:.2f}" for s in pre_scores],textposition='outside'),
+                         dict(type='bar', name='After Session',x=topics,y=post_scores,
+                            marker_color='#006341',text=[f"{v:.2f}" for v in post_scores],textposition='outside',
+                            **gain_ci(s))],
+                        dict(barmode='group',yaxis_title='Knowledge Score (1–5 scale)',
+                            yaxis=dict(range=[0,5.8]),height=420,font=dict(family="Epilogue",color="#2c3e50"),
+                            plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5)))
+                    st.plotly_chart(knowledge_fig, use_container_width=True)
+                    note = gain_ci_note(s)
+                    if note:
+                        st.caption(note)
+                with col2:
+                    st.markdown("### Growth by Topic")
+                    bar_colors = ['#006341' if v>=0 else '#e74c3c' for v in improvements]
+                    ci = gain_ci(s, axis='x')
+                    x_range = ([min(-0.5, min(t.ci_low for t in s.topics) - 0.1),
+                                max(0.8, max(t.ci_high for t in s.topics) + 0.3)] if ci else [-0.5, 0.8])
+                    improvement_fig = lnc_figure(
+                        [dict(type='bar', x=improvements,y=topics,orientation='h',
+                            marker_color=bar_colors,text=[f"{v:+.2f}" for v in improvements],
+                            textposition='outside',textfont=dict(size=13),**ci)],
+                        dict(xaxis_title='Score Change',xaxis=dict(range=x_range),
+                            height=420,font=dict(family="Epilogue",color="#2c3e50"),
+                            plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
+                            showlegend=False,margin=dict(l=10,r=40,t=20,b=20)),
+                        vline=dict(x=0,line_dash="dash",line_color="#adb5bd",line_width=1.5))
+                    st.plotly_chart(improvement_fig, use_container_width=True)
+                    st.markdown("### Key Metrics")
+                    st.metric("Average Growth", f"+{avg_growth:.2f} pts")
+                    st.metric("Participants Improved", f"{improved_pct:.1f}%")
+                    st.metric("Topics Improved", f"{positive_topics} / {len(topics)}")
+
+        with tab2:
+            if tab_open(tab2):
+                st.markdown("### Knowledge Profile — Before vs After")
+                radar_fig = lnc_figure(
+                    [dict(type='scatterpolar', r=pre_scores+[pre_scores[0]],theta=topics+[topics[0]],
+                        fill='toself',name='Before Session',line_color='#adb5bd',fillcolor='rgba(173,181,189,0.2)',line_width=2),
+                     dict(type='scatterpolar', r=post_scores+[post_scores[0]],theta=topics+[topics[0]],
+                        fill='toself',name='After Session',line_color='#006341',fillcolor='rgba(0,132,61,0.15)',line_width=2.5)],
+                    dict(polar=dict(radialaxis=dict(visible=True,range=[0,5],tickfont=dict(size=11)),
+                        angularaxis=dict(tickfont=dict(size=13,family='Epilogue'))),
+                        showlegend=True,height=500,font=dict(family="Epilogue",color="#2c3e50"),paper_bgcolor='rgba(0,0,0,0)',
+                        legend=dict(orientation="h",yanchor="bottom",y=-0.15,xanchor="center",x=0.5)))
+                col1,col2,col3 = st.columns([1,3,1])
+                with col2: st.plotly_chart(radar_fig, use_container_width=True)
+                st.markdown("### Score Summary")
+                summary_cols = st.columns(len(topics))
+                for i,(col,topic) in enumerate(zip(summary_cols,topics)):
+                    with col:
+                        st.metric(label=topic,value=f"{post_scores[i]:.2f}",delta=f"{improvements[i]:+.2f}",
+                            delta_color="normal" if improvements[i]>=0 else "inverse")
+
+        with tab3:
+            if tab_open(tab3):
+                st.markdown("### Who Attended?")
+                location_data = s.location
+                heard_data    = s.heard_about
+                academic_data = s.academic_level
+                if not location_data and not heard_data and not academic_data:
+                    st.info("No demographics data available in the JSON yet.")
+                else:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown("#### 📍 Location")
+                        if location_data:
+                            fig_loc = lnc_figure(
+                                [dict(type='pie', labels=list(location_data.keys()),
+                                    values=list(location_data.values()),hole=0.45,
+                                    marker_colors=['#006341','#00843d','#93c13f','#b8d96d','#d4e89e','#e9f5c9','#f4fbe8'],
+                                    textfont=dict(size=13,family='Epilogue'),textinfo='label+percent')],
+                                dict(height=400,showlegend=True,paper_bgcolor='rgba(0,0,0,0)',
+                                    font=dict(family="Epilogue",color="#2c3e50"),
+                                    legend=dict(orientation="v",yanchor="middle",y=0.5,xanchor="left",x=1.02),
+                                    margin=dict(l=20,r=120,t=20,b=20)))
+                            st.plotly_chart(fig_loc, use_container_width=True)
+                    with col2:
+                        st.markdown("#### 📣 How Did They Hear About Us?")
+                        if heard_data:
+                            heard_labels = list(heard_data.keys()); heard_values = list(heard_data.values())
+                            fig_heard = lnc_figure(
+                                [dict(type='bar', x=heard_labels,y=heard_values,
+                                    marker_color=['#006341','#00843d','#93c13f','#b8d96d','#d4e89e'][:len(heard_labels)],
+                                    text=heard_values,textposition='outside',textfont=dict(size=15,family='Epilogue'))],
+                                dict(height=380,yaxis_title='Number of Participants',
+                                    yaxis=dict(range=[0,max(heard_values)*1.35]),
+                                    font=dict(family="Epilogue",color="#2c3e50"),
+                                    plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
+                                    showlegend=False,margin=dict(l=20,r=20,t=20,b=60)))
+                            st.plotly_chart(fig_heard, use_container_width=True)
+    dashboard_tabs()
 
     st.markdown(f"""<div class="info-box"><h3>📋 About This Session</h3>
         <p>This <strong>{selected_session}</strong> session is part of the <strong>{initiative_info['name']}</strong> initiative, 
@@ -3827,21 +4237,21 @@ if session_info.get('type') == 'health':
         <h2>{session_info['icon']} {selected_session}</h2>
         <p class="tagline">{initiative_info['name']} • Australia Chapter</p>
         <div style='display:flex;justify-content:center;gap:3rem;margin:2rem 0;flex-wrap:wrap;position:relative;z-index:1;'>
-            <div><div style='font-size:2.5rem;font-weight:700'>{metrics['total_participants_pre']}</div><div style='opacity:0.8'>Participants</div></div>
-            <div><div style='font-size:2.5rem;font-weight:700'>{metrics['total_responses']}</div><div style='opacity:0.8'>Matched Surveys</div></div>
+            <div><div style='font-size:2.5rem;font-weight:700'>{s.total_participants_pre}</div><div style='opacity:0.8'>Participants</div></div>
+            <div><div style='font-size:2.5rem;font-weight:700'>{s.total_responses}</div><div style='opacity:0.8'>Matched Surveys</div></div>
             <div><div style='font-size:2.5rem;font-weight:700'>{improved_pct:.0f}%</div><div style='opacity:0.8'>Showed Growth</div></div>
             <div><div style='font-size:2.5rem;font-weight:700'>{avg_post:.2f}/5</div><div style='opacity:0.8'>Avg Post-Score</div></div>
         </div>
         <p style='font-size:1.1rem;margin-top:2rem;opacity:0.9;position:relative;z-index:1'><strong>Grow • Connect • Impact</strong></p>
         <p style='font-size:0.9rem;opacity:0.7;margin-top:1rem;position:relative;z-index:1'>{datetime.now().strftime('%B %d, %Y')} | Vision 2030</p>
     </div>""", unsafe_allow_html=True)
-    st.stop()
 
 # ============================================================================
 # AWARENESS DASHBOARD
 # ============================================================================
 
-if session_info.get('type') == 'awareness':
+def render_awareness(selected_session, initiative_info, session_info, data):
+    """Awareness study dashboard."""
     metrics = data['metrics']
     viz_data = data['visualization_data']
     
@@ -3879,41 +4289,43 @@ if session_info.get('type') == 'awareness':
         pre_dist = metrics['awareness_distribution']['pre']
         labels_pre = list(pre_dist.keys()); values_pre = list(pre_dist.values())
         colors_pre = [colors_map.get(l,'#666') for l in labels_pre]
-        fig_pre = go.Figure(data=[go.Pie(labels=labels_pre,values=values_pre,marker_colors=colors_pre,
-            textfont=dict(size=14,family='Epilogue'),hole=0.4)])
-        fig_pre.update_layout(height=400,showlegend=True,
-            annotations=[dict(text=f"<b>{metrics['awareness_summary']['aware_pre_pct']:.1f}%</b><br>Aware",
-                x=0.5,y=0.5,font=dict(size=20,family='Cormorant Garamond'),showarrow=False)],
-            paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation="h",yanchor="bottom",y=-0.15,xanchor="center",x=0.5))
+        fig_pre = lnc_figure(
+            [dict(type='pie', labels=labels_pre,values=values_pre,marker_colors=colors_pre,
+                textfont=dict(size=14,family='Epilogue'),hole=0.4)],
+            dict(height=400,showlegend=True,
+                annotations=[dict(text=f"<b>{metrics['awareness_summary']['aware_pre_pct']:.1f}%</b><br>Aware",
+                    x=0.5,y=0.5,font=dict(size=20,family='Cormorant Garamond'),showarrow=False)],
+                paper_bgcolor='rgba(0,0,0,0)',
+                legend=dict(orientation="h",yanchor="bottom",y=-0.15,xanchor="center",x=0.5)))
         st.plotly_chart(fig_pre, use_container_width=True)
     with col2:
         st.markdown("### After Session")
         post_dist = metrics['awareness_distribution']['post']
         labels_post = list(post_dist.keys()); values_post = list(post_dist.values())
         colors_post = [colors_map.get(l,'#666') for l in labels_post]
-        fig_post = go.Figure(data=[go.Pie(labels=labels_post,values=values_post,marker_colors=colors_post,
-            textfont=dict(size=14,family='Epilogue'),hole=0.4)])
-        fig_post.update_layout(height=400,showlegend=True,
-            annotations=[dict(text=f"<b>{metrics['awareness_summary']['aware_post_pct']:.0f}%</b><br>Aware",
-                x=0.5,y=0.5,font=dict(size=20,family='Cormorant Garamond'),showarrow=False)],
-            paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation="h",yanchor="bottom",y=-0.15,xanchor="center",x=0.5))
+        fig_post = lnc_figure(
+            [dict(type='pie', labels=labels_post,values=values_post,marker_colors=colors_post,
+                textfont=dict(size=14,family='Epilogue'),hole=0.4)],
+            dict(height=400,showlegend=True,
+                annotations=[dict(text=f"<b>{metrics['awareness_summary']['aware_post_pct']:.0f}%</b><br>Aware",
+                    x=0.5,y=0.5,font=dict(size=20,family='Cormorant Garamond'),showarrow=False)],
+                paper_bgcolor='rgba(0,0,0,0)',
+                legend=dict(orientation="h",yanchor="bottom",y=-0.15,xanchor="center",x=0.5)))
         st.plotly_chart(fig_post, use_container_width=True)
 
     st.markdown('<p class="section-title">🔄 Before vs After Comparison</p>', unsafe_allow_html=True)
     levels = viz_data['awareness_comparison']['levels']
     pre_scores_aw = viz_data['awareness_comparison']['pre']
     post_scores_aw = viz_data['awareness_comparison']['post']
-    fig_compare = go.Figure()
-    fig_compare.add_trace(go.Bar(name='Before Session',x=levels,y=pre_scores_aw,
-        marker_color='#e9ecef',text=[f"{s:.1f}%" for s in pre_scores_aw],textposition='outside'))
-    fig_compare.add_trace(go.Bar(name='After Session',x=levels,y=post_scores_aw,
-        marker_color='#006341',text=[f"{s:.1f}%" for s in post_scores_aw],textposition='outside'))
-    fig_compare.update_layout(barmode='group',yaxis_title='Percentage of Participants',yaxis=dict(range=[0,80]),
-        height=450,font=dict(family="Epilogue",color="#2c3e50"),
-        plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
-        legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5))
+    fig_compare = lnc_figure(
+        [dict(type='bar', name='Before Session',x=levels,y=pre_scores_aw,
+            marker_color='#e9ecef',text=[f"{s:.1f}%" for s in pre_scores_aw],textposition='outside'),
+         dict(type='bar', name='After Session',x=levels,y=post_scores_aw,
+            marker_color='#006341',text=[f"{s:.1f}%" for s in post_scores_aw],textposition='outside')],
+        dict(barmode='group',yaxis_title='Percentage of Participants',yaxis=dict(range=[0,80]),
+            height=450,font=dict(family="Epilogue",color="#2c3e50"),
+            plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
+            legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5)))
     st.plotly_chart(fig_compare, use_container_width=True)
 
     st.markdown("""<div class="info-box"><h3>📋 About This Study</h3>
@@ -3930,13 +4342,13 @@ if session_info.get('type') == 'awareness':
         <p style='font-size:1.1rem;margin-top:2rem;opacity:0.9;position:relative;z-index:1'><strong>Grow • Connect • Impact</strong></p>
         <p style='font-size:0.9rem;opacity:0.7;margin-top:1rem;position:relative;z-index:1'>{datetime.now().strftime('%B %d, %Y')} | Misk Tracks</p>
     </div>""",unsafe_allow_html=True)
-    st.stop()
 
 # ============================================================================
 # COMPREHENSIVE DASHBOARD (10x Leaders)
 # ============================================================================
 
-if session_info.get('type') == 'comprehensive':
+def render_comprehensive(selected_session, initiative_info, session_info, data):
+    """10x Leaders comprehensive dashboard."""
     metrics = data['metrics']
     response_summary   = metrics.get('response_summary', {})
     awareness_analysis = metrics.get('awareness_analysis', {})
@@ -4014,15 +4426,15 @@ if session_info.get('type') == 'comprehensive':
     categories = ['Overall (All Respondents)', 'Paired (Matched Participants)']
     pre_values  = [awareness_analysis.get('overall_pre_pct',0), awareness_analysis.get('paired_pre_pct',0)]
     post_values = [awareness_analysis.get('overall_post_pct',0), awareness_analysis.get('paired_post_pct',0)]
-    fig_awareness = go.Figure()
-    fig_awareness.add_trace(go.Bar(name='Before Session',x=categories,y=pre_values,marker_color='#e9ecef',
-        text=[f"{v:.1f}%" for v in pre_values],textposition='outside',textfont=dict(size=14)))
-    fig_awareness.add_trace(go.Bar(name='After Session',x=categories,y=post_values,marker_color='#006341',
-        text=[f"{v:.1f}%" for v in post_values],textposition='outside',textfont=dict(size=14)))
-    fig_awareness.update_layout(barmode='group',yaxis_title='Awareness Percentage',yaxis=dict(range=[0,100]),
-        height=450,font=dict(family="Epilogue",color="#2c3e50"),
-        plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
-        legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5))
+    fig_awareness = lnc_figure(
+        [dict(type='bar', name='Before Session',x=categories,y=pre_values,marker_color='#e9ecef',
+            text=[f"{v:.1f}%" for v in pre_values],textposition='outside',textfont=dict(size=14)),
+         dict(type='bar', name='After Session',x=categories,y=post_values,marker_color='#006341',
+            text=[f"{v:.1f}%" for v in post_values],textposition='outside',textfont=dict(size=14))],
+        dict(barmode='group',yaxis_title='Awareness Percentage',yaxis=dict(range=[0,100]),
+            height=450,font=dict(family="Epilogue",color="#2c3e50"),
+            plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
+            legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5)))
     st.plotly_chart(fig_awareness, use_container_width=True)
 
     st.markdown(f"""<div class='sls-footer'>
@@ -4035,185 +4447,282 @@ if session_info.get('type') == 'comprehensive':
         <p style='font-size:1.1rem;margin-top:2rem;opacity:0.9;position:relative;z-index:1'><strong>Grow • Connect • Impact</strong></p>
         <p style='font-size:0.9rem;opacity:0.7;margin-top:1rem;position:relative;z-index:1'>{datetime.now().strftime('%B %d, %Y')} | 10x Leaders</p>
     </div>""",unsafe_allow_html=True)
-    st.stop()
 
 # ============================================================================
 # STANDARD SESSION DASHBOARD (Cybersecurity, Finance)
 # ============================================================================
 
-metrics = data['metrics']
-viz_data = data.get('visualization_data', {})
-chapter_metrics = metrics.get('chapter_metrics', {})
-REGISTERED       = chapter_metrics.get('total_registered', 0)
-TARGET           = chapter_metrics.get('target_attendance', 50)
-ACTUAL_ATTENDEES = chapter_metrics.get('actual_attendees', 0)
-
-st.markdown('<p class="section-title">📊 Key Performance Indicators</p>', unsafe_allow_html=True)
-st.markdown('<p class="subsection-title">Reach & Participation</p>', unsafe_allow_html=True)
-col1, col2, col3 = st.columns(3)
-with col1:
-    attendance_rate = (ACTUAL_ATTENDEES/REGISTERED*100) if REGISTERED>0 else 0
-    st.markdown(create_kpi_card("REACH","Total Participants",f"{ACTUAL_ATTENDEES}",
-        f"Out of {REGISTERED} registered",f"✓ {attendance_rate:.0f}% attendance rate"),unsafe_allow_html=True)
-with col2:
-    survey_completion = (metrics['total_responses']/ACTUAL_ATTENDEES*100) if ACTUAL_ATTENDEES>0 else 0
-    st.markdown(create_kpi_card("ENGAGEMENT","Completed Both Surveys",f"{metrics['total_responses']}",
-        f"Out of {ACTUAL_ATTENDEES} participants",
-        "✓ High engagement" if survey_completion>=50 else "→ Can improve"),unsafe_allow_html=True)
-with col3:
-    target_performance = (ACTUAL_ATTENDEES/TARGET*100) if TARGET>0 else 0
-    st.markdown(create_kpi_card("TARGET","Goal Achievement",f"{target_performance:.0f}%",
-        f"Target was {TARGET} participants",
-        f"✓ Exceeded target" if ACTUAL_ATTENDEES>TARGET else "→ Approaching target"),unsafe_allow_html=True)
-
-st.markdown('<p class="subsection-title">Learning Effectiveness</p>', unsafe_allow_html=True)
-col1, col2, col3 = st.columns(3)
-with col1:
-    avg_growth = metrics.get('grow_avg_knowledge_increase',0)
-    st.markdown(create_kpi_card("KNOWLEDGE","Average Growth",f"+{avg_growth:.2f}",
-        "Points improvement (1-5 scale)",
-        f"✓ Strong growth" if avg_growth>=1.0 else "→ Moderate growth"),unsafe_allow_html=True)
-with col2:
-    improved_pct = metrics.get('grow_members_reporting_growth_pct',0)
-    st.markdown(create_kpi_card("LEARNING","Participants Improved",f"{improved_pct:.0f}%",
-        "Showed knowledge gain","✓ Excellent reach" if improved_pct>=70 else "→ Good reach"),unsafe_allow_html=True)
-with col3:
-    significant_pct = metrics.get('grow_significant_growth_pct',0)
-    st.markdown(create_kpi_card("IMPACT","Significant Growth",f"{significant_pct:.0f}%",
-        "Gained ≥0.5 points","✓ Deep learning" if significant_pct>=50 else "→ Solid progress"),unsafe_allow_html=True)
-
-st.markdown('<p class="subsection-title">Action & Satisfaction</p>', unsafe_allow_html=True)
-col1, col2, col3 = st.columns(3)
-with col1:
-    action_pct   = metrics.get('connect_members_planning_action_pct',0)
-    action_count = metrics.get('connect_total_planning_action',0)
-    st.markdown(create_kpi_card("COMMITMENT","Plan to Take Action",f"{action_pct:.0f}%",
-        f"{action_count} participants committed",
-        f"✓ Outstanding" if action_pct>=80 else "✓ Strong" if action_pct>=60 else "→ Growing"),unsafe_allow_html=True)
-with col2:
-    satisfaction = metrics.get('impact_avg_satisfaction',0)
-    st.markdown(create_kpi_card("QUALITY","Satisfaction Score",f"{satisfaction:.2f}/5.0",
-        "Average participant rating",
-        f"✓ Excellent" if satisfaction>=4.5 else "✓ Very good" if satisfaction>=4.0 else "→ Good"),unsafe_allow_html=True)
-with col3:
-    satisfied_pct = metrics.get('impact_satisfaction_pct',0)
-    st.markdown(create_kpi_card("SATISFACTION","Highly Satisfied",f"{satisfied_pct:.0f}%",
-        "Rated 4+ stars","✓ Strong approval" if satisfied_pct>=70 else "→ Positive reception"),unsafe_allow_html=True)
-
-achievements = []
-if action_pct>=80:   achievements.append(f"{action_pct:.0f}% of participants committed to taking action")
-if satisfaction>=4.0: achievements.append(f"Achieved {satisfaction:.1f}/5.0 satisfaction rating")
-if ACTUAL_ATTENDEES>TARGET: achievements.append(f"Exceeded attendance target by {((ACTUAL_ATTENDEES-TARGET)/TARGET*100):.0f}%")
-if avg_growth>=1.0:  achievements.append(f"Strong knowledge improvement of +{avg_growth:.2f} points")
-if achievements:
-    st.markdown(f"""<div class="highlight-box"><h3>✨ Session Highlights</h3>
-        <ul>{''.join([f'<li>{a}</li>' for a in achievements])}</ul></div>""",unsafe_allow_html=True)
+def render_standard(selected_session, initiative_info, session_info, data):
+    """Standard session dashboard (Cybersecurity, Finance); `data` is a SessionRecord."""
+    s = segment_filter(selected_session, session_info, data)
+    REGISTERED       = s.chapter.total_registered
+    TARGET           = s.chapter.target_attendance
+    ACTUAL_ATTENDEES = s.chapter.actual_attendees
 
-st.markdown('<p class="section-title">🎓 Participant Journey</p>', unsafe_allow_html=True)
-col1, col2 = st.columns([2,1])
-with col1:
-    funnel_fig = go.Figure()
-    funnel_fig.add_trace(go.Funnel(
-        y=['Registered','Attended','Completed Both Surveys','Plan to Act'],
-        x=[REGISTERED,ACTUAL_ATTENDEES,metrics['total_responses'],metrics.get('connect_total_planning_action',0)],
-        textposition="inside",textinfo="value+percent initial",
-        marker={"color":['#006341','#00843d','#93c13f','#b8d96d'],"line":{"width":2,"color":"white"}}
-    ))
-    funnel_fig.update_layout(height=400,font=dict(family="Epilogue",size=14,color="#2c3e50"),
-        plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',margin=dict(l=20,r=20,t=20,b=20))
-    st.plotly_chart(funnel_fig, use_container_width=True)
-with col2:
-    st.markdown("### Conversion Metrics")
-    reg_to_attend     = (ACTUAL_ATTENDEES/REGISTERED*100) if REGISTERED>0 else 0
-    attend_to_survey  = (metrics['total_responses']/ACTUAL_ATTENDEES*100) if ACTUAL_ATTENDEES>0 else 0
-    survey_to_action  = (metrics.get('connect_total_planning_action',0)/metrics['total_responses']*100) if metrics['total_responses']>0 else 0
-    st.metric("Registered → Attended",f"{reg_to_attend:.0f}%")
-    st.metric("Attended → Surveyed",f"{attend_to_survey:.0f}%")
-    st.metric("Surveyed → Committed",f"{survey_to_action:.0f}%")
-    st.markdown("---")
-    overall = (metrics.get('connect_total_planning_action',0)/REGISTERED*100) if REGISTERED>0 else 0
-    st.info(f"**Overall:** {overall:.0f}% of registrants became committed participants")
-
-st.markdown("---")
-st.markdown('<p class="section-title">📚 Detailed Analysis</p>', unsafe_allow_html=True)
-tab1, tab2, tab3 = st.tabs(["🌱 Knowledge Development","🤝 Commitment","💡 Satisfaction"])
+    st.markdown('<p class="section-title">📊 Key Performance Indicators</p>', unsafe_allow_html=True)
+    st.markdown('<p class="subsection-title">Reach & Participation</p>', unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        attendance_rate = (ACTUAL_ATTENDEES/REGISTERED*100) if REGISTERED>0 else 0
+        st.markdown(create_kpi_card("REACH","Total Participants",f"{ACTUAL_ATTENDEES}",
+            f"Out of {REGISTERED} registered",f"✓ {attendance_rate:.0f}% attendance rate"),unsafe_allow_html=True)
+    with col2:
+        survey_completion = (s.total_responses/ACTUAL_ATTENDEES*100) if ACTUAL_ATTENDEES>0 else 0
+        st.markdown(create_kpi_card("ENGAGEMENT","Completed Both Surveys",f"{s.total_responses}",
+            f"Out of {ACTUAL_ATTENDEES} participants",
+            "✓ High engagement" if survey_completion>=50 else "→ Can improve"),unsafe_allow_html=True)
+    with col3:
+        target_performance = (ACTUAL_ATTENDEES/TARGET*100) if TARGET>0 else 0
+        st.markdown(create_kpi_card("TARGET","Goal Achievement",f"{target_performance:.0f}%",
+            f"Target was {TARGET} participants",
+            f"✓ Exceeded target" if ACTUAL_ATTENDEES>TARGET else "→ Approaching target"),unsafe_allow_html=True)
 
-with tab1:
-    st.markdown("### Learning Progress")
-    col1, col2 = st.columns([3,2])
+    st.markdown('<p class="subsection-title">Learning Effectiveness</p>', unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
     with col1:
-        topics = session_info['topic_labels']
-        pre_scores  = viz_data['knowledge_comparison']['pre_scores']
-        post_scores = viz_data['knowledge_comparison']['post_scores']
-        improvements = viz_data['knowledge_comparison']['improvements']
-        knowledge_fig = go.Figure()
-        knowledge_fig.add_trace(go.Bar(name='Before Session',x=topics,y=pre_scores,
-            marker_color='#e9ecef',text=[f"{s:.2f}" for s in pre_scores],textposition='outside'))
-        knowledge_fig.add_trace(go.Bar(name='After Session',x=topics,y=post_scores,
-            marker_color='#006341',text=[f"{s:.2f}" for s in post_scores],textposition='outside'))
-        knowledge_fig.update_layout(barmode='group',yaxis_title='Knowledge Level (1-5)',
-            yaxis=dict(range=[0,6]),height=400,font=dict(family="Epilogue",color="#2c3e50"),
-            plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5))
-        st.plotly_chart(knowledge_fig, use_container_width=True)
+        avg_growth = s.grow_avg_knowledge_increase
+        st.markdown(create_kpi_card("KNOWLEDGE","Average Growth",f"+{avg_growth:.2f}",
+            "Points improvement (1-5 scale)",
+            f"✓ Strong growth" if avg_growth>=1.0 else "→ Moderate growth"),unsafe_allow_html=True)
     with col2:
-        st.markdown("### Key Metrics")
-        st.metric("Average Growth",f"+{metrics.get('grow_avg_knowledge_increase',0):.2f} pts")
-        st.metric("Participants Improved",f"{metrics.get('grow_members_reporting_growth_pct',0):.0f}%")
-        st.metric("Significant Growth",f"{metrics.get('grow_significant_growth_pct',0):.0f}%")
+        improved_pct = s.grow_members_reporting_growth_pct
+        st.markdown(create_kpi_card("LEARNING","Participants Improved",f"{improved_pct:.0f}%",
+            "Showed knowledge gain","✓ Excellent reach" if improved_pct>=70 else "→ Good reach"),unsafe_allow_html=True)
+    with col3:
+        significant_pct = s.grow_significant_growth_pct
+        st.markdown(create_kpi_card("IMPACT","Significant Growth",f"{significant_pct:.0f}%",
+            "Gained ≥0.5 points","✓ Deep learning" if significant_pct>=50 else "→ Solid progress"),unsafe_allow_html=True)
 
-with tab2:
-    st.markdown("### Action Commitment")
-    col1, col2 = st.columns(2)
+    st.markdown('<p class="subsection-title">Action & Satisfaction</p>', unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
     with col1:
-        action_data = viz_data.get('action_plan_data',{})
-        labels = list(action_data.keys()); values = list(action_data.values())
-        committed_count = metrics.get('connect_total_planning_action',0)
-        action_fig = go.Figure(data=[go.Pie(labels=labels,values=values,hole=0.6,
-            marker_colors=['#006341','#e9ecef'],textfont=dict(size=16,family='Epilogue'))])
-        action_fig.update_layout(height=350,showlegend=True,
-            annotations=[dict(text=f"<b>{committed_count}</b><br>Committed",
-                x=0.5,y=0.5,font=dict(size=20,family='Cormorant Garamond'),showarrow=False)],
-            paper_bgcolor='rgba(0,0,0,0)',
-            legend=dict(orientation="h",yanchor="bottom",y=-0.1,xanchor="center",x=0.5))
-        st.plotly_chart(action_fig, use_container_width=True)
+        action_pct   = s.connect_members_planning_action_pct
+        action_count = s.connect_total_planning_action
+        st.markdown(create_kpi_card("COMMITMENT","Plan to Take Action",f"{action_pct:.0f}%",
+            f"{action_count} participants committed",
+            f"✓ Outstanding" if action_pct>=80 else "✓ Strong" if action_pct>=60 else "→ Growing"),unsafe_allow_html=True)
     with col2:
-        st.markdown("### Summary")
-        st.metric("Commitment Rate",f"{metrics.get('connect_members_planning_action_pct',0):.1f}%")
-        st.metric("Total Committed",metrics.get('connect_total_planning_action',0))
-        st.metric("Would Recommend",f"{metrics.get('impact_likely_recommend_pct',0):.1f}%")
-
-with tab3:
-    st.markdown("### Participant Feedback")
-    col1, col2 = st.columns([3,2])
+        satisfaction = s.impact_avg_satisfaction
+        st.markdown(create_kpi_card("QUALITY","Satisfaction Score",f"{satisfaction:.2f}/5.0",
+            "Average participant rating",
+            f"✓ Excellent" if satisfaction>=4.5 else "✓ Very good" if satisfaction>=4.0 else "→ Good"),unsafe_allow_html=True)
+    with col3:
+        satisfied_pct = s.impact_satisfaction_pct
+        st.markdown(create_kpi_card("SATISFACTION","Highly Satisfied",f"{satisfied_pct:.0f}%",
+            "Rated 4+ stars","✓ Strong approval" if satisfied_pct>=70 else "→ Positive reception"),unsafe_allow_html=True)
+
+    achievements = []
+    if action_pct>=80:   achievements.append(f"{action_pct:.0f}% of participants committed to taking action")
+    if satisfaction>=4.0: achievements.append(f"Achieved {satisfaction:.1f}/5.0 satisfaction rating")
+    if ACTUAL_ATTENDEES>TARGET: achievements.append(f"Exceeded attendance target by {((ACTUAL_ATTENDEES-TARGET)/TARGET*100):.0f}%")
+    if avg_growth>=1.0:  achievements.append(f"Strong knowledge improvement of +{avg_growth:.2f} points")
+    if achievements:
+        st.markdown(f"""<div class="highlight-box"><h3>✨ Session Highlights</h3>
+        <ul>{''.join([f'<li>{a}</li>' for a in achievements])}</ul></div>""",unsafe_allow_html=True)
+
+    st.markdown('<p class="section-title">🎓 Participant Journey</p>', unsafe_allow_html=True)
+    col1, col2 = st.columns([2,1])
     with col1:
-        satisfaction_data = viz_data.get('satisfaction_data',{})
-        if satisfaction_data:
-            satisfaction_order = ['Very dissatisfied','Dissatisfied','Neutral','Satisfied','Very satisfied']
-            sorted_items = sorted(satisfaction_data.items(),
-                key=lambda x: satisfaction_order.index(x[0]) if x[0] in satisfaction_order else 2)
-            labels = [item[0] for item in sorted_items]; values = [item[1] for item in sorted_items]
-            colors = ['#e74c3c','#e67e22','#f39c12','#93c13f','#006341'][:len(labels)]
-            sat_fig = go.Figure(data=[go.Bar(y=labels,x=values,orientation='h',marker_color=colors,
-                text=values,textposition='outside',textfont=dict(size=14))])
-            sat_fig.update_layout(xaxis_title='Number of Participants',height=350,
-                font=dict(family="Epilogue",color="#2c3e50"),
-                plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',showlegend=False)
-            st.plotly_chart(sat_fig, use_container_width=True)
+        funnel_fig = lnc_figure(
+            [dict(type='funnel', y=['Registered','Attended','Completed Both Surveys','Plan to Act'],
+                x=[REGISTERED,ACTUAL_ATTENDEES,s.total_responses,s.connect_total_planning_action],
+                textposition="inside",textinfo="value+percent initial",
+                marker={"color":['#006341','#00843d','#93c13f','#b8d96d'],"line":{"width":2,"color":"white"}})],
+            dict(height=400,font=dict(family="Epilogue",size=14,color="#2c3e50"),
+                plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',margin=dict(l=20,r=20,t=20,b=20)))
+        st.plotly_chart(funnel_fig, use_container_width=True)
     with col2:
-        st.markdown("### Metrics")
-        st.metric("Average Rating",f"{metrics.get('impact_avg_satisfaction',0):.2f}/5.0")
-        st.metric("Highly Satisfied",f"{metrics.get('impact_satisfaction_pct',0):.0f}%")
-        st.metric("Likely to Recommend",f"{metrics.get('impact_likely_recommend_pct',0):.1f}%")
+        st.markdown("### Conversion Metrics")
+        reg_to_attend     = (ACTUAL_ATTENDEES/REGISTERED*100) if REGISTERED>0 else 0
+        attend_to_survey  = (s.total_responses/ACTUAL_ATTENDEES*100) if ACTUAL_ATTENDEES>0 else 0
+        survey_to_action  = (s.connect_total_planning_action/s.total_responses*100) if s.total_responses>0 else 0
+        st.metric("Registered → Attended",f"{reg_to_attend:.0f}%")
+        st.metric("Attended → Surveyed",f"{attend_to_survey:.0f}%")
+        st.metric("Surveyed → Committed",f"{survey_to_action:.0f}%")
+        st.markdown("---")
+        overall = (s.connect_total_planning_action/REGISTERED*100) if REGISTERED>0 else 0
+        st.info(f"**Overall:** {overall:.0f}% of registrants became committed participants")
 
-st.markdown(f"""<div class='sls-footer'>
+    st.markdown("---")
+    st.markdown('<p class="section-title">📚 Detailed Analysis</p>', unsafe_allow_html=True)
+    @st.fragment
+    def dashboard_tabs():
+        tab1, tab2, tab3 = session_tabs(selected_session, ["🌱 Knowledge Development","🤝 Commitment","💡 Satisfaction"])
+
+        with tab1:
+            if tab_open(tab1):
+                st.markdown("### Learning Progress")
+                col1, col2 = st.columns([3,2])
+                with col1:
+                    topics = s.topic_labels
+                    pre_scores  = s.pre_scores
+                    post_scores = s.post_scores
+                    knowledge_fig = lnc_figure(
+                        [dict(type='bar', name='Before Session',x=topics,y=pre_scores,
+                            marker_color='#e9ecef',text=[f"{s:.2f}" for s in pre_scores],textposition='outside'),
+                         dict(type='bar', name='After Session',x=topics,y=post_scores,
+                            marker_color='#006341',text=[f"{v:.2f}" for v in post_scores],textposition='outside',
+                            **gain_ci(s))],
+                        dict(barmode='group',yaxis_title='Knowledge Level (1-5)',
+                            yaxis=dict(range=[0,6]),height=400,font=dict(family="Epilogue",color="#2c3e50"),
+                            plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation="h",yanchor="bottom",y=1.02,xanchor="center",x=0.5)))
+                    st.plotly_chart(knowledge_fig, use_container_width=True)
+                    note = gain_ci_note(s)
+                    if note:
+                        st.caption(note)
+                with col2:
+                    st.markdown("### Key Metrics")
+                    st.metric("Average Growth",f"+{s.grow_avg_knowledge_increase:.2f} pts")
+                    st.metric("Participants Improved",f"{s.grow_members_reporting_growth_pct:.0f}%")
+                    st.metric("Significant Growth",f"{s.grow_significant_growth_pct:.0f}%")
+
+        with tab2:
+            if tab_open(tab2):
+                st.markdown("### Action Commitment")
+                col1, col2 = st.columns(2)
+                with col1:
+                    action_data = s.action_plan
+                    labels = list(action_data.keys()); values = list(action_data.values())
+                    committed_count = s.connect_total_planning_action
+                    action_fig = lnc_figure(
+                        [dict(type='pie', labels=labels,values=values,hole=0.6,
+                            marker_colors=['#006341','#e9ecef'],textfont=dict(size=16,family='Epilogue'))],
+                        dict(height=350,showlegend=True,
+                            annotations=[dict(text=f"<b>{committed_count}</b><br>Committed",
+                                x=0.5,y=0.5,font=dict(size=20,family='Cormorant Garamond'),showarrow=False)],
+                            paper_bgcolor='rgba(0,0,0,0)',
+                            legend=dict(orientation="h",yanchor="bottom",y=-0.1,xanchor="center",x=0.5)))
+                    st.plotly_chart(action_fig, use_container_width=True)
+                with col2:
+                    st.markdown("### Summary")
+                    st.metric("Commitment Rate",f"{s.connect_members_planning_action_pct:.1f}%")
+                    st.metric("Total Committed",s.connect_total_planning_action)
+                    st.metric("Would Recommend",f"{s.impact_likely_recommend_pct:.1f}%")
+
+        with tab3:
+            if tab_open(tab3):
+                st.markdown("### Participant Feedback")
+                col1, col2 = st.columns([3,2])
+                with col1:
+                    satisfaction_data = s.satisfaction
+                    if satisfaction_data:
+                        satisfaction_order = ['Very dissatisfied','Dissatisfied','Neutral','Satisfied','Very satisfied']
+                        sorted_items = sorted(satisfaction_data.items(),
+                            key=lambda x: satisfaction_order.index(x[0]) if x[0] in satisfaction_order else 2)
+                        labels = [item[0] for item in sorted_items]; values = [item[1] for item in sorted_items]
+                        colors = ['#e74c3c','#e67e22','#f39c12','#93c13f','#006341'][:len(labels)]
+                        sat_fig = lnc_figure(
+                            [dict(type='bar', y=labels,x=values,orientation='h',marker_color=colors,
+                                text=values,textposition='outside',textfont=dict(size=14))],
+                            dict(xaxis_title='Number of Participants',height=350,
+                                font=dict(family="Epilogue",color="#2c3e50"),
+                                plot_bgcolor='rgba(0,0,0,0)',paper_bgcolor='rgba(0,0,0,0)',showlegend=False))
+                        st.plotly_chart(sat_fig, use_container_width=True)
+                with col2:
+                    st.markdown("### Metrics")
+                    st.metric("Average Rating",f"{s.impact_avg_satisfaction:.2f}/5.0")
+                    st.metric("Highly Satisfied",f"{s.impact_satisfaction_pct:.0f}%")
+                    st.metric("Likely to Recommend",f"{s.impact_likely_recommend_pct:.1f}%")
+    dashboard_tabs()
+
+    st.markdown(f"""<div class='sls-footer'>
     <h2>Saudi Leadership Society</h2>
     <p class="tagline">Towards the Vision • Australia Chapter</p>
     <div style='display:flex;justify-content:center;gap:3rem;margin:2rem 0;flex-wrap:wrap;position:relative;z-index:1;'>
         <div><div style='font-size:2.5rem;font-weight:700'>{ACTUAL_ATTENDEES}</div><div style='opacity:0.8'>Participants</div></div>
-        <div><div style='font-size:2.5rem;font-weight:700'>+{metrics.get('grow_avg_knowledge_increase',0):.2f}</div><div style='opacity:0.8'>Avg Growth</div></div>
-        <div><div style='font-size:2.5rem;font-weight:700'>{metrics.get('connect_total_planning_action',0)}</div><div style='opacity:0.8'>Taking Action</div></div>
+        <div><div style='font-size:2.5rem;font-weight:700'>+{s.grow_avg_knowledge_increase:.2f}</div><div style='opacity:0.8'>Avg Growth</div></div>
+        <div><div style='font-size:2.5rem;font-weight:700'>{s.connect_total_planning_action}</div><div style='opacity:0.8'>Taking Action</div></div>
     </div>
     <p style='font-size:1.1rem;margin-top:2rem;opacity:0.9;position:relative;z-index:1'><strong>Grow • Connect • Impact</strong></p>
     <p style='font-size:0.9rem;opacity:0.7;margin-top:1rem;position:relative;z-index:1'>{datetime.now().strftime('%B %d, %Y')} | Vision 2030</p>
 </div>""",unsafe_allow_html=True)
+
+# ============================================================================
+# LOAD SELECTED SESSION
+# ============================================================================
+
+selected_initiative = st.session_state.selected_initiative
+selected_session    = st.session_state.selected_session
+initiative_info     = INITIATIVES[selected_initiative]
+session_info        = initiative_info['sessions'][selected_session]
+
+render_profile.mark("header")
+show_header_image()
+
+# ─── Header (LNC gets its own navy header) ───────────────────────────────────
+if session_info.get('type') == 'lnc':
+    st.markdown(f"""
+    <div class="lnc-header">
+        <h1 class="initiative-title">🔗 Leaders Network Circles</h1>
+        <p class="initiative-subtitle">Saudi Leadership Society — Australia Chapter</p>
+        <div style="text-align:center; margin-top:1.2rem; position:relative; z-index:1;">
+            <span class="circle-badge circle-growth">🌱 Growth</span>
+            <span class="circle-badge circle-connect">🤝 Connection</span>
+            <span class="circle-badge circle-impact">💥 Impact</span>
+        </div>
+        <div style="text-align:center; margin-top:1rem;">
+            <span class="mission-tagline">Health Sector — Session 1</span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+else:
+    st.markdown(f"""
+    <div class="sls-header">
+        <h1 class="initiative-title">{session_info["icon"]} {selected_session}</h1>
+        <p class="initiative-subtitle">{initiative_info['name']} • {session_info['vision_theme']}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+col1, col2 = st.columns([1, 5])
+with col1:
+    st.button("← Back", type="secondary", on_click=navigate, args=(selected_initiative,))
+
+# Standard and health dashboards get a SessionRecord; multi-session views
+# (cross-sector, combined) one JSON document per source; the rest their document.
+render_profile.mark("data loading")
+live = live_session(session_info.get('live'))
+try:
+    data = (parse_session(session_info, live_data(live)) if live is not None
+            else session_record(selected_initiative, selected_session))
+except SchemaError as e:
+    st.error(f"⚠️ The data for {selected_session} doesn't match the "
+             f"'{session_info.get('type', 'standard')}' dashboard's schema: {e}")
+    st.stop()
+if data is None:
+    st.error("Could not load data.")
+    st.stop()
+if live is not None:
+    live_status(live)
+
+# ============================================================================
+# RENDER SELECTED SESSION
+# ============================================================================
+
+RENDERERS = {
+    'lnc':                 render_lnc,
+    'lnc_tech':            render_lnc_tech,
+    'lnc_cross':           render_lnc_cross,
+    'lnc_combined':        render_lnc_combined,
+    'leaders_accelerator': render_leaders_accelerator,
+    'health':              render_health,
+    'awareness':           render_awareness,
+    'comprehensive':       render_comprehensive,
+}
+
+render = RENDERERS.get(session_info.get('type'), render_standard)
+if load_respondents(session_info.get('respondents')) is not None:
+    # Segment filters reshape every number below the header, so the whole
+    # dashboard body is their fragment; the header and data loading stay put.
+    render = st.fragment(render)
+render(selected_session, initiative_info, session_info, data)
+
+if PROFILING:
+    timings = render_profile.stop()
+    render_profile.write_log(timings, session=f"{selected_initiative}/{selected_session}",
+                             type=session_info.get('type', 'standard'))
+    with st.expander(f"⏱️ Render Timings — {timings['total_ms']:.0f} ms"):
+        st.markdown("**By section**")
+        st.dataframe(timings['sections'], use_container_width=True, hide_index=True)
+        st.markdown("**Charts, images & CSS**")
+        st.dataframe(timings['calls'], use_container_width=True, hide_index=True)
@@ -0,0 +1,242 @@
+"""Self-hosted fonts, the minified app stylesheet and resized header images.
+
+Streamlit serves the `static/` folder at `app/static/` when
+`server.enableStaticServing` is on (see .streamlit/config.toml). A build step
+writes the app's minified CSS there under a content hash, so each rerun sends
+a one-line <link> instead of the whole <style> block, and browsers cache the
+file. It also writes the header image as WebP and JPEG variants per viewport
+width, behind content-hashed (stable) URLs. The serving process only reads
+static/: until the build has run for the current CSS and image, the app
+inlines its <style> and sends the image through st.image.
+
+Fonts come from `static/fonts/` once bundled. Until then, and in the inline
+<style>, pages use the system fonts at the end of each font-family stack:
+nothing is fetched from outside the server, so offline kiosks render the same.
+
+    python assets.py fetch-fonts     # bundle the fonts (needs network), then commit static/fonts/
+    python assets.py build           # write the stylesheet and image variants (at deploy)
+"""
+import argparse
+import ast
+import glob
+import hashlib
+import os
+import re
+import sys
+import urllib.request
+from io import BytesIO
+
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_URL = "app/static"
+FONTS_DIR = os.path.join(STATIC_DIR, "fonts")
+FONTS_CSS = os.path.join(FONTS_DIR, "fonts.css")
+
+GOOGLE_FONTS_CSS = ("https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@300;400;500;600;700"
+                    "&family=Epilogue:wght@300;400;500;600;700;800;900&display=swap")
+# Google serves woff2 only to browsers it recognises.
+BROWSER_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+FONT_SUBSETS = ("latin", "latin-ext")
+
+IMG_DIR = os.path.join(STATIC_DIR, "img")
+IMAGE_WIDTHS = (640, 1024, 1600)  # phone, laptop, wide desktop
+WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+
+# ============================================================================
+# STYLESHEET
+# ============================================================================
+
+def minify_css(css):
+    """Strip comments and redundant whitespace, leaving quoted strings untouched."""
+    out = []
+    for i, part in enumerate(re.split(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''', css)):
+        if i % 2:  # quoted string
+            out.append(part)
+            continue
+        part = re.sub(r'/\*.*?\*/', '', part, flags=re.S)
+        part = re.sub(r'\s+', ' ', part)
+        part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+        part = re.sub(r':\s+', ':', part)
+        out.append(part.replace(';}', '}'))
+    return ''.join(out).strip()
+
+
+def font_faces():
+    """@font-face rules for the bundled fonts; none (system fonts) until
+    `fetch-fonts` has run."""
+    if not os.path.exists(FONTS_CSS):
+        return ""
+    with open(FONTS_CSS, encoding='utf-8') as f:
+        return f.read()
+
+
+def static_stylesheet(css):
+    """(file name, minified text) of the static stylesheet for `css`."""
+    text = minify_css(font_faces() + css)
+    return f"sls.{hashlib.blake2b(text.encode('utf-8'), digest_size=6).hexdigest()}.css", text
+
+
+def stylesheet_html(css, static_serving):
+    """The HTML to inject on every rerun: a <link> to the built stylesheet when
+    it is being served, else the minified CSS inline (whose relative font URLs
+    wouldn't resolve, so it uses the system fonts)."""
+    if static_serving:
+        name, _ = static_stylesheet(css)
+        if os.path.exists(os.path.join(STATIC_DIR, name)):
+            return f'<link rel="stylesheet" href="{STATIC_URL}/{name}">'
+    return f"<style>{minify_css(css)}</style>"
+
+
+def write_stylesheet(css):
+    """Build step: write static/sls.<hash>.css, removing older builds. Returns its path."""
+    name, text = static_stylesheet(css)
+    path = os.path.join(STATIC_DIR, name)
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    for old in glob.glob(os.path.join(STATIC_DIR, "sls.*.css")):
+        if old != path:
+            os.remove(old)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp, path)
+    return path
+
+
+# ============================================================================
+# IMAGES
+# ============================================================================
+
+def image_variants(src, widths=IMAGE_WIDTHS, write=False):
+    """WebP + JPEG copies of `src` at each width (never upscaled).
+
+    Returns {"width", "height", "webp": [(url, w), ...], "jpeg": [(url, w), ...]}.
+    File names carry a hash of the source bytes, so URLs only change with the image.
+    Missing files are written with `write=True` (the build step); otherwise they
+    raise FileNotFoundError.
+    """
+    from PIL import Image
+
+    with open(src, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.blake2b(raw, digest_size=6).hexdigest()
+    stem = os.path.splitext(os.path.basename(src))[0]
+    image = Image.open(BytesIO(raw))
+    source_format = image.format
+    image = image.convert('RGB')
+    if write:
+        os.makedirs(IMG_DIR, exist_ok=True)
+
+    variants = {"width": image.width, "height": image.height, "webp": [], "jpeg": []}
+    for w in sorted({min(w, image.width) for w in widths}):
+        resized = image if w == image.width else image.resize(
+            (w, round(image.height * w / image.width)), Image.LANCZOS)
+        for fmt, ext, options in (("WEBP", "webp", {"quality": WEBP_QUALITY, "method": 6}),
+                                  ("JPEG", "jpeg", {"quality": JPEG_QUALITY, "optimize": True, "progressive": True})):
+            name = f"{stem}.{w}.{digest}.{ext}"
+            path = os.path.join(IMG_DIR, name)
+            if not os.path.exists(path):
+                if not write:
+                    raise FileNotFoundError(f"{path}: run 'python assets.py build'")
+                if resized is image and fmt == source_format:
+                    data = raw  # already this format and size; re-encoding only loses quality
+                else:
+                    buf = BytesIO()
+                    resized.save(buf, fmt, **options)
+                    data = buf.getvalue()
+                with open(path + '.tmp', 'wb') as f:
+                    f.write(data)
+                os.replace(path + '.tmp', path)
+            variants[ext].append((f"{STATIC_URL}/img/{name}", w))
+    return variants
+
+
+def picture_html(src, alt=""):
+    """Responsive <picture> for `src`'s built variants: WebP where supported, JPEG otherwise, full width."""
+    v = image_variants(src)
+    srcset = lambda items: ", ".join(f"{url} {w}w" for url, w in items)
+    fallback = v["jpeg"][-1][0]
+    return (f'<picture><source type="image/webp" srcset="{srcset(v["webp"])}" sizes="100vw">'
+            f'<img src="{fallback}" srcset="{srcset(v["jpeg"])}" sizes="100vw" alt="{alt}" '
+            f'width="{v["width"]}" height="{v["height"]}" '
+            f'style="width:100%;height:auto;display:block;"></picture>')
+
+
+# ============================================================================
+# FONT BUNDLING
+# ============================================================================
+
+def fetch(url):
+    request = urllib.request.Request(url, headers={"User-Agent": BROWSER_UA})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def fetch_fonts():
+    """Download the woff2 files the app uses and write static/fonts/fonts.css."""
+    css = fetch(GOOGLE_FONTS_CSS).decode('utf-8')
+    os.makedirs(FONTS_DIR, exist_ok=True)
+    faces, files = [], {}
+    for subset, body in re.findall(r'/\*\s*([\w-]+)\s*\*/\s*@font-face\s*\{([^}]*)\}', css):
+        if subset not in FONT_SUBSETS:
+            continue
+        rule = dict(re.findall(r'([\w-]+)\s*:\s*([^;]+);', body))
+        family = rule['font-family'].strip("'\"")
+        url = re.search(r'url\(([^)]+)\)', rule['src']).group(1)
+        if url not in files:
+            files[url] = f"{re.sub(r'[^a-z0-9]+', '-', family.lower())}-{subset}-{len(files)}.woff2"
+            with open(os.path.join(FONTS_DIR, files[url]), 'wb') as f:
+                f.write(fetch(url))
+        faces.append(f"@font-face {{ font-family: '{family}'; font-style: {rule['font-style']}; "
+                     f"font-weight: {rule['font-weight']}; font-display: swap; "
+                     f"src: local('{family}'), url('fonts/{files[url]}') format('woff2'); "
+                     f"unicode-range: {rule['unicode-range']}; }}")
+    with open(FONTS_CSS, 'w', encoding='utf-8') as f:
+        f.write("\n".join(faces) + "\n")
+    return list(files.values())
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def app_constants(app, *names):
+    """Literal module-level constants from the app source, without running Streamlit."""
+    with open(app, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    found = {t.id: node.value for node in tree.body if isinstance(node, ast.Assign)
+             for t in node.targets if getattr(t, 'id', None) in names}
+    missing = [name for name in names if name not in found]
+    if missing:
+        raise ValueError(f"{app}: no {', '.join(missing)}")
+    return [ast.literal_eval(found[name]) for name in names]
+
+
+def build(app):
+    """Write the stylesheet and header image variants the app will link to."""
+    css, header = app_constants(app, 'APP_CSS', 'HEADER_IMAGE')
+    print(f"wrote {os.path.relpath(write_stylesheet(css))}"
+          f"{'' if os.path.exists(FONTS_CSS) else ' (system fonts: run fetch-fonts to bundle Epilogue and Cormorant Garamond)'}")
+    header = os.path.join(os.path.dirname(os.path.abspath(app)), header)
+    variants = image_variants(header, write=True)
+    print(f"wrote {len(variants['webp']) + len(variants['jpeg'])} variant(s) of {os.path.relpath(header)}")
+
+
+def main(argv=None):
+    from export_snapshots import APP
+
+    parser = argparse.ArgumentParser(description="Manage the app's self-hosted static assets.")
+    parser.add_argument('command', choices=['fetch-fonts', 'build'])
+    parser.add_argument('--app', default=APP)
+    args = parser.parse_args(argv)
+    if args.command == 'fetch-fonts':
+        files = fetch_fonts()
+        print(f"wrote {len(files)} font file(s) and {os.path.relpath(FONTS_CSS)}")
+    else:
+        build(args.app)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""Headless benchmark of app_new_3.py, one fresh process per session.
+
+Each session is driven the way a viewer gets there, by clicking through
+Streamlit's AppTest: the initiative list, the initiative's session list, then
+the session page, then each of its tabs in turn (tabs render lazily, so each
+is opened through its `tabs_<session>` key the way a viewer switches to it).
+It records:
+
+    cold_start_ms     first script run in a new process (imports, registry, CSS)
+    session_list_ms   initiative button -> session list
+    cold_session_ms   session button -> first render of that dashboard (first tab)
+    tabs              per tab: switch_ms (first open) and bytes / charts rendered
+    tab_switch_ms     sum of switch_ms over the tabs after the first
+    tabs_bytes        sum of bytes over the tabs' renders: what a viewer who opens
+                      every tab is sent
+    warm_ms_p50/max   reruns of the first tab with warm caches
+    bytes             serialized size of the rendered element protos per rerun
+                      (first tab)
+    elements, charts  rendered element count / Plotly charts
+    rerun_alloc_peak_kb  tracemalloc peak during one warm rerun
+    peak_rss_mb       process peak RSS after all of the above
+
+Results are written as a JSON baseline, keyed by session and summarised per
+session `type`. Compare a later run against it to catch regressions:
+
+    python benchmark.py                                # -> bench_baseline.json
+    python benchmark.py -o bench_new.json --compare bench_baseline.json
+    python benchmark.py "Leaders Network Circles/Combined Analysis" -n 10
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from export_snapshots import APP, load_registry
+
+
+RENDER_TIMEOUT = 120
+WARM_RUNS = 5
+# Relative increase that counts as a regression, per compared metric.
+TOLERANCE = 0.25
+COMPARED = ("cold_session_ms", "tab_switch_ms", "warm_ms_p50", "bytes", "tabs_bytes", "peak_rss_mb")
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def tree_bytes(node):
+    """Serialized size of an AppTest element tree (what a rerun sends, less media)."""
+    proto = getattr(node, 'proto', None)
+    size = proto.ByteSize() if hasattr(proto, 'ByteSize') else 0
+    return size + sum(tree_bytes(c) for c in getattr(node, 'children', {}).values())
+
+
+def tree_count(node, kind=None):
+    own = 1 if kind is None or getattr(node, 'type', None) == kind else 0
+    return own + sum(tree_count(c, kind) for c in getattr(node, 'children', {}).values())
+
+
+def timed_run(action):
+    start = time.perf_counter()
+    at = action()
+    ms = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return round(ms, 1)
+
+
+def rendered(at):
+    return {"bytes": tree_bytes(at.main), "charts": tree_count(at.main, 'plotly_chart')}
+
+
+def bench_tabs(at, session, cold_ms):
+    """Open each of the session's tabs in turn (the first is already showing),
+    then return to the first. {label: {switch_ms, bytes, charts}}."""
+    key = f"tabs_{session}"
+    if key not in at.session_state:  # no tabs, or all of them rendered eagerly
+        return {}
+    labels = list(dict.fromkeys(tab.label for tab in at.main.tabs))
+    tabs = {labels[0]: {"switch_ms": cold_ms, **rendered(at)}}
+    for label in labels[1:]:
+        at.session_state[key] = label
+        tabs[label] = {"switch_ms": timed_run(at.run), **rendered(at)}
+    at.session_state[key] = labels[0]
+    timed_run(at.run)
+    return tabs
+
+
+def bench_session(initiative, session, warm_runs=WARM_RUNS, app=APP):
+    """Click through to one session in this (fresh) process and measure it."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app, default_timeout=RENDER_TIMEOUT)
+    result = {
+        "cold_start_ms": timed_run(at.run),
+        "session_list_ms": timed_run(at.button(key=f"btn_init_{initiative}").click().run),
+        "cold_session_ms": timed_run(at.button(key=f"btn_{session}").click().run),
+    }
+    tabs = bench_tabs(at, session, result["cold_session_ms"])
+    result.update({
+        "tabs": tabs,
+        "tab_switch_ms": round(sum(t["switch_ms"] for t in list(tabs.values())[1:]), 1),
+        "tabs_bytes": sum(t["bytes"] for t in tabs.values()) or tree_bytes(at.main),
+    })
+    warm = [timed_run(at.run) for _ in range(warm_runs)]
+    result.update({
+        "warm_ms_p50": round(statistics.median(warm), 1),
+        "warm_ms_max": max(warm),
+        "bytes": tree_bytes(at.main),
+        "elements": tree_count(at.main),
+        "charts": tree_count(at.main, 'plotly_chart'),
+    })
+    tracemalloc.start()
+    timed_run(at.run)
+    result["rerun_alloc_peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024)
+    tracemalloc.stop()
+    result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return result
+
+
+def by_type(sessions):
+    """Per-`type` summary: mean timings/bytes, max memory."""
+    groups = {}
+    for r in sessions.values():
+        groups.setdefault(r["type"], []).append(r)
+    mean = lambda rs, k: round(statistics.mean(r[k] for r in rs), 1)
+    return {t: {"sessions": len(rs),
+                "cold_session_ms": mean(rs, "cold_session_ms"),
+                "warm_ms_p50": mean(rs, "warm_ms_p50"),
+                "tab_switch_ms": mean(rs, "tab_switch_ms"),
+                "bytes": round(statistics.mean(r["bytes"] for r in rs)),
+                "tabs_bytes": round(statistics.mean(r["tabs_bytes"] for r in rs)),
+                "peak_rss_mb": max(r["peak_rss_mb"] for r in rs)}
+            for t, rs in sorted(groups.items())}
+
+
+# ============================================================================
+# BASELINE
+# ============================================================================
+
+def compare(new, baseline, tolerance=TOLERANCE):
+    """Lines describing sessions/metrics that regressed beyond `tolerance`."""
+    regressions = []
+    for name, r in new["sessions"].items():
+        old = baseline["sessions"].get(name)
+        if old is None:
+            print(f"  new session: {name}")
+            continue
+        for key in COMPARED:
+            if old.get(key) and r[key] > old[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {old[key]} -> {r[key]} (+{(r[key] / old[key] - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark cold start, reruns and memory per session.")
+    parser.add_argument('sessions', nargs='*', help='"Initiative/Session" names (default: all)')
+    parser.add_argument('-n', '--warm-runs', type=int, default=WARM_RUNS)
+    parser.add_argument('-o', '--out', default='bench_baseline.json')
+    parser.add_argument('--compare', help="baseline JSON to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    args = parser.parse_args(argv)
+
+    registry = load_registry()
+    every = [(i, s) for i, info in registry.items() for s in info['sessions']]
+    wanted = [tuple(name.split('/', 1)) for name in args.sessions] or every
+    unknown = [w for w in wanted if w not in every]
+    if unknown:
+        parser.error(f"unknown session(s): {', '.join('/'.join(u) for u in unknown)}")
+
+    sessions = {}
+    # One session at a time, each in a new process: cold numbers stay cold and
+    # parallel runs don't skew each other's timings.
+    for initiative, session in wanted:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            r = pool.submit(bench_session, initiative, session, args.warm_runs).result()
+        r["type"] = registry[initiative]['sessions'][session].get('type', 'standard')
+        sessions[f"{initiative}/{session}"] = r
+        print(f"{initiative}/{session}: cold {r['cold_session_ms']:.0f} ms, "
+              f"{len(r['tabs'])} tab(s) +{r['tab_switch_ms']:.0f} ms, warm {r['warm_ms_p50']:.0f} ms, "
+              f"{r['bytes'] / 1024:.0f} KB ({r['tabs_bytes'] / 1024:.0f} KB all tabs), {r['charts']} charts, "
+              f"RSS {r['peak_rss_mb']:.0f} MB")
+
+    result = {
+        "generated": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "streamlit": __import__('streamlit').__version__,
+        "warm_runs": args.warm_runs,
+        "sessions": sessions,
+        "types": by_type(sessions),
+    }
+    tmp = args.out + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, args.out)
+    print(f"wrote {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        print(f"{len(regressions)} regression(s) vs {args.compare} (tolerance {args.tolerance:.0%})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""Static HTML snapshots of every session dashboard in app_new_3.py.
+
+Each session in INITIATIVES is rendered headlessly with Streamlit's AppTest,
+then its KPI cards, comparison bands, Plotly figures, metrics and notes are
+written into one self-contained HTML file. An index page links them all, so
+finished sessions can be served from any static file server. Sessions render
+in parallel, one process each (AppTest keeps global runtime state).
+
+    python export_snapshots.py                            # every session -> snapshots/
+    python export_snapshots.py -o site -j 4
+    python export_snapshots.py "Leaders Network Circles/Combined Analysis"
+    python export_snapshots.py --plotlyjs file            # share one plotly.min.js
+"""
+import argparse
+import base64
+import html
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from assets import STATIC_DIR, STATIC_URL
+from registry import load_registry  # re-exported for the other CLIs
+
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app_new_3.py")
+RENDER_TIMEOUT = 120
+
+# Streamlit's own chrome (metrics, alerts, columns) that the app's CSS assumes.
+BASE_CSS = """
+body { margin: 0; background: #fff; color: #31333f; }
+.snapshot { max-width: 1200px; margin: 0 auto; padding: 1.5rem 1rem 3rem; }
+.snap-row { display: flex; gap: 1rem; flex-wrap: wrap; margin: 0.5rem 0; }
+.snap-col { min-width: 220px; }
+.snap-metric { padding: 0.4rem 0; }
+.snap-metric-label { font-size: 0.875rem; color: #555; }
+.snap-metric-value { font-size: 2rem; font-weight: 600; }
+.snap-metric-delta { font-size: 0.875rem; }
+.snap-metric-delta.green { color: #09ab3b; } .snap-metric-delta.red { color: #ff2b2b; }
+.snap-metric-delta.gray { color: #808495; }
+.snap-alert { border-radius: 0.5rem; padding: 0.9rem 1rem; margin: 0.6rem 0; }
+.snap-alert.info { background: #e8f1fb; } .snap-alert.success { background: #e6f5ea; }
+.snap-alert.warning { background: #fff8e1; } .snap-alert.error { background: #fdecea; }
+.snap-tab-label { border-bottom: 2px solid #0d3b6e; padding-bottom: 0.3rem; margin-top: 2rem; }
+.snap-chart { width: 100%; }
+.snap-caption { font-size: 0.85rem; color: #777; }
+img.snap-image { width: 100%; }
+details.snap-expander { border: 1px solid #ddd; border-radius: 0.5rem; padding: 0.5rem 1rem; margin: 0.6rem 0; }
+"""
+
+
+# ============================================================================
+# SESSIONS
+# ============================================================================
+
+def slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def snapshot_name(initiative, session):
+    return f"{slug(initiative)}--{slug(session)}.html"
+
+
+# ============================================================================
+# ELEMENT TREE -> HTML
+# ============================================================================
+
+def md_to_html(text):
+    """The small Markdown subset the dashboards use: headings, bold/italic, rules, bullets."""
+    out, bullets = [], []
+    inline = lambda s: re.sub(r'\*(.+?)\*', r'<em>\1</em>',
+                              re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html.escape(s, quote=False)))
+    for line in text.strip().splitlines() + ['']:
+        stripped = line.strip()
+        if stripped.startswith(('- ', '* ', '• ')):
+            bullets.append(f"<li>{inline(stripped[2:])}</li>")
+            continue
+        if bullets:
+            out.append(f"<ul>{''.join(bullets)}</ul>")
+            bullets = []
+        heading = re.match(r'(#{1,6})\s+(.*)', stripped)
+        if heading:
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{inline(heading.group(2))}</h{level}>")
+        elif stripped in ('---', '***'):
+            out.append("<hr>")
+        elif stripped:
+            out.append(f"<p>{inline(stripped)}</p>")
+    return "\n".join(out)
+
+
+STYLESHEET_LINK = re.compile(rf'<link rel="stylesheet" href="{re.escape(STATIC_URL)}/([^"]+)">')
+FONT_URL = re.compile(r"""url\(['"]?(fonts/[^'")]+)['"]?\)""")
+PICTURE = re.compile(r'<picture>.*?(<img [^>]*>).*?</picture>', re.S)
+IMG_SRC = re.compile(rf'src="{re.escape(STATIC_URL)}/([^"]+)"')
+
+
+def static_file(name, mode='r'):
+    path = os.path.join(STATIC_DIR, name)
+    if not os.path.exists(path):
+        return None
+    with open(path, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+        return f.read()
+
+
+def inline_stylesheets(markup):
+    """Swap <link>s to the app's static stylesheet for its contents, fonts as data URIs."""
+    def font(match):
+        data = static_file(match.group(1), 'rb')
+        return f"url(data:font/woff2;base64,{base64.b64encode(data).decode('ascii')})" if data else "url('')"
+
+    def stylesheet(match):
+        css = static_file(match.group(1))
+        return f"<style>{FONT_URL.sub(font, css)}</style>" if css else ''
+
+    return STYLESHEET_LINK.sub(stylesheet, markup)
+
+
+def inline_pictures(markup):
+    """Reduce static <picture>s to their JPEG fallback <img>, embedded as a data URI."""
+    def picture(match):
+        img = re.sub(r'\s(?:srcset|sizes)="[^"]*"', '', match.group(1))
+        src = IMG_SRC.search(img)
+        data = static_file(src.group(1), 'rb') if src else None
+        if not data:
+            return ''
+        return img.replace(src.group(0), f'src="data:image/jpeg;base64,{base64.b64encode(data).decode("ascii")}"')
+
+    return PICTURE.sub(picture, markup)
+
+
+def media_bytes(url):
+    """Bytes of an image AppTest stored in its in-memory media manager."""
+    from streamlit.runtime import Runtime
+    try:
+        media = Runtime.instance().media_file_mgr._storage.get_file(url.rsplit('/', 1)[-1])
+    except Exception:
+        return None, None
+    return media.content, media.mimetype
+
+
+def node_html(node, charts):
+    """HTML for one AppTest element/block; `charts` collects Plotly specs by div id."""
+    kind = getattr(node, 'type', None)
+    children = lambda: "\n".join(node_html(c, charts) for c in getattr(node, 'children', {}).values())
+
+    if kind == 'markdown':
+        value = node.value
+        return inline_pictures(inline_stylesheets(value)) if value.lstrip().startswith('<') else md_to_html(value)
+    if kind == 'caption':
+        return f'<p class="snap-caption">{html.escape(node.value)}</p>'
+    if kind in ('info', 'success', 'warning', 'error'):
+        return f'<div class="snap-alert {kind}">{md_to_html(node.value)}</div>'
+    if kind == 'metric':
+        color = node.proto.MetricColor.Name(node.proto.color).lower()
+        delta = (f'<div class="snap-metric-delta {color}">{html.escape(node.proto.delta)}</div>'
+                 if node.proto.delta else '')
+        return (f'<div class="snap-metric"><div class="snap-metric-label">{html.escape(node.label)}</div>'
+                f'<div class="snap-metric-value">{html.escape(node.proto.body)}</div>{delta}</div>')
+    if kind == 'plotly_chart':
+        div_id = f"chart-{len(charts)}"
+        charts[div_id] = json.loads(node.proto.spec)
+        return f'<div class="snap-chart" id="{div_id}"></div>'
+    if kind == 'image':
+        imgs = []
+        for img in node.proto.imgs:
+            content, mimetype = media_bytes(img.url)
+            if content:
+                uri = f"data:{mimetype};base64,{base64.b64encode(content).decode('ascii')}"
+                imgs.append(f'<img class="snap-image" src="{uri}" alt="{html.escape(img.caption)}">')
+        return "\n".join(imgs)
+    if kind == 'flex_container':
+        cols = [c for c in node.children.values() if getattr(c, 'type', None) == 'column']
+        if cols:
+            return '<div class="snap-row">' + "".join(
+                f'<div class="snap-col" style="flex:{c.proto.weight:.4f}">{node_html(c, charts)}</div>'
+                for c in cols) + '</div>'
+        return f"<div>{children()}</div>"
+    if kind == 'tab':
+        return f'<section><h3 class="snap-tab-label">{html.escape(node.label)}</h3>{children()}</section>'
+    if kind == 'expandable':
+        return (f'<details class="snap-expander"><summary>{html.escape(node.proto.label)}</summary>'
+                f'{children()}</details>')
+    # Widgets (buttons, pickers) are interactive-only; containers just recurse.
+    return children()
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+def render_session(initiative, session, app=APP):
+    """Run one session through AppTest; returns (body HTML, {div id: plotly spec})."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app, default_timeout=RENDER_TIMEOUT)
+    at.session_state['selected_initiative'] = initiative
+    at.session_state['selected_session'] = session
+    at.session_state['all_tabs'] = True  # every tab's content, not just the open one
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{initiative}/{session}: {at.exception[0].message}")
+    charts = {}
+    body = "\n".join(node_html(node, charts) for node in at.main.children.values()
+                     if getattr(node, 'type', None) != 'warning')  # Streamlit deprecation notices
+    return body, charts
+
+
+def page(title, body, charts, plotly_js):
+    as_js = lambda obj: json.dumps(obj).replace('</', '<\\/')
+    plots = "\n".join(
+        f"Plotly.newPlot({as_js(div_id)}, {as_js(spec.get('data', []))}, "
+        f"{as_js(spec.get('layout', {}))}, {{responsive: true, displaylogo: false}});"
+        for div_id, spec in charts.items())
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+{plotly_js}
+<style>{BASE_CSS}</style>
+</head>
+<body>
+<main class="snapshot">
+{body}
+</main>
+<script>
+{plots}
+</script>
+</body>
+</html>
+"""
+
+
+def export_session(initiative, session, out_dir, plotly_js, app=APP):
+    """Render and write one snapshot. Returns (path, seconds)."""
+    start = time.perf_counter()
+    body, charts = render_session(initiative, session, app)
+    path = os.path.join(out_dir, snapshot_name(initiative, session))
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(page(f"{session} — {initiative}", body, charts, plotly_js))
+    os.replace(tmp, path)
+    return path, time.perf_counter() - start
+
+
+def write_index(out_dir, registry, exported):
+    sections = []
+    for initiative, info in registry.items():
+        links = [f'<li><a href="{snapshot_name(initiative, s)}">{html.escape(sinfo["name"])}</a></li>'
+                 for s, sinfo in info['sessions'].items() if (initiative, s) in exported]
+        if links:
+            sections.append(f'<h2>{info["icon"]} {html.escape(initiative)}</h2><ul>{"".join(links)}</ul>')
+    path = os.path.join(out_dir, "index.html")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page("Saudi Leadership Society — Session Snapshots",
+                     "<h1>Session Snapshots</h1>\n" + "\n".join(sections), {}, ""))
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export every session dashboard as a static HTML page.")
+    parser.add_argument('sessions', nargs='*', help='"Initiative/Session" names to export (default: all)')
+    parser.add_argument('-o', '--out', default='snapshots', help="output folder (default: snapshots)")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help="parallel render processes")
+    parser.add_argument('--plotlyjs', choices=('inline', 'file'), default='inline',
+                        help="embed plotly.js in every page, or write one shared plotly.min.js")
+    args = parser.parse_args(argv)
+
+    registry = load_registry()
+    every = [(i, s) for i, info in registry.items() for s in info['sessions']]
+    wanted = [tuple(name.split('/', 1)) for name in args.sessions] or every
+    unknown = [w for w in wanted if w not in every]
+    if unknown:
+        parser.error(f"unknown session(s): {', '.join('/'.join(u) for u in unknown)}")
+
+    from plotly.offline import get_plotlyjs
+    os.makedirs(args.out, exist_ok=True)
+    if args.plotlyjs == 'file':
+        with open(os.path.join(args.out, "plotly.min.js"), 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+        plotly_js = '<script src="plotly.min.js"></script>'
+    else:
+        plotly_js = f"<script>{get_plotlyjs()}</script>"
+
+    start, exported, failed = time.perf_counter(), set(), 0
+    # A fresh process per session: AppTest replaces the worker's __main__ module.
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(wanted))), max_tasks_per_child=1) as pool:
+        futures = {pool.submit(export_session, i, s, args.out, plotly_js): (i, s) for i, s in wanted}
+        for future in as_completed(futures):
+            initiative, session = futures[future]
+            try:
+                path, secs = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"FAILED {initiative}/{session}: {e}", file=sys.stderr)
+                continue
+            exported.add((initiative, session))
+            print(f"{initiative}/{session}: wrote {path} in {secs:.1f} s")
+
+    write_index(args.out, registry, exported)
+    print(f"{len(exported)} snapshot(s) in {time.perf_counter() - start:.1f} s -> {args.out}/index.html")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
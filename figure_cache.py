@@ -0,0 +1,218 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+# ============================================================================
+# FROZEN FIGURES
+# ============================================================================
+
+def lock_arrays(spec):
+    """Mark every ndarray in a figure dict read-only, in place; returns `spec`."""
+    if isinstance(spec, np.ndarray):
+        spec.flags.writeable = False
+    elif isinstance(spec, dict):
+        for value in spec.values():
+            lock_arrays(value)
+    elif isinstance(spec, (list, tuple)):
+        for value in spec:
+            lock_arrays(value)
+    return spec
+
+
+def copy_spec(spec):
+    """A copy of a figure dict's dicts and lists; leaves (and read-only arrays) are shared."""
+    if isinstance(spec, dict):
+        return {key: copy_spec(value) for key, value in spec.items()}
+    if isinstance(spec, list):
+        return [copy_spec(value) for value in spec]
+    return spec
+
+
+def _frozen_property(name):
+    """A BaseFigure property (data / layout / frames) whose setter raises once frozen."""
+    prop = getattr(go.Figure, name)
+
+    def setter(self, value):
+        self._check_mutable()
+        prop.fset(self, value)
+
+    return property(prop.fget, setter, doc=prop.__doc__)
+
+
+class FrozenFigure(go.Figure):
+    """A built figure whose dict form is serialized once and shared.
+
+    Streamlit calls `to_dict()` on every `st.plotly_chart`, which normally
+    deep-copies the whole figure through plotly's validators; here it copies
+    the cached dict's containers instead. Instances are shared across
+    sessions, so every mutation raises and leaves it unchanged: the update_* /
+    add_* helpers, property assignment on the layout or a trace (plotly
+    routes those through _relayout_child / _restyle_child), and replacing
+    data, layout or frames. Pass overrides to the builder instead.
+    """
+
+    def __init__(self, fig):
+        super().__init__(fig)
+        self._frozen_dict = lock_arrays(super().to_dict())
+        self._frozen = True
+        # Layout and trace objects write their own properties only outside
+        # batch mode, and report every set to the hooks below, which raise.
+        # Pinning batch mode on means a rejected set never lands either.
+        self._in_batch_mode = True
+
+    def _check_mutable(self):
+        if getattr(self, '_frozen', False):
+            raise TypeError("Cached figures are shared across sessions; "
+                            "pass layout overrides to the builder instead.")
+
+    def to_dict(self):
+        return copy_spec(self._frozen_dict)
+
+    def to_plotly_json(self):
+        return self.to_dict()
+
+    data = _frozen_property('data')
+    layout = _frozen_property('layout')
+    frames = _frozen_property('frames')
+
+    def _relayout_child(self, *args, **kwargs):
+        self._check_mutable()
+        return super()._relayout_child(*args, **kwargs)
+
+    def _restyle_child(self, *args, **kwargs):
+        self._check_mutable()
+        return super()._restyle_child(*args, **kwargs)
+
+    def add_traces(self, *args, **kwargs):
+        self._check_mutable()
+        return super().add_traces(*args, **kwargs)
+
+    def plotly_relayout(self, *args, **kwargs):
+        self._check_mutable()
+        return super().plotly_relayout(*args, **kwargs)
+
+    def plotly_restyle(self, *args, **kwargs):
+        self._check_mutable()
+        return super().plotly_restyle(*args, **kwargs)
+
+    def plotly_update(self, *args, **kwargs):
+        self._check_mutable()
+        return super().plotly_update(*args, **kwargs)
+
+
+# ============================================================================
+# LRU CACHE
+# ============================================================================
+
+def canonical(value):
+    """`value` with every ndarray replaced by its dtype, shape and a digest of its
+    bytes (numpy's repr elides large arrays with '...')."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("Cached figure builders can't take object arrays; pass a list.")
+        data = np.ascontiguousarray(value).tobytes()
+        return ('ndarray', value.dtype.str, value.shape, hashlib.blake2b(data, digest_size=16).hexdigest())
+    if isinstance(value, dict):
+        return {k: canonical(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(canonical(v) for v in value)
+    if isinstance(value, list):
+        return [canonical(v) for v in value]
+    return value
+
+
+def content_key(name, args, kwargs):
+    """Digest of a builder call. Inputs must be plain values (or ndarrays) with a stable repr."""
+    raw = repr(canonical((name, args, sorted(kwargs.items()))))
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class FigureCache:
+    """Process-wide LRU of FrozenFigures keyed by the content of their inputs.
+
+    Shared by every Streamlit session and rerun, so it is guarded by a lock
+    (scripts run on separate threads).
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, build):
+        with self._lock:
+            fig = self._entries.get(key)
+            if fig is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fig
+            self.misses += 1
+        # Build outside the lock: two threads racing on the same key just
+        # produce identical figures and the second insert wins.
+        fig = FrozenFigure(build())
+        with self._lock:
+            self._entries[key] = fig
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return fig
+
+    def builder(self, func):
+        """Decorator: cache a figure builder on the content of its arguments."""
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = content_key(name, args, kwargs)
+            return self.get_or_build(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    def export(self):
+        """[(key, figure dict)] for every cached figure: picklable, for another process's preload()."""
+        with self._lock:
+            return [(key, fig.to_dict()) for key, fig in self._entries.items()]
+
+    def preload(self, items):
+        """Install figures built elsewhere (see export()). Keys already cached are kept
+        and hit/miss counts are left alone. Returns how many were added."""
+        with self._lock:
+            items = [(key, spec) for key, spec in items if key not in self._entries]
+        figs = [(key, FrozenFigure(go.Figure(spec))) for key, spec in items]
+        with self._lock:
+            for key, fig in figs:
+                self._entries.setdefault(key, fig)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return len(figs)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate_pct": round(self.hits / total * 100, 1) if total else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+FIGURE_CACHE = FigureCache()
+cached_figure = FIGURE_CACHE.builder
@@ -0,0 +1,101 @@
+"""Background watcher that reports data files whose content changed.
+
+One daemon thread polls each watched file's (mtime, size). A file counts as
+changed once that signature has moved and then held still for one poll (so a
+half-written file isn't picked up) and its content hash differs from the last
+one seen, so touching or re-saving identical content fires nothing. Each
+path has its own callbacks, which is what lets the app drop one session's
+cache entry while every other session stays warm. A callback that raises is
+reported on the log and the watcher keeps polling.
+"""
+import hashlib
+import os
+import sys
+import threading
+
+
+_SETTLED = object()  # no signature change pending
+
+
+def signature(path):
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def digest(path):
+    """Content hash of a file, or None if it can't be read."""
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+class FileWatcher:
+    """Polls watched files every `interval` seconds and calls back on real changes."""
+
+    def __init__(self, interval=2.0, log=sys.stderr):
+        self.interval = interval
+        self.log = log
+        self.changes = 0
+        self._files = {}  # path -> [signature, digest, pending signature, callbacks]
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def watch(self, path, callback):
+        """Call `callback(path)` whenever `path`'s content changes."""
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is None:
+                entry = self._files[path] = [signature(path), digest(path), _SETTLED, []]
+            entry[3].append(callback)
+
+    def check(self):
+        """One poll over every watched file; returns the paths that changed."""
+        with self._lock:
+            files = list(self._files.items())
+        changed = []
+        for path, entry in files:
+            sig = signature(path)
+            if sig == entry[0]:
+                entry[2] = _SETTLED
+                continue
+            if sig != entry[2]:  # still moving: wait for it to settle
+                entry[2] = sig
+                continue
+            content = digest(path) if sig is not None else None
+            entry[0], entry[2] = sig, _SETTLED
+            if content != entry[1]:
+                entry[1] = content
+                changed.append(path)
+                for callback in entry[3]:
+                    try:
+                        callback(path)
+                    except Exception as e:
+                        print(f"[file watch] {path}: callback failed: {type(e).__name__}: {e}", file=self.log)
+        self.changes += len(changed)
+        return changed
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="file-watch", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,415 @@
+"""Live ingestion: fold survey responses into a session's metrics as they arrive.
+
+A live session is a folder holding the session's metrics_engine spec and an
+append-only log of raw responses:
+
+    live/cybersecurity/
+        spec.json          the session's entry from the metrics_engine manifest
+        responses.jsonl    {"survey": "pre"|"post", "answers": {header: answer}}
+
+Responses are appended as they come in (a CSV export, or one JSON object per
+line on stdin). The app keeps one LiveSession per folder; each refresh reads
+only the lines appended since the last one and updates running sums, answer
+counts and a gain sketch, so a new response costs O(topics), not a rerun of
+the engine. A resubmission replaces the respondent's earlier answers, as in
+the batch engine. When collection closes, freeze the session into a normal
+sls_kpi file with `build`:
+
+    python live_ingest.py init manifest.json cybersecurity live/cybersecurity --seed
+    python live_ingest.py append live/cybersecurity post raw/late_post.csv
+    tail -f collector.jsonl | python live_ingest.py append live/cybersecurity pre -
+    python live_ingest.py build live/cybersecurity -o sls_kpi_data_cybersecurity.json
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import warnings
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from metrics_engine import (SATISFACTION_SCALE, SIGNIFICANT_GAIN, column, gain_uncertainty, normalize_ids,
+                            read_columns, score_matrix, session_document, to_scores)
+
+
+SPEC_FILE = "spec.json"
+LOG_FILE = "responses.jsonl"
+SURVEYS = ("pre", "post")
+DEMOGRAPHICS = ("location", "academic_level", "heard_about")
+POST_ANSWERS = ("satisfaction", "recommend", "action_plan")
+
+
+# ============================================================================
+# GAIN SKETCH
+# ============================================================================
+
+class GainSketch:
+    """Streaming quantiles of per-respondent gains.
+
+    Gains are rounded to 0.01 and bounded by the 1-5 scale, so the sketch is a
+    count per hundredth from -4 to +4: O(1) to add or remove a respondent, and
+    quantiles interpolate between order statistics exactly like np.percentile.
+    Sums are kept in integer hundredths so removals never drift.
+    """
+    LO, HI = -400, 400
+
+    def __init__(self):
+        self.counts = np.zeros(self.HI - self.LO + 1, dtype=np.int64)
+        self.n = self.total = self.squares = 0
+
+    def add(self, gain, sign=1):
+        """Add (sign=1) or remove (sign=-1) one gain, given in hundredths."""
+        self.counts[gain - self.LO] += sign
+        self.n += sign
+        self.total += sign * gain
+        self.squares += sign * gain * gain
+
+    def count(self, lo=None, hi=None):
+        """Gains in [lo, hi) hundredths; None leaves that side open."""
+        lo = 0 if lo is None else max(lo - self.LO, 0)
+        hi = len(self.counts) if hi is None else max(hi - self.LO, 0)
+        return int(self.counts[lo:hi].sum())
+
+    def order_stat(self, k):
+        """The k-th smallest gain (0-based), in hundredths."""
+        return int(np.searchsorted(np.cumsum(self.counts), k, side='right')) + self.LO
+
+    def quantile(self, q):
+        h = (self.n - 1) * q
+        k = int(np.floor(h))
+        a, b = self.order_stat(k), self.order_stat(min(k + 1, self.n - 1))
+        return (a + (h - k) * (b - a)) / 100
+
+    def mean(self):
+        return self.total / self.n / 100 if self.n else 0.0
+
+    def stats(self):
+        """metrics_engine.improvement_stats() from the sketch."""
+        if not self.n:
+            return {k: 0.0 for k in ("mean", "median", "std", "min", "max", "q25", "q75")}
+        variance = (self.n * self.squares - self.total ** 2) / (self.n * (self.n - 1)) if self.n > 1 else 0
+        return {
+            "mean":   round(self.mean(), 2),
+            "median": round(self.quantile(0.5), 2),
+            "std":    round(float(np.sqrt(variance)) / 100, 2) if self.n > 1 else 0.0,
+            "min":    round(self.order_stat(0) / 100, 2),
+            "max":    round(self.order_stat(self.n - 1) / 100, 2),
+            "q25":    round(self.quantile(0.25), 2),
+            "q75":    round(self.quantile(0.75), 2),
+        }
+
+    def distribution(self):
+        """metrics_engine.improvement_distribution() from the sketch."""
+        return {
+            "significant_improvement_2plus": self.count(200),
+            "moderate_improvement_1to2":     self.count(100, 200),
+            "slight_improvement_0to1":       self.count(1, 100),
+            "no_change":                     self.count(0, 1),
+            "decreased":                     self.count(None, 0),
+        }
+
+
+# ============================================================================
+# RUNNING METRICS
+# ============================================================================
+
+def ranked(counter):
+    """Counter -> {answer: count}, most frequent first (metrics_engine.value_counts order)."""
+    return {k: v for k, v in sorted(counter.items(), key=lambda kv: (-kv[1], kv[0])) if v > 0}
+
+
+def score_bin(scores):
+    """A respondent's average score rounded to a whole point, or None if unanswered."""
+    if np.all(np.isnan(scores)):
+        return None
+    return int(np.clip(np.rint(np.nanmean(scores)), 1, 5))
+
+
+class LiveMetrics:
+    """Running aggregates of one session, updated one response at a time.
+
+    Keeps each respondent's latest parsed answers per survey. Pre-only fields
+    (demographics) count every pre respondent; everything else counts only
+    respondents present in both surveys, and is withdrawn and re-added when
+    either of their answers is replaced.
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.cols = spec.get('columns', {})
+        self.id_column = spec.get('id_column', 'Email')
+        k = len(spec['topics'])
+        self.answers = {"pre": {}, "post": {}}  # survey -> {respondent id: record}
+        self.n_matched = 0
+        self.topic_sum = {s: np.zeros(k) for s in SURVEYS}
+        self.topic_n = {s: np.zeros(k, dtype=np.int64) for s in SURVEYS}
+        self.score_bins = {s: np.zeros(6, dtype=np.int64) for s in SURVEYS}
+        self.gains = GainSketch()
+        self.sat_sum, self.sat_n = 0.0, 0
+        self.counts = {name: Counter() for name in DEMOGRAPHICS + POST_ANSWERS}
+
+    # ── Parsing ──
+    def records(self, survey, table):
+        """(respondent id, record) per row of a {header: answers} table, in row order."""
+        rows = np.arange(len(next(iter(table.values()), [])))
+        ids = normalize_ids(column(table, self.id_column, rows))
+        scores = score_matrix(table, [t[survey] for t in self.spec['topics'].values()], rows)
+        if survey == "pre":
+            extra = {name: column(table, self.cols.get(name), rows) for name in DEMOGRAPHICS}
+        else:
+            extra = {name: column(table, self.cols.get(name), rows) for name in POST_ANSWERS}
+            extra["satisfaction_score"] = to_scores(extra["satisfaction"], SATISFACTION_SCALE)
+        for i, rid in enumerate(ids):
+            if rid:
+                yield str(rid), {"scores": scores[i], **{name: values[i] for name, values in extra.items()}}
+
+    # ── Folding ──
+    def add(self, survey, table):
+        """Fold a table of new `survey` responses in; returns the rows accepted."""
+        n = 0
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN answers
+            for rid, record in self.records(survey, table):
+                self.replace(survey, rid, record)
+                n += 1
+        return n
+
+    def replace(self, survey, rid, record):
+        mine, other = self.answers[survey], self.answers["post" if survey == "pre" else "pre"]
+        old = mine.get(rid)
+        if old is not None:
+            if rid in other:
+                self.matched(-1, *self.pair(survey, old, other[rid]))
+            self.single(-1, survey, old)
+        mine[rid] = record
+        self.single(1, survey, record)
+        if rid in other:
+            self.matched(1, *self.pair(survey, record, other[rid]))
+
+    @staticmethod
+    def pair(survey, record, other):
+        return (record, other) if survey == "pre" else (other, record)
+
+    def single(self, sign, survey, record):
+        if survey == "pre":
+            for name in DEMOGRAPHICS:
+                if record[name]:
+                    self.counts[name][str(record[name])] += sign
+
+    def matched(self, sign, pre, post):
+        self.n_matched += sign
+        for survey, record in (("pre", pre), ("post", post)):
+            answered = ~np.isnan(record["scores"])
+            self.topic_sum[survey][answered] += sign * record["scores"][answered]
+            self.topic_n[survey][answered] += sign
+            b = score_bin(record["scores"])
+            if b is not None:
+                self.score_bins[survey][b] += sign
+        diffs = post["scores"] - pre["scores"]
+        if not np.all(np.isnan(diffs)):
+            self.gains.add(int(round(float(np.round(np.nanmean(diffs), 2)) * 100)), sign)
+        if not np.isnan(post["satisfaction_score"]):
+            self.sat_sum += sign * post["satisfaction_score"]
+            self.sat_n += sign
+        for name in POST_ANSWERS:
+            if post[name]:
+                self.counts[name][str(post[name])] += sign
+
+    # ── Output ──
+    def aggregates(self):
+        """The aggregates metrics_engine.session_document() expects."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            topic_mean = {s: self.topic_sum[s] / self.topic_n[s] for s in SURVEYS}
+        return {
+            "n_pre": len(self.answers["pre"]), "n_post": len(self.answers["post"]),
+            "n_matched": self.n_matched,
+            "topic_pre": topic_mean["pre"], "topic_post": topic_mean["post"],
+            "pre_score_distribution": {f"score_{k}": int(self.score_bins["pre"][k]) for k in range(1, 6)},
+            "post_score_distribution": {f"score_{k}": int(self.score_bins["post"][k]) for k in range(1, 6)},
+            "n_paired": self.gains.n,
+            "improved": self.gains.count(1),
+            "significant": self.gains.count(int(round(SIGNIFICANT_GAIN * 100))),
+            "gain_mean": self.gains.mean(),
+            "improvement_distribution": self.gains.distribution(),
+            "improvement_stats": self.gains.stats(),
+            "action": ranked(self.counts["action_plan"]),
+            "satisfaction": ranked(self.counts["satisfaction"]),
+            "recommend": ranked(self.counts["recommend"]),
+            "avg_satisfaction": self.sat_sum / self.sat_n if self.sat_n else float('nan'),
+            **{name: ranked(self.counts[name]) for name in DEMOGRAPHICS},
+        }
+
+    def uncertainty(self):
+        """Bootstrap CIs and paired tests of the matched respondents' gains (see metrics_engine)."""
+        pre, post = self.answers["pre"], self.answers["post"]
+        # In id order, as the batch engine matches them, so both draw the same resamples.
+        pairs = [(pre[rid]["scores"], post[rid]["scores"]) for rid in sorted(pre) if rid in post]
+        k = len(self.spec['topics'])
+        pre_scores = np.array([p for p, _ in pairs]).reshape(-1, k)
+        post_scores = np.array([q for _, q in pairs]).reshape(-1, k)
+        return gain_uncertainty(self.spec['topics'], pre_scores, post_scores)
+
+    def document(self, uncertainty=False):
+        """The session's sls_kpi document; the resampling behind `uncertainty` is
+        left to `build`, so a refresh stays O(new responses)."""
+        agg = self.aggregates()
+        if uncertainty:
+            agg["uncertainty"] = self.uncertainty()
+        return session_document(self.spec, agg)
+
+
+# ============================================================================
+# LIVE SESSION FOLDER
+# ============================================================================
+
+def rows_to_table(rows):
+    """[{header: answer}, ...] -> {header: array of stripped strings}."""
+    headers = list(dict.fromkeys(h for r in rows for h in r))
+    return {h: np.char.strip(np.array([str(r.get(h, '')) for r in rows], dtype=str)) for h in headers}
+
+
+def append_responses(path, survey, rows):
+    """Append responses ([{header: answer}, ...]) to a live session's log in one write."""
+    if survey not in SURVEYS:
+        raise ValueError(f"survey must be one of {SURVEYS}, not {survey!r}")
+    lines = "".join(json.dumps({"survey": survey, "answers": r}, ensure_ascii=False) + "\n" for r in rows)
+    with open(os.path.join(path, LOG_FILE), 'a', encoding='utf-8') as f:
+        f.write(lines)
+    return len(rows)
+
+
+class LiveSession:
+    """A live session folder, folded incrementally; safe to share between threads.
+
+    `version` counts refreshes that brought in new responses, so each viewer
+    can tell whether what it rendered is still current.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, SPEC_FILE), encoding='utf-8') as f:
+            self.spec = json.load(f)
+        self.log = os.path.join(path, LOG_FILE)
+        self.version = 0
+        self.responses = 0
+        self.updated = None
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.metrics = LiveMetrics(self.spec)
+        self.offset = 0
+        self._document = None
+
+    def refresh(self):
+        """Fold in whatever was appended since the last call; True if anything was."""
+        with self._lock:
+            size = os.path.getsize(self.log) if os.path.exists(self.log) else 0
+            if size < self.offset:  # log replaced or truncated: replay it
+                self._reset()
+            if size == self.offset:
+                return False
+            with open(self.log, 'rb') as f:
+                f.seek(self.offset)
+                chunk = f.read(size - self.offset)
+            end = chunk.rfind(b'\n') + 1  # a writer may be mid-line
+            if not end:
+                return False
+            self.offset += end
+
+            batches = {s: [] for s in SURVEYS}
+            for line in chunk[:end].decode('utf-8').splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    batches[entry["survey"]].append(entry["answers"])
+            # Only order within a survey matters (the latest answer wins).
+            for survey, rows in batches.items():
+                if rows:
+                    self.responses += self.metrics.add(survey, rows_to_table(rows))
+            self.version += 1
+            self.updated = datetime.now()
+            self._document = None
+            return True
+
+    def document(self):
+        """The session's sls_kpi document as of the last refresh (rebuilt only after new responses)."""
+        with self._lock:
+            if self._document is None:
+                self._document = self.metrics.document()
+            return self._document
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def init_session(manifest, name, path, seed=False):
+    """Create a live folder from a manifest entry; `seed` replays its current exports."""
+    with open(manifest, encoding='utf-8') as f:
+        spec = dict(json.load(f)['sessions'][name])
+    base_dir = os.path.dirname(os.path.abspath(manifest))
+    for key in ('pre', 'post', 'output', 'respondents'):
+        if spec.get(key) and not os.path.isabs(spec[key]):
+            spec[key] = os.path.join(base_dir, spec[key])
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, SPEC_FILE), 'w', encoding='utf-8') as f:
+        json.dump(spec, f, indent=2, ensure_ascii=False)
+    open(os.path.join(path, LOG_FILE), 'a').close()
+    seeded = 0
+    if seed:
+        for survey in SURVEYS:
+            seeded += append_responses(path, survey, read_rows(spec[survey]))
+    return seeded
+
+
+def read_rows(source):
+    """Responses from a CSV export, or JSON lines of {header: answer} from '-' (stdin)."""
+    if source == '-':
+        return [json.loads(line) for line in sys.stdin if line.strip()]
+    table = read_columns(source)
+    headers = list(table)
+    return [dict(zip(headers, values)) for values in zip(*(table[h].tolist() for h in headers))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Append survey responses to a live session and fold them in.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    p = sub.add_parser('init', help="create a live session folder from a manifest entry")
+    p.add_argument('manifest')
+    p.add_argument('session')
+    p.add_argument('path')
+    p.add_argument('--seed', action='store_true', help="start from the session's current pre/post exports")
+    p = sub.add_parser('append', help="append responses from a CSV export (or '-' for JSON lines on stdin)")
+    p.add_argument('path')
+    p.add_argument('survey', choices=SURVEYS)
+    p.add_argument('source')
+    p = sub.add_parser('build', help="write the session's current sls_kpi document")
+    p.add_argument('path')
+    p.add_argument('-o', '--out', help="output JSON (default: the spec's output)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'init':
+        seeded = init_session(args.manifest, args.session, args.path, args.seed)
+        print(f"created {args.path}" + (f" with {seeded} response(s)" if args.seed else ""))
+    elif args.command == 'append':
+        n = append_responses(args.path, args.survey, read_rows(args.source))
+        print(f"appended {n} {args.survey} response(s) to {os.path.join(args.path, LOG_FILE)}")
+    else:
+        start = time.perf_counter()
+        live = LiveSession(args.path)
+        live.refresh()
+        out = args.out or live.spec.get('output') or os.path.join(args.path, "sls_kpi_live.json")
+        tmp = out + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(live.metrics.document(uncertainty=True), f, indent=2, ensure_ascii=False)
+        os.replace(tmp, out)
+        print(f"wrote {out} from {live.responses} response(s) in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
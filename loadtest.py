@@ -0,0 +1,314 @@
+"""Load test: N simulated viewers against a local Streamlit server.
+
+Starts `streamlit run app_new_3.py` headless on a free port (or targets a
+running server with --url/--pid). It then opens N websocket sessions that
+replay a viewer's click path over Streamlit's own protocol:
+
+    initiative list -> initiative button -> session button -> T tab switches -> R reruns
+
+With --deep-link, viewers instead open the session's URL
+(?initiative=...&session=...) and land on the dashboard in one run.
+Dashboard tabs only build the open tab, so each switch is a server
+round trip; viewers pick another of the session's tabs and send it the way
+the browser does (a fragment rerun where the tabs live in one). Each viewer
+waits a random think time between steps, and connections ramp up over
+--ramp seconds. Every viewer stays connected until all of them are done, so
+the server's RSS is measured with all N sessions live.
+
+    python loadtest.py -n 200
+    python loadtest.py -n 50 --session "Leaders Network Circles/Combined Analysis"
+    python loadtest.py -n 50 --deep-link
+    python loadtest.py --url ws://127.0.0.1:8501 --pid 4242 -n 100 -o load.json
+
+Needs the `websockets` package (installed alongside Streamlit's server).
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.parse
+import urllib.request
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from export_snapshots import APP, load_registry
+
+
+STEPS = ("initiatives", "session_list", "session", "tab", "rerun")
+SERVER_START_TIMEOUT = 60
+RSS_SAMPLE_SECONDS = 0.25
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port):
+    """Launch the app headless and wait for its health check."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP, "--server.headless", "true",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc
+        except OSError:
+            time.sleep(0.25)
+    proc.terminate()
+    raise RuntimeError(f"streamlit did not come up on port {port}")
+
+
+def rss_mb(pid):
+    """Resident memory of `pid` (Linux /proc), or None if unavailable."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+
+# ============================================================================
+# VIEWERS
+# ============================================================================
+
+class Tabs:
+    """A stateful st.tabs container seen in a run: its widget id, labels and fragment."""
+
+    def __init__(self, widget_id, fragment_id):
+        self.widget_id, self.fragment_id, self.labels = widget_id, fragment_id, []
+
+
+async def run_script(ws, widget_id=None, query_string="", tab=None):
+    """One rerun, optionally clicking a button or selecting label `tab` = (Tabs, label).
+
+    Returns (ms, bytes, {button key: widget id}, {tabs key: Tabs}).
+    """
+    back = BackMsg()
+    back.rerun_script.query_string = query_string
+    if widget_id:
+        widget = back.rerun_script.widget_states.widgets.add()
+        widget.id, widget.trigger_value = widget_id, True
+    if tab:
+        tabs, label = tab
+        widget = back.rerun_script.widget_states.widgets.add()
+        widget.id, widget.string_value = tabs.widget_id, label
+        back.rerun_script.fragment_id = tabs.fragment_id
+    start, nbytes, buttons, containers = time.perf_counter(), 0, {}, {}
+    await ws.send(back.SerializeToString())
+    while True:
+        raw = await ws.recv()
+        nbytes += len(raw)
+        msg = ForwardMsg()
+        msg.ParseFromString(raw)
+        kind = msg.WhichOneof("type")
+        if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            element = msg.delta.new_element
+            if element.WhichOneof("type") == "button":
+                buttons[element.button.id.split("-", 2)[-1]] = element.button.id  # "$$ID-<hash>-<key>"
+        elif kind == "delta" and msg.delta.WhichOneof("type") == "add_block":
+            block, path = msg.delta.add_block, tuple(msg.metadata.delta_path)
+            if block.WhichOneof("type") == "tab_container" and block.tab_container.id:
+                containers[path] = Tabs(block.tab_container.id, msg.delta.fragment_id)
+            elif block.WhichOneof("type") == "tab" and path[:-1] in containers:
+                containers[path[:-1]].labels.append(block.tab.label)
+        elif kind == "script_finished":
+            if msg.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                buttons, containers = {}, {}  # a button handler called st.rerun(); the next run follows
+                continue
+            if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                raise RuntimeError("script failed to compile")
+            tabs = {t.widget_id.split("-", 2)[-1]: t for t in containers.values()}
+            return (time.perf_counter() - start) * 1000, nbytes, buttons, tabs
+
+
+async def viewer(url, initiative, session, reruns, think, stats, all_done, deep_link=False, tab_switches=0):
+    async def step(name, widget_id=None, query_string="", tab=None):
+        await asyncio.sleep(random.uniform(*think))
+        ms, nbytes, buttons, tabs = await run_script(ws, widget_id, query_string, tab)
+        stats["latency"][name].append(ms)
+        stats["bytes"][name].append(nbytes)
+        return buttons, tabs
+
+    arrived = False
+
+    def arrive():
+        nonlocal arrived
+        if not arrived:
+            arrived = True
+            stats["finished"] += 1
+            if stats["finished"] == stats["viewers"]:
+                all_done.set()
+
+    try:
+        async with websockets.connect(f"{url}/_stcore/stream", subprotocols=["streamlit"],
+                                      max_size=None, open_timeout=60) as ws:
+            stats["connected"] += 1
+            if deep_link:
+                _, tabs = await step("session", query_string=urllib.parse.urlencode(
+                    {"initiative": initiative, "session": session}))
+            else:
+                buttons, _ = await step("initiatives")
+                buttons, _ = await step("session_list", buttons[f"btn_init_{initiative}"])
+                _, tabs = await step("session", buttons[f"btn_{session}"])
+            # The session's own tabs (key tabs_<session>); a fragment rerun re-sends them.
+            dashboard = tabs.get(f"tabs_{session}")
+            current = dashboard.labels[0] if dashboard and len(dashboard.labels) > 1 else None
+            for _ in range(tab_switches if current else 0):
+                current = random.choice([label for label in dashboard.labels if label != current])
+                _, tabs = await step("tab", tab=(dashboard, current))
+                dashboard = tabs.get(f"tabs_{session}", dashboard)
+            for _ in range(reruns):
+                await step("rerun")
+            arrive()
+            await all_done.wait()  # hold the session open until every viewer is in
+    except Exception as e:
+        stats["errors"].append(f"{initiative}/{session}: {type(e).__name__}: {e}")
+    finally:
+        arrive()
+
+
+async def sample_rss(pid, stats, stop):
+    while not stop.is_set():
+        rss = rss_mb(pid) if pid else None
+        if rss is not None:
+            stats["rss_peak_mb"] = max(stats["rss_peak_mb"] or 0, rss)
+        await asyncio.sleep(RSS_SAMPLE_SECONDS)
+
+
+def new_stats(viewers):
+    return {"viewers": viewers, "connected": 0, "finished": 0, "errors": [],
+            "latency": {s: [] for s in STEPS}, "bytes": {s: [] for s in STEPS},
+            "rss_base_mb": None, "rss_peak_mb": None}
+
+
+async def load(url, pid, paths, reruns, think, ramp, deep_link=False, tab_switches=0):
+    # One warm-up viewer first, so the baseline already holds the module-level caches.
+    await viewer(url, *paths[0], reruns=0, think=(0, 0), stats=new_stats(1), all_done=asyncio.Event(),
+                 deep_link=deep_link)
+    stats = new_stats(len(paths))
+    stats["rss_base_mb"] = rss_mb(pid) if pid else None
+
+    all_done, stop = asyncio.Event(), asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(pid, stats, stop))
+    start = time.perf_counter()
+
+    async def delayed(i, initiative, session):
+        await asyncio.sleep(ramp * i / max(len(paths) - 1, 1))
+        await viewer(url, initiative, session, reruns, think, stats, all_done, deep_link, tab_switches)
+
+    await asyncio.gather(*(delayed(i, *p) for i, p in enumerate(paths)))
+    stats["wall_s"] = round(time.perf_counter() - start, 1)
+    stop.set()
+    await sampler
+    return stats
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def percentiles(values):
+    if not values:
+        return {"n": 0}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"n": len(values), "p50_ms": round(p50, 1), "p95_ms": round(p95, 1), "p99_ms": round(p99, 1),
+            "max_ms": round(max(values), 1)}
+
+
+def report(stats):
+    every = [ms for s in STEPS for ms in stats["latency"][s]]
+    base, peak = stats["rss_base_mb"], stats["rss_peak_mb"]
+    per_session = round((peak - base) / stats["connected"], 2) if base and peak and stats["connected"] else None
+    return {
+        "viewers": stats["viewers"],
+        "connected": stats["connected"],
+        "errors": stats["errors"],
+        "wall_s": stats["wall_s"],
+        "reruns": percentiles(every),
+        "steps": {s: {**percentiles(stats["latency"][s]),
+                      "avg_kb": round(np.mean(stats["bytes"][s]) / 1024, 1) if stats["bytes"][s] else 0}
+                  for s in STEPS},
+        "server_rss_base_mb": base and round(base, 1),
+        "server_rss_peak_mb": peak and round(peak, 1),
+        "server_mb_per_session": per_session,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard viewers against a Streamlit server.")
+    parser.add_argument("-n", "--viewers", type=int, default=100)
+    parser.add_argument("--session", action="append", default=[],
+                        help='"Initiative/Session" each viewer opens (repeatable; default: random mix of all)')
+    parser.add_argument("--tabs", type=int, default=3, help="tab switches per viewer after opening the session")
+    parser.add_argument("--reruns", type=int, default=3, help="reruns per viewer after the tab switches")
+    parser.add_argument("--think", type=float, nargs=2, default=(0.2, 1.0), metavar=("MIN", "MAX"),
+                        help="seconds between a viewer's steps")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which viewers connect")
+    parser.add_argument("--deep-link", action="store_true", help="open each session from its URL, not by clicking")
+    parser.add_argument("--url", help="existing server, e.g. ws://127.0.0.1:8501 (default: start one)")
+    parser.add_argument("--pid", type=int, help="server process id for RSS when using --url")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--out", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    registry = load_registry()
+    every = [(i, s) for i, info in registry.items() for s in info["sessions"]]
+    chosen = [tuple(name.split("/", 1)) for name in args.session] or every
+    unknown = [c for c in chosen if c not in every]
+    if unknown:
+        parser.error(f"unknown session(s): {', '.join('/'.join(u) for u in unknown)}")
+    random.seed(args.seed)
+    paths = [random.choice(chosen) for _ in range(args.viewers)]
+
+    server = None
+    if args.url:
+        url, pid = args.url.rstrip("/"), args.pid
+    else:
+        port = free_port()
+        server = start_server(port)
+        url, pid = f"ws://127.0.0.1:{port}", server.pid
+    try:
+        result = report(asyncio.run(load(url, pid, paths, args.reruns, tuple(args.think), args.ramp,
+                                        args.deep_link, args.tabs)))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    print(f"{result['connected']}/{result['viewers']} viewers connected, {len(result['errors'])} error(s), "
+          f"{result['wall_s']} s")
+    print(f"{'step':<14} {'n':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'avg KB':>8}")
+    for name, s in [("all reruns", result["reruns"])] + list(result["steps"].items()):
+        if s["n"]:
+            print(f"{name:<14} {s['n']:>6} {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['p99_ms']:>9.1f} "
+                  f"{s.get('avg_kb', ''):>8}")
+    if result["server_mb_per_session"] is not None:
+        print(f"server RSS {result['server_rss_base_mb']} MB -> {result['server_rss_peak_mb']} MB "
+              f"({result['server_mb_per_session']} MB per connected session)")
+    for err in result["errors"][:10]:
+        print(f"  ERROR {err}", file=sys.stderr)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,598 @@
+"""Offline metrics engine: raw pre/post survey exports -> sls_kpi_*.json.
+
+Builds the `metrics` / `visualization_data` / `metadata` files read by the
+standard and health dashboards in app_new_3.py. Sessions are described in a
+JSON manifest:
+
+    {
+      "sessions": {
+        "cybersecurity": {
+          "pre":  "raw/cybersecurity_pre.csv",
+          "post": "raw/cybersecurity_post.csv",
+          "output": "sls_kpi_data_cybersecurity.json",
+          "id_column": "Email",
+          "topics": {
+            "grow_cybersecurity": {"label": "Cybersecurity Knowledge",
+                                   "pre": "Rate your cybersecurity knowledge",
+                                   "post": "Rate your cybersecurity knowledge now"}
+          },
+          "columns": {"satisfaction": "...", "recommend": "...", "action_plan": "...",
+                      "location": "...", "academic_level": "...", "heard_about": "..."},
+          "chapter": {"event_name": "...", "total_registered": 119,
+                      "target_attendance": 50, "actual_attendees": 54},
+          "respondents": "respondents/cybersecurity"
+        }
+      }
+    }
+
+The optional "respondents" folder receives a respondent_store of the matched
+respondents (Likert codes + demographics) for per-segment filtering in the app.
+Relative paths resolve against the manifest's folder. Usage:
+
+    python metrics_engine.py manifest.json              # every session
+    python metrics_engine.py manifest.json cybersecurity
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+import warnings
+from datetime import datetime
+
+import numpy as np
+
+from respondent_store import write_store
+
+
+ENGINE_VERSION = "2.1"
+
+# ── Answer scales (matched case-insensitively; "4", "4 - High" also parse) ──
+KNOWLEDGE_SCALE = {"very low": 1, "low": 2, "moderate": 3, "high": 4, "very high": 5}
+SATISFACTION_SCALE = {"very dissatisfied": 1, "dissatisfied": 2, "neutral": 3,
+                      "satisfied": 4, "very satisfied": 5}
+SATISFIED = ("Satisfied", "Very satisfied")
+LIKELY = ("Likely", "Very likely")
+ACTION_YES = ("Yes",)
+
+# Significant growth threshold, matching the dashboard's "Gained ≥0.5 points".
+SIGNIFICANT_GAIN = 0.5
+
+# ── Uncertainty of the gains ──
+CONFIDENCE = 0.95
+BOOTSTRAP_RESAMPLES = 10_000       # at most
+BOOTSTRAP_MIN_RESAMPLES = 2_000    # before the intervals may be called settled
+BOOTSTRAP_TOLERANCE = 0.005        # settled: no endpoint moved more than this over the last batch
+BOOTSTRAP_BATCH = 1_000
+BOOTSTRAP_SEED = 2030      # fixed, so rebuilding from the same exports gives the same file
+BOOTSTRAP_BATCH_CELLS = 2_000_000  # resamples × respondents per weight matrix (16 MB)
+WILCOXON_EXACT_MAX = 50    # exact signed-rank null distribution up to this many non-zero pairs
+
+
+# ============================================================================
+# LOADING & MATCHING
+# ============================================================================
+
+def read_columns(path):
+    """Read a CSV export into {header: array of stripped strings}."""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.reader(f))
+    if not rows:
+        return {}
+    header, body = [h.strip() for h in rows[0]], rows[1:]
+    width = len(header)
+    table = np.array([(r + [''] * width)[:width] for r in body], dtype=object).reshape(-1, width)
+    table = np.char.strip(table.astype(str))
+    return {h: table[:, i] for i, h in enumerate(header)}
+
+
+def normalize_ids(values):
+    return np.char.lower(np.char.strip(values.astype(str)))
+
+
+def latest_per_id(ids):
+    """Row indices of each respondent's last submission, in file order (blank ids dropped)."""
+    rev = ids[::-1]
+    uniq, first_in_rev = np.unique(rev, return_index=True)
+    keep = np.sort(len(ids) - 1 - first_in_rev[uniq != ''])
+    return keep
+
+
+def match_respondents(pre_ids, post_ids):
+    """Pre/post row indices of respondents present in both exports."""
+    pre_rows, post_rows = latest_per_id(pre_ids), latest_per_id(post_ids)
+    _, i_pre, i_post = np.intersect1d(pre_ids[pre_rows], post_ids[post_rows],
+                                      assume_unique=True, return_indices=True)
+    return pre_rows, post_rows, pre_rows[i_pre], post_rows[i_post]
+
+
+# ============================================================================
+# VECTORIZED HELPERS
+# ============================================================================
+
+def to_scores(values, scale=KNOWLEDGE_SCALE):
+    """Map Likert answers to 1-5 floats (NaN when blank or unrecognised).
+
+    Works on the distinct answers only, then broadcasts back with the inverse
+    index, so cost is O(rows) regardless of how answers are spelled.
+    """
+    uniq, inverse = np.unique(np.char.lower(values.astype(str)), return_inverse=True)
+    lookup = np.full(len(uniq), np.nan)
+    for i, answer in enumerate(uniq):
+        if answer[:1].isdigit():
+            lookup[i] = float(answer[0])
+        elif answer in scale:
+            lookup[i] = scale[answer]
+    scores = lookup[inverse]
+    scores[(scores < 1) | (scores > 5)] = np.nan
+    return scores
+
+
+def value_counts(values):
+    """{answer: count}, most frequent first; blanks are ignored."""
+    values = values[values != '']
+    uniq, counts = np.unique(values, return_counts=True)
+    order = np.lexsort((uniq, -counts))
+    return {str(uniq[i]): int(counts[i]) for i in order}
+
+
+def pct(part, whole, ndigits=1):
+    return round(float(part) / whole * 100, ndigits) if whole else 0.0
+
+
+def score_distribution(scores):
+    """Counts of respondent averages rounded to the nearest whole point."""
+    scores = scores[~np.isnan(scores)]
+    bins = np.bincount(np.clip(np.rint(scores), 1, 5).astype(int), minlength=6)
+    return {f"score_{k}": int(bins[k]) for k in range(1, 6)}
+
+
+def improvement_distribution(gains):
+    return {
+        "significant_improvement_2plus": int(np.count_nonzero(gains >= 2)),
+        "moderate_improvement_1to2":     int(np.count_nonzero((gains >= 1) & (gains < 2))),
+        "slight_improvement_0to1":       int(np.count_nonzero((gains > 0) & (gains < 1))),
+        "no_change":                     int(np.count_nonzero(gains == 0)),
+        "decreased":                     int(np.count_nonzero(gains < 0)),
+    }
+
+
+def improvement_stats(gains):
+    if not len(gains):
+        return {k: 0.0 for k in ("mean", "median", "std", "min", "max", "q25", "q75")}
+    q25, median, q75 = np.percentile(gains, [25, 50, 75])
+    return {
+        "mean":   round(float(gains.mean()), 2),
+        "median": round(float(median), 2),
+        "std":    round(float(gains.std(ddof=1)), 2) if len(gains) > 1 else 0.0,
+        "min":    round(float(gains.min()), 2),
+        "max":    round(float(gains.max()), 2),
+        "q25":    round(float(q25), 2),
+        "q75":    round(float(q75), 2),
+    }
+
+
+def share(counts, keys):
+    return sum(counts.get(k, 0) for k in keys)
+
+
+# ============================================================================
+# UNCERTAINTY
+# ============================================================================
+
+def bootstrap_batches(diffs, resamples=BOOTSTRAP_RESAMPLES, seed=BOOTSTRAP_SEED):
+    """Yield (batch × columns) resampled means of `diffs` (respondents × columns,
+    NaN = unanswered) until `resamples` have been drawn.
+
+    Each resample of respondents is a row of counts (a bincount of n draws
+    with replacement), so all columns' resampled means come out of one matrix
+    product, each column averaging only the respondents who answered it.
+    Batches hold BOOTSTRAP_BATCH resamples, fewer once that would pass
+    BOOTSTRAP_BATCH_CELLS weights.
+    """
+    n = len(diffs)
+    rng = np.random.default_rng(seed)
+    answered = ~np.isnan(diffs)
+    values, counted = np.where(answered, diffs, 0.0), answered.astype(float)
+    batch = max(1, min(BOOTSTRAP_BATCH, BOOTSTRAP_BATCH_CELLS // n))
+    for start in range(0, resamples, batch):
+        size = min(batch, resamples - start)
+        draws = rng.integers(0, n, size=(size, n)) + (np.arange(size) * n)[:, None]
+        weights = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n).astype(float)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            yield (weights @ values) / (weights @ counted)
+
+
+def bootstrap_means(diffs, resamples=BOOTSTRAP_RESAMPLES, seed=BOOTSTRAP_SEED):
+    """(resamples × columns) means of `diffs`; see bootstrap_batches."""
+    return np.concatenate(list(bootstrap_batches(diffs, resamples, seed)))
+
+
+def bootstrap_ci(diffs, confidence=CONFIDENCE, resamples=BOOTSTRAP_RESAMPLES, seed=BOOTSTRAP_SEED,
+                 tolerance=BOOTSTRAP_TOLERANCE):
+    """(low, high, resamples drawn): percentile intervals per column of `diffs`.
+
+    Resampling stops early once at least BOOTSTRAP_MIN_RESAMPLES are drawn and
+    no endpoint moved more than `tolerance` over the last batch; `resamples`
+    is the cap. With a fixed seed the result is still reproducible.
+    """
+    means, previous = [], None
+    for batch in bootstrap_batches(diffs, resamples, seed):
+        means.append(batch)
+        drawn = sum(len(m) for m in means)
+        if drawn < min(BOOTSTRAP_MIN_RESAMPLES, resamples):
+            continue
+        ci = percentile_ci(np.concatenate(means), confidence)
+        if previous is not None and np.nan_to_num(np.abs(ci - previous)).max(initial=0) <= tolerance:
+            break
+        previous = ci
+    return ci[0], ci[1], drawn
+
+
+def percentile_ci(means, confidence=CONFIDENCE):
+    """Percentile interval per column, ignoring resamples where a column had no answers."""
+    tail = (1 - confidence) / 2 * 100
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # an all-NaN column -> NaN bounds
+        return np.nanpercentile(means, [tail, 100 - tail], axis=0)
+
+
+def betainc(a, b, x):
+    """Regularized incomplete beta I_x(a, b), by Lentz's continued fraction."""
+    if x <= 0 or x >= 1:
+        return float(x >= 1)
+    if x > (a + 1) / (a + b + 2):  # the fraction converges fast only below this point
+        return 1 - betainc(b, a, 1 - x)
+    tiny = 1e-300
+    c, d = 1.0, 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        for num in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                    -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + num * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + num / c
+            c = c if abs(c) > tiny else tiny
+            h *= c * d
+        if abs(c * d - 1) < 1e-15:
+            break
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1 - x))
+    return front * h / a
+
+
+def paired_t(d):
+    """(t, two-sided p) of a paired t-test on the differences `d`; (None, None) below two pairs."""
+    n = len(d)
+    if n < 2:
+        return None, None
+    mean, sd = float(d.mean()), float(d.std(ddof=1))
+    if sd == 0:
+        return None, 1.0 if mean == 0 else 0.0
+    t = mean / (sd / math.sqrt(n))
+    df = n - 1
+    return t, betainc(df / 2, 0.5, df / (df + t * t))
+
+
+def wilcoxon_signed_rank(d):
+    """(W+, two-sided p) of the Wilcoxon signed-rank test on `d`.
+
+    Zero differences are dropped and tied magnitudes share their mean rank.
+    Up to WILCOXON_EXACT_MAX pairs the p-value comes from the exact null
+    distribution of the (tied) ranks; above that, from the normal approximation
+    with tie and continuity corrections.
+    """
+    d = d[d != 0]
+    n = len(d)
+    if n == 0:
+        return 0.0, 1.0
+    _, inverse, counts = np.unique(np.abs(d), return_inverse=True, return_counts=True)
+    doubled = (2 * np.cumsum(counts) - counts + 1)[inverse]   # 2 × mean rank: always an integer
+    w2 = int(doubled[d > 0].sum())
+    if n <= WILCOXON_EXACT_MAX:
+        dist = np.zeros(int(doubled.sum()) + 1)
+        dist[0] = 1.0
+        for r in doubled:  # each rank is either in W+ or not: convolve with {0, r}
+            dist[r:] = dist[r:] + dist[:-r]
+        tail = min(dist[:w2 + 1].sum(), dist[w2:].sum()) / dist.sum()
+        return w2 / 2, min(1.0, 2 * tail)
+    mean = n * (n + 1) / 4
+    var = n * (n + 1) * (2 * n + 1) / 24 - float(((counts ** 3) - counts).sum()) / 48
+    z = max(abs(w2 / 2 - mean) - 0.5, 0) / math.sqrt(var)
+    return w2 / 2, math.erfc(z / math.sqrt(2))
+
+
+def improvement_uncertainty(diffs, confidence=CONFIDENCE, resamples=BOOTSTRAP_RESAMPLES,
+                            seed=BOOTSTRAP_SEED):
+    """Bootstrap CI and paired tests of the mean gain, per column of `diffs`.
+
+    `diffs` is (respondents × columns) post − pre, NaN where a pair is missing.
+    Returns (resamples drawn, one {n, mean, ci_low, ci_high, t, p_ttest, w,
+    p_wilcoxon} per column), with None where a statistic is undefined.
+    """
+    if len(diffs):
+        low, high, drawn = bootstrap_ci(diffs, confidence, resamples, seed)
+    else:
+        (low, high), drawn = np.full((2, diffs.shape[1]), np.nan), 0
+    r = lambda v, nd: None if v is None or np.isnan(v) else round(float(v), nd)
+    out = []
+    for j in range(diffs.shape[1]):
+        d = diffs[:, j][~np.isnan(diffs[:, j])]
+        t, p_t = paired_t(d)
+        w, p_w = wilcoxon_signed_rank(d) if len(d) else (None, None)
+        out.append({
+            "n": len(d),
+            "mean": r(d.mean(), 2) if len(d) else None,
+            "ci_low": r(low[j], 3), "ci_high": r(high[j], 3),
+            "t": r(t, 3), "p_ttest": r(p_t, 4),
+            "w": w, "p_wilcoxon": r(p_w, 4),
+        })
+    return drawn, out
+
+
+def gain_uncertainty(topics, pre_scores, post_scores):
+    """{"resamples", "overall", "topics": {key: ...}} uncertainty of the gains of matched respondents.
+
+    One bootstrap batch covers every topic's gain and each respondent's
+    overall gain (their mean topic gain, rounded as in the headline average).
+    """
+    diffs = post_scores - pre_scores
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # respondents with no answered pair
+        gains = np.round(np.nanmean(diffs, axis=1), 2)
+    drawn, (*per_topic, overall) = improvement_uncertainty(np.column_stack([diffs, gains]))
+    return {"resamples": drawn, "overall": overall, "topics": dict(zip(topics, per_topic))}
+
+
+# ============================================================================
+# SESSION METRICS
+# ============================================================================
+
+def column(table, name, rows):
+    """Column values for the given rows, or an empty column if not exported."""
+    if not name or name not in table:
+        return np.full(len(rows), '', dtype=str)
+    return table[name][rows]
+
+
+def score_matrix(table, names, rows):
+    """(rows × topics) matrix of 1-5 scores."""
+    return np.column_stack([to_scores(column(table, n, rows)) for n in names] or [np.empty((len(rows), 0))])
+
+
+def compute_session(spec, pre, post):
+    """Build the full sls_kpi document for one session from loaded CSV columns."""
+    id_col = spec.get('id_column', 'Email')
+    cols = spec.get('columns', {})
+    topics = spec['topics']
+
+    pre_rows, post_rows, m_pre, m_post = match_respondents(normalize_ids(pre[id_col]),
+                                                           normalize_ids(post[id_col]))
+    n_pre, n_post, n_matched = len(pre_rows), len(post_rows), len(m_pre)
+
+    # ── Knowledge growth: (matched respondents × topics) score matrices ──
+    pre_scores = score_matrix(pre, [t['pre'] for t in topics.values()], m_pre)
+    post_scores = score_matrix(post, [t['post'] for t in topics.values()], m_post)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN rows/topics -> NaN
+        topic_pre = np.nanmean(pre_scores, axis=0)
+        topic_post = np.nanmean(post_scores, axis=0)
+        respondent_pre = np.nanmean(pre_scores, axis=1)
+        respondent_post = np.nanmean(post_scores, axis=1)
+        gains = np.nanmean(post_scores - pre_scores, axis=1)
+    gains = np.round(gains[~np.isnan(gains)], 2)
+
+    # ── Connect & impact (matched post responses) ──
+    satisfaction_answers = column(post, cols.get('satisfaction'), m_post)
+    sat_scores = to_scores(satisfaction_answers, SATISFACTION_SCALE)
+
+    return session_document(spec, {
+        "n_pre": n_pre, "n_post": n_post, "n_matched": n_matched,
+        "topic_pre": topic_pre, "topic_post": topic_post,
+        "pre_score_distribution": score_distribution(respondent_pre),
+        "post_score_distribution": score_distribution(respondent_post),
+        "n_paired": len(gains),
+        "improved": int(np.count_nonzero(gains > 0)),
+        "significant": int(np.count_nonzero(gains >= SIGNIFICANT_GAIN)),
+        "gain_mean": float(gains.mean()) if len(gains) else 0.0,
+        "improvement_distribution": improvement_distribution(gains),
+        "improvement_stats": improvement_stats(gains),
+        "uncertainty": gain_uncertainty(topics, pre_scores, post_scores),
+        "action": value_counts(column(post, cols.get('action_plan'), m_post)),
+        "satisfaction": value_counts(satisfaction_answers),
+        "recommend": value_counts(column(post, cols.get('recommend'), m_post)),
+        "avg_satisfaction": float(np.nanmean(sat_scores)) if np.any(~np.isnan(sat_scores)) else float('nan'),
+        # ── Demographics (every pre respondent) ──
+        "location": value_counts(column(pre, cols.get('location'), pre_rows)),
+        "academic_level": value_counts(column(pre, cols.get('academic_level'), pre_rows)),
+        "heard_about": value_counts(column(pre, cols.get('heard_about'), pre_rows)),
+    })
+
+
+def session_document(spec, agg):
+    """The sls_kpi document from a session's aggregates.
+
+    `agg` holds respondent counts, per-topic mean scores (NaN when unanswered),
+    gain summaries and answer counts; compute_session() builds it from full
+    exports (adding the gains' CIs and tests as "uncertainty"),
+    live_ingest.LiveMetrics from running totals.
+    """
+    topics = spec['topics']
+    n_pre, n_matched, n_paired = agg['n_pre'], agg['n_matched'], agg['n_paired']
+
+    metrics = {
+        "total_responses": n_matched,
+        "total_participants_pre": n_pre,
+        "total_participants_post": agg['n_post'],
+        "match_rate_pct": pct(n_matched, n_pre),
+        "grow_members_reporting_growth_pct": pct(agg['improved'], n_paired),
+        "grow_avg_knowledge_increase": round(agg['gain_mean'], 2) if n_paired else 0.0,
+    }
+    for (key, _), p, q in zip(topics.items(), agg['topic_pre'], agg['topic_post']):
+        p, q = (0.0 if np.isnan(p) else round(float(p), 2)), (0.0 if np.isnan(q) else round(float(q), 2))
+        metrics[key] = {"pre": p, "post": q, "improvement": round(q - p, 2)}
+    metrics["grow_improvement_distribution"] = agg['improvement_distribution']
+    metrics["grow_pre_score_distribution"] = agg['pre_score_distribution']
+    metrics["grow_post_score_distribution"] = agg['post_score_distribution']
+    metrics["grow_significant_growth_pct"] = pct(agg['significant'], n_paired)
+    metrics["improvement_stats"] = agg['improvement_stats']
+    if 'uncertainty' in agg:  # needs the paired responses; live running totals don't keep them
+        metrics["improvement_uncertainty"] = {
+            "method": "percentile bootstrap; Wilcoxon signed-rank and paired t-test, two-sided",
+            "confidence": CONFIDENCE,
+            "seed": BOOTSTRAP_SEED,
+            **agg['uncertainty'],
+        }
+
+    action, satisfaction, recommend = agg['action'], agg['satisfaction'], agg['recommend']
+    n_action, n_sat, n_rec = sum(action.values()), sum(satisfaction.values()), sum(recommend.values())
+    planning = share(action, ACTION_YES)
+    avg_satisfaction = agg['avg_satisfaction']
+
+    metrics.update({
+        "connect_members_planning_action_pct": pct(planning, n_action),
+        "connect_total_planning_action": planning,
+        "connect_action_plan_distribution": action,
+        "impact_avg_satisfaction": 0.0 if np.isnan(avg_satisfaction) else round(avg_satisfaction, 2),
+        "impact_satisfaction_pct": pct(share(satisfaction, SATISFIED), n_sat),
+        "impact_satisfaction_distribution": satisfaction,
+        "impact_likely_recommend_pct": pct(share(recommend, LIKELY), n_rec),
+        "impact_recommend_distribution": recommend,
+        "impact_people_impacted_estimate": planning,
+    })
+
+    location, academic, heard = agg['location'], agg['academic_level'], agg['heard_about']
+    metrics["demographics_location"] = location
+    metrics["demographics_academic_level"] = academic
+    metrics["demographics_heard_about"] = heard
+
+    chapter = {
+        "event_name": "SLS Chapter Event",
+        "total_pre_responses": n_pre,
+        "total_post_responses": agg['n_post'],
+        "completed_both_surveys": n_matched,
+        "completion_rate_pct": pct(n_matched, n_pre),
+        "attendance_rate": pct(n_matched, n_pre),
+    }
+    chapter.update(spec.get('chapter', {}))
+    metrics["chapter_metrics"] = chapter
+
+    visualization = {
+        "knowledge_comparison": {
+            "topics": [t['label'] for t in topics.values()],
+            "pre_scores": [metrics[k]['pre'] for k in topics],
+            "post_scores": [metrics[k]['post'] for k in topics],
+            "improvements": [metrics[k]['improvement'] for k in topics],
+        },
+        "location_data": location,
+        "academic_level_data": academic,
+        "heard_about_data": heard,
+        "satisfaction_data": satisfaction,
+        "recommend_data": recommend,
+        "action_plan_data": action,
+        "improvement_distribution": metrics["grow_improvement_distribution"],
+        "pre_score_distribution": metrics["grow_pre_score_distribution"],
+        "post_score_distribution": metrics["grow_post_score_distribution"],
+    }
+
+    metadata = {
+        "generated_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "total_participants": n_pre,
+        "analysis_version": ENGINE_VERSION,
+        "privacy_safe": True,
+    }
+    return {"metrics": metrics, "visualization_data": visualization, "metadata": metadata}
+
+
+def segment_metrics(agg, topics):
+    """sls_kpi metric overrides for one SegmentCube.select() result."""
+    n_paired = agg['paired']
+    metrics = {
+        "total_responses": agg['n'],
+        "grow_members_reporting_growth_pct": pct(agg['improved'], n_paired),
+        "grow_avg_knowledge_increase": round(agg['gain_sum'] / n_paired, 2) if n_paired else 0.0,
+        "grow_significant_growth_pct": pct(agg['significant'], n_paired),
+    }
+    levels = np.arange(1, 6)
+    mean = lambda h: round(float(h @ levels / h.sum()), 2) if h.sum() else 0.0
+    for key in topics:
+        p, q = mean(agg['likert'][f"{key}_pre"]), mean(agg['likert'][f"{key}_post"])
+        metrics[key] = {"pre": p, "post": q, "improvement": round(q - p, 2)}
+
+    satisfaction = agg['likert'].get("satisfaction", np.zeros(5))
+    action = agg['categories'].get("action_plan", {})
+    recommend = agg['categories'].get("recommend", {})
+    planning = share(action, ACTION_YES)
+    metrics.update({
+        "connect_members_planning_action_pct": pct(planning, sum(action.values())),
+        "connect_total_planning_action": planning,
+        "impact_avg_satisfaction": mean(satisfaction),
+        "impact_satisfaction_pct": pct(int(satisfaction[3:].sum()), int(satisfaction.sum())),
+        "impact_likely_recommend_pct": pct(share(recommend, LIKELY), sum(recommend.values())),
+    })
+    return metrics
+
+
+def respondent_columns(spec, pre, post):
+    """Per-respondent columns of the matched respondents, for write_store()."""
+    id_col = spec.get('id_column', 'Email')
+    cols = spec.get('columns', {})
+    _, _, m_pre, m_post = match_respondents(normalize_ids(pre[id_col]), normalize_ids(post[id_col]))
+
+    likert = {}
+    for key, topic in spec['topics'].items():
+        likert[f"{key}_pre"] = to_scores(column(pre, topic['pre'], m_pre))
+        likert[f"{key}_post"] = to_scores(column(post, topic['post'], m_post))
+    likert["satisfaction"] = to_scores(column(post, cols.get('satisfaction'), m_post), SATISFACTION_SCALE)
+    categories = {name: column(pre, cols.get(name), m_pre)
+                  for name in ('location', 'academic_level', 'heard_about')}
+    categories.update({name: column(post, cols.get(name), m_post)
+                       for name in ('recommend', 'action_plan')})
+    return likert, categories
+
+
+# ============================================================================
+# BATCH DRIVER
+# ============================================================================
+
+def build_session(name, spec, base_dir='.'):
+    """Load one session's exports, compute its document and write it. Returns (path, seconds)."""
+    resolve = lambda p: p if os.path.isabs(p) else os.path.join(base_dir, p)
+    start = time.perf_counter()
+    pre, post = read_columns(resolve(spec['pre'])), read_columns(resolve(spec['post']))
+    doc = compute_session(spec, pre, post)
+    out = resolve(spec.get('output', f"sls_kpi_{name}.json"))
+    tmp = out + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(doc, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, out)
+    if spec.get('respondents'):
+        likert, categories = respondent_columns(spec, pre, post)
+        write_store(resolve(spec['respondents']), likert, categories)
+    return out, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate sls_kpi_*.json files from raw survey exports.")
+    parser.add_argument('manifest', help="JSON manifest describing each session")
+    parser.add_argument('sessions', nargs='*', help="session names to build (default: all)")
+    args = parser.parse_args(argv)
+
+    with open(args.manifest, encoding='utf-8') as f:
+        sessions = json.load(f)['sessions']
+    base_dir = os.path.dirname(os.path.abspath(args.manifest))
+    unknown = [s for s in args.sessions if s not in sessions]
+    if unknown:
+        parser.error(f"unknown session(s): {', '.join(unknown)}")
+
+    for name in args.sessions or sessions:
+        out, secs = build_session(name, sessions[name], base_dir)
+        print(f"{name}: wrote {out} in {secs * 1000:.0f} ms (v{ENGINE_VERSION})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""Cross-session trends: one date-indexed KPI series built from every session file.
+
+Each session file is reduced to a single point: its `metadata.generated_date`
+and headline KPIs (satisfaction, knowledge growth, match rate, NPS,
+responses). Points are kept in an index on disk, keyed by file path and
+(mtime, size), so building the series re-reads only the files that are new or
+changed since the last build. The series itself is a few numpy columns sorted
+by date. A trend page over hundreds of sessions costs one small JSON read,
+not hundreds of large ones. Refresh the index for every KPI session in the
+app's registry (e.g. at deploy) and print the series with:
+
+    python portfolio.py
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+
+from file_watch import signature
+
+
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "portfolio_index.json")
+INDEX_VERSION = 1
+KPI_TYPES = ("standard", "health")  # dashboard types whose files carry these metrics
+
+# name -> (label, unit)
+KPIS = {
+    "satisfaction": ("Average Satisfaction", "/5"),
+    "growth":       ("Knowledge Growth", " pts"),
+    "match_rate":   ("Match Rate", "%"),
+    "nps":          ("Net Promoter Score", ""),
+}
+# NPS on the surveys' 5-point recommend scale: top box promotes, the middle
+# answer is passive, the rest detract.
+NPS_PROMOTERS = ("Very likely",)
+NPS_PASSIVES = ("Likely",)
+
+
+# ============================================================================
+# SESSION POINTS
+# ============================================================================
+
+def nps(distribution):
+    """Promoters minus detractors, as % of answers (None without answers)."""
+    total = sum(distribution.values()) if distribution else 0
+    if not total:
+        return None
+    promoters = sum(distribution.get(k, 0) for k in NPS_PROMOTERS)
+    passives = sum(distribution.get(k, 0) for k in NPS_PASSIVES)
+    return round((2 * promoters + passives - total) / total * 100, 1)
+
+
+def session_point(doc):
+    """{date, KPIs...} for one sls_kpi document; KPIs the file doesn't report are None."""
+    metrics = doc.get('metrics') or {}
+    date = (doc.get('metadata') or {}).get('generated_date')
+    answered = lambda key: bool(metrics.get(key))  # the engine writes 0 when nobody answered
+    return {
+        "date": str(date) if date else None,
+        "responses": metrics.get('total_responses'),
+        "satisfaction": metrics.get('impact_avg_satisfaction') if answered('impact_satisfaction_distribution') else None,
+        "growth": metrics.get('grow_avg_knowledge_increase'),
+        "match_rate": metrics.get('match_rate_pct'),
+        "nps": nps(metrics.get('impact_recommend_distribution')),
+    }
+
+
+def parse_date(text):
+    for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(text, fmt)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+def load_index(path=INDEX_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return index.get('files', {}) if index.get('version') == INDEX_VERSION else {}
+
+
+def save_index(files, path=INDEX_PATH):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({"version": INDEX_VERSION, "files": files}, f, indent=1, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def refresh_points(paths, index_path=INDEX_PATH):
+    """{path: point} for `paths`, reading only files whose signature moved since
+    the index was written. Unreadable files map to None. Returns (points, files re-read)."""
+    files = load_index(index_path)
+    points, reread = {}, 0
+    for path in paths:
+        sig = signature(path)
+        entry = files.get(path)
+        if sig is None:
+            points[path] = None
+            continue
+        if entry is None or entry.get('signature') != list(sig):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    point = session_point(json.load(f))
+            except (OSError, ValueError):
+                point = None
+            entry = files[path] = {"signature": list(sig), "point": point}
+            reread += 1
+        points[path] = entry['point']
+    if reread:
+        try:
+            save_index(files, index_path)
+        except OSError:
+            pass  # read-only deploy: the series is still right, just not persisted
+    return points, reread
+
+
+# ============================================================================
+# SERIES
+# ============================================================================
+
+class Portfolio:
+    """KPI columns of every dated session, sorted by generated date.
+
+    `undated` lists sessions left out because their file is missing,
+    unreadable or has no usable `metadata.generated_date`.
+    """
+
+    def __init__(self, sessions, points):
+        rows, self.undated = [], []
+        for name, point in zip(sessions, points):
+            date = parse_date(point['date']) if point else None
+            if date is None:
+                self.undated.append(name)
+            else:
+                rows.append((date, name, point))
+        rows.sort(key=lambda r: r[0])
+        self.sessions = [name for _, name, _ in rows]
+        self.dates = np.array([d for d, _, _ in rows], dtype='datetime64[s]')
+        self.responses = np.array([p['responses'] or 0 for _, _, p in rows], dtype=np.int64)
+        self.kpis = {k: np.array([np.nan if p[k] is None else p[k] for _, _, p in rows], dtype=float)
+                     for k in KPIS}
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def latest(self, kpi):
+        """(value, session) of the most recent session reporting `kpi`, or (None, None)."""
+        values = self.kpis[kpi]
+        reported = np.flatnonzero(~np.isnan(values))
+        if not len(reported):
+            return None, None
+        return float(values[reported[-1]]), self.sessions[reported[-1]]
+
+    def change(self, kpi):
+        """Latest minus first reported value (None with fewer than two reports)."""
+        values = self.kpis[kpi][~np.isnan(self.kpis[kpi])]
+        return round(float(values[-1] - values[0]), 2) if len(values) > 1 else None
+
+    def table(self):
+        """Column-wise rows for st.dataframe."""
+        return {"Session": self.sessions,
+                "Generated": [str(d).replace('T', ' ') for d in self.dates],
+                "Responses": self.responses.tolist(),
+                **{label: [None if np.isnan(v) else v for v in self.kpis[k]]
+                   for k, (label, _) in KPIS.items()}}
+
+
+def build_portfolio(sessions, index_path=INDEX_PATH):
+    """Portfolio over [(session name, data file), ...]."""
+    points, _ = refresh_points([path for _, path in sessions], index_path)
+    return Portfolio([name for name, _ in sessions], [points[path] for _, path in sessions])
+
+
+def kpi_sessions(initiative_info):
+    """[(session name, data file)] of an initiative's KPI dashboards, in registry order."""
+    return [(name, info['data_file']) for name, info in initiative_info['sessions'].items()
+            if info.get('type', 'standard') in KPI_TYPES and info.get('data_file')]
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh the portfolio index and print each initiative's KPI series.")
+    parser.add_argument('--index', default=INDEX_PATH)
+    args = parser.parse_args(argv)
+    from export_snapshots import load_registry
+
+    for initiative, info in load_registry().items():
+        sessions = kpi_sessions(info)
+        if len(sessions) < 2:
+            continue
+        points, reread = refresh_points([path for _, path in sessions], args.index)
+        series = Portfolio([name for name, _ in sessions], [points[path] for _, path in sessions])
+        print(f"{initiative}: {len(series)} dated session(s), {reread} file(s) re-read")
+        for row in zip(*series.table().values()):
+            print("  " + " | ".join("—" if v is None else f"{v:g}" if isinstance(v, float) else str(v)
+                                    for v in row))
+        for name in series.undated:
+            print(f"  skipped {name}: no readable file or generated_date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
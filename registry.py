@@ -0,0 +1,176 @@
+"""The initiative / session registry, loaded from registry.json and hot-reloaded.
+
+The app used to define INITIATIVES as a dict literal in its own source, so
+adding a session meant a code change and a restart that dropped every
+connected viewer. Now the registry lives in registry.json (or the file named
+by SLS_REGISTRY). It is read into an immutable snapshot built from
+shared_data's FrozenDict / FrozenList, so no reader can change what another
+reader sees.
+
+    REGISTRY.current()     the published snapshot (read on first use); no lock
+    REGISTRY.reload()      parse the file and publish a new snapshot
+    REGISTRY.watch(...)    reload on a background FileWatcher thread whenever
+                           the file's content changes
+
+Publishing a snapshot is a single reference assignment. A script run that
+read the old snapshot finishes with it, and the next run sees the new one.
+A file that fails to parse or validate is reported and the old snapshot
+stays live. Subscribers are called with (old, new, changed) after each
+publish. `changed` lists the (initiative, session) pairs that were added,
+removed or edited, which lets the app drop only those sessions' caches.
+
+Check the file without starting the app:
+
+    python registry.py
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+
+from file_watch import FileWatcher
+from shared_data import freeze
+
+
+REGISTRY_PATH = os.environ.get(
+    "SLS_REGISTRY", os.path.join(os.path.dirname(os.path.abspath(__file__)), "registry.json"))
+REQUIRED_INITIATIVE = ("name", "icon", "description", "sessions")
+REQUIRED_SESSION = ("name", "icon", "vision_theme")
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def problems(registry):
+    """Structural problems in a parsed registry (data files are checked by session_schema)."""
+    if not isinstance(registry, dict) or not registry:
+        return ["the registry must be a non-empty object of initiatives"]
+    found = []
+    for initiative, info in registry.items():
+        if not isinstance(info, dict):
+            found.append(f"{initiative}: not an object")
+            continue
+        found += [f"{initiative}: missing '{key}'" for key in REQUIRED_INITIATIVE if key not in info]
+        sessions = info.get('sessions')
+        if not isinstance(sessions, dict):
+            if sessions is not None:
+                found.append(f"{initiative}: 'sessions' must be an object")
+            continue
+        for name, session in sessions.items():
+            if not isinstance(session, dict):
+                found.append(f"{initiative}/{name}: not an object")
+                continue
+            found += [f"{initiative}/{name}: missing '{key}'" for key in REQUIRED_SESSION if key not in session]
+            if not session.get('data_file') and not session.get('sources'):
+                found.append(f"{initiative}/{name}: needs a 'data_file' or 'sources'")
+    return found
+
+
+def load_registry(path=REGISTRY_PATH):
+    """The registry as plain (mutable) dicts; raises OSError / ValueError."""
+    with open(path, encoding='utf-8') as f:
+        try:
+            registry = json.load(f)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+    found = problems(registry)
+    if found:
+        raise ValueError(f"{path}: " + "; ".join(found))
+    return registry
+
+
+def changed_sessions(old, new):
+    """(initiative, session) pairs added, removed or edited between two snapshots."""
+    def sessions(snapshot):
+        return {(i, s): info for i, initiative in (snapshot or {}).items()
+                for s, info in initiative['sessions'].items()}
+    before, after = sessions(old), sessions(new)
+    return sorted(key for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+
+
+# ============================================================================
+# LIVE REGISTRY
+# ============================================================================
+
+class Registry:
+    """Holds the published snapshot; reloads are serialized, reads are lock-free."""
+
+    def __init__(self, path=REGISTRY_PATH, log=sys.stderr):
+        self.path = path
+        self.log = log
+        self.version = 0
+        self.snapshot = None
+        self._subscribers = []
+        self._lock = threading.Lock()  # writers only
+        self._watcher = None
+
+    def reload(self):
+        """Publish the file's current content; returns the changed sessions, or None if it was rejected."""
+        with self._lock:
+            try:
+                snapshot = freeze(load_registry(self.path))
+            except (OSError, ValueError) as e:
+                if self.snapshot is None:
+                    raise
+                print(f"[registry] kept version {self.version}: {e}", file=self.log)
+                return None
+            old, changed = self.snapshot, changed_sessions(self.snapshot, snapshot)
+            if old is not None and not changed and old == snapshot:
+                return []
+            self.snapshot = snapshot
+            self.version += 1
+            subscribers = list(self._subscribers)
+        if old is not None:
+            print(f"[registry] version {self.version}: {len(changed)} session(s) changed", file=self.log)
+        for callback in subscribers:
+            callback(old, snapshot, changed)
+        return changed
+
+    def current(self):
+        """The published snapshot, loading the file on first use."""
+        if self.snapshot is None:
+            self.reload()
+        return self.snapshot
+
+    def subscribe(self, callback):
+        """Call `callback(old, new, changed)` after every published reload."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def watch(self, interval=2.0):
+        """Reload on a background thread whenever the file's content changes."""
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = FileWatcher(interval, log=self.log)
+                self._watcher.watch(self.path, lambda path: self.reload())
+                self._watcher.start()
+        return self
+
+
+REGISTRY = Registry()
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the session registry and list its sessions.")
+    parser.add_argument('path', nargs='?', default=REGISTRY_PATH)
+    args = parser.parse_args(argv)
+    try:
+        registry = load_registry(args.path)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    for initiative, info in registry.items():
+        print(f"{initiative}: {len(info['sessions'])} session(s)")
+        for name, session in info['sessions'].items():
+            print(f"  {name} [{session.get('type', 'standard')}]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""Opt-in render-time instrumentation for the dashboards.
+
+Enable with `SLS_PROFILE=1` in the environment or `?profile=1` in the URL.
+While a run is being profiled, `st.markdown`, `st.image`, `st.plotly_chart`
+and `st.tabs` are timed and sized. The page is split into sections at each
+header, `section-title` / `subsection-title` heading and tab, so a run reads like:
+
+    page setup   css         12.1 ms   18 KB
+    header       image       40.3 ms  210 KB
+    📊 Key Performance Indicators    8.0 ms   14 KB
+    🌱 Knowledge Development         ...
+
+Every profiled run is appended as one JSON line to SLS_PROFILE_LOG
+(default render_timings.jsonl). Summarise a log across reruns with:
+
+    python render_profile.py render_timings.jsonl
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+LOG_PATH = os.environ.get("SLS_PROFILE_LOG", "render_timings.jsonl")
+HEADER = re.compile(r'class="(?:sls|lnc)-header"')
+SECTION_TITLE = re.compile(r'class="(sub)?section-title"[^>]*>(.*?)</p>', re.S)
+
+_current = threading.local()  # one script run per thread
+_install_lock = threading.Lock()
+_log_lock = threading.Lock()
+_installed = False
+
+
+def enabled(query_params=None):
+    if os.environ.get("SLS_PROFILE", "").lower() in ("1", "true", "yes"):
+        return True
+    return bool(query_params) and query_params.get("profile") in ("1", "true")
+
+
+# ============================================================================
+# PER-RUN RECORDER
+# ============================================================================
+
+class RenderProfile:
+    """Wall time and payload bytes of one script run, by section and by call."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.sections = []  # [name, started, ms, bytes, elements]
+        self.calls = []     # {"section", "kind", "name", "ms", "bytes"}
+        self.begin("page setup")
+
+    @property
+    def section(self):
+        return self.sections[-1][0]
+
+    def begin(self, name):
+        now = time.perf_counter()
+        if self.sections:
+            self.sections[-1][2] = (now - self.sections[-1][1]) * 1000
+        self.sections.append([name, now, 0.0, 0, 0])
+
+    def record(self, kind, name, ms, nbytes):
+        self.sections[-1][3] += nbytes
+        self.sections[-1][4] += 1
+        if kind != "markdown":
+            self.calls.append({"section": self.section, "kind": kind, "name": name,
+                               "ms": round(ms, 2), "bytes": nbytes})
+
+    def finish(self):
+        self.begin("")  # closes the last real section
+        self.sections.pop()
+        return {
+            "total_ms": round((time.perf_counter() - self.start) * 1000, 2),
+            "sections": [{"section": name, "ms": round(ms, 2), "bytes": nbytes, "elements": n}
+                         for name, _, ms, nbytes, n in self.sections],
+            "calls": self.calls,
+        }
+
+
+def current():
+    return getattr(_current, "profile", None)
+
+
+def start(enabled=True):
+    """Begin profiling this thread's run (or clear a run abandoned by st.stop())."""
+    _current.profile = RenderProfile() if enabled else None
+    return _current.profile
+
+
+def mark(name):
+    """Start a named section, when profiling."""
+    profile = current()
+    if profile is not None:
+        profile.begin(name)
+
+
+def stop():
+    profile, _current.profile = current(), None
+    return profile.finish() if profile else None
+
+
+# ============================================================================
+# STREAMLIT HOOKS
+# ============================================================================
+
+def _timed(kind, original, payload):
+    def wrapper(*args, **kwargs):
+        profile = current()
+        if profile is None:
+            return original(*args, **kwargs)
+        body, what = (args[0] if args else None), kind
+        if what == "markdown" and isinstance(body, str):
+            title = SECTION_TITLE.search(body)
+            if title:
+                name = re.sub(r'<[^>]+>', '', title.group(2)).strip()
+                if title.group(1):  # subsection: nest under the current section
+                    name = f"{profile.section.split(' › ')[0]} › {name}"
+                profile.begin(name)
+            elif HEADER.search(body):
+                profile.begin("header")
+            elif "<style>" in body or 'rel="stylesheet"' in body:
+                what = "css"
+            elif body.startswith("<picture"):
+                what = "image"
+        t = time.perf_counter()
+        result = original(*args, **kwargs)
+        ms = (time.perf_counter() - t) * 1000
+        name, nbytes = payload(body)
+        profile.record(what, name, ms, nbytes)
+        return result
+    return wrapper
+
+
+def _markdown_payload(body):
+    return "", len(body.encode("utf-8")) if isinstance(body, str) else 0
+
+
+def _image_payload(image):
+    if isinstance(image, str) and os.path.exists(image):
+        return image, os.path.getsize(image)
+    return type(image).__name__, getattr(image, "nbytes", 0)
+
+
+def _chart_payload(fig):
+    title = getattr(getattr(getattr(fig, "layout", None), "title", None), "text", None)
+    n = sum(c["kind"] == "chart" for c in current().calls) + 1
+    return title or f"chart {n}", len(fig.to_json()) if hasattr(fig, "to_json") else 0
+
+
+class _TimedTab:
+    """A tab container that opens a profiling section when entered."""
+
+    def __init__(self, tab, label):
+        self._tab, self._label = tab, label
+
+    def __enter__(self):
+        profile = current()
+        if profile is not None:
+            parent = profile.section.split(" › ")[0]
+            profile.begin(f"{parent} › {self._label}")
+        return self._tab.__enter__()
+
+    def __exit__(self, *exc):
+        return self._tab.__exit__(*exc)
+
+    def __getattr__(self, name):
+        return getattr(self._tab, name)
+
+
+def _timed_tabs(original):
+    def wrapper(tabs, *args, **kwargs):
+        containers = original(tabs, *args, **kwargs)
+        if current() is None:
+            return containers
+        return [_TimedTab(c, label) for c, label in zip(containers, tabs)]
+    return wrapper
+
+
+def install(st):
+    """Wrap the Streamlit calls once per process; unprofiled runs pass straight through."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        st.markdown = _timed("markdown", st.markdown, _markdown_payload)
+        st.image = _timed("image", st.image, _image_payload)
+        st.plotly_chart = _timed("chart", st.plotly_chart, _chart_payload)
+        st.tabs = _timed_tabs(st.tabs)
+        _installed = True
+
+
+# ============================================================================
+# LOG
+# ============================================================================
+
+def write_log(result, **context):
+    """Append one profiled run to the JSON-lines log."""
+    entry = {"ts": datetime.now().isoformat(timespec="seconds"), **context, **result}
+    with _log_lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def summarize(path):
+    """{(session, section): [ms per run, ...]} across every run in a log."""
+    timings = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            run = json.loads(line)
+            per_run = {"TOTAL": run["total_ms"]}
+            for s in run["sections"]:  # a section name can recur (app + renderer headers)
+                per_run[s["section"]] = per_run.get(s["section"], 0.0) + s["ms"]
+            for section, ms in per_run.items():
+                timings.setdefault((run.get("session", ""), section), []).append(ms)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise render timings across profiled reruns.")
+    parser.add_argument("log", nargs="?", default=LOG_PATH)
+    args = parser.parse_args(argv)
+
+    print(f"{'session':<32} {'section':<48} {'runs':>5} {'p50 ms':>9} {'p95 ms':>9}")
+    for (session, section), ms in sorted(summarize(args.log).items()):
+        p50, p95 = np.percentile(ms, [50, 95])
+        print(f"{session[:32]:<32} {section[:48]:<48} {len(ms):>5} {p50:>9.1f} {p95:>9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
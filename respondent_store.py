@@ -0,0 +1,239 @@
+"""Columnar on-disk store for per-respondent survey answers.
+
+A store is a folder with one `.npy` file per column plus `columns.json`:
+
+    respondents/cybersecurity/
+        columns.json        {"version": 1, "rows": 2500, "columns": {...}}
+        location.npy        int16 codes into the column's "labels" (-1 = blank)
+        grow_cyber_pre.npy  int8 Likert codes 1-5 (0 = blank)
+
+Columns are memory-mapped read-only on first use, so a dashboard touches only
+the columns it aggregates and every Streamlit session shares the same pages.
+"""
+import json
+import os
+
+import numpy as np
+
+
+STORE_VERSION = 1
+LIKERT = "likert"
+CATEGORY = "category"
+
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def likert_codes(scores):
+    """1-5 scores (floats, NaN for blank) -> int8 codes with 0 for blank."""
+    scores = np.asarray(scores, dtype=float)
+    codes = np.zeros(len(scores), dtype=np.int8)
+    valid = ~np.isnan(scores)
+    codes[valid] = np.clip(np.rint(scores[valid]), 1, 5).astype(np.int8)
+    return codes
+
+
+def category_codes(values):
+    """Answers -> (int16 codes, labels); blank answers get -1."""
+    values = np.char.strip(np.asarray(values, dtype=str))
+    labels, codes = np.unique(values, return_inverse=True)
+    codes = codes.astype(np.int16)
+    if len(labels) and labels[0] == '':
+        codes -= 1
+        labels = labels[1:]
+    return codes, [str(l) for l in labels]
+
+
+def save_column(path, name, codes):
+    """Write one column beside the old one, then swap it in: readers that have the
+    old file mapped keep their pages instead of seeing it truncated."""
+    final = os.path.join(path, f"{name}.npy")
+    with open(final + '.tmp', 'wb') as f:
+        np.save(f, codes)
+    os.replace(final + '.tmp', final)
+
+
+def write_store(path, likert=None, categories=None):
+    """Write a store. `likert` maps names to 1-5 scores, `categories` to answers."""
+    likert, categories = likert or {}, categories or {}
+    lengths = {len(v) for v in list(likert.values()) + list(categories.values())}
+    if len(lengths) > 1:
+        raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+    os.makedirs(path, exist_ok=True)
+
+    columns = {}
+    for name, scores in likert.items():
+        save_column(path, name, likert_codes(scores))
+        columns[name] = {"kind": LIKERT, "file": f"{name}.npy"}
+    for name, values in categories.items():
+        codes, labels = category_codes(values)
+        save_column(path, name, codes)
+        columns[name] = {"kind": CATEGORY, "file": f"{name}.npy", "labels": labels}
+
+    meta = {"version": STORE_VERSION, "rows": lengths.pop() if lengths else 0, "columns": columns}
+    tmp = os.path.join(path, "columns.json.tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, os.path.join(path, "columns.json"))
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+class RespondentStore:
+    """Read-only, lazily memory-mapped view of a store folder."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "columns.json"), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get("version") != STORE_VERSION:
+            raise ValueError(f"{path}: unsupported store version {meta.get('version')}")
+        self.rows = meta["rows"]
+        self.columns = meta["columns"]
+        self._arrays = {}
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def codes(self, name):
+        """The column's raw codes (a read-only memmap)."""
+        arr = self._arrays.get(name)
+        if arr is None:
+            arr = np.load(os.path.join(self.path, self.columns[name]["file"]), mmap_mode='r')
+            self._arrays[name] = arr
+        return arr
+
+    def labels(self, name):
+        col = self.columns[name]
+        return col["labels"] if col["kind"] == CATEGORY else [1, 2, 3, 4, 5]
+
+    def mask(self, **filters):
+        """Rows matching every filter; a filter value may be one label or a list of labels."""
+        keep = np.ones(self.rows, dtype=bool)
+        for name, wanted in filters.items():
+            if wanted is None:
+                continue
+            wanted = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            labels = self.labels(name)
+            wanted_codes = [labels.index(w) for w in wanted if w in labels]
+            keep &= np.isin(self.codes(name), wanted_codes)
+        return keep
+
+    def counts(self, name, mask=None):
+        """{label: respondents} for a column, optionally within `mask`."""
+        codes = self.codes(name) if mask is None else self.codes(name)[mask]
+        labels = self.labels(name)
+        if self.columns[name]["kind"] == LIKERT:
+            bins = np.bincount(codes.astype(np.intp), minlength=6)[1:6]
+        else:
+            bins = np.bincount(codes[codes >= 0].astype(np.intp), minlength=len(labels))
+        return {label: int(n) for label, n in zip(labels, bins)}
+
+    def mean(self, name, mask=None):
+        """Mean Likert score over answered rows (NaN if none)."""
+        codes = self.codes(name) if mask is None else self.codes(name)[mask]
+        answered = codes[codes > 0]
+        return float(answered.mean()) if len(answered) else float('nan')
+
+
+# ============================================================================
+# SEGMENT CUBE
+# ============================================================================
+
+class SegmentCube:
+    """Aggregates of a store pre-summed per combination of segment dimensions.
+
+    Every dimension gets one extra trailing cell for blank answers. Measures are
+    arrays of shape dims + (k,), so a filter is an index per dimension and a sum;
+    the respondent columns are never scanned again.
+    """
+
+    def __init__(self, dims, topics, labels, n, likert, categories, gains):
+        self.dims = dims
+        self.topics = topics          # topic keys with _pre/_post columns
+        self.labels = labels          # {dim or category column: [label, ...]}
+        self.n = n                    # dims + (1,)
+        self.likert = likert          # {column: dims + (5,)} answer histograms
+        self.categories = categories  # {column: dims + (labels,)} answer counts
+        self.gains = gains            # dims + (4,): paired, gain sum, improved, significant
+
+    def select(self, **filters):
+        """Aggregates for respondents matching every filter (label or list of labels)."""
+        index = []
+        for dim in self.dims:
+            wanted = filters.get(dim)
+            if wanted is None:
+                index.append(np.arange(len(self.labels[dim]) + 1))
+                continue
+            wanted = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            index.append(np.array([self.labels[dim].index(w) for w in wanted if w in self.labels[dim]],
+                                  dtype=np.intp))
+        cells = np.ix_(*index)
+        total = lambda arr: arr[cells].reshape(-1, arr.shape[-1]).sum(axis=0)
+        paired, gain_sum, improved, significant = total(self.gains)
+        return {
+            "n": int(total(self.n)[0]),
+            "likert": {name: total(h) for name, h in self.likert.items()},
+            "categories": {name: dict(zip(self.labels[name], total(c).tolist()))
+                           for name, c in self.categories.items()},
+            "paired": int(paired), "gain_sum": float(gain_sum),
+            "improved": int(improved), "significant": int(significant),
+        }
+
+
+def topic_pairs(store):
+    """Topic keys that have both `<key>_pre` and `<key>_post` Likert columns, in store order."""
+    return [name[:-4] for name, col in store.columns.items()
+            if col["kind"] == LIKERT and name.endswith("_pre") and f"{name[:-4]}_post" in store]
+
+
+def build_cube(store, dims, significant_gain=0.5):
+    """Pre-aggregate `store` over the category columns `dims` (missing ones are skipped)."""
+    dims = [d for d in dims if d in store and store.columns[d]["kind"] == CATEGORY]
+    shape = tuple(len(store.labels(d)) + 1 for d in dims)
+    size = int(np.prod(shape))
+    # Blank answers (-1) land in each dimension's trailing cell.
+    cell = np.ravel_multi_index([np.where(store.codes(d) < 0, len(store.labels(d)), store.codes(d))
+                                 for d in dims], shape) if dims else np.zeros(len(store), dtype=np.intp)
+
+    def per_cell(values, k):
+        """(cell, value) pair counts -> shape + (k,)."""
+        return np.bincount(cell * k + values, minlength=size * k).reshape(shape + (k,))
+
+    n = per_cell(np.zeros(len(store), dtype=np.intp), 1)
+    likert = {}
+    for name, col in store.columns.items():
+        if col["kind"] == LIKERT:
+            codes = store.codes(name).astype(np.intp)
+            keep = codes > 0
+            likert[name] = np.bincount(cell[keep] * 5 + codes[keep] - 1,
+                                       minlength=size * 5).reshape(shape + (5,))
+    categories = {}
+    for name, col in store.columns.items():
+        if col["kind"] == CATEGORY and name not in dims:
+            codes = store.codes(name).astype(np.intp)
+            keep = codes >= 0
+            k = max(len(col["labels"]), 1)
+            categories[name] = np.bincount(cell[keep] * k + codes[keep], minlength=size * k).reshape(shape + (k,))
+
+    # Per-respondent knowledge gain, averaged over topics (engine semantics).
+    gains = np.zeros(shape + (4,))
+    topics = topic_pairs(store)
+    if topics:
+        to_float = lambda name: np.where(store.codes(name) > 0, store.codes(name), np.nan).astype(float)
+        diffs = np.column_stack([to_float(f"{t}_post") - to_float(f"{t}_pre") for t in topics])
+        with np.errstate(invalid='ignore'):
+            paired = ~np.all(np.isnan(diffs), axis=1)
+            gain = np.round(np.nanmean(np.where(paired[:, None], diffs, 0.0), axis=1), 2)
+        for j, weights in enumerate((paired, np.where(paired, gain, 0.0),
+                                     paired & (gain > 0), paired & (gain >= significant_gain))):
+            gains[..., j] = np.bincount(cell, weights=weights.astype(float), minlength=size).reshape(shape)
+
+    labels = {name: store.labels(name) for name in list(dims) + list(categories)}
+    return SegmentCube(dims, topics, labels, n, likert, categories, gains)
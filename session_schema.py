@@ -0,0 +1,366 @@
+"""Per-type schemas for the session JSON files, checked once when a file loads.
+
+Each dashboard `type` lists the paths its renderer indexes directly, so a file
+missing one is rejected at load with every offending path instead of raising
+a KeyError halfway down the page. The KPI dashboards (standard and health)
+also get a typed, slotted SessionRecord, parsed once per data version, so
+their renderers read attributes instead of walking `.get` chains on every
+rerun. Check every file in the app's registry (e.g. before a deploy) with:
+
+    python session_schema.py
+"""
+import argparse
+import json
+import sys
+from dataclasses import dataclass, fields, replace
+
+
+class SchemaError(ValueError):
+    """A session file that doesn't match its dashboard type's schema."""
+
+
+NUMBER = "number"
+COUNTS = "counts"   # {label: number}
+LIST = "list"
+OBJECT = "object"
+
+HEALTH_DEFAULT_TOPIC_KEYS = ['grow_sector', 'grow_vision2030', 'grow_job_market', 'grow_skills']
+HEALTH_TOPICS = 4  # render_health lays its topic cards out in one row of four
+
+
+# ============================================================================
+# REQUIRED PATHS
+# ============================================================================
+
+def paths(prefix, kind, *keys):
+    return tuple(((*prefix, k), kind) for k in keys)
+
+
+# lnc_sector(): shared by the LNC dashboards and the cross-sector / combined views.
+LNC_SECTOR = (
+    paths(("respondents",), NUMBER, "pre", "post")
+    + paths(("pre",), COUNTS, "registration", "heard_about", "confidence", "conn_targets", "barriers")
+    + paths(("post",), COUNTS, "format_rating", "linkedin_conns", "meaningful", "nps", "recommendation",
+            "barriers_overcome")
+    + paths(("pre", "atmosphere"), NUMBER, "Comfortable\n& friendly", "A bit\noverwhelming")
+    + paths(("post", "atmosphere"), NUMBER, "Comfortable\n& friendly", "A bit\noverwhelming")
+)
+
+REQUIRED = {
+    "standard": paths(("metrics",), NUMBER, "total_responses")
+                + paths(("visualization_data", "knowledge_comparison"), LIST,
+                        "pre_scores", "post_scores", "improvements"),
+    "health": paths(("metrics",), NUMBER, "total_responses", "total_participants_pre",
+                    "total_participants_post", "match_rate_pct"),
+    "awareness": (
+        paths(("metrics",), NUMBER, "total_responses", "match_rate_pct")
+        + paths(("metrics", "awareness_summary"), NUMBER,
+                "aware_pre_pct", "aware_post_pct", "awareness_increase_pct_points")
+        + paths(("metrics", "awareness_distribution"), COUNTS, "pre", "post")
+        + paths(("visualization_data", "awareness_comparison"), LIST, "levels", "pre", "post")
+    ),
+    "comprehensive": paths((), OBJECT, "metrics"),
+    "lnc": (
+        LNC_SECTOR
+        + paths(("pre",), COUNTS, "nps", "experience", "goals")
+        + paths(("post",), COUNTS, "business_opps", "circles_helped", "goals_achieved", "research_opps",
+                "vs_other_events")
+        + paths(("pre", "nps"), NUMBER, "Promoters", "Detractors")
+        + paths(("post", "nps"), NUMBER, "Promoters", "Detractors")
+        + paths(("pre", "registration"), NUMBER, "Excellent")
+        + paths(("pre", "confidence"), NUMBER, "Extremely confident")
+        + paths(("pre", "experience"), NUMBER, "Very Good")
+        + paths(("post", "experience"), NUMBER, "Very Good")
+        + paths(("post", "format_rating"), NUMBER, "Excellent")
+        + paths(("post", "confidence_change"), NUMBER, "Significantly\nimproved", "Slightly\nimproved")
+        + paths(("post", "career_opps"), NUMBER, "Possibly", "Yes, definitely")
+        + paths(("post", "network_expanded"), NUMBER, "Significantly")
+        + paths(("post", "recommendation"), NUMBER, "Highly recommend")
+    ),
+    "lnc_tech": (
+        LNC_SECTOR
+        + paths(("pre",), COUNTS, "connection_types")
+        + paths(("post",), COUNTS, "connection_types")
+        + paths(("post", "nps"), NUMBER, "Promoters", "Passives", "Detractors")
+        + paths(("pre", "registration"), NUMBER, "Excellent")
+        + paths(("pre", "confidence"), NUMBER, "Very confident", "Confident")
+        + paths(("post", "confidence"), NUMBER, "Very confident", "Confident")
+        + paths(("post", "relevance"), NUMBER, "Very relevant", "Relevant")
+        + paths(("post", "recommendation"), NUMBER, "Very likely", "Likely")
+        + paths(("post", "format_rating"), NUMBER, "Excellent")
+        + paths(("post", "discussion_questions"), NUMBER, "Very helpful", "Helpful")
+    ),
+    "leaders_accelerator": (
+        paths(("respondents",), NUMBER, "pre", "post")
+        + paths(("pre",), COUNTS, "program_understanding", "track_clarity", "app_confidence",
+                "articulate_leadership", "heard_about", "location")
+        + paths(("post",), COUNTS, "program_understanding", "track_clarity", "app_confidence",
+                "articulate_leadership", "mentoring_helped")
+        + paths(("post", "recommendation"), NUMBER, "Very likely", "Likely")
+        + paths(("post", "plan_to_apply"), NUMBER, "Yes", "I have already applied")
+    ),
+}
+# Multi-source views: the schema every file in `sources` must meet.
+SOURCE_TYPES = {"lnc_cross": "lnc_sector", "lnc_combined": "lnc_sector"}
+REQUIRED["lnc_sector"] = LNC_SECTOR
+
+
+def path_name(path):
+    return "".join(f".{k}" if k.isidentifier() else f"[{k!r}]" for k in path).lstrip(".")
+
+
+def is_kind(value, kind):
+    number = lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)
+    if kind == NUMBER:
+        return number(value)
+    if kind == COUNTS:
+        return isinstance(value, dict) and all(number(v) for v in value.values())
+    if kind == LIST:
+        return isinstance(value, list)
+    return isinstance(value, dict)
+
+
+def check(doc, kind):
+    """Problems with `doc` against a type's required paths (empty if it conforms)."""
+    if not isinstance(doc, dict):
+        return [f"expected a JSON object, got {type(doc).__name__}"]
+    problems = []
+    for path, expected in REQUIRED[kind]:
+        node = doc
+        for depth, key in enumerate(path):
+            if not isinstance(node, dict) or key not in node:
+                problems.append(f"{path_name(path[:depth + 1])}: missing")
+                break
+            node = node[key]
+        else:
+            if not is_kind(node, expected):
+                problems.append(f"{path_name(path)}: expected {expected}, got {type(node).__name__}")
+    return problems
+
+
+# ============================================================================
+# RECORDS
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class Topic:
+    key: str | None   # metrics key (health); standard topics come positionally from visualization_data
+    label: str
+    pre: float
+    post: float
+    improvement: float
+    # From metrics.improvement_uncertainty (metrics_engine), when the file has it.
+    ci_low: float | None = None
+    ci_high: float | None = None
+    p_wilcoxon: float | None = None
+    p_ttest: float | None = None
+
+
+UNCERTAINTY_FIELDS = ("ci_low", "ci_high", "p_wilcoxon", "p_ttest")
+
+
+@dataclass(frozen=True, slots=True)
+class Chapter:
+    total_registered: int = 0
+    target_attendance: int = 50
+    actual_attendees: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class SessionRecord:
+    """Everything the standard and health dashboards read from a session file.
+
+    Metric fields keep their JSON names (and the renderers' old defaults), so
+    metrics_engine.segment_metrics() overrides apply with dataclasses.replace.
+    """
+    total_responses: int
+    total_participants_pre: int = 0
+    total_participants_post: int = 0
+    match_rate_pct: float = 0.0
+    grow_avg_knowledge_increase: float = 0.0
+    grow_members_reporting_growth_pct: float = 0.0
+    grow_significant_growth_pct: float = 0.0
+    connect_members_planning_action_pct: float = 0.0
+    connect_total_planning_action: int = 0
+    impact_avg_satisfaction: float = 0.0
+    impact_satisfaction_pct: float = 0.0
+    impact_likely_recommend_pct: float = 0.0
+    chapter: Chapter = Chapter()
+    topics: tuple[Topic, ...] = ()
+    action_plan: dict = None
+    satisfaction: dict = None
+    recommend: dict = None
+    location: dict = None
+    heard_about: dict = None
+    academic_level: dict = None
+    uncertainty: dict = None   # metrics.improvement_uncertainty without the per-topic entries
+
+    @property
+    def topic_labels(self):
+        return [t.label for t in self.topics]
+
+    @property
+    def pre_scores(self):
+        return [t.pre for t in self.topics]
+
+    @property
+    def post_scores(self):
+        return [t.post for t in self.topics]
+
+    @property
+    def improvements(self):
+        return [t.improvement for t in self.topics]
+
+
+METRIC_FIELDS = tuple(f.name for f in fields(SessionRecord)
+                      if f.name not in ("chapter", "topics", "action_plan", "satisfaction", "recommend",
+                                        "location", "heard_about", "academic_level", "uncertainty"))
+
+
+def metric_values(metrics):
+    return {name: metrics[name] for name in METRIC_FIELDS if metrics.get(name) is not None}
+
+
+def chapter_record(metrics):
+    chapter = metrics.get('chapter_metrics') or {}
+    return Chapter(**{f.name: chapter[f.name] for f in fields(Chapter) if chapter.get(f.name) is not None})
+
+
+def uncertainty_blocks(metrics, keys):
+    """(overall block, per-topic field dicts) from metrics.improvement_uncertainty.
+
+    Topics are matched by key, or by position when `keys` is None (standard
+    sessions); anything that doesn't line up is left without intervals.
+    """
+    block = metrics.get('improvement_uncertainty')
+    if not isinstance(block, dict) or not isinstance(block.get('topics'), dict):
+        return None, [{}] * len(keys or ())
+    per_topic = block['topics']
+    entries = [per_topic.get(k) for k in keys] if keys is not None else list(per_topic.values())
+    fields_of = lambda u: {f: u.get(f) for f in UNCERTAINTY_FIELDS} if isinstance(u, dict) else {}
+    return {k: v for k, v in block.items() if k != 'topics'}, [fields_of(u) for u in entries]
+
+
+def standard_record(doc, topic_labels):
+    metrics, viz = doc['metrics'], doc.get('visualization_data', {})
+    kc = viz['knowledge_comparison']
+    columns = (kc['pre_scores'], kc['post_scores'], kc['improvements'])
+    if any(len(c) != len(topic_labels) for c in columns):
+        raise SchemaError(f"visualization_data.knowledge_comparison has {len(kc['pre_scores'])} topics, "
+                          f"the registry lists {len(topic_labels)} topic_labels")
+    overall, intervals = uncertainty_blocks(metrics, None)
+    if len(intervals) != len(topic_labels):
+        overall, intervals = None, [{}] * len(topic_labels)
+    return SessionRecord(
+        **metric_values(metrics),
+        chapter=chapter_record(metrics),
+        topics=tuple(Topic(None, label, *scores, **ci)
+                     for label, ci, *scores in zip(topic_labels, intervals, *columns)),
+        uncertainty=overall,
+        action_plan=viz.get('action_plan_data') or {},
+        satisfaction=viz.get('satisfaction_data') or {},
+        recommend=viz.get('recommend_data') or {},
+    )
+
+
+def health_topic_keys(metrics, topic_keys=None):
+    """The registry's topic_keys, else the defaults if the file has them, else the file's own
+    `grow_*` topics in file order."""
+    if topic_keys:
+        return list(topic_keys)
+    if all(k in metrics for k in HEALTH_DEFAULT_TOPIC_KEYS):
+        return HEALTH_DEFAULT_TOPIC_KEYS
+    return [k for k, v in metrics.items() if k.startswith('grow_') and isinstance(v, dict) and 'post' in v]
+
+
+def health_record(doc, topic_labels, topic_keys=None):
+    metrics = doc['metrics']
+    keys = health_topic_keys(metrics, topic_keys)
+    if len(keys) != len(topic_labels) or len(keys) != HEALTH_TOPICS:
+        raise SchemaError(f"health sessions need {HEALTH_TOPICS} topics: found {len(keys)} "
+                          f"({', '.join(keys) or 'none'}) for {len(topic_labels)} topic_labels")
+    problems = [f"metrics.{k}: missing or not a {{pre, post, improvement}} object" for k in keys
+                if not (isinstance(metrics.get(k), dict)
+                        and all(is_kind(metrics[k].get(f, 0), NUMBER) for f in ("pre", "post", "improvement")))]
+    if problems:
+        raise SchemaError("; ".join(problems))
+    demographics = metrics.get('demographics') or {}
+    overall, intervals = uncertainty_blocks(metrics, keys)
+    return SessionRecord(
+        **metric_values(metrics),
+        chapter=chapter_record(metrics),
+        topics=tuple(Topic(k, label, metrics[k].get('pre', 0), metrics[k].get('post', 0),
+                           metrics[k].get('improvement', 0), **ci)
+                     for k, label, ci in zip(keys, topic_labels, intervals)),
+        uncertainty=overall,
+        location=demographics.get('location') or metrics.get('demographics_location') or {},
+        heard_about=demographics.get('heard_about') or metrics.get('demographics_heard_about') or {},
+        academic_level=demographics.get('academic_level') or {},
+    )
+
+
+def parse_session(session_info, data):
+    """Validate a session's loaded data against its type's schema.
+
+    Returns a SessionRecord for standard and health sessions and the (checked)
+    document(s) otherwise; raises SchemaError listing every problem.
+    """
+    kind = session_info.get('type', 'standard')
+    if kind in SOURCE_TYPES:
+        problems = [f"{src}: {p}" for src, doc in zip(session_info['sources'], data)
+                    for p in check(doc, SOURCE_TYPES[kind])]
+    else:
+        problems = check(data, kind) if kind in REQUIRED else []
+    if problems:
+        raise SchemaError("; ".join(problems))
+    if kind == 'standard':
+        return standard_record(data, session_info['topic_labels'])
+    if kind == 'health':
+        return health_record(data, session_info['topic_labels'], session_info.get('topic_keys'))
+    return data
+
+
+def with_segment(record, metrics, topic_keys, viz=None):
+    """`record` with segment_metrics() overrides (and re-counted answer breakdowns) applied.
+
+    The whole-session confidence intervals and tests don't describe a segment,
+    so they are dropped.
+    """
+    unset = dict.fromkeys(UNCERTAINTY_FIELDS)
+    def topic(i, t):
+        key = t.key if t.key is not None else (topic_keys[i] if i < len(topic_keys) else None)
+        return replace(t, **metrics[key], **unset) if key in metrics else replace(t, **unset)
+    return replace(record, **{k: v for k, v in metrics.items() if k in METRIC_FIELDS},
+                   topics=tuple(topic(i, t) for i, t in enumerate(record.topics)),
+                   uncertainty=None, **(viz or {}))
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate every session file in the app's registry.")
+    parser.parse_args(argv)
+    from export_snapshots import load_registry
+
+    failures = 0
+    for initiative, info in load_registry().items():
+        for name, session in info['sessions'].items():
+            files = session.get('sources') or [session.get('data_file')]
+            try:
+                docs = []
+                for path in files:
+                    with open(path, encoding='utf-8') as f:
+                        docs.append(json.load(f))
+                parse_session(session, docs if session.get('sources') else docs[0])
+            except (OSError, ValueError) as e:  # SchemaError and JSON errors are ValueErrors
+                failures += 1
+                print(f"FAIL {initiative}/{name} ({', '.join(map(str, files))}): {e}")
+            else:
+                print(f"ok   {initiative}/{name}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Session data held once per process, read-only, and shared by every viewer.
+
+`st.cache_data` pickles what a loader returns and unpickles a fresh copy on
+every call, so each rerun of each viewer paid to deserialize the session
+JSON again and briefly held its own copy of it. Here each data file is
+parsed once into FrozenDict / FrozenList containers: dict and list
+subclasses (so schema checks and Plotly take them as-is) whose mutators
+raise. Every session and rerun reads the same objects, and nothing is
+copied per call.
+
+Each document also carries the digest of the file it was parsed from.
+Cached helpers keyed on documents pass `hash_funcs=HASH_FUNCS`, so
+Streamlit hashes a document by that digest instead of walking it on
+every call.
+
+`SHARED_DATA.reload(path)` parses a changed file and swaps it in with one
+dict assignment. Readers never take a lock. A render that's mid-way keeps
+the document it started with, since that one is never mutated, and the
+next read gets the new one.
+"""
+import hashlib
+import json
+import threading
+
+
+# ============================================================================
+# FROZEN CONTAINERS
+# ============================================================================
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("Shared session data is read-only; copy it (dict(x) / list(x)) to change it.")
+
+
+class FrozenDict(dict):
+    """A dict whose contents can't change. `digest` is set on whole documents."""
+
+    __slots__ = ('digest',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.digest = None
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),), self.digest
+
+    def __setstate__(self, digest):
+        self.digest = digest
+
+
+class FrozenList(list):
+    """A list whose contents can't change."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(value):
+    """`value` with every dict and list (recursively) replaced by its frozen form."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def document_hash(doc):
+    """hash_funcs entry: a whole document by its file digest, anything nested by content."""
+    return doc.digest if doc.digest is not None else dict(doc)
+
+
+HASH_FUNCS = {FrozenDict: document_hash}
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+def load_document(path):
+    """Parse a JSON file into a frozen document; raises OSError / ValueError."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    doc = freeze(json.loads(raw))
+    if isinstance(doc, FrozenDict):
+        doc.digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return doc
+
+
+class SharedData:
+    """path -> frozen document, parsed on first use and replaced whole on reload."""
+
+    def __init__(self):
+        self._docs = {}
+        self._lock = threading.Lock()  # one parse per path at a time; reads don't take it
+
+    def get(self, path):
+        doc = self._docs.get(path)
+        if doc is None:
+            with self._lock:
+                doc = self._docs.get(path)
+                if doc is None:
+                    doc = self._docs[path] = load_document(path)
+        return doc
+
+    def reload(self, path):
+        """Re-parse `path` and swap it in. A file that no longer parses is dropped
+        (the next get() raises) rather than left serving stale data."""
+        try:
+            doc = load_document(path)
+        except (OSError, ValueError):
+            self._docs.pop(path, None)
+            return None
+        with self._lock:
+            self._docs[path] = doc
+        return doc
+
+
+SHARED_DATA = SharedData()
@@ -0,0 +1,33 @@
+"""FileWatcher: a callback that raises doesn't stop the others or the polling.
+
+    python -m pytest test_file_watch.py
+"""
+import io
+
+from file_watch import FileWatcher
+
+
+def test_failing_callback_is_logged_and_skipped(tmp_path):
+    first, second = tmp_path / "first.json", tmp_path / "second.json"
+    first.write_text("{}")
+    second.write_text("{}")
+    log, calls = io.StringIO(), []
+
+    def broken(path):
+        raise KeyError("sessions")
+
+    watcher = FileWatcher(log=log)
+    watcher.watch(str(first), broken)
+    watcher.watch(str(first), calls.append)
+    watcher.watch(str(second), calls.append)
+
+    first.write_text('{"a": 1}')
+    second.write_text('{"b": 2}')
+    # One poll sees the files move, the next sees them settle and fires.
+    assert watcher.check() + watcher.check() == [str(first), str(second)]
+    assert calls == [str(first), str(second)]
+    assert f"[file watch] {first}: callback failed: KeyError" in log.getvalue()
+
+    first.write_text('{"a": 22}')
+    assert watcher.check() + watcher.check() == [str(first)]
+    assert calls[-1] == str(first)
@@ -0,0 +1,55 @@
+"""Registry reloads: a rejected file keeps the old snapshot and the watcher alive.
+
+    python -m pytest test_registry.py
+"""
+import io
+import json
+import time
+
+from registry import Registry, problems
+
+
+SESSION = {"name": "Session 1", "icon": "📊", "vision_theme": "Theme", "data_file": "session1.json"}
+
+
+def initiative(sessions):
+    return {"name": "Initiative", "icon": "🎯", "description": "About", "sessions": sessions}
+
+
+def publish(path, registry):
+    path.write_text(json.dumps(registry), encoding='utf-8')
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_sessions_must_be_an_object():
+    assert problems({"SLS": initiative([])}) == ["SLS: 'sessions' must be an object"]
+    assert problems({"SLS": initiative({"s1": SESSION})}) == []
+
+
+def test_bad_registry_then_good_one(tmp_path):
+    path = tmp_path / "registry.json"
+    publish(path, {"SLS": initiative({"s1": SESSION})})
+    log = io.StringIO()
+    registry = Registry(str(path), log=log)
+    assert registry.reload() == [("SLS", "s1")]
+    assert registry.version == 1
+    registry.watch(interval=0.01)
+    try:
+        publish(path, {"SLS": initiative([])})
+        assert wait_for(lambda: "'sessions' must be an object" in log.getvalue())
+        assert registry.version == 1
+        assert list(registry.current()["SLS"]["sessions"]) == ["s1"]
+
+        publish(path, {"SLS": initiative({"s1": SESSION, "s2": dict(SESSION, name="Session 2")})})
+        assert wait_for(lambda: registry.version == 2)
+        assert list(registry.current()["SLS"]["sessions"]) == ["s1", "s2"]
+    finally:
+        registry._watcher.stop()
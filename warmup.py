@@ -0,0 +1,248 @@
+"""Startup warm-up: render every registered session once, in parallel, before viewers do.
+
+Right after a deploy, the first viewer of each session used to pay for its
+JSON load, schema check and figure builds, and for Plotly's lazy imports the
+first time each trace type is drawn. When the server starts, the app hands
+the registry to a WarmUp. WarmUp spreads the sessions over a process pool,
+and each worker renders its sessions headlessly the way a viewer would
+(AppTest, as in benchmark.py). Each result carries:
+
+    render_ms        time to render the session in the worker
+    startup_ms       on a worker's first session only: its imports and first
+                     (home page) run, paid before render_ms is timed
+    charts, figures  charts drawn / entries the worker added to FIGURE_CACHE
+    trace_types      Plotly trace types those charts use
+
+The server can't host the pool itself: Streamlit installs the app script as
+`__main__`, so spawned workers would re-run the app on import. A WarmUp
+instead starts `python warmup.py --jsonl` and reads one JSON line per session
+as the workers finish. A background thread then installs each session's
+figures into the server's own FIGURE_CACHE and builds one figure per new
+trace type, so those imports are paid off the request path. Before that, the
+same thread runs the app's `prepare` callback, which loads and validates
+every data file in the server process. It also logs a line per session to
+stderr.
+
+Only figures cross back from the workers. The per-type tallies (the app's
+*_static caches) are left to the first viewer; they cost about 1 ms each.
+
+Time the warm-up without starting a server:
+
+    python warmup.py                                     # every session
+    python warmup.py -j 4 "Leaders Network Circles/Combined Analysis"
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from plotly.utils import PlotlyJSONEncoder
+
+from figure_cache import FIGURE_CACHE
+
+
+SCRIPT = os.path.abspath(__file__)
+RENDER_TIMEOUT = 120
+
+_primed = set()  # trace types this process has already built
+_started = False  # this worker has paid its start-up run
+
+
+def serving():
+    """True inside `streamlit run`; False in bare mode and under AppTest (whose runtime is a mock)."""
+    from streamlit import runtime
+
+    return runtime.exists() and type(runtime.get_instance()) is runtime.Runtime
+
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+def worker_startup(app):
+    """Run the app once on its home page, paying this worker's imports; returns the ms it took."""
+    global _started
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+
+    AppTest.from_file(app, default_timeout=RENDER_TIMEOUT).run()
+    _started = True
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def warm_session(initiative, session, app):
+    """Render one session in this worker; returns its timings and what it built."""
+    from streamlit.testing.v1 import AppTest
+
+    startup = None if _started else worker_startup(app)
+    known = {key for key, _ in FIGURE_CACHE.export()}
+    at = AppTest.from_file(app, default_timeout=RENDER_TIMEOUT)
+    at.session_state.selected_initiative = initiative
+    at.session_state.selected_session = session
+    at.session_state.all_tabs = True  # warm every tab, not just the one a viewer lands on
+    start = time.perf_counter()
+    at.run()
+    result = {"render_ms": round((time.perf_counter() - start) * 1000, 1)}
+    if startup is not None:
+        result["startup_ms"] = startup
+    if at.exception:
+        result["error"] = at.exception[0].message
+        return result
+    charts = [json.loads(c.proto.spec) for c in at.get("plotly_chart")]
+    figures = [(key, spec) for key, spec in FIGURE_CACHE.export() if key not in known]
+    result.update({
+        "charts": len(charts),
+        "figures": figures,
+        "trace_types": sorted({t.get("type", "scatter") for c in charts for t in c.get("data", [])}),
+    })
+    return result
+
+
+def warm_sessions(sessions, app, workers=None):
+    """Yield ("Initiative/Session", result) as each worker finishes, in completion order.
+
+    Workers are spawned rather than forked: the server is multi-threaded by the
+    time this runs. A worker that renders several sessions pays its imports on
+    the first of them only.
+    """
+    # By module name, not __main__: AppTest swaps __main__ out in the worker.
+    from warmup import warm_session as task
+
+    workers = workers or min(len(sessions), os.cpu_count() or 1)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max(workers, 1), mp_context=context) as pool:
+        futures = {pool.submit(task, i, s, app): f"{i}/{s}" for i, s in sessions}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:  # a worker died; report it and keep going
+                result = {"error": f"{type(e).__name__}: {e}"}
+            yield futures[future], result
+
+
+# ============================================================================
+# SERVER SIDE
+# ============================================================================
+
+def prime_trace_types(types):
+    """Build one tiny figure per trace type not drawn yet, paying Plotly's lazy imports now."""
+    import plotly.graph_objects as go
+
+    for kind in set(types) - _primed:
+        go.Figure(data=[{"type": kind}]).to_dict()
+        _primed.add(kind)
+
+
+class WarmUp:
+    """Warms this process's figure cache from `python warmup.py --jsonl`, on a daemon thread.
+
+    `prepare`, if given, runs first on the same thread (off the first viewer's script run).
+    """
+
+    def __init__(self, app, sessions, workers=None, prepare=None, log=sys.stderr):
+        self.app = app
+        self.sessions = list(sessions)
+        self.workers = workers
+        self.prepare = prepare
+        self.log = log
+        self.report = {}  # "Initiative/Session" -> result, minus the figures
+        self.total_ms = None
+        self.done = threading.Event()
+        self._thread = None
+
+    def results(self):
+        """Yield (name, result) from a warm-up subprocess as its workers finish."""
+        command = [sys.executable, SCRIPT, "--jsonl", "--app", self.app]
+        if self.workers:
+            command += ["-j", str(self.workers)]
+        command += [f"{i}/{s}" for i, s in self.sessions]
+        # The workers' own Streamlit warnings would only clutter the server log;
+        # render errors come back in the results.
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True, encoding="utf-8") as proc:
+            for line in proc.stdout:
+                name, result = json.loads(line)
+                yield name, result
+
+    def _run(self):
+        start = time.perf_counter()
+        if self.prepare is not None:
+            self.prepare()
+            print(f"[warm-up] prepared in {(time.perf_counter() - start) * 1000:.0f} ms", file=self.log)
+        for name, result in self.results():
+            if "error" not in result:
+                t = time.perf_counter()
+                result["installed"] = FIGURE_CACHE.preload(result.pop("figures"))
+                prime_trace_types(result["trace_types"])
+                result["install_ms"] = round((time.perf_counter() - t) * 1000, 1)
+            self.report[name] = result
+            print(f"[warm-up] {describe(name, result)}", file=self.log)
+        self.total_ms = round((time.perf_counter() - start) * 1000, 1)
+        print(f"[warm-up] {len(self.report)} session(s) in {self.total_ms / 1000:.1f} s", file=self.log)
+        self.done.set()
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="warm-up", daemon=True)
+            self._thread.start()
+        return self
+
+
+def describe(name, r):
+    if "error" in r:
+        return f"{name}: FAILED after {r.get('render_ms', 0):.0f} ms: {r['error']}"
+    line = f"{name}: {r['render_ms']:.0f} ms render, {r['charts']} charts"
+    if "startup_ms" in r:
+        line += f" (+{r['startup_ms']:.0f} ms worker start-up)"
+    if "figures" in r:
+        line += f", {len(r['figures'])} cached figures"
+    if "install_ms" in r:
+        line += f", {r['installed']} figures installed in {r['install_ms']:.0f} ms"
+    return line
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv=None):
+    from export_snapshots import APP, load_registry
+
+    parser = argparse.ArgumentParser(description="Render every session once across a process pool and time it.")
+    parser.add_argument('sessions', nargs='*', help='"Initiative/Session" names (default: all)')
+    parser.add_argument('-j', '--workers', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--app', default=APP)
+    parser.add_argument('--jsonl', action='store_true',
+                        help="print [name, result] per session, figures included (read by WarmUp)")
+    args = parser.parse_args(argv)
+
+    registry = load_registry()
+    every = [(i, s) for i, info in registry.items() for s in info['sessions']]
+    wanted = [tuple(name.split('/', 1)) for name in args.sessions] or every
+    unknown = [w for w in wanted if w not in every]
+    if unknown:
+        parser.error(f"unknown session(s): {', '.join('/'.join(u) for u in unknown)}")
+
+    start = time.perf_counter()
+    failed, startup = 0, 0.0
+    for name, result in warm_sessions(wanted, args.app, args.workers):
+        failed += "error" in result
+        startup += result.get("startup_ms", 0)
+        if args.jsonl:
+            print(json.dumps([name, result], cls=PlotlyJSONEncoder), flush=True)
+        else:
+            print(describe(name, result))
+    if args.jsonl:
+        return 1 if failed else 0
+    print(f"{len(wanted)} session(s) in {time.perf_counter() - start:.1f} s "
+          f"({startup / 1000:.1f} s of it worker start-up), {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())